@@ -1,5 +1,6 @@
 import sqlite3
 from db.utils import db_path
+from src.core.wrestler_repository import invalidate_wrestler
 
 def add_wrestler(
     name,
@@ -78,4 +79,5 @@ def add_wrestler(
 
     conn.commit()
     conn.close()
+    invalidate_wrestler(wrestler_id)
     print(f"✅ Wrestler '{name}' added successfully with {len(signature_moves)} signature move(s).")
@@ -337,6 +337,10 @@ def import_wrestlers_from_csv(csv_path):
     # Commit changes
     conn.commit()
     conn.close()
+
+    # The roster changed wholesale; drop any cached profiles
+    from src.core.wrestler_repository import invalidate_wrestler
+    invalidate_wrestler()
     
     print(f"Successfully imported {imported_count} wrestlers into the database!")
 
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Apply pending schema migrations to the game databases.
+
+Safe to rerun; each database records the migrations it has applied in its
+schema_version table. Afterwards the hot queries are checked for full table
+scans.
+"""
+
+import os
+import sys
+import sqlite3
+
+# Add the parent directory to path to import src
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.db.utils import db_path
+from src.db.migrations import HOT_QUERIES, find_full_scans, migrate_all, schema_version
+
+
+def migrate_schema():
+    """Migrate every existing database and report hot queries that still scan whole tables."""
+    for db_name, applied in migrate_all().items():
+        note = f"applied {', '.join(map(str, applied))}" if applied else "up to date"
+        print(f"  {db_name:<20} version {schema_version(db_name)} ({note})")
+
+    clean = True
+    for db_name, query, params in HOT_QUERIES:
+        if not os.path.exists(db_path(db_name)):
+            continue
+        try:
+            offenders = find_full_scans([(db_name, query, params)])
+        except sqlite3.OperationalError as e:
+            # Table not created yet
+            print(f"  {db_name}: skipped check ({e})")
+            continue
+        for _, text, tables in offenders:
+            clean = False
+            print(f"⚠️  {db_name}: full scan of {', '.join(tables)} in: {text}")
+    if clean:
+        print("✅ Schema migrated; no hot query scans a whole table")
+
+
+if __name__ == "__main__":
+    migrate_schema()
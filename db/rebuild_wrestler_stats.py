@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Rebuild or check the materialized wrestler career stats.
+
+    python db/rebuild_wrestler_stats.py          # recompute wrestler_stats
+    python db/rebuild_wrestler_stats.py --check  # report stale rows, exit 1 if any
+
+wrestler_stats is kept up to date as matches are recorded; rebuild it after
+editing match_statistics.db by hand or if --check reports drift.
+"""
+
+import os
+import sys
+import argparse
+
+# Add the parent directory to path to import src
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.core.match_statistics import MatchStatistics
+
+
+def rebuild_wrestler_stats(check_only=False):
+    """Rebuild (or just check) wrestler_stats. Returns the number of stale values left."""
+    stats = MatchStatistics()
+    if not check_only:
+        print(f"✅ Rebuilt career stats for {stats.rebuild_wrestler_stats()} wrestlers")
+
+    mismatches = stats.check_wrestler_stats()
+    for wrestler_id, column, stored, expected in mismatches:
+        print(f"⚠️  wrestler {wrestler_id}: {column} is {stored}, expected {expected}")
+    if not mismatches:
+        print("✅ wrestler_stats matches the recorded matches")
+    return len(mismatches)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="only report stale rows")
+    args = parser.parse_args()
+    sys.exit(1 if rebuild_wrestler_stats(check_only=args.check) else 0)
@@ -1,5 +1,6 @@
 import sqlite3
 from db.utils import db_path
+from src.db.migrations import migrate
 
 def setup_events_db():
     conn = sqlite3.connect(db_path("events.db"))
@@ -52,6 +53,7 @@ def setup_matches_db():
     """)
     conn.commit()
     conn.close()
+    migrate("matches.db")
     
 def setup_weekly_shows_db():
     conn = sqlite3.connect(db_path("events.db"))
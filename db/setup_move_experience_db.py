@@ -10,6 +10,7 @@ import sys
 # Add the parent directory to path to import db.utils
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from db.utils import db_path
+from src.db.migrations import migrate
 
 def setup_move_experience_db():
     """Create the wrestler_move_experience table."""
@@ -45,6 +46,7 @@ def setup_move_experience_db():
     
     conn.commit()
     conn.close()
+    migrate("wrestlers.db")
     
     print("Move experience database setup complete!")
 
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Build the promo expectation table used by estimate_promo_rating.
+
+Rerun whenever the promo scoring in src/promo/promo_engine_helpers.py changes.
+A running game keeps the table it loaded until it calls
+invalidate_promo_expectations() (src/promo/promo_expectations.py).
+"""
+
+import os
+import sys
+
+# Add the parent directory to path to import db.utils and src
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db.utils import db_path
+from src.promo.promo_expectations import EXPECTATIONS_DB, build_promo_expectations
+
+
+def setup_promo_expectations_db(trials=100):
+    """Simulate the expectation grid and write it to promo_expectations.db."""
+    print(f"Simulating promo expectation grid ({trials} promos per cell)...")
+
+    next_report = [0]
+
+    def report(completed, total):
+        # Roughly every 10% of the grid
+        if completed >= next_report[0] or completed == total:
+            print(f"  {completed}/{total} promos")
+            next_report[0] = completed + total // 10
+
+    table = build_promo_expectations(trials=trials, progress_callback=report)
+    table.save(db_path(EXPECTATIONS_DB))
+
+    print(f"✅ Promo expectation table written ({len(table)} cells)")
+
+
+if __name__ == "__main__":
+    setup_promo_expectations_db()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Snapshot the separate game databases into a save slot.
+
+Collects every database the game uses, including copies older builds left in
+the working directory or data/, and writes a snapshot of them to one save
+slot. The game keeps running on the working databases, which are not
+modified.
+
+Usage: python db/snapshot_databases.py [slot]
+"""
+
+import os
+import sys
+
+# Add the parent directory to path to import src
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.db.save_snapshot import DEFAULT_SLOT, legacy_sources, save_game, save_path
+
+
+def snapshot_databases(slot=DEFAULT_SLOT):
+    """Write all existing game databases into save slot ``slot``."""
+    sources = legacy_sources()
+    if not sources:
+        print("❌ No game databases found; run db/setup_all_db.py first")
+        return None
+
+    for namespace, path in sorted(sources.items()):
+        print(f"  {namespace:<17} {path}")
+    counts = save_game(slot, sources=sources)
+
+    print(f"✅ Saved {len(counts)} databases ({sum(counts.values())} rows) to {save_path(slot)}")
+    return counts
+
+
+if __name__ == "__main__":
+    snapshot_databases(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SLOT)
@@ -1,7 +1,10 @@
 import os
 
+# Points every db_path() lookup at another directory (e.g. a benchmark fixture)
+DB_DIR_ENV = "OVERBOOKED_DB_DIR"
+
 def db_path(filename):
     # Get the absolute path to the db directory
-    db_dir = os.path.dirname(os.path.abspath(__file__))
+    db_dir = os.environ.get(DB_DIR_ENV) or os.path.dirname(os.path.abspath(__file__))
     # Join with the specified filename
     return os.path.join(db_dir, filename)
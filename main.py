@@ -49,6 +49,10 @@ def main():
     setup_logging()
     logging.info("=== Overbooked: Wrestling Simulator ===")
     logging.info("Starting application...")
+
+    # Bring existing databases up to the current schema before the UI starts
+    from src.db.migrations import migrate_all
+    migrate_all()
     
     app = QApplication(sys.argv)
 
@@ -88,6 +92,10 @@ def main():
     # Add keyboard shortcut for exiting application (ESC key)
     exit_shortcut = QShortcut(QKeySequence("Esc"), window)
     exit_shortcut.activated.connect(app.quit)
+
+    # Write any move experience still buffered when the app closes
+    from src.core.move_experience import flush_move_experience
+    app.aboutToQuit.connect(flush_move_experience)
     
     logging.info("Application window launched in fullscreen mode")
     sys.exit(app.exec_())
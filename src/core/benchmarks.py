@@ -0,0 +1,482 @@
+"""
+Benchmark Suite
+
+Headless throughput and latency benchmarks for the engine hot paths:
+
+- ``match_fast``: ``simulate_match_fast`` (no observers, nothing persisted)
+- ``match_silent``: ``simulate_match`` in fast mode at SILENT verbosity,
+  including match history and move experience writes
+- ``promo``: ``PromoEngine.simulate``
+- ``versus_promo``: ``VersusPromoEngine.simulate``
+- ``load_wrestler``: ``load_wrestler_by_id`` across the roster
+- ``event_card``: a full card the way the event screen plays it (load both
+  wrestlers, simulate, save the match and event results) inside one move
+  experience batch and event replay
+- ``daily_business``: advancing the game day and processing daily
+  merchandise sales
+
+Every run uses a fixture database: a scratch directory holding copies of the
+shipped databases plus freshly built match history, business and event data.
+``db_path()`` is pointed at it through ``OVERBOOKED_DB_DIR`` for the duration
+of the run, so benchmarks never write to the game's own files.
+
+Each benchmark records ops/sec and p50/p99 latency. Results can be saved as a
+JSON baseline and later runs compared against it; a benchmark regresses when
+its throughput drops more than ``max_regression`` (a fraction) below the
+baseline.
+
+Run from the project root::
+
+    python -m src.core.benchmarks --update-baseline
+    python -m src.core.benchmarks --max-regression 0.15
+
+tests/test_benchmarks.py runs the same comparison under pytest whenever a
+baseline file exists.
+"""
+
+import os
+import sys
+import json
+import math
+import random
+import shutil
+import sqlite3
+import logging
+import argparse
+import platform
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from src.db.utils import DB_DIR_ENV
+from src.db.save_snapshot import invalidate_db_caches
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BASELINE_PATH = os.path.join(PROJECT_ROOT, "benchmark_baseline.json")
+DEFAULT_MAX_REGRESSION = 0.2
+
+# Shipped databases copied into every fixture
+FIXTURE_DATABASES = ("wrestlers.db", "finishers.db", "manoeuvres.db", "commentary.db",
+                     "events.db", "matches.db", "save_state.db")
+FIXTURE_SEED = 2024
+EVENT_MATCHES = 4
+
+# name -> (setup function, default iterations); setup returns the operation to time
+BENCHMARKS = {}
+
+
+def benchmark(name, iterations):
+    """Register a benchmark; the decorated function builds its operation."""
+    def register(setup):
+        BENCHMARKS[name] = (setup, iterations)
+        return setup
+    return register
+
+
+class BenchmarkFixture:
+    """Fixture database directory plus the roster the benchmarks draw from."""
+
+    def __init__(self, directory, roster_ids, event_id):
+        self.directory = directory
+        self.roster_ids = roster_ids
+        self.event_id = event_id
+
+
+def _create_match_history(path):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            wrestler1_id INTEGER,
+            wrestler2_id INTEGER,
+            winner_id INTEGER,
+            match_type TEXT,
+            finish_type TEXT,
+            match_quality REAL,
+            match_time INTEGER,
+            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+
+def _create_business_data(path, roster, rng):
+    from src.db.business_schema import create_business_tables, initialize_business_data
+
+    create_business_tables()
+    initialize_business_data()
+
+    conn = sqlite3.connect(path)
+    # Merchandise queries join against a wrestlers table in business.db
+    conn.execute("CREATE TABLE IF NOT EXISTS wrestlers (id INTEGER PRIMARY KEY, name TEXT, popularity INTEGER)")
+    conn.executemany("INSERT INTO wrestlers VALUES (?, ?, ?)",
+                     [(w_id, name, rng.randint(30, 95)) for w_id, name in roster])
+    items = []
+    for w_id, name in roster:
+        stats = [rng.randint(1, 5) for _ in range(4)]
+        items.append((w_id, f"{name} T-Shirt", "T-Shirt", 3, 1, *stats, sum(stats) // 4))
+    conn.executemany("""
+        INSERT INTO merchandise_items (
+            wrestler_id, name, type, base_price, production_cost,
+            design_quality, material_quality, uniqueness, fan_appeal, overall_quality
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, items)
+    conn.commit()
+    conn.close()
+
+
+def build_fixture(directory, source_dir=None):
+    """
+    Populate ``directory`` with the benchmark databases and return a BenchmarkFixture.
+
+    Must run with db_path() already pointed at ``directory`` (see fixture_database).
+    """
+    source_dir = source_dir or os.path.join(PROJECT_ROOT, "db")
+    for name in FIXTURE_DATABASES:
+        source = os.path.join(source_dir, name)
+        if os.path.exists(source):
+            shutil.copyfile(source, os.path.join(directory, name))
+
+    conn = sqlite3.connect(os.path.join(directory, "wrestlers.db"))
+    roster = conn.execute("SELECT id, name FROM wrestlers ORDER BY id").fetchall()
+    conn.close()
+    if len(roster) < 2 * EVENT_MATCHES:
+        raise ValueError(f"Fixture roster needs at least {2 * EVENT_MATCHES} wrestlers, found {len(roster)}")
+
+    rng = random.Random(FIXTURE_SEED)
+    _create_match_history(os.path.join(directory, "match_history.db"))
+    _create_business_data(os.path.join(directory, "business.db"), roster, rng)
+
+    from src.ui.event_manager_helper import add_event
+    card = [(roster[i][1], roster[i + 1][1]) for i in range(0, 2 * EVENT_MATCHES, 2)]
+    add_event("Benchmark Night", card, "Fixture City", "Local Arena", "2025-06-01")
+    conn = sqlite3.connect(os.path.join(directory, "events.db"))
+    event_id = conn.execute("SELECT MAX(id) FROM events").fetchone()[0]
+    conn.close()
+
+    return BenchmarkFixture(directory, [w_id for w_id, _ in roster], event_id)
+
+
+@contextmanager
+def fixture_database(directory=None):
+    """
+    Point db_path() at a fixture database for the duration of the block.
+
+    Builds the fixture in ``directory`` (a temporary directory by default,
+    removed on exit) and yields the BenchmarkFixture. Cached rosters and
+    catalogs are dropped on entry and exit so nothing leaks between the
+    fixture and the game databases.
+    """
+    from src.core import game_state
+
+    scratch = tempfile.mkdtemp(prefix="overbooked_bench_") if directory is None else None
+    directory = directory or scratch
+    previous_dir = os.environ.get(DB_DIR_ENV)
+    previous_date = game_state.current_date
+    # merchandise_utils binds its manager to business.db when first imported
+    merchandise_module = sys.modules.get("src.core.merchandise_utils")
+    previous_business_db = merchandise_module.business_db if merchandise_module else None
+
+    os.environ[DB_DIR_ENV] = directory
+    invalidate_db_caches()
+    try:
+        fixture = build_fixture(directory)
+        from src.core import merchandise_utils
+        from src.db.business_db_manager import BusinessDBManager
+        merchandise_utils.business_db = BusinessDBManager()
+        yield fixture
+    finally:
+        if merchandise_module:
+            merchandise_module.business_db = previous_business_db
+        else:
+            # Imported against the fixture; the next import binds to the game's database
+            sys.modules.pop("src.core.merchandise_utils", None)
+        game_state.current_date = previous_date
+        if previous_dir is None:
+            os.environ.pop(DB_DIR_ENV, None)
+        else:
+            os.environ[DB_DIR_ENV] = previous_dir
+        invalidate_db_caches()
+        from src.core.db_utils import close_connections
+        close_connections(directory)
+        if scratch:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+
+def _pairings(fixture, rng):
+    """Endless stream of distinct-wrestler pairings drawn from the fixture roster."""
+    ids = fixture.roster_ids
+    while True:
+        w1_id, w2_id = rng.sample(ids, 2)
+        yield w1_id, w2_id
+
+
+@benchmark("match_fast", iterations=200)
+def _match_fast(fixture, rng):
+    from src.core.match_engine import load_wrestler_by_id
+    from src.core.optimized_match_engine import simulate_match_fast
+    pairs = [(load_wrestler_by_id(a), load_wrestler_by_id(b)) for a, b in _take(_pairings(fixture, rng), 20)]
+    cycle = _cycle(pairs)
+
+    def run():
+        w1, w2 = next(cycle)
+        simulate_match_fast(w1, w2, rng)
+    return run
+
+
+@benchmark("match_silent", iterations=100)
+def _match_silent(fixture, rng):
+    from src.core.match_core import SILENT
+    from src.core.match_engine import load_wrestler_by_id, simulate_match
+    pairs = [(load_wrestler_by_id(a), load_wrestler_by_id(b)) for a, b in _take(_pairings(fixture, rng), 20)]
+    cycle = _cycle(pairs)
+
+    def run():
+        w1, w2 = next(cycle)
+        simulate_match(w1, w2, log_function=None, fast_mode=True, verbosity=SILENT, rng=rng)
+    return run
+
+
+@benchmark("promo", iterations=200)
+def _promo(fixture, rng):
+    from src.core.match_engine import load_wrestler_by_id
+    from src.promo.promo_engine import PromoEngine
+    cycle = _cycle([load_wrestler_by_id(w_id) for w_id in fixture.roster_ids])
+
+    def run():
+        PromoEngine(next(cycle), rng=rng, compact_beats=True).simulate()
+    return run
+
+
+@benchmark("versus_promo", iterations=200)
+def _versus_promo(fixture, rng):
+    from src.core.match_engine import load_wrestler_by_id
+    from src.promo.versus_promo_engine import VersusPromoEngine
+    pairs = [(load_wrestler_by_id(a), load_wrestler_by_id(b)) for a, b in _take(_pairings(fixture, rng), 20)]
+    cycle = _cycle(pairs)
+
+    def run():
+        w1, w2 = next(cycle)
+        VersusPromoEngine(w1, w2, rng=rng).simulate()
+    return run
+
+
+@benchmark("load_wrestler", iterations=2000)
+def _load_wrestler(fixture, rng):
+    from src.core.match_engine import load_wrestler_by_id
+    cycle = _cycle(fixture.roster_ids)
+
+    def run():
+        load_wrestler_by_id(next(cycle))
+    return run
+
+
+@benchmark("event_card", iterations=10)
+def _event_card(fixture, rng):
+    from src.core.match_core import SILENT
+    from src.core.match_engine import get_all_wrestlers, load_wrestler_by_id, simulate_match
+    from src.core.match_replay import begin_event_replay, end_event_replay
+    from src.core.move_experience import move_experience_batch
+    from src.ui.event_manager_helper import get_event_by_id, save_match_to_db, update_event_results
+
+    event_id = fixture.event_id
+
+    def run():
+        event = get_event_by_id(event_id)
+        name_to_id = {name: id_ for id_, name in get_all_wrestlers()}
+        results, ratings = [], []
+        begin_event_replay(event_id)
+        try:
+            with move_experience_batch():
+                for index, (name1, name2) in enumerate(event["card"]):
+                    w1 = load_wrestler_by_id(name_to_id[name1])
+                    w2 = load_wrestler_by_id(name_to_id[name2])
+                    result = simulate_match(w1, w2, log_function=None, fast_mode=True, verbosity=SILENT, rng=rng)
+                    save_match_to_db(event_id, index, name1, name2, result)
+                    results.append((name1, name2, result["winner"]))
+                    ratings.append((event_id, index, result["quality"]))
+                    update_event_results(event_id, results, match_ratings=ratings)
+        finally:
+            end_event_replay()
+    return run
+
+
+@benchmark("daily_business", iterations=50)
+def _daily_business(fixture, rng):
+    from src.core.game_state import advance_day
+    from src.core.merchandise_utils import process_daily_merchandise_sales
+
+    def run():
+        advance_day()
+        process_daily_merchandise_sales(rng)
+    return run
+
+
+def _take(iterator, count):
+    return [next(iterator) for _ in range(count)]
+
+
+def _cycle(items):
+    while True:
+        yield from items
+
+
+def _percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    rank = math.ceil(fraction * len(ordered))
+    return ordered[max(0, min(len(ordered), rank) - 1)]
+
+
+def run_benchmark(name, fixture, iterations=None, warmup=None, seed=0):
+    """
+    Time one benchmark against a fixture.
+
+    Returns a dict with iterations, total_time, ops_per_sec, p50_ms and p99_ms.
+    ``warmup`` untimed calls (default: a tenth of the iterations) run first.
+    """
+    setup, default_iterations = BENCHMARKS[name]
+    iterations = iterations or default_iterations
+    warmup = max(1, iterations // 10) if warmup is None else warmup
+    operation = setup(fixture, random.Random(seed))
+
+    for _ in range(warmup):
+        operation()
+
+    perf_counter = time.perf_counter
+    latencies = []
+    append = latencies.append
+    start = perf_counter()
+    for _ in range(iterations):
+        began = perf_counter()
+        operation()
+        append(perf_counter() - began)
+    total_time = perf_counter() - start
+
+    latencies.sort()
+    return {
+        "iterations": iterations,
+        "total_time": total_time,
+        "ops_per_sec": iterations / total_time if total_time else 0,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000
+    }
+
+
+def run_suite(names=None, iterations=None, scale=1.0, seed=0, progress_callback=None):
+    """
+    Run benchmarks (all by default) against a fresh fixture database.
+
+    ``iterations`` overrides every benchmark's count; ``scale`` multiplies the
+    defaults instead (e.g. 0.1 for a smoke run).
+    """
+    names = list(names or BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    results = {}
+    with fixture_database() as fixture:
+        for name in names:
+            count = iterations or max(1, int(BENCHMARKS[name][1] * scale))
+            results[name] = run_benchmark(name, fixture, count, seed=seed)
+            logging.info(f"Benchmark {name}: {results[name]['ops_per_sec']:.1f} ops/s, "
+                         f"p50 {results[name]['p50_ms']:.3f}ms, p99 {results[name]['p99_ms']:.3f}ms")
+            if progress_callback:
+                progress_callback(name, results[name])
+    return results
+
+
+def save_baseline(results, path=BASELINE_PATH):
+    """Write results as the JSON baseline."""
+    data = {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "benchmarks": results
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+    logging.info(f"Benchmark baseline written to {path}")
+
+
+def load_baseline(path=BASELINE_PATH):
+    """Return the benchmark results stored at ``path``, or None if there is no baseline."""
+    try:
+        with open(path) as f:
+            return json.load(f)["benchmarks"]
+    except FileNotFoundError:
+        return None
+
+
+def find_regressions(results, baseline, max_regression=DEFAULT_MAX_REGRESSION, thresholds=None):
+    """
+    Compare results with a baseline.
+
+    Returns one dict (name, baseline_ops, ops, change) per benchmark whose
+    ops/sec fell more than ``max_regression`` below the baseline.
+    ``thresholds`` maps benchmark names to their own allowed fraction.
+    Benchmarks missing from the baseline are not compared.
+    """
+    thresholds = thresholds or {}
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference or not reference.get("ops_per_sec"):
+            continue
+        change = result["ops_per_sec"] / reference["ops_per_sec"] - 1
+        if change < -thresholds.get(name, max_regression):
+            regressions.append({
+                "name": name,
+                "baseline_ops": reference["ops_per_sec"],
+                "ops": result["ops_per_sec"],
+                "change": change
+            })
+    return regressions
+
+
+def _parse_threshold(text):
+    name, _, fraction = text.partition("=")
+    return name, float(fraction)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Overbooked benchmark suite.")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--iterations", type=int, help="timed iterations per benchmark")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier for the default iteration counts")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="save this run as the baseline")
+    parser.add_argument("--max-regression", type=float, default=DEFAULT_MAX_REGRESSION,
+                        help="allowed ops/sec drop as a fraction (default: %(default)s)")
+    parser.add_argument("--threshold", action="append", type=_parse_threshold, default=[],
+                        metavar="NAME=FRACTION", help="per-benchmark allowed drop")
+    args = parser.parse_args(argv)
+
+    def report(name, result):
+        print(f"{name:<16} {result['ops_per_sec']:>10.1f} ops/s   p50 {result['p50_ms']:8.3f}ms   "
+              f"p99 {result['p99_ms']:8.3f}ms   ({result['iterations']} runs)")
+
+    results = run_suite(args.names, args.iterations, args.scale, args.seed, report)
+
+    if args.update_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.max_regression, dict(args.threshold))
+    for regression in regressions:
+        print(f"REGRESSION {regression['name']}: {regression['ops']:.1f} ops/s vs "
+              f"{regression['baseline_ops']:.1f} baseline ({regression['change']:+.1%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
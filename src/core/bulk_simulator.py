@@ -0,0 +1,186 @@
+"""
+Bulk Match Simulator
+
+Runs large batches of headless matches across a process pool for balance
+testing (e.g. tuning ``calculate_final_quality``).
+
+- The roster is loaded from SQLite once in the parent and shipped to each
+  worker a single time through the pool initializer.
+- Every match gets its own seed drawn from a master seed up front and runs
+  on its own ``random.Random`` built from it (see ``rng_utils``). Results are
+  returned in match order, so a given master seed produces identical output
+  for any worker count.
+- Matches are dispatched in chunks; the progress callback receives each
+  chunk's compact summaries as soon as it completes.
+"""
+
+import os
+import random
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.core.match_core import run_match, SILENT
+from src.core.rng_utils import make_rng
+
+# Roster available to the current worker process, keyed by wrestler id
+_worker_roster = {}
+
+
+def load_roster():
+    """Load every wrestler in the database, keyed by id."""
+    from src.core.match_engine import load_wrestler_by_id, get_all_wrestlers
+
+    roster = {}
+    for wrestler_id, _name in get_all_wrestlers():
+        wrestler = load_wrestler_by_id(wrestler_id)
+        if wrestler:
+            roster[wrestler_id] = wrestler
+    return roster
+
+
+def plan_matches(wrestler_ids, count, master_seed):
+    """
+    Draw the pairings and per-match seeds for a bulk run.
+
+    Returns a list of (index, wrestler1_id, wrestler2_id, seed) tuples. The
+    plan depends only on the sorted wrestler ids, the count and the master
+    seed, never on how the work is later split up.
+    """
+    wrestler_ids = sorted(wrestler_ids)
+    if len(wrestler_ids) < 2:
+        raise ValueError("Bulk simulation needs at least two wrestlers")
+
+    planner = random.Random(master_seed)
+    plan = []
+    for index in range(count):
+        w1_id, w2_id = planner.sample(wrestler_ids, 2)
+        plan.append((index, w1_id, w2_id, planner.getrandbits(64)))
+    return plan
+
+
+def summarize_result(index, wrestler1, wrestler2, result):
+    """Reduce a full match result to the compact record streamed back to the parent."""
+    winner = result["winner"]
+    if winner == wrestler1["name"]:
+        winner_id = wrestler1.get("id")
+    elif winner == wrestler2["name"]:
+        winner_id = wrestler2.get("id")
+    else:
+        winner_id = None
+
+    return {
+        "index": index,
+        "wrestler_ids": (wrestler1.get("id"), wrestler2.get("id")),
+        "wrestlers": [wrestler1["name"], wrestler2["name"]],
+        "winner": winner,
+        "winner_id": winner_id,
+        "finish_type": result["finish_type"],
+        "quality": result["quality"],
+        "turns": result["turns"],
+        "drama_score": result["drama_score"],
+        "false_finishes": result["false_finishes"],
+        "sig_moves_landed": result["sig_moves_landed"],
+        "crowd_energy": result["crowd_energy"],
+        "execution_summary": result["execution_summary"]
+    }
+
+
+def simulate_planned_match(roster, index, wrestler1_id, wrestler2_id, seed):
+    """Simulate one planned match on its own random stream and return its summary."""
+    # Work on copies: the core resets stamina/damage on the dicts it is given
+    wrestler1 = dict(roster[wrestler1_id])
+    wrestler2 = dict(roster[wrestler2_id])
+    result = run_match(wrestler1, wrestler2, verbosity=SILENT, rng=make_rng(seed))
+    return summarize_result(index, wrestler1, wrestler2, result)
+
+
+def _init_worker(roster):
+    global _worker_roster
+    _worker_roster = roster
+
+
+def _simulate_chunk(chunk):
+    return [simulate_planned_match(_worker_roster, *planned) for planned in chunk]
+
+
+def _chunked(plan, chunk_size):
+    return [plan[i:i + chunk_size] for i in range(0, len(plan), chunk_size)]
+
+
+def simulate_bulk(count, master_seed=None, workers=None, chunk_size=None, roster=None, progress_callback=None):
+    """
+    Simulate ``count`` matches between random roster pairings.
+
+    Args:
+        count: Number of matches to simulate
+        master_seed: Seed for pairings and per-match seeds (random if None)
+        workers: Worker processes to use; 1 runs in-process (default: CPU count)
+        chunk_size: Matches per task sent to a worker (default: sized from count)
+        roster: Preloaded {wrestler_id: wrestler} dict (default: load from db)
+        progress_callback: Called as progress_callback(completed, total, summaries)
+            with the summaries of each finished chunk
+
+    Returns:
+        Dictionary with aggregate statistics and the per-match summaries in
+        match order under "results".
+    """
+    start_time = time.time()
+
+    if master_seed is None:
+        master_seed = random.SystemRandom().getrandbits(64)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if roster is None:
+        roster = load_roster()
+    if not roster:
+        raise ValueError("No wrestlers found in database")
+
+    plan = plan_matches(roster.keys(), count, master_seed)
+    if chunk_size is None:
+        chunk_size = max(1, min(500, count // (workers * 8) or 1))
+    chunks = _chunked(plan, chunk_size)
+
+    results = [None] * count
+    completed = 0
+
+    def collect(summaries):
+        nonlocal completed
+        for summary in summaries:
+            results[summary["index"]] = summary
+        completed += len(summaries)
+        if progress_callback:
+            progress_callback(completed, count, summaries)
+
+    if workers <= 1:
+        _init_worker(roster)
+        for chunk in chunks:
+            collect(_simulate_chunk(chunk))
+    else:
+        # Warm the manoeuvre catalog so forked workers inherit it
+        from src.core.manoeuvre_catalog import get_manoeuvre_catalog
+        get_manoeuvre_catalog()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(roster,)) as pool:
+            futures = [pool.submit(_simulate_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                collect(future.result())
+
+    total_time = time.time() - start_time
+    logging.info(f"Simulated {count} matches on {workers} worker(s) in {total_time:.2f}s")
+
+    finish_types = {}
+    for summary in results:
+        finish_types[summary["finish_type"]] = finish_types.get(summary["finish_type"], 0) + 1
+
+    return {
+        "total_matches": count,
+        "master_seed": master_seed,
+        "workers": workers,
+        "total_time": total_time,
+        "avg_time_per_match": total_time / count if count else 0,
+        "avg_quality": sum(r["quality"] for r in results) / count if count else 0,
+        "avg_turns": sum(r["turns"] for r in results) / count if count else 0,
+        "finish_types": finish_types,
+        "results": results
+    }
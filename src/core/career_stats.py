@@ -0,0 +1,125 @@
+"""
+Career Statistics
+
+``wrestler_stats`` in match_statistics.db is a materialized per-wrestler
+aggregate of ``match_participants``: running counts, sums and best/worst
+match, plus the averages derived from them. MatchStatistics updates it with
+``apply_match_result()`` in the same transaction that records the match, so
+reading a wrestler's career line is a single primary-key lookup however many
+matches they have had.
+
+``rebuild_wrestler_stats()`` recomputes the table from match_participants
+(after a migration, an import or a repair) and ``check_wrestler_stats()``
+reports rows that disagree with it. ``db/rebuild_wrestler_stats.py`` runs
+both from the command line.
+"""
+
+from datetime import datetime
+
+# Columns compared by check_wrestler_stats (last_updated is not)
+STAT_COLUMNS = (
+    "matches", "wins", "losses", "total_quality", "best_match", "worst_match",
+    "total_drama", "total_reversals", "total_duration", "avg_quality", "avg_drama", "reversal_rate"
+)
+
+# Averages are recomputed from running sums, so allow for float rounding
+TOLERANCE = 1e-6
+
+CREATE_WRESTLER_STATS_SQL = """
+    CREATE TABLE IF NOT EXISTS wrestler_stats (
+        wrestler_id INTEGER PRIMARY KEY,
+        matches INTEGER NOT NULL DEFAULT 0,
+        wins INTEGER NOT NULL DEFAULT 0,
+        losses INTEGER NOT NULL DEFAULT 0,
+        total_quality INTEGER NOT NULL DEFAULT 0,
+        best_match INTEGER,
+        worst_match INTEGER,
+        total_drama INTEGER NOT NULL DEFAULT 0,
+        total_reversals INTEGER NOT NULL DEFAULT 0,
+        total_duration REAL NOT NULL DEFAULT 0,
+        avg_quality REAL NOT NULL DEFAULT 0,
+        avg_drama REAL NOT NULL DEFAULT 0,
+        reversal_rate REAL NOT NULL DEFAULT 0,
+        last_updated TEXT NOT NULL
+    )
+"""
+
+# In ON CONFLICT DO UPDATE every right-hand side reads the row before the update
+_APPLY_SQL = """
+    INSERT INTO wrestler_stats (
+        wrestler_id, matches, wins, losses, total_quality, best_match, worst_match,
+        total_drama, total_reversals, total_duration, avg_quality, avg_drama, reversal_rate, last_updated
+    ) VALUES (?, 1, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(wrestler_id) DO UPDATE SET
+        matches = matches + 1,
+        wins = wins + excluded.wins,
+        losses = losses + excluded.losses,
+        total_quality = total_quality + excluded.total_quality,
+        best_match = MAX(COALESCE(best_match, excluded.best_match), excluded.best_match),
+        worst_match = MIN(COALESCE(worst_match, excluded.worst_match), excluded.worst_match),
+        total_drama = total_drama + excluded.total_drama,
+        total_reversals = total_reversals + excluded.total_reversals,
+        total_duration = total_duration + excluded.total_duration,
+        avg_quality = CAST(total_quality + excluded.total_quality AS REAL) / (matches + 1),
+        avg_drama = CAST(total_drama + excluded.total_drama AS REAL) / (matches + 1),
+        reversal_rate = CAST(total_reversals + excluded.total_reversals AS REAL) / (matches + 1),
+        last_updated = excluded.last_updated
+"""
+
+_AGGREGATE_SQL = """
+    SELECT wrestler_id,
+           COUNT(*),
+           SUM(won),
+           COUNT(*) - SUM(won),
+           SUM(quality),
+           MAX(quality),
+           MIN(quality),
+           SUM(drama),
+           SUM(reversals),
+           TOTAL(duration_minutes),
+           CAST(SUM(quality) AS REAL) / COUNT(*),
+           CAST(SUM(drama) AS REAL) / COUNT(*),
+           CAST(SUM(reversals) AS REAL) / COUNT(*)
+    FROM match_participants
+"""
+
+
+def apply_match_result(cursor, wrestler_id, won, quality, drama, reversals, duration_minutes):
+    """Fold one wrestler's result into their wrestler_stats row (inside the caller's transaction)."""
+    cursor.execute(_APPLY_SQL, (
+        wrestler_id, 1 if won else 0, 0 if won else 1, quality, quality, quality,
+        drama, reversals, duration_minutes, quality, drama, reversals, datetime.now().isoformat()
+    ))
+
+
+def rebuild_wrestler_stats(conn):
+    """Recompute wrestler_stats from match_participants. Returns the number of wrestlers."""
+    conn.execute("DELETE FROM wrestler_stats")
+    cursor = conn.execute(f"""
+        INSERT INTO wrestler_stats (wrestler_id, {", ".join(STAT_COLUMNS)}, last_updated)
+        SELECT aggregate.*, ? FROM ({_AGGREGATE_SQL} GROUP BY wrestler_id) AS aggregate
+    """, (datetime.now().isoformat(),))
+    return cursor.rowcount
+
+
+def check_wrestler_stats(conn, wrestler_id=None):
+    """
+    Compare wrestler_stats with match_participants.
+
+    Returns a list of (wrestler_id, column, stored, expected) for every value
+    that differs; a missing or extra row shows up as a "matches" mismatch.
+    """
+    where, params = (" WHERE wrestler_id = ?", (wrestler_id,)) if wrestler_id is not None else ("", ())
+    expected = {row[0]: row[1:] for row in conn.execute(f"{_AGGREGATE_SQL}{where} GROUP BY wrestler_id", params)}
+    stored = {row[0]: row[1:] for row in conn.execute(
+        f"SELECT wrestler_id, {', '.join(STAT_COLUMNS)} FROM wrestler_stats{where}", params)}
+
+    mismatches = []
+    for w_id in sorted(expected.keys() | stored.keys()):
+        if w_id not in stored or w_id not in expected:
+            mismatches.append((w_id, "matches", stored.get(w_id, (0,))[0], expected.get(w_id, (0,))[0]))
+            continue
+        for column, have, want in zip(STAT_COLUMNS, stored[w_id], expected[w_id]):
+            if have != want and (have is None or want is None or abs(have - want) > TOLERANCE):
+                mismatches.append((w_id, column, have, want))
+    return mismatches
@@ -0,0 +1,86 @@
+"""
+Commentary Store
+
+In-memory copy of the ``attacking_commentary`` table in commentary.db.
+
+The table only changes when ``db/setup_commentary_db.py`` rebuilds it, so it
+is loaded once per process into one tuple of templates per (context, tier)
+pool. The ``(wrestler1)``/``(wrestler2)`` placeholders are compiled into
+``str.format`` templates at load time, so a line costs a dict lookup, one
+random index and a format call instead of a connection per call.
+"""
+
+import logging
+import random
+import sqlite3
+
+FALLBACK_TEMPLATE = "{w1} is in control!"
+
+
+def compile_template(line):
+    """Turn a stored line with (wrestler1)/(wrestler2) placeholders into a format template."""
+    return (
+        line.replace("{", "{{").replace("}", "}}")
+        .replace("(wrestler1)", "{w1}").replace("(wrestler2)", "{w2}")
+    )
+
+
+class CommentaryStore:
+    """Commentary templates grouped by (context, tier)."""
+
+    def __init__(self, rows):
+        # rows are (context, tier, line) tuples; tier may be None
+        pools = {}
+        for context, tier, line in rows:
+            pools.setdefault((context, tier or None), []).append(compile_template(line))
+        self._pools = {key: tuple(lines) for key, lines in pools.items()}
+        # Own generator so colour commentary never shifts the match's random stream
+        self._random = random.Random()
+
+    @classmethod
+    def from_db(cls, path):
+        """Load every commentary line from the database at ``path``."""
+        conn = sqlite3.connect(path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT context, tier, line FROM attacking_commentary ORDER BY id")
+            rows = cursor.fetchall()
+        finally:
+            conn.close()
+        logging.debug(f"Loaded {len(rows)} commentary lines into store")
+        return cls(rows)
+
+    def pool(self, context, tier=None):
+        """Return the tuple of templates for a context and tier."""
+        return self._pools.get((context, tier or None), ())
+
+    def line(self, context, tier=None, w1="Wrestler 1", w2="Wrestler 2"):
+        """Pick and render a random line, falling back to a generic one."""
+        templates = self._pools.get((context, tier or None))
+        if not templates:
+            return FALLBACK_TEMPLATE.format(w1=w1, w2=w2)
+        template = templates[int(self._random.random() * len(templates))]
+        return template.format(w1=w1, w2=w2)
+
+
+_store = None
+
+
+def get_commentary_store():
+    """Return the process-wide store, loading it from commentary.db on first use."""
+    global _store
+    if _store is None:
+        from db.utils import db_path
+        try:
+            _store = CommentaryStore.from_db(db_path("commentary.db"))
+        except sqlite3.Error as e:
+            logging.error(f"Failed to load commentary: {e}")
+            _store = CommentaryStore(())
+    return _store
+
+
+def invalidate_commentary_store():
+    """Drop the cached store so the next lookup reloads commentary.db."""
+    global _store
+    _store = None
+    logging.info("Commentary store invalidated")
@@ -4,17 +4,49 @@ Centralized Database Utilities for Overbooked
 This module provides standardized utilities for database access across the application.
 All code should use these utilities rather than hardcoding database paths or creating
 custom db_path functions.
+
+Shared connections
+------------------
+``shared_connection(db)`` and ``transaction(db)`` hand out one long-lived
+connection per database file per thread instead of a new sqlite3 connection
+per call. Each connection is opened once with WAL journaling,
+``synchronous=NORMAL``, an 8 MiB page cache and a larger prepared-statement
+cache, and is closed at interpreter exit (or by ``close_connections()``).
+
+``shared_connection`` is a drop-in replacement for
+``sqlite3.connect(db_path(...))`` in open/commit/close code: ``close()``
+leaves the connection open and only discards uncommitted changes, as closing
+a real connection would, and ``row_factory`` is local to the handle.
+``transaction`` is the preferred form for new code::
+
+    with transaction("business.db") as conn:
+        conn.execute(...)
+
+It commits when the block exits and rolls back if it raises. Nested blocks on
+the same database become savepoints, and legacy ``commit()``/``close()``
+calls made inside a block are deferred to it, so helpers written in the old
+style can be composed into one atomic unit. A legacy ``rollback()`` inside a
+block undoes only the innermost block's work; the enclosing blocks carry on.
 """
 
 import os
+import atexit
 import sqlite3
 import logging
+import threading
+from contextlib import contextmanager
+
+from src.db.utils import db_path
+
+PAGE_CACHE_KIB = 8192
+STATEMENT_CACHE_SIZE = 256
 
 def get_db_path(db_name):
     """
     Get the path to a database file.
     
-    This function returns the path to the database file in the /db directory.
+    This function returns the path to the database file in the /db directory
+    (or in the OVERBOOKED_DB_DIR override, see src/db/utils.py).
     
     Args:
         db_name: Name of the database file
@@ -22,34 +54,25 @@ def get_db_path(db_name):
     Returns:
         Full path to the database file
     """
-    # Get project root directory
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(current_dir))
-    
-    # Path to the database file
-    db_path = os.path.join(project_root, "db", db_name)
-    
-    return db_path
+    return db_path(db_name)
+
 
 def get_connection(db_name):
     """
     Get a connection to a database.
     
+    The handle is on this thread's shared connection (see shared_connection);
+    closing it does not close the underlying connection.
+    
     Args:
         db_name: Name of the database file
         
     Returns:
         SQLite connection object
     """
-    path = get_db_path(db_name)
-    
-    try:
-        conn = sqlite3.connect(path)
-        conn.row_factory = sqlite3.Row  # Enable row factory for named columns
-        return conn
-    except sqlite3.Error as e:
-        logging.error(f"Error connecting to database {db_name}: {e}")
-        raise
+    conn = shared_connection(db_name)
+    conn.row_factory = sqlite3.Row  # Enable row factory for named columns
+    return conn
 
 def execute_query(db_name, query, params=None):
     """
@@ -64,20 +87,11 @@ def execute_query(db_name, query, params=None):
         List of results
     """
     conn = get_connection(db_name)
-    cursor = conn.cursor()
-    
     try:
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        
-        results = cursor.fetchall()
-        conn.commit()
-        return results
+        # Reads run outside a transaction (or inside the caller's, if one is open)
+        return conn.execute(query, params or ()).fetchall()
     except sqlite3.Error as e:
         logging.error(f"Error executing query on {db_name}: {e}")
-        conn.rollback()
         raise
     finally:
         conn.close()
@@ -94,24 +108,12 @@ def execute_update(db_name, query, params=None):
     Returns:
         Number of rows affected
     """
-    conn = get_connection(db_name)
-    cursor = conn.cursor()
-    
     try:
-        if params:
-            cursor.execute(query, params)
-        else:
-            cursor.execute(query)
-        
-        affected_rows = cursor.rowcount
-        conn.commit()
-        return affected_rows
+        with transaction(db_name) as conn:
+            return conn.execute(query, params or ()).rowcount
     except sqlite3.Error as e:
         logging.error(f"Error executing update on {db_name}: {e}")
-        conn.rollback()
         raise
-    finally:
-        conn.close()
 
 def execute_script(db_name, script):
     """
@@ -201,4 +203,281 @@ def create_database_if_not_exists(db_name):
             logging.error(f"Error creating database {db_name}: {e}")
             raise
     
-    return True 
\ No newline at end of file
+    return True
+
+
+# --------------------------
+# Shared connections
+# --------------------------
+def _resolve(db):
+    """Absolute path for a database name (resolved with db_path) or a path."""
+    if db == ":memory:":
+        return db
+    if os.path.dirname(db):
+        return os.path.abspath(db)
+    return get_db_path(db)
+
+
+class _Entry:
+    """A thread's connection to one database, its transaction depth and open handles."""
+
+    __slots__ = ("conn", "depth", "handles")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.depth = 0
+        self.handles = 0
+
+
+class ConnectionManager:
+    """Keeps one configured connection per database file per thread."""
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all = []
+        self._pid = os.getpid()
+        # Statements run on managed connections while trace_statements() is active
+        self.statements = 0
+        self._tracing = 0
+
+    def _open(self, path):
+        conn = sqlite3.connect(path, cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+        try:
+            if path != ":memory:":
+                mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+                if mode.lower() != "wal":
+                    logging.debug(f"{path} stays in {mode} journal mode")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA cache_size=-{PAGE_CACHE_KIB}")
+        except sqlite3.Error as e:
+            # Still usable with the default settings (read-only file, say)
+            logging.warning(f"Could not tune connection to {path}: {e}")
+        if self._tracing:
+            conn.set_trace_callback(self._count_statement)
+        return _Entry(conn)
+
+    def _count_statement(self, statement):
+        self.statements += 1
+
+    @contextmanager
+    def trace_statements(self):
+        """
+        Count every SQL statement run on a managed connection, on any thread,
+        in ``self.statements`` while the block runs.
+
+        Tracing costs a Python call per statement, so it is off otherwise.
+        """
+        with self._lock:
+            self._tracing += 1
+            if self._tracing == 1:
+                for _, entry in self._all:
+                    if entry.conn is not None:
+                        entry.conn.set_trace_callback(self._count_statement)
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._tracing -= 1
+                if not self._tracing:
+                    for _, entry in self._all:
+                        if entry.conn is not None:
+                            entry.conn.set_trace_callback(None)
+
+    def entry(self, db):
+        """Return this thread's _Entry for ``db``, opening it on first use."""
+        if os.getpid() != self._pid:
+            # Forked child: connections inherited from the parent must not be used
+            self._local = threading.local()
+            self._all = []
+            self._pid = os.getpid()
+
+        entries = getattr(self._local, "entries", None)
+        if entries is None:
+            entries = self._local.entries = {}
+        path = _resolve(db)
+        entry = entries.get(path)
+        if entry is None or entry.conn is None:
+            try:
+                entry = entries[path] = self._open(path)
+            except sqlite3.Error as e:
+                logging.error(f"Error connecting to database {db}: {e}")
+                raise
+            with self._lock:
+                self._all.append((path, entry))
+        return entry
+
+    def connection(self, db):
+        """Return a SharedConnection handle on this thread's connection to ``db``."""
+        return SharedConnection(self.entry(db))
+
+    @contextmanager
+    def transaction(self, db, immediate=False):
+        """
+        Run the block in a transaction on ``db`` and yield a SharedConnection.
+
+        Commits on exit, rolls back on error; nested blocks use savepoints.
+        ``immediate`` takes the write lock up front (BEGIN IMMEDIATE).
+        """
+        entry = self.entry(db)
+        conn = entry.conn
+        outermost = not entry.depth
+        if outermost:
+            if conn.in_transaction:
+                # Work left pending by open/commit/close code joins this transaction
+                logging.debug(f"Joining an open transaction on {db}")
+            else:
+                conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+        # Every level, the outermost included, gets a savepoint so that a
+        # rollback() on a handle inside the block can undo just this level
+        savepoint = f"sp_{entry.depth}"
+        conn.execute(f"SAVEPOINT {savepoint}")
+
+        entry.depth += 1
+        try:
+            yield SharedConnection(entry, managed=True)
+        except BaseException:
+            entry.depth -= 1
+            if outermost:
+                conn.rollback()
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            raise
+        entry.depth -= 1
+        if outermost:
+            conn.commit()
+        else:
+            conn.execute(f"RELEASE {savepoint}")
+
+    def close_all(self, directory=None):
+        """Close every connection (or those to files under ``directory``)."""
+        prefix = os.path.join(os.path.abspath(directory), "") if directory else None
+        with self._lock:
+            keep = []
+            for path, entry in self._all:
+                if prefix and not path.startswith(prefix):
+                    keep.append((path, entry))
+                    continue
+                try:
+                    entry.conn.close()
+                except sqlite3.Error as e:
+                    logging.warning(f"Error closing connection to {path}: {e}")
+                # The owning thread reopens on its next use
+                entry.conn = None
+            closed = len(self._all) - len(keep)
+            self._all = keep
+        return closed
+
+
+class SharedConnection:
+    """
+    Handle on a managed connection, usable where a sqlite3.Connection was.
+
+    ``close()`` keeps the underlying connection open; ``commit()`` and
+    ``close()`` inside a ``transaction()`` block are left to the block.
+    Handles on the same connection share its transaction, so a helper that
+    commits while its caller's handle is open commits the caller's pending
+    statements too. A handle that is never closed is closed when it is
+    garbage collected.
+    """
+
+    def __init__(self, entry, managed=False):
+        self._entry = entry
+        self._open = not managed
+        self.row_factory = None
+        if self._open:
+            entry.handles += 1
+
+    @property
+    def in_transaction(self):
+        return self._entry.conn.in_transaction
+
+    @property
+    def total_changes(self):
+        return self._entry.conn.total_changes
+
+    def cursor(self):
+        conn = self._entry.conn
+        if conn is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+        cursor = conn.cursor()
+        cursor.row_factory = self.row_factory
+        return cursor
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, script):
+        return self.cursor().executescript(script)
+
+    def commit(self):
+        if not self._entry.depth:
+            self._entry.conn.commit()
+
+    def rollback(self):
+        entry = self._entry
+        if entry.depth:
+            # Inside a transaction() block: undo the innermost block's work and
+            # leave the enclosing blocks' work and savepoints in place
+            entry.conn.execute(f"ROLLBACK TO sp_{entry.depth - 1}")
+        else:
+            entry.conn.rollback()
+
+    def close(self):
+        if not self._open:
+            return
+        self._open = False
+        entry = self._entry
+        entry.handles -= 1
+        # Closing a connection discards whatever it had not committed, unless
+        # another open handle (a caller further up the stack) still uses it
+        if not entry.handles and not entry.depth and entry.conn is not None and entry.conn.in_transaction:
+            entry.conn.rollback()
+
+    def __del__(self):
+        # A handle dropped without close() (its caller raised before reaching
+        # it, say) is released here, so its uncommitted work is discarded as it
+        # was when a real connection was collected
+        try:
+            self.close()
+        except (AttributeError, sqlite3.Error):
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Same as sqlite3.Connection: commit or roll back, do not close
+        if exc_type is None:
+            self.commit()
+        elif not self._entry.depth:
+            self.rollback()
+        return False
+
+
+_manager = ConnectionManager()
+atexit.register(_manager.close_all)
+
+
+def get_connection_manager():
+    """Return the process-wide ConnectionManager."""
+    return _manager
+
+
+def shared_connection(db):
+    """This thread's long-lived connection to ``db`` (a db name or path)."""
+    return _manager.connection(db)
+
+
+def transaction(db, immediate=False):
+    """Context manager running its block as one transaction on ``db``."""
+    return _manager.transaction(db, immediate)
+
+
+def close_connections(directory=None):
+    """Close shared connections, e.g. before moving or deleting database files."""
+    return _manager.close_all(directory)
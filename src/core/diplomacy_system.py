@@ -1,5 +1,6 @@
 import sqlite3
-from db.utils import db_path
+from src.core.db_utils import shared_connection, transaction
+from src.db.migrations import migrate
 from src.core.match_engine_utils import get_wrestler_id_by_name  # We'll write this next if needed
 import random
 import logging
@@ -21,7 +22,7 @@ class DiplomacySystem:
         """Load all wrestler relationships from the database."""
         logging.info("Loading wrestler relationships from database")
         try:
-            conn = sqlite3.connect(db_path("relationships.db"))
+            conn = shared_connection("relationships.db")
             cursor = conn.cursor()
             
             # Create relationships table if it doesn't exist
@@ -45,6 +46,7 @@ class DiplomacySystem:
                     timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            migrate("relationships.db")
             
             # Load relationships
             cursor.execute("SELECT wrestler1_id, wrestler2_id, relationship_value FROM relationships")
@@ -77,20 +79,13 @@ class DiplomacySystem:
         """Save all wrestler relationships to the database."""
         logging.info("Saving wrestler relationships to database")
         try:
-            conn = sqlite3.connect(db_path("relationships.db"))
-            cursor = conn.cursor()
-            
-            # Insert or update relationships
-            for key, value in self.relationships.items():
-                w1, w2 = self._split_key(key)
-                cursor.execute("""
+            with transaction("relationships.db") as conn:
+                # Insert or update relationships
+                conn.executemany("""
                     INSERT OR REPLACE INTO relationships 
                     (wrestler1_id, wrestler2_id, relationship_value) 
                     VALUES (?, ?, ?)
-                """, (w1, w2, value))
-            
-            conn.commit()
-            conn.close()
+                """, [(*self._split_key(key), value) for key, value in self.relationships.items()])
             
             logging.info(f"Saved {len(self.relationships)} relationships to database")
             return True
@@ -138,15 +133,12 @@ class DiplomacySystem:
         
         # Record event
         try:
-            conn = sqlite3.connect(db_path("relationships.db"))
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO relationship_events 
-                (wrestler1_id, wrestler2_id, event_description, value_change) 
-                VALUES (?, ?, ?, ?)
-            """, (w1, w2, reason, change))
-            conn.commit()
-            conn.close()
+            with transaction("relationships.db") as conn:
+                conn.execute("""
+                    INSERT INTO relationship_events 
+                    (wrestler1_id, wrestler2_id, event_description, value_change) 
+                    VALUES (?, ?, ?, ?)
+                """, (w1, w2, reason, change))
         except Exception as e:
             logging.error(f"Error recording relationship event: {e}")
         
@@ -157,9 +149,14 @@ class DiplomacySystem:
         # Return the new value
         return new_value
 
-    def decay_relationships(self, amount=1, randomized=True):
-        """Decay all relationships by specified amount (simulate time passing)."""
+    def decay_relationships(self, amount=1, randomized=True, rng=random):
+        """Decay all relationships by specified amount (simulate time passing).
+
+        ``rng`` is the random.Random for the randomized decay (default: the
+        global generator).
+        """
         logging.info(f"Decaying all relationships by {amount}")
+        rand, randint = rng.random, rng.randint
         count = 0
         for key in self.relationships:
             current = self.relationships[key]
@@ -172,7 +169,7 @@ class DiplomacySystem:
             decay = amount
             if randomized:
                 # Add some randomness to the decay
-                decay = random.randint(0, amount * 2) if random.random() < 0.3 else 0
+                decay = randint(0, amount * 2) if rand() < 0.3 else 0
             
             # Apply decay
             if current > 0:
@@ -246,7 +243,7 @@ class DiplomacySystem:
 
 def load_relationships_from_db():
     """Load all wrestler relationships from the database."""
-    conn = sqlite3.connect(db_path("wrestlers.db"))
+    conn = shared_connection("wrestlers.db")
     cursor = conn.cursor()
     
     cursor.execute("""
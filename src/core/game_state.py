@@ -19,6 +19,21 @@ def set_game_date(date_string):
     global current_date
     current_date = datetime.strptime(date_string, "%A, %d %B %Y")
 
+def get_game_date_ordinal(date_string=None):
+    """
+    Day number (date.toordinal()) of a game date string, or of the current date.
+
+    Game dates are stored as text ("Sunday, 01 June 2025") that does not sort
+    chronologically; store and order by this number instead. ISO dates are
+    accepted too. Raises ValueError for anything else.
+    """
+    if date_string is None:
+        return current_date.toordinal()
+    try:
+        return datetime.strptime(date_string, "%A, %d %B %Y").toordinal()
+    except ValueError:
+        return datetime.fromisoformat(date_string).toordinal()
+
 def advance_day(days=1):
     """Advance the game date by the specified number of days."""
     global current_date
@@ -38,7 +53,7 @@ def consume_relationships_refresh_flag():
     return result
 
 def save_game_state():
-    """Save the current game state to the database."""
+    """Save the current game state to the database. Returns True on success."""
     try:
         conn = sqlite3.connect(db_path("save_state.db"))
         cursor = conn.cursor()
@@ -56,8 +71,10 @@ def save_game_state():
         conn.close()
         
         print("[SaveState] Game state saved.")
+        return True
     except Exception as e:
         logging.error(f"Error saving game state: {e}")
+        return False
 
 def load_game_state():
     """Load the game state from the database."""
@@ -22,6 +22,7 @@ performance_stats = {
     "promo_generation_time": 0,
     "storyline_updates": 0,
     "diplomacy_adjustments": 0,
+    "match_profile": {},
     "last_reset": datetime.now().isoformat()
 }
 
@@ -43,6 +44,7 @@ def reset_stats():
         "promo_generation_time": 0,
         "storyline_updates": 0,
         "diplomacy_adjustments": 0,
+        "match_profile": {},
         "last_reset": datetime.now().isoformat()
     }
     logging.info("Debug performance statistics reset")
@@ -54,6 +56,39 @@ def track_match_simulation(duration):
     avg_time = performance_stats["match_simulation_time"] / performance_stats["match_simulations"]
     logging.debug(f"Match simulation completed in {duration:.2f}s (avg: {avg_time:.2f}s)")
 
+def track_match_profile(profile):
+    """Merge a match profiler snapshot (see match_profiler.MatchProfiler.to_dict)"""
+    merged = performance_stats.setdefault("match_profile", {})
+    for key in ("matches", "match_time", "db_statements"):
+        merged[key] = merged.get(key, 0) + profile[key]
+    merged["db_statements_per_match"] = (
+        merged["db_statements"] / merged["matches"] if merged["matches"] else 0
+    )
+    sections = merged.setdefault("sections", {})
+    for name, section in profile["sections"].items():
+        totals = sections.setdefault(name, {"calls": 0, "time": 0})
+        totals["calls"] += section["calls"]
+        totals["time"] += section["time"]
+        totals["avg_time"] = totals["time"] / totals["calls"] if totals["calls"] else 0
+    logging.debug(f"Match profile merged: {profile['matches']} match(es), {profile['db_statements']} DB statement(s)")
+
+def export_performance_stats(filename=None):
+    """Export the performance statistics (including the match profile) to JSON"""
+    try:
+        if filename is None:
+            if not os.path.exists('debug'):
+                os.makedirs('debug')
+            filename = f"debug/performance_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+
+        with open(filename, 'w') as f:
+            json.dump(performance_stats, f, indent=2)
+
+        logging.info(f"Performance stats exported to {filename}")
+        return filename
+    except Exception as e:
+        logging.error(f"Error exporting performance stats: {e}")
+        return None
+
 def track_promo_generation(duration):
     """Track a promo generation performance"""
     performance_stats["promo_generations"] += 1
@@ -0,0 +1,108 @@
+"""
+Manoeuvre Catalog
+
+In-memory copy of the ``manoeuvres`` table used by the match engine.
+
+The table is small (~150 rows) and only changes when
+``db/setup_manoeuvres_db.py`` rebuilds it, so it is loaded once per process
+and move selection never touches SQLite during a match. A process that is
+already running keeps its copy after a rebuild until
+``invalidate_manoeuvre_catalog()`` is called. Candidate lists for
+each (min_damage, max_damage, max_difficulty) window are built on first use
+and kept as tuples so a random pick is a single index lookup.
+"""
+
+import logging
+import random
+import sqlite3
+
+
+def progressive_window(turn):
+    """Return the (min_damage, max_damage, max_difficulty) window for a turn."""
+    turn_weight = min(turn / 40, 1.0)
+
+    min_damage = int(3 + (7 * turn_weight))    # 3 → 10
+    max_damage = int(6 + (10 * turn_weight))   # 6 → 16
+    max_difficulty = int(4 + (6 * turn_weight)) # 4 → 10
+
+    min_damage = max(1, min_damage)
+    max_damage = min(16, max_damage)
+    max_difficulty = min(10, max_difficulty)
+
+    return min_damage, max_damage, max_difficulty
+
+
+class ManoeuvreCatalog:
+    """Immutable snapshot of the manoeuvres table with precomputed buckets."""
+
+    def __init__(self, moves):
+        # Each move is a (name, type, damage, difficulty) tuple, the same shape
+        # the old SQL queries returned.
+        self.moves = tuple(tuple(move) for move in moves)
+        self._by_type = {}
+        for move in self.moves:
+            self._by_type.setdefault(move[1], []).append(move)
+        self._by_type = {k: tuple(v) for k, v in self._by_type.items()}
+        self._windows = {}
+
+    @classmethod
+    def from_db(cls, path):
+        """Load every manoeuvre from the database at ``path``."""
+        conn = sqlite3.connect(path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name, type, damage, difficulty FROM manoeuvres ORDER BY id")
+            rows = cursor.fetchall()
+        finally:
+            conn.close()
+        logging.debug(f"Loaded {len(rows)} manoeuvres into catalog")
+        return cls(rows)
+
+    def window_candidates(self, min_damage, max_damage, max_difficulty):
+        """Return the tuple of moves inside a damage/difficulty window."""
+        key = (min_damage, max_damage, max_difficulty)
+        candidates = self._windows.get(key)
+        if candidates is None:
+            candidates = tuple(
+                move for move in self.moves
+                if min_damage <= move[2] <= max_damage and move[3] <= max_difficulty
+            )
+            self._windows[key] = candidates
+        return candidates
+
+    def type_candidates(self, move_type):
+        """Return the tuple of moves of the given type."""
+        return self._by_type.get(move_type, ())
+
+    def pick_for_turn(self, turn, rng=random):
+        """Pick a random move for ``turn``, or None if the window is empty."""
+        candidates = self.window_candidates(*progressive_window(turn))
+        if not candidates:
+            return None
+        return candidates[int(rng.random() * len(candidates))]
+
+    def pick_by_type(self, move_type, rng=random):
+        """Pick a random move of ``move_type``, or None if there are none."""
+        candidates = self._by_type.get(move_type)
+        if not candidates:
+            return None
+        return candidates[int(rng.random() * len(candidates))]
+
+
+_catalog = None
+
+
+def get_manoeuvre_catalog():
+    """Return the process-wide catalog, loading it from manoeuvres.db on first use."""
+    global _catalog
+    if _catalog is None:
+        from db.utils import db_path
+        _catalog = ManoeuvreCatalog.from_db(db_path("manoeuvres.db"))
+    return _catalog
+
+
+def invalidate_manoeuvre_catalog():
+    """Drop the cached catalog so the next lookup reloads manoeuvres.db."""
+    global _catalog
+    _catalog = None
+    logging.info("Manoeuvre catalog invalidated")
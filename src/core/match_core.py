@@ -0,0 +1,573 @@
+"""
+Headless Match Core
+
+Pure-Python match simulation with no UI dependencies. Everything a front end
+needs from a running match is delivered through ``MatchObserver`` hooks:
+
+- ``on_log``: narrative lines (play-by-play, results)
+- ``on_colour``: colour commentary lines
+- ``on_update``: wrestler state, always in (left, right) booking order
+- ``on_stats``: running statistics snapshots
+- ``on_move``: each resolved move or finisher attempt, with the wrestlers'
+  state after it (used by the replay recorder)
+- ``on_tick``: yield point after each significant beat, used by the Qt
+  adapter to pump the event loop
+
+A match run with no observers attached does no UI work at all, which is what
+batch jobs and bulk simulations use. Narrative lines are only formatted when
+something subscribes to ``on_log``; at ``SILENT`` verbosity log and colour
+subscribers are ignored as well.
+"""
+
+import random
+import time
+import logging
+
+from src.core.commentary_store import get_commentary_store
+from src.core.match_profiler import get_active_profiler
+from src.core.match_engine_utils import (
+    get_execution_commentary,
+    calculate_final_quality,
+    select_progressive_manoeuvre,
+    move_success,
+    try_finisher,
+    stalemate_check,
+    get_crowd_reaction,
+    classify_execution_score
+)
+
+# Verbosity levels
+SILENT = 0   # no narrative at all (batch and bulk runs)
+NORMAL = 1   # narrative delivered to subscribed observers
+VERBOSE = 2  # callers also print the move usage report
+
+# Reversal chance modifier by move type
+REVERSAL_TYPE_BONUS = {
+    "strike": -0.05,
+    "slam": 0.00,
+    "grapple": 0.02,
+    "submission": 0.05,
+    "aerial": 0.08
+}
+
+
+class MatchObserver:
+    """Base class for match event subscribers. Override only the hooks you need."""
+
+    def on_log(self, line):
+        pass
+
+    def on_colour(self, line):
+        pass
+
+    def on_update(self, left, right):
+        pass
+
+    def on_stats(self, stats):
+        pass
+
+    def on_move(self, turn, entry, left, right):
+        pass
+
+    def on_tick(self):
+        pass
+
+
+class CallbackObserver(MatchObserver):
+    """Adapts the legacy simulate_match callback arguments to the observer interface."""
+
+    def __init__(self, log_function=None, update_callback=None, colour_callback=None, stats_callback=None):
+        # Only bind the hooks that have a callback so unused events stay unsubscribed
+        if log_function:
+            self.on_log = log_function
+        if update_callback:
+            self.on_update = update_callback
+        if colour_callback:
+            self.on_colour = colour_callback
+        if stats_callback:
+            self.on_stats = stats_callback
+
+
+def _subscribers(observers, hook):
+    """Return the bound hooks of observers that actually handle ``hook``."""
+    handlers = []
+    for observer in observers:
+        handler = getattr(observer, hook)
+        # Skip the no-op defaults inherited from MatchObserver
+        if getattr(handler, "__func__", None) is getattr(MatchObserver, hook):
+            continue
+        handlers.append(handler)
+    return handlers
+
+
+def _dispatch(handlers):
+    """Build a single callable that fans out to ``handlers`` (None if empty)."""
+    if not handlers:
+        return None
+    if len(handlers) == 1:
+        return handlers[0]
+
+    def fan_out(*args):
+        for handler in handlers:
+            handler(*args)
+    return fan_out
+
+
+def reversal_chance(turn, defender_stamina, defender_dexterity, type_bonus):
+    """Chance that a missed move is reversed. Also works on NumPy arrays."""
+    chance = max(0.1, 0.5 - (turn * 0.015))
+    chance -= (1 - (defender_stamina / 100)) * 0.2  # fatigue penalty
+    chance += defender_dexterity / 200
+    chance += type_bonus
+    return chance
+
+
+def maybe_inject_colour_commentary(turn, attacking, defending, colour_callback):
+    # Only inject color commentary every 4th turn for consistency
+    if turn % 4 != 0 or not colour_callback:
+        return
+
+    line = get_commentary_store().line("colour", w1=attacking["name"], w2=defending["name"])
+    if line:
+        colour_callback(line)
+
+
+def prepare_wrestler(wrestler):
+    """Prepare a wrestler for a match by adding match-specific attributes."""
+    prepared = wrestler.copy()
+    prepared["stamina"] = 100
+    prepared["damage_taken"] = 0
+    prepared["momentum"] = False
+    return prepared
+
+
+def run_match(wrestler1, wrestler2, observers=(), verbosity=NORMAL, rng=None):
+    """
+    Simulate a full match between two wrestlers.
+
+    Args:
+        wrestler1: Wrestler booked on the left
+        wrestler2: Wrestler booked on the right
+        observers: Iterable of MatchObserver instances to notify
+        verbosity: SILENT drops log and colour commentary subscribers
+        rng: random.Random driving every gameplay roll (default: the global
+            generator); see src/core/rng_utils.py for seeding
+
+    Returns:
+        Match result dictionary. The move log is included under "move_log"
+        so callers can persist experience or build reports.
+    """
+    start_time = time.time()
+    logging.info("Starting match simulation: %s vs %s", wrestler1["name"], wrestler2["name"])
+
+    if rng is None:
+        rng = random
+    rand = rng.random
+
+    observers = tuple(observers)
+    if verbosity > SILENT:
+        log_function = _dispatch(_subscribers(observers, "on_log"))
+        colour_callback = _dispatch(_subscribers(observers, "on_colour"))
+    else:
+        log_function = colour_callback = None
+    update_callback = _dispatch(_subscribers(observers, "on_update"))
+    stats_callback = _dispatch(_subscribers(observers, "on_stats"))
+    tick = _dispatch(_subscribers(observers, "on_tick"))
+    move_callback = _dispatch(_subscribers(observers, "on_move"))
+
+    # Phase functions, swapped for timed wrappers while a profiler is active
+    select_move, roll_move, resolve_finisher = select_progressive_manoeuvre, move_success, try_finisher
+    render_commentary, inject_colour = get_execution_commentary, maybe_inject_colour_commentary
+    profiler = get_active_profiler()
+    if profiler:
+        select_move = profiler.wrap("move_selection", select_move)
+        roll_move = profiler.wrap("move_success", roll_move)
+        resolve_finisher = profiler.wrap("finisher", resolve_finisher)
+        render_commentary = profiler.wrap("commentary", render_commentary)
+        inject_colour = profiler.wrap("commentary", inject_colour)
+        log_function, colour_callback, update_callback, stats_callback, tick, move_callback = (
+            profiler.wrap("ui_callbacks", callback) for callback in
+            (log_function, colour_callback, update_callback, stats_callback, tick, move_callback)
+        )
+
+    # Set up match state
+    w1, w2 = prepare_wrestler(wrestler1), prepare_wrestler(wrestler2)
+
+    for w in (w1, w2):
+        logging.debug(
+            "Initial wrestler stats - %s: STR=%s, DEX=%s, END=%s",
+            w["name"], w.get("strength", "N/A"), w.get("dexterity", "N/A"), w.get("endurance", "N/A")
+        )
+
+    if update_callback:
+        update_callback(w1, w2)
+
+    if log_function:
+        log_function(f"The bell rings as {w1['name']} and {w2['name']} lock up in the center of the ring!")
+        log_function(f"Both wrestlers looking to establish dominance early.")
+
+    attacking, defending = stalemate_check(wrestler1, wrestler2, rng)
+
+    for wrestler in (wrestler1, wrestler2):
+        wrestler["stamina"] = 100
+        wrestler["damage_taken"] = 0
+        wrestler["momentum"] = False
+
+    crowd_energy = 50 + ((wrestler1.get("entrance_presence", 10) + wrestler2.get("entrance_presence", 10)) // 5)
+    execution_buckets = {
+        "botched": 0,
+        "okay": 0,
+        "great": 0,
+        "fantastic": 0,
+        "perfect": 0
+    }
+    moves_by_phase = {
+        "early": [],
+        "mid": [],
+        "late": [],
+        "all": []
+    }
+    move_log = []  # Track each move's full details by wrestler
+
+    types_used = set()
+    turn = 0
+    winner = None
+    finish_type = None
+    last_reversal_turn = -5
+    match_quality_score = 0
+
+    # Match stats
+    successful_moves = 0
+    reversal_count = 0
+
+    # quality calculator
+    drama_score = 0
+    false_finish_count = 0
+    sig_moves_landed = 0
+    flow_streak = 0
+    had_highlight = False
+
+    # Per-wrestler tracking
+    success_by_wrestler = {wrestler1["name"]: 0, wrestler2["name"]: 0}
+    misses_by_wrestler = {wrestler1["name"]: 0, wrestler2["name"]: 0}
+    reversals_by_wrestler = {wrestler1["name"]: 0, wrestler2["name"]: 0}
+
+    original_left = wrestler1["name"]
+
+    def update_ui(att, def_):
+        if update_callback:
+            if att["name"] == original_left:
+                update_callback(att, def_)
+            else:
+                update_callback(def_, att)
+
+    def stats_snapshot(quality):
+        return {
+            "quality": quality,
+            "reaction": get_crowd_reaction(quality),
+            "hits": success_by_wrestler,
+            "reversals": reversals_by_wrestler,
+            "misses": misses_by_wrestler,
+            "successes": success_by_wrestler,
+            "flow_streak": flow_streak,
+            "drama_score": drama_score,
+            "false_finishes": false_finish_count,
+            "sig_moves_landed": sig_moves_landed,
+            "turns": turn
+        }
+
+    while True:
+        use_signature = (
+            "signature_moves" in attacking and
+            attacking["signature_moves"] and
+            rng.randint(1, 6) == 1
+        )
+
+        turn += 1
+
+        # Handle color commentary with consistent timing
+        inject_colour(turn, attacking, defending, colour_callback)
+
+        if tick:
+            tick()
+
+        if use_signature:
+            sig = rng.choice(attacking["signature_moves"])
+            name, move_type, damage, difficulty = sig["name"], sig["type"], sig["damage"], sig["difficulty"]
+            if log_function:
+                log_function(f"✨ {attacking['name']} goes for their signature move: {name}!")
+        else:
+            name, move_type, damage, difficulty = select_move(turn, rng)
+
+        is_signature = use_signature
+        types_used.add(move_type)
+        success, exec_score, success_chance = roll_move(attacking, move_type, difficulty, rng)
+
+        # Track move usage
+        move_entry = {
+            "wrestler_id": attacking.get("id", None),
+            "move_name": name,
+            "success": success,
+            "move_type": move_type,
+            "category": "signature" if is_signature else "regular",
+            "exec_score": exec_score,
+            "reversed": False,
+            "experience": 0  # Will be populated later
+        }
+        move_log.append(move_entry)
+
+        # Determine match phase
+        if turn <= 10:
+            phase = "early"
+        elif turn <= 30:
+            phase = "mid"
+        else:
+            phase = "late"
+
+        # Log the move used
+        moves_by_phase[phase].append({
+            "type": move_type,
+            "success": success
+        })
+        moves_by_phase["all"].append({
+            "type": move_type,
+            "success": success
+        })
+
+        grade = classify_execution_score(exec_score)
+
+        if success:
+            if log_function:
+                log_function(f"{attacking['name']} successfully uses {name}!")
+
+            if is_signature:
+                attacking["momentum"] = True
+                if log_function:
+                    log_function(f"✅ {attacking['name']} lands their signature!")
+
+            # count successful moves
+            successful_moves += 1
+            success_by_wrestler[attacking["name"]] += 1
+            match_quality_score += int(exec_score * 10)
+
+            # calculate execution score
+            execution_buckets[grade] += 1
+
+            # Signature drama bonus
+            if is_signature:
+                sig_moves_landed += 1
+                if turn > 10:
+                    drama_score += 2
+                else:
+                    drama_score += 1
+
+            # Comeback tracking
+            if grade in ("great", "fantastic", "perfect"):
+                flow_streak += 1
+                if flow_streak == 3:
+                    drama_score += 2
+            else:
+                flow_streak = 0
+
+            # Track highlight-worthy moment
+            if exec_score >= 0.95:
+                had_highlight = True
+
+            # Stamina drain
+            base_drain = max(1, 6 - int(attacking["endurance"] / 2))
+            extra_drain = 0
+            if exec_score < 0.3:
+                extra_drain = 3  # extra drain for botched
+            elif exec_score < 0.6:
+                extra_drain = 1  # mild penalty for okay
+            attacking["stamina"] = max(0, attacking["stamina"] - (base_drain + extra_drain))
+
+            # damage calculation
+            defending["damage_taken"] += damage
+
+            # Crowd energy adjustment
+            # -- Crowd energy from execution quality
+            if grade == "botched":
+                confidence = attacking.get("confidence", 10)
+                soften = max(0, (confidence - 10) // 5)  # Up to -1 penalty reduction
+                crowd_energy -= (2 - soften)
+            elif grade == "perfect":
+                crowd_energy += 3
+            elif grade == "fantastic":
+                crowd_energy += 2
+            elif grade == "great":
+                crowd_energy += 1
+
+            # -- Signature move late in match
+            if is_signature and turn > 10:
+                fan_engage = attacking.get("fan_engagement", 10)
+                charisma = attacking.get("charisma", 10)
+                crowd_energy += (fan_engage + charisma) // 30
+
+            # -- Comeback streak pop
+            if flow_streak == 3:
+                under_fire = attacking.get("presence_under_fire", 10)
+                if under_fire >= 15:
+                    crowd_energy += 1
+            # -- Stat-based passive buffs
+            if attacking.get("fan_engagement", 10) >= 15:
+                crowd_energy += 1
+            if attacking.get("charisma", 10) >= 15:
+                crowd_energy += 1
+            if attacking.get("confidence", 10) >= 15:
+                crowd_energy += 1
+
+            # -- Stat-based passive debuffs
+            if attacking.get("fan_engagement", 10) < 8:
+                crowd_energy -= 1
+            if attacking.get("charisma", 10) < 8:
+                crowd_energy -= 1
+            if grade == "botched" and attacking.get("confidence", 10) < 8:
+                crowd_energy -= 1
+
+            # Clamp to 0–100
+            crowd_energy = max(0, min(100, crowd_energy))
+
+            if log_function:
+                commentary = render_commentary(grade, attacking["name"], name)
+                if commentary:
+                    log_function(commentary)
+
+            update_ui(attacking, defending)
+
+            if stats_callback:
+                stats_callback(stats_snapshot(match_quality_score))
+
+            if tick:
+                tick()
+        else:
+            # Reversal check
+            chance = reversal_chance(
+                turn, defending["stamina"], defending["dexterity"], REVERSAL_TYPE_BONUS.get(move_type, 0)
+            )
+
+            if turn - last_reversal_turn >= 3 and rand() < chance:
+                if log_function:
+                    log_function(f"{defending['name']} reverses the {name}!")
+
+                reversal_count += 1
+                reversals_by_wrestler[defending["name"]] += 1
+                move_entry["reversed"] = True
+                attacking, defending = defending, attacking
+                last_reversal_turn = turn
+                update_ui(attacking, defending)
+                if stats_callback:
+                    stats_callback(stats_snapshot(match_quality_score))
+
+                if tick:
+                    tick()
+
+        if move_callback:
+            move_callback(turn, move_entry, wrestler1, wrestler2)
+
+        # Pinfall attempt check
+        if defending["damage_taken"] >= 30 + turn // 3:
+            if "finisher" in attacking and attacking["stamina"] > 30 and rand() < 0.3:
+                # Track finisher attempt
+                finisher_entry = {
+                    "wrestler_id": attacking.get("id", None),
+                    "move_name": attacking["finisher"]["name"],
+                    "move_type": attacking["finisher"]["style"],
+                    "category": "finisher",
+                    "success": False,  # Will be updated based on result
+                    "experience": 0  # Will be populated later
+                }
+
+                # Try finisher
+                fin_success, fin_winner, fin_type, was_escape = resolve_finisher(
+                    attacking, defending, turn, log_function, update_ui if update_callback else None, rng
+                )
+
+                # Update the success flag and add to move log
+                if fin_success:
+                    finisher_entry["success"] = True
+                    winner, finish_type = fin_winner["name"], fin_type
+                    if log_function:
+                        log_function(f"🏆 {winner} wins by {finish_type}!")
+                    move_log.append(finisher_entry)
+                    if move_callback:
+                        move_callback(turn, finisher_entry, wrestler1, wrestler2)
+                    break
+                else:
+                    if was_escape:
+                        false_finish_count += 1
+                        drama_score += 3
+                    # Add to move log even if unsuccessful
+                    move_log.append(finisher_entry)
+                    if move_callback:
+                        move_callback(turn, finisher_entry, wrestler1, wrestler2)
+            elif turn > 40 and rand() < 0.1:
+                # Exhaustion finish (late match)
+                update_ui(attacking, defending)
+
+                if log_function:
+                    log_function(f"{attacking['name']} goes for a pinfall with a small package!")
+                    log_function(f"🏆 {attacking['name']} gets the pinfall victory!")
+                winner, finish_type = attacking["name"], "pinfall"
+                break
+
+    # Final bookkeeping and stats
+    match_time = time.time() - start_time
+    if profiler:
+        profiler.record_match(match_time)
+    logging.info("Match %s vs %s completed in %.2fs", wrestler1["name"], wrestler2["name"], match_time)
+    logging.info("Winner: %s via %s", winner, finish_type)
+
+    flow_streak_at_end = min(flow_streak, 3)  # Cap for purposes of final score
+
+    w1_charisma = w1.get("charisma", 10)
+    w2_charisma = w2.get("charisma", 10)
+    winner_charisma = w1_charisma if winner == w1["name"] else w2_charisma
+
+    quality = calculate_final_quality(
+        match_quality_score,
+        types_used,
+        winner_charisma,
+        execution_buckets,
+        drama_score,
+        crowd_energy,
+        flow_streak_at_end,
+        had_highlight,
+        rng
+    )
+
+    if log_function:
+        if quality >= 90:
+            log_function(f"🌟 What a match! The crowd is going wild! ({quality})")
+        elif quality >= 75:
+            log_function(f"👏 That was a great match! The crowd loved it. ({quality})")
+        elif quality >= 60:
+            log_function(f"👌 A solid match. The crowd is satisfied. ({quality})")
+        elif quality >= 45:
+            log_function(f"😐 A decent but unremarkable match. ({quality})")
+        else:
+            log_function(f"😴 That match didn't connect with the crowd. ({quality})")
+
+    if stats_callback:
+        stats_callback(stats_snapshot(quality))
+
+    return {
+        "winner": winner,
+        "win_type": finish_type,
+        "finish_type": finish_type,  # Alias used by the bulk/fast simulation callers
+        "quality": quality,
+        "drama_score": drama_score,
+        "false_finishes": false_finish_count,
+        "sig_moves_landed": sig_moves_landed,
+        "turns": turn,
+        "crowd_energy": crowd_energy,
+        "execution_summary": execution_buckets,
+        "stamina_drain": {
+            w1["name"]: 100 - w1["stamina"],
+            w2["name"]: 100 - w2["stamina"]
+        },
+        "match_time": match_time,
+        "reversals": reversals_by_wrestler,
+        "move_log": move_log,
+        "moves_by_phase": moves_by_phase
+    }
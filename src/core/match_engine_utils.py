@@ -1,46 +1,22 @@
 import random
 import sqlite3
 
+from src.core.manoeuvre_catalog import get_manoeuvre_catalog
+from src.core.move_experience import update_wrestler_move_experience
+
 
 # --------------------------
 # Select a manoeuvre based on match progression
 # --------------------------
-def select_progressive_manoeuvre(turn):
-    from db.utils import db_path
-
-    turn_weight = min(turn / 40, 1.0)
-
-    min_damage = int(3 + (7 * turn_weight))    # 3 → 10
-    max_damage = int(6 + (10 * turn_weight))   # 6 → 16
-    max_difficulty = int(4 + (6 * turn_weight)) # 4 → 10
-
-    min_damage = max(1, min_damage)
-    max_damage = min(16, max_damage)
-    max_difficulty = min(10, max_difficulty)
-
-    conn = sqlite3.connect(db_path("manoeuvres.db"))
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT name, type, damage, difficulty
-        FROM manoeuvres
-        WHERE damage BETWEEN ? AND ?
-        AND difficulty <= ?
-        ORDER BY RANDOM()
-        LIMIT 1
-    """, (min_damage, max_damage, max_difficulty))
-    move = cursor.fetchone()
-    conn.close()
-
-    return move  # (name, type, damage, difficulty)
+def select_progressive_manoeuvre(turn, rng=random):
+    # Served from the in-memory catalog; see src/core/manoeuvre_catalog.py
+    return get_manoeuvre_catalog().pick_for_turn(turn, rng)  # (name, type, damage, difficulty)
 
 
 # --------------------------
 # Select a manoeuvre based on wrestler attributes
 # --------------------------
-def select_weighted_manoeuvre(wrestler, turn):
-    import random
-    from db.utils import db_path
-
+def select_weighted_manoeuvre(wrestler, turn, rng=random):
     # Base weights for manoeuvre types
     base_weights = {
         "strike": 1.0,
@@ -70,27 +46,14 @@ def select_weighted_manoeuvre(wrestler, turn):
     normalized_weights = {k: v / total_weight for k, v in base_weights.items()}
 
     # Select manoeuvre type based on weights
-    manoeuvre_type = random.choices(
+    manoeuvre_type = rng.choices(
         population=list(normalized_weights.keys()),
         weights=list(normalized_weights.values()),
         k=1
     )[0]
 
-    # Query manoeuvres database for a move of the selected type
-    conn = sqlite3.connect(db_path("manoeuvres.db"))
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT name, type, damage, difficulty
-        FROM manoeuvres
-        WHERE type = ?
-        ORDER BY RANDOM()
-        LIMIT 1
-        """,
-        (manoeuvre_type,)
-    )
-    move = cursor.fetchone()
-    conn.close()
+    # Pick a move of the selected type from the manoeuvre catalog
+    move = get_manoeuvre_catalog().pick_by_type(manoeuvre_type, rng)
 
     return move  # (name, type, damage, difficulty)
 
@@ -98,8 +61,7 @@ def select_weighted_manoeuvre(wrestler, turn):
 # --------------------------
 # Select a manoeuvre based on wrestler attributes and match phase
 # --------------------------
-def select_weighted_manoeuvre_with_personality(wrestler, opponent, turn):
-    import random
+def select_weighted_manoeuvre_with_personality(wrestler, opponent, turn, rng=random):
     from db.utils import db_path
 
     # Determine match phase
@@ -165,7 +127,7 @@ def select_weighted_manoeuvre_with_personality(wrestler, opponent, turn):
     total_weight = sum(base_weights.values())
     normalized_weights = {k: v / total_weight for k, v in base_weights.items()}
 
-    manoeuvre_type = random.choices(
+    manoeuvre_type = rng.choices(
         population=list(normalized_weights.keys()),
         weights=list(normalized_weights.values()),
         k=1
@@ -190,27 +152,16 @@ def select_weighted_manoeuvre_with_personality(wrestler, opponent, turn):
     normalized_weights = {k: v / total_weight for k, v in base_weights.items()}
 
     # Select manoeuvre type based on weights
-    manoeuvre_type = random.choices(
+    manoeuvre_type = rng.choices(
         population=list(normalized_weights.keys()),
         weights=list(normalized_weights.values()),
         k=1
     )[0]
 
-    # Query manoeuvres database for a move of the selected type
-    try:
-        cursor.execute(
-            """
-            SELECT name, type, damage, difficulty
-            FROM manoeuvres
-            WHERE type = ?
-            ORDER BY RANDOM()
-            LIMIT 1
-            """,
-            (manoeuvre_type,)
-        )
-        move = cursor.fetchone()
-    finally:
-        conn.close()
+    conn.close()
+
+    # Pick a move of the selected type from the manoeuvre catalog
+    move = get_manoeuvre_catalog().pick_by_type(manoeuvre_type, rng)
 
     return move  # (name, type, damage, difficulty)
 
@@ -218,7 +169,7 @@ def select_weighted_manoeuvre_with_personality(wrestler, opponent, turn):
 # --------------------------
 # Determine if a move succeeds
 # --------------------------
-def move_success(wrestler, move_type, difficulty):
+def move_success_chance(wrestler, move_type, difficulty):
     if move_type == "strike":
         skill = (wrestler["strength"] + wrestler["dexterity"]) / 2
     elif move_type == "slam":
@@ -237,9 +188,13 @@ def move_success(wrestler, move_type, difficulty):
     success_chance = 0.3 + (normalized_skill * 0.6) - (difficulty * 0.03)
 
     # Cap between 5% and 95%
-    success_chance = max(0.05, min(success_chance, 0.95))
-    
-    roll = random.random()
+    return max(0.05, min(success_chance, 0.95))
+
+
+def move_success(wrestler, move_type, difficulty, rng=random):
+    success_chance = move_success_chance(wrestler, move_type, difficulty)
+
+    roll = rng.random()
     result = roll < success_chance
 
     # Calculate how well the move was executed
@@ -247,7 +202,7 @@ def move_success(wrestler, move_type, difficulty):
     execution_score = max(0.0, min(execution_score, 1.0))
 
 
-    result = random.random() < success_chance
+    result = rng.random() < success_chance
     # print(f"Move success: {result} (chance: {success_chance:.2f} | skill: {skill:.1f} | difficulty: {difficulty})")
     return result, execution_score, success_chance
 
@@ -255,7 +210,7 @@ def move_success(wrestler, move_type, difficulty):
 # --------------------------
 # Finisher logic
 # --------------------------
-def try_finisher(attacker, defender, turn, log_function, update_callback=None):
+def try_finisher(attacker, defender, turn, log_function=None, update_callback=None, rng=random):
     base_chance = 0.05 + (turn * 0.015)
     momentum_bonus = 0.15 if attacker.get("momentum") else 0
     desperation_bonus = 0.1 if attacker["stamina"] < 30 else 0
@@ -274,18 +229,21 @@ def try_finisher(attacker, defender, turn, log_function, update_callback=None):
         "experience": 0  # Will be populated later
     }
 
-    if random.random() >= final_chance:
+    if rng.random() >= final_chance:
         return False, None, None, False
 
-    log_function(f"🔥 {attacker['name']} attempts their finisher: {finisher['name']}!")
+    if log_function:
+        log_function(f"🔥 {attacker['name']} attempts their finisher: {finisher['name']}!")
 
     if finisher["style"] == "submission":
-        if try_submission(attacker, defender, finisher["damage"]):
-            log_function(f"💢 {defender['name']} taps out to the {finisher['name']}!")
+        if try_submission(attacker, defender, finisher["damage"], rng):
+            if log_function:
+                log_function(f"💢 {defender['name']} taps out to the {finisher['name']}!")
             finisher_entry["success"] = True
             return True, attacker, "submission", False
         else:
-            log_function(f"{defender['name']} escapes the {finisher['name']}!")
+            if log_function:
+                log_function(f"{defender['name']} escapes the {finisher['name']}!")
             attacker["momentum"] = False
             if update_callback:
                 update_callback(attacker, defender)
@@ -295,17 +253,19 @@ def try_finisher(attacker, defender, turn, log_function, update_callback=None):
             defender["endurance"] +
             defender["stamina"] -
             defender["damage_taken"] +
-            random.uniform(0, 20)
+            rng.uniform(0, 20)
         )
         if attacker.get("momentum"):
             resistance -= 5
 
         if resistance < 25:
-            log_function(f"💥 {attacker['name']} lands the {finisher['name']}! That's it!")
+            if log_function:
+                log_function(f"💥 {attacker['name']} lands the {finisher['name']}! That's it!")
             finisher_entry["success"] = True
             return True, attacker, "pinfall", False
         else:
-            log_function(f"{attacker['name']} can't hit the {finisher['name']}!")
+            if log_function:
+                log_function(f"{attacker['name']} can't hit the {finisher['name']}!")
             attacker["momentum"] = False
             if update_callback:
                 update_callback(attacker, defender)
@@ -315,12 +275,12 @@ def try_finisher(attacker, defender, turn, log_function, update_callback=None):
 # --------------------------
 # Submission helper
 # --------------------------
-def try_submission(attacker, defender, difficulty):
+def try_submission(attacker, defender, difficulty, rng=random):
     if "submission_escapes" not in defender:
         defender["submission_escapes"] = 0
 
-    attacker_score = attacker["intelligence"] + random.uniform(0, 5)
-    defender_score = defender["endurance"] + random.uniform(0, 5)
+    attacker_score = attacker["intelligence"] + rng.uniform(0, 5)
+    defender_score = defender["endurance"] + rng.uniform(0, 5)
     defender_score -= defender["submission_escapes"] * 0.5
 
     threshold = difficulty + 2
@@ -337,8 +297,8 @@ def try_submission(attacker, defender, difficulty):
 # --------------------------
 # Choose starting attacker/defender
 # --------------------------
-def stalemate_check(wrestler1, wrestler2):
-    return (wrestler1, wrestler2) if random.random() < 0.5 else (wrestler2, wrestler1)
+def stalemate_check(wrestler1, wrestler2, rng=random):
+    return (wrestler1, wrestler2) if rng.random() < 0.5 else (wrestler2, wrestler1)
 
 
 # --------------------------
@@ -356,7 +316,7 @@ def get_crowd_reaction(quality):
     else:
         return "💤 Dead Crowd"
 
-def attempt_finisher(attacker, defender, log_function):
+def attempt_finisher(attacker, defender, log_function, rng=random):
     finisher = attacker["finisher"]
     style = finisher["style"]
     name = finisher["name"]
@@ -365,7 +325,7 @@ def attempt_finisher(attacker, defender, log_function):
     log_function(f"🔥 {attacker['name']} attempts their finisher: {name} ({style})!")
 
     if style == "submission":
-        if try_submission(attacker, defender, damage):
+        if try_submission(attacker, defender, damage, rng):
             log_function(f"💢 {defender['name']} taps out to the {name}!")
             return attacker, "submission"
         else:
@@ -374,7 +334,7 @@ def attempt_finisher(attacker, defender, log_function):
 
     # Otherwise: pinfall-style finisher
     resistance = defender["endurance"] + defender["stamina"] - defender["damage_taken"]
-    resistance_roll = random.uniform(0, 20)
+    resistance_roll = rng.uniform(0, 20)
 
     if resistance + resistance_roll < 25:
         log_function(f"💥 {attacker['name']} lands the {name}! That's it!")
@@ -405,80 +365,82 @@ def calculate_match_quality(score_sum, types_used, turns, charisma):
     )
 
 
+# Commentary draws from its own generator so rendering (or skipping) narrative
+# never shifts the random stream that decides the match
+_commentary_random = random.Random()
+
+# Execution commentary templates by grade, formatted with wrestler_name and move_name
+EXECUTION_COMMENTARY = {
+    "botched": (
+        "{wrestler_name} completely botched the {move_name}.",
+        "That {move_name} did not go to plan.",
+        "{wrestler_name} fumbled the {move_name} — sloppy stuff.",
+        "{move_name}? That was a mess from the start.",
+        "{wrestler_name} was way off on the timing of that {move_name}.",
+        "The crowd winced — that {move_name} was ugly.",
+        "That didn't look good. {wrestler_name} blew the {move_name}.",
+        "Bad execution on the {move_name}. {wrestler_name} will want that one back.",
+        "That {move_name} came apart in mid-air.",
+        "{wrestler_name} completely lost control of the {move_name}.",
+    ),
+    "okay": (
+        "{wrestler_name} landed the {move_name}, but it lacked impact.",
+        "A serviceable {move_name}, nothing special.",
+        "{wrestler_name} made it work, just about.",
+        "The {move_name} connected, but it wasn't smooth.",
+        "An acceptable effort from {wrestler_name} on that {move_name}.",
+        "The {move_name} gets the job done, if a little flat.",
+        "{wrestler_name} didn't miss, but it was far from crisp.",
+        "The {move_name} could have used more snap.",
+        "A decent attempt, but {wrestler_name} has done better.",
+        "{wrestler_name} didn't sell the {move_name} with much conviction.",
+    ),
+    "great": (
+        "Good connection from {wrestler_name} with that {move_name}.",
+        "{wrestler_name} delivered the {move_name} with authority.",
+        "That {move_name} landed cleanly and looked strong.",
+        "Solid execution from {wrestler_name} — the {move_name} hit its mark.",
+        "That {move_name} had weight behind it.",
+        "{wrestler_name} found the timing for that {move_name} perfectly.",
+        "Clean technique on that {move_name}.",
+        "The {move_name} was sharp, and the crowd reacted.",
+        "{wrestler_name} brought the goods on that {move_name}.",
+        "The {move_name} had just the right amount of impact.",
+    ),
+    "fantastic": (
+        "{wrestler_name} made the {move_name} look easy.",
+        "That was an impressive piece of execution from {wrestler_name}.",
+        "Strong delivery — the {move_name} really connected.",
+        "The crowd came alive after that {move_name}.",
+        "{wrestler_name} delivered a picture-perfect {move_name}.",
+        "That's a move they'll be talking about after the show.",
+        "{wrestler_name} hit that {move_name} with confidence and precision.",
+        "That {move_name} was something special.",
+        "{wrestler_name} looked completely in control with that {move_name}.",
+        "That {move_name} shifted the energy in the building.",
+    ),
+    "perfect": (
+        "{wrestler_name} just hit the cleanest {move_name} of the night.",
+        "Flawless execution on that {move_name}.",
+        "That {move_name} couldn't have been timed better.",
+        "That's how you deliver a {move_name} — perfect form.",
+        "{wrestler_name} made the {move_name} look effortless.",
+        "The technique on that {move_name} was textbook.",
+        "{wrestler_name} couldn't have done that any better.",
+        "That {move_name} belongs in a highlight reel.",
+        "You won't see a smoother {move_name} than that.",
+        "That was world-class execution from {wrestler_name}.",
+    )
+}
+
+
 def get_execution_commentary(grade, wrestler_name, move_name):
-    # Remove random skip chance to make commentary more consistent
-    lines = {
-        "botched": [
-            f"{wrestler_name} completely botched the {move_name}.",
-            f"That {move_name} did not go to plan.",
-            f"{wrestler_name} fumbled the {move_name} — sloppy stuff.",
-            f"{move_name}? That was a mess from the start.",
-            f"{wrestler_name} was way off on the timing of that {move_name}.",
-            f"The crowd winced — that {move_name} was ugly.",
-            f"That didn't look good. {wrestler_name} blew the {move_name}.",
-            f"Bad execution on the {move_name}. {wrestler_name} will want that one back.",
-            f"That {move_name} came apart in mid-air.",
-            f"{wrestler_name} completely lost control of the {move_name}.",
-        ],
-        "okay": [
-            f"{wrestler_name} landed the {move_name}, but it lacked impact.",
-            f"A serviceable {move_name}, nothing special.",
-            f"{wrestler_name} made it work, just about.",
-            f"The {move_name} connected, but it wasn't smooth.",
-            f"An acceptable effort from {wrestler_name} on that {move_name}.",
-            f"The {move_name} gets the job done, if a little flat.",
-            f"{wrestler_name} didn't miss, but it was far from crisp.",
-            f"The {move_name} could have used more snap.",
-            f"A decent attempt, but {wrestler_name} has done better.",
-            f"{wrestler_name} didn't sell the {move_name} with much conviction.",
-        ],
-        "great": [
-            f"Good connection from {wrestler_name} with that {move_name}.",
-            f"{wrestler_name} delivered the {move_name} with authority.",
-            f"That {move_name} landed cleanly and looked strong.",
-            f"Solid execution from {wrestler_name} — the {move_name} hit its mark.",
-            f"That {move_name} had weight behind it.",
-            f"{wrestler_name} found the timing for that {move_name} perfectly.",
-            f"Clean technique on that {move_name}.",
-            f"The {move_name} was sharp, and the crowd reacted.",
-            f"{wrestler_name} brought the goods on that {move_name}.",
-            f"The {move_name} had just the right amount of impact.",
-        ],
-        "fantastic": [
-            f"{wrestler_name} made the {move_name} look easy.",
-            f"That was an impressive piece of execution from {wrestler_name}.",
-            f"Strong delivery — the {move_name} really connected.",
-            f"The crowd came alive after that {move_name}.",
-            f"{wrestler_name} delivered a picture-perfect {move_name}.",
-            f"That's a move they'll be talking about after the show.",
-            f"{wrestler_name} hit that {move_name} with confidence and precision.",
-            f"That {move_name} was something special.",
-            f"{wrestler_name} looked completely in control with that {move_name}.",
-            f"That {move_name} shifted the energy in the building.",
-        ],
-        "perfect": [
-            f"{wrestler_name} just hit the cleanest {move_name} of the night.",
-            f"Flawless execution on that {move_name}.",
-            f"That {move_name} couldn't have been timed better.",
-            f"That's how you deliver a {move_name} — perfect form.",
-            f"{wrestler_name} made the {move_name} look effortless.",
-            f"The technique on that {move_name} was textbook.",
-            f"{wrestler_name} couldn't have done that any better.",
-            f"That {move_name} belongs in a highlight reel.",
-            f"You won't see a smoother {move_name} than that.",
-            f"That was world-class execution from {wrestler_name}.",
-        ]
-    }
-    
-    options = lines.get(grade, [])
+    options = EXECUTION_COMMENTARY.get(grade)
     if not options:
         return None
 
-    return random.choice(options)
-
-import random
+    return _commentary_random.choice(options).format(wrestler_name=wrestler_name, move_name=move_name)
 
-import random
 
 def calculate_final_quality(
     match_quality_score,
@@ -488,13 +450,14 @@ def calculate_final_quality(
     drama_score=0,
     crowd_energy=50,
     flow_streak_at_end=0,
-    had_highlight=False
+    had_highlight=False,
+    rng=random
 ):
     # --- Base components
     base = match_quality_score * 0.6
     variety_bonus = len(types_used) * 3
     charisma_bonus = winner_charisma * 0.6
-    crowd_bias = random.randint(-5, 5)
+    crowd_bias = rng.randint(-5, 5)
     botch_penalty = -5 if execution_buckets.get("botched", 0) >= 3 else 0
 
     # --- Diminishing drama returns
@@ -531,7 +494,7 @@ def calculate_final_quality(
     )
 
     # 1 in 1000 chance of legendary moment
-    if random.random() < 0.001 and quality >= 95:
+    if rng.random() < 0.001 and quality >= 95:
         quality += 4
     
     if quality >= 99:
@@ -602,31 +565,6 @@ def update_manoeuvre_stats(manoeuvre_type, success):
     conn.commit()
     conn.close()
 
-def update_wrestler_move_experience(wrestler_id, move_name, success):
-    from db.utils import db_path
-    conn = sqlite3.connect(db_path("manoeuvres.db"))
-    cursor = conn.cursor()
-
-    # Make sure the row exists
-    cursor.execute("""
-        INSERT OR IGNORE INTO wrestler_move_experience (wrestler_id, move_name)
-        VALUES (?, ?)
-    """, (wrestler_id, move_name))
-
-    # Update the experience tracking
-    cursor.execute("""
-        UPDATE wrestler_move_experience
-        SET 
-            attempt_count = attempt_count + 1,
-            success_count = success_count + ?,
-            experience_score = experience_score + ?
-        WHERE wrestler_id = ? AND move_name = ?
-    """, (1 if success else 0, 1 if success else 0, wrestler_id, move_name))
-
-    conn.commit()
-    conn.close()
-
-
 def get_wrestler_id_by_name(name):
     from db.utils import db_path
     conn = sqlite3.connect(db_path("wrestlers.db"))
@@ -0,0 +1,373 @@
+"""
+Vectorized Match Estimator
+
+Monte Carlo estimates of a single pairing for card planning. Instead of
+calling ``simulate_match_fast`` thousands of times, N independent matches of
+the same two wrestlers run in lockstep as NumPy arrays, one lane per match.
+
+Each lane follows the rules of ``run_match`` in match_core: the move success
+roll (``move_success_chance``), the reversal chance (``reversal_chance``), the
+finisher and submission checks of ``try_finisher``/``try_submission``, the
+crowd energy adjustments and ``calculate_final_quality``. Every running match
+is on the same turn, so the progressive move window is shared by all lanes and
+a lane simply drops out once its match ends. No narrative, move log or move
+experience is produced.
+
+Results agree with the scalar engine statistically, not draw for draw;
+``tests/test_match_estimator.py`` checks the agreement.
+"""
+
+import logging
+
+import numpy as np
+
+from src.core.manoeuvre_catalog import get_manoeuvre_catalog, progressive_window
+from src.core.match_core import REVERSAL_TYPE_BONUS, reversal_chance
+from src.core.match_engine_utils import move_success_chance
+
+MOVE_TYPES = ("strike", "slam", "grapple", "aerial", "submission")
+
+# Execution grades in classify_execution_score order
+GRADES = ("botched", "okay", "great", "fantastic", "perfect")
+GRADE_THRESHOLDS = np.array([0.2, 0.5, 0.7, 0.9])
+BOTCHED, OKAY, GREAT, FANTASTIC, PERFECT = range(len(GRADES))
+
+FINISH_TYPES = ("pinfall", "submission")
+
+# Safety cap: lanes still running after this many turns are reported as unfinished
+MAX_TURNS = 1000
+
+
+class _Side:
+    """Per-wrestler constants, stacked into arrays indexed by side (0 = left, 1 = right)."""
+
+    def __init__(self, wrestler1, wrestler2, type_id):
+        sides = (wrestler1, wrestler2)
+        self.dexterity = np.array([w["dexterity"] for w in sides], dtype=float)
+        self.intelligence = np.array([w["intelligence"] for w in sides], dtype=float)
+        self.endurance = np.array([w["endurance"] for w in sides], dtype=float)
+        self.charisma = np.array([w.get("charisma", 10) for w in sides], dtype=float)
+        self.base_drain = np.array([max(1, 6 - int(w["endurance"] / 2)) for w in sides])
+
+        self.has_finisher = np.array(["finisher" in w for w in sides])
+        self.finisher_submission = np.array([
+            "finisher" in w and w["finisher"]["style"] == "submission" for w in sides
+        ])
+        self.finisher_damage = np.array([w["finisher"]["damage"] if "finisher" in w else 0 for w in sides])
+
+        # Crowd energy deltas from the attacker's stats, indexed [side, grade]
+        self.grade_crowd = np.zeros((2, len(GRADES)), dtype=np.int64)
+        self.passive_crowd = np.zeros(2, dtype=np.int64)
+        self.signature_crowd = np.zeros(2, dtype=np.int64)
+        self.streak_crowd = np.zeros(2, dtype=np.int64)
+        for side, w in enumerate(sides):
+            confidence = w.get("confidence", 10)
+            fan_engagement = w.get("fan_engagement", 10)
+            charisma = w.get("charisma", 10)
+            soften = max(0, (confidence - 10) // 5)
+            self.grade_crowd[side] = (-(2 - soften) - (confidence < 8), 0, 1, 2, 3)
+            self.passive_crowd[side] = (
+                (fan_engagement >= 15) + (charisma >= 15) + (confidence >= 15)
+                - (fan_engagement < 8) - (charisma < 8)
+            )
+            self.signature_crowd[side] = (fan_engagement + charisma) // 30
+            self.streak_crowd[side] = 1 if w.get("presence_under_fire", 10) >= 15 else 0
+
+        # Signature moves, padded to the longer list
+        sigs = [w.get("signature_moves") or [] for w in sides]
+        width = max(1, max(len(s) for s in sigs))
+        self.sig_count = np.array([len(s) for s in sigs])
+        self.sig_chance = np.full((2, width), 0.05)
+        self.sig_damage = np.zeros((2, width), dtype=np.int64)
+        self.sig_type_bit = np.zeros((2, width), dtype=np.int64)
+        self.sig_type_bonus = np.zeros((2, width))
+        for side, moves in enumerate(sigs):
+            for i, sig in enumerate(moves):
+                self.sig_chance[side, i] = move_success_chance(sides[side], sig["type"], sig["difficulty"])
+                self.sig_damage[side, i] = sig["damage"]
+                self.sig_type_bit[side, i] = 1 << type_id(sig["type"])
+                self.sig_type_bonus[side, i] = REVERSAL_TYPE_BONUS.get(sig["type"], 0)
+
+
+def _window_arrays(catalog, window, sides, type_id, cache):
+    """Per-window move arrays: success chance per side, damage, type bit, reversal bonus."""
+    arrays = cache.get(window)
+    if arrays is None:
+        moves = catalog.window_candidates(*window)
+        arrays = (
+            np.array([[move_success_chance(w, m[1], m[3]) for m in moves] for w in sides]),
+            np.array([m[2] for m in moves], dtype=np.int64),
+            np.array([1 << type_id(m[1]) for m in moves], dtype=np.int64),
+            np.array([REVERSAL_TYPE_BONUS.get(m[1], 0) for m in moves], dtype=float)
+        )
+        cache[window] = arrays
+    return arrays
+
+
+def estimate_matchup(wrestler1, wrestler2, simulations=10000, seed=None, catalog=None, max_turns=MAX_TURNS):
+    """
+    Estimate the outcome distribution of one pairing.
+
+    Args:
+        wrestler1: Wrestler booked on the left (as returned by load_wrestler_by_id)
+        wrestler2: Wrestler booked on the right
+        simulations: Number of matches to run
+        seed: Seed or numpy Generator for reproducible estimates
+        catalog: ManoeuvreCatalog to draw moves from (default: the process-wide one)
+        max_turns: Turn cap after which running matches count as unfinished
+
+    Returns:
+        Dictionary with win counts and rates (in booking order), finish type,
+        quality and turn distributions.
+    """
+    rng = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+    catalog = catalog or get_manoeuvre_catalog()
+    n = simulations
+
+    type_ids = {move_type: i for i, move_type in enumerate(MOVE_TYPES)}
+
+    def type_id(move_type):
+        return type_ids.setdefault(move_type, len(type_ids))
+
+    sides = (wrestler1, wrestler2)
+    side = _Side(wrestler1, wrestler2, type_id)
+    windows = {}
+
+    # Match state, one row per lane; per-wrestler state is indexed [lane, side]
+    attacker = np.where(rng.random(n) < 0.5, 0, 1)  # stalemate_check
+    stamina = np.full((n, 2), 100, dtype=np.int64)
+    damage_taken = np.zeros((n, 2), dtype=np.int64)
+    momentum = np.zeros((n, 2), dtype=bool)
+    submission_escapes = np.zeros((n, 2), dtype=np.int64)
+    reversals = np.zeros((n, 2), dtype=np.int64)
+
+    crowd_energy = np.full(n, 50 + (wrestler1.get("entrance_presence", 10) + wrestler2.get("entrance_presence", 10)) // 5)
+    execution_buckets = np.zeros((n, len(GRADES)), dtype=np.int64)
+    types_used = np.zeros(n, dtype=np.int64)
+    match_quality_score = np.zeros(n, dtype=np.int64)
+    drama_score = np.zeros(n, dtype=np.int64)
+    false_finishes = np.zeros(n, dtype=np.int64)
+    sig_moves_landed = np.zeros(n, dtype=np.int64)
+    flow_streak = np.zeros(n, dtype=np.int64)
+    had_highlight = np.zeros(n, dtype=bool)
+    last_reversal_turn = np.full(n, -5, dtype=np.int64)
+    turns = np.zeros(n, dtype=np.int64)
+    winner = np.full(n, -1, dtype=np.int64)
+    finish_type = np.full(n, -1, dtype=np.int64)
+    active = np.ones(n, dtype=bool)
+
+    turn = 0
+    while turn < max_turns:
+        lanes = np.flatnonzero(active)
+        if not lanes.size:
+            break
+        turn += 1
+        turns[lanes] = turn
+        m = lanes.size
+        att = attacker[lanes]
+
+        # --- Move choice: signature (1 in 6) or a progressive manoeuvre
+        chance_table, move_damage, move_bit, move_bonus = _window_arrays(
+            catalog, progressive_window(turn), sides, type_id, windows
+        )
+        pick = (rng.random(m) * move_damage.size).astype(np.int64)
+        chance = chance_table[att, pick]
+        damage = move_damage[pick]
+        type_bit = move_bit[pick]
+        type_bonus = move_bonus[pick]
+
+        use_sig = (side.sig_count[att] > 0) & (rng.integers(1, 7, m) == 1)
+        if use_sig.any():
+            sig_pick = (rng.random(m) * side.sig_count[att]).astype(np.int64)
+            chance = np.where(use_sig, side.sig_chance[att, sig_pick], chance)
+            damage = np.where(use_sig, side.sig_damage[att, sig_pick], damage)
+            type_bit = np.where(use_sig, side.sig_type_bit[att, sig_pick], type_bit)
+            type_bonus = np.where(use_sig, side.sig_type_bonus[att, sig_pick], type_bonus)
+        types_used[lanes] |= type_bit
+
+        # --- move_success: one roll grades execution, an independent roll decides success
+        roll = rng.random(m)
+        exec_score = np.clip((chance - np.abs(roll - chance)) / chance, 0.0, 1.0)
+        success = rng.random(m) < chance
+        grade = np.searchsorted(GRADE_THRESHOLDS, exec_score, side="right")
+
+        # --- Successful moves
+        s_lanes, s_att = lanes[success], att[success]
+        s_grade, s_exec, s_sig = grade[success], exec_score[success], use_sig[success]
+
+        momentum[s_lanes[s_sig], s_att[s_sig]] = True
+        sig_moves_landed[s_lanes] += s_sig
+        drama_score[s_lanes] += s_sig * (2 if turn > 10 else 1)
+        match_quality_score[s_lanes] += (s_exec * 10).astype(np.int64)
+        execution_buckets[s_lanes, s_grade] += 1
+
+        flow_streak[s_lanes] = np.where(s_grade >= GREAT, flow_streak[s_lanes] + 1, 0)
+        streak = flow_streak[s_lanes] == 3
+        drama_score[s_lanes] += 2 * streak
+        had_highlight[s_lanes] |= s_exec >= 0.95
+
+        extra_drain = np.where(s_exec < 0.3, 3, np.where(s_exec < 0.6, 1, 0))
+        stamina[s_lanes, s_att] = np.maximum(0, stamina[s_lanes, s_att] - (side.base_drain[s_att] + extra_drain))
+        damage_taken[s_lanes, 1 - s_att] += damage[success]
+
+        crowd = crowd_energy[s_lanes] + side.grade_crowd[s_att, s_grade] + side.passive_crowd[s_att]
+        if turn > 10:
+            crowd += s_sig * side.signature_crowd[s_att]
+        crowd += streak * side.streak_crowd[s_att]
+        crowd_energy[s_lanes] = np.clip(crowd, 0, 100)
+
+        # --- Missed moves may be reversed
+        missed = ~success
+        f_lanes, f_def = lanes[missed], 1 - att[missed]
+        chance = reversal_chance(turn, stamina[f_lanes, f_def], side.dexterity[f_def], type_bonus[missed])
+        reversed_ = (turn - last_reversal_turn[f_lanes] >= 3) & (rng.random(f_lanes.size) < chance)
+        r_lanes, r_def = f_lanes[reversed_], f_def[reversed_]
+        reversals[r_lanes, r_def] += 1
+        attacker[r_lanes] = r_def
+        last_reversal_turn[r_lanes] = turn
+
+        # --- Pinfall attempt check
+        att = attacker[lanes]
+        dfn = 1 - att
+        near_finish = damage_taken[lanes, dfn] >= 30 + turn // 3
+        go_finisher = (
+            near_finish & side.has_finisher[att] &
+            (stamina[lanes, att] > 30) & (rng.random(m) < 0.3)
+        )
+        exhaustion = near_finish & ~go_finisher & (turn > 40) & (rng.random(m) < 0.1)
+
+        e_lanes = lanes[exhaustion]
+        winner[e_lanes] = att[exhaustion]
+        finish_type[e_lanes] = FINISH_TYPES.index("pinfall")
+        active[e_lanes] = False
+
+        # try_finisher
+        g_lanes, g_att, g_def = lanes[go_finisher], att[go_finisher], dfn[go_finisher]
+        fin_chance = np.minimum(
+            0.05 + (turn * 0.015)
+            + 0.15 * momentum[g_lanes, g_att]
+            + 0.1 * (stamina[g_lanes, g_att] < 30)
+            - 0.1 * (damage_taken[g_lanes, g_att] > 50),
+            0.9
+        )
+        attempt = rng.random(g_lanes.size) < fin_chance
+        a_lanes, a_att, a_def = g_lanes[attempt], g_att[attempt], g_def[attempt]
+        k = a_lanes.size
+        if k:
+            submission = side.finisher_submission[a_att]
+
+            # try_submission
+            attacker_score = side.intelligence[a_att] + rng.uniform(0, 5, k)
+            defender_score = (
+                side.endurance[a_def] + rng.uniform(0, 5, k)
+                - submission_escapes[a_lanes, a_def] * 0.5
+            )
+            submission_win = (attacker_score > side.finisher_damage[a_att] + 2) & (attacker_score > defender_score)
+
+            resistance = (
+                side.endurance[a_def] + stamina[a_lanes, a_def] - damage_taken[a_lanes, a_def]
+                + rng.uniform(0, 20, k) - 5 * momentum[a_lanes, a_att]
+            )
+            won = np.where(submission, submission_win, resistance < 25)
+
+            escaped = submission & ~won
+            x_lanes, x_def = a_lanes[escaped], a_def[escaped]
+            submission_escapes[x_lanes, x_def] += 1
+            stamina[x_lanes, x_def] = np.maximum(0, stamina[x_lanes, x_def] - 3)
+
+            kicked_out = ~won
+            momentum[a_lanes[kicked_out], a_att[kicked_out]] = False
+            false_finishes[a_lanes[kicked_out]] += 1
+            drama_score[a_lanes[kicked_out]] += 3
+
+            w_lanes = a_lanes[won]
+            winner[w_lanes] = a_att[won]
+            finish_type[w_lanes] = np.where(submission[won], FINISH_TYPES.index("submission"), FINISH_TYPES.index("pinfall"))
+            active[w_lanes] = False
+
+    unfinished = int(active.sum())
+    if unfinished:
+        logging.warning(f"{unfinished} of {n} estimated matches hit the {max_turns} turn cap")
+
+    quality = _final_quality(
+        rng, match_quality_score, types_used, len(type_ids),
+        np.where(winner == 0, side.charisma[0], side.charisma[1]),
+        execution_buckets, drama_score, crowd_energy, flow_streak, had_highlight
+    )
+
+    wins = [int((winner == 0).sum()), int((winner == 1).sum())]
+    finish_counts = {name: int((finish_type == i).sum()) for i, name in enumerate(FINISH_TYPES)}
+    if unfinished:
+        finish_counts["unfinished"] = unfinished
+    values, counts = np.unique(quality, return_counts=True)
+
+    return {
+        "wrestlers": [wrestler1["name"], wrestler2["name"]],
+        "simulations": n,
+        "wins": wins,
+        "win_rate": [wins[0] / n if n else 0, wins[1] / n if n else 0],
+        "finish_types": finish_counts,
+        "avg_quality": float(quality.mean()) if n else 0,
+        "quality_std": float(quality.std()) if n else 0,
+        "quality_histogram": {int(v): int(c) for v, c in zip(values, counts)},
+        "avg_turns": float(turns.mean()) if n else 0,
+        "avg_false_finishes": float(false_finishes.mean()) if n else 0,
+        "avg_reversals": float(reversals.sum(axis=1).mean()) if n else 0
+    }
+
+
+def _final_quality(rng, match_quality_score, types_used, type_count, winner_charisma,
+                   execution_buckets, drama_score, crowd_energy, flow_streak, had_highlight):
+    """Vectorized calculate_final_quality."""
+    n = match_quality_score.size
+    variety = sum((types_used >> bit) & 1 for bit in range(type_count))
+
+    drama = np.where(drama_score > 20, drama_score - (drama_score - 20) // 2, drama_score)
+    expectation_penalty = np.where(crowd_energy > 90, (crowd_energy - 90) // 5, 0)
+    flow_at_end = np.minimum(flow_streak, 3)
+
+    quality = np.trunc(
+        match_quality_score * 0.6 +
+        variety * 3 +
+        winner_charisma * 0.6 +
+        rng.integers(-5, 6, n) +
+        np.where(execution_buckets[:, BOTCHED] >= 3, -5, 0) +
+        drama +
+        np.where(flow_at_end >= 3, 2, 0) +
+        np.where(had_highlight, 2, 0) +
+        np.where((drama < 5) & (match_quality_score > 80), -3, 0) -
+        expectation_penalty
+    ).astype(np.int64)
+
+    # 1 in 1000 chance of legendary moment
+    quality = np.where((rng.random(n) < 0.001) & (quality >= 95), quality + 4, quality)
+
+    # Require multiple criteria to reach 5★
+    short_of_five_stars = (
+        (drama < 20) | (execution_buckets[:, PERFECT] < 3) |
+        (crowd_energy < 85) | ~had_highlight | (flow_at_end < 3)
+    )
+    quality = np.where((quality >= 99) & short_of_five_stars, 98, quality)
+
+    return np.clip(quality, 10, 100)
+
+
+def estimate_card(pairings, simulations=2000, seed=None, catalog=None):
+    """
+    Estimate many candidate pairings.
+
+    Args:
+        pairings: Iterable of (wrestler1, wrestler2) tuples
+        simulations: Matches to run per pairing
+        seed: Master seed; each pairing gets an independent child stream
+
+    Returns:
+        List of estimate_matchup results in pairing order.
+    """
+    pairings = list(pairings)
+    catalog = catalog or get_manoeuvre_catalog()
+    streams = np.random.SeedSequence(seed).spawn(len(pairings))
+    return [
+        estimate_matchup(w1, w2, simulations, np.random.default_rng(stream), catalog)
+        for (w1, w2), stream in zip(pairings, streams)
+    ]
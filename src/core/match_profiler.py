@@ -0,0 +1,159 @@
+"""
+Match Profiler
+
+Optional instrumentation for the match engine. While a profiler is active
+(``with profile_matches() as profiler:``) ``run_match`` and ``simulate_match``
+time their phases:
+
+- ``move_selection``: picking the manoeuvre for a turn
+- ``move_success``: the success/execution roll
+- ``finisher``: finisher and submission resolution
+- ``commentary``: rendering execution and colour commentary
+- ``ui_callbacks``: time spent inside observer callbacks
+- ``db_persistence``: match history, move experience and replay writes
+
+Sections are exclusive: time spent in a nested section (a UI callback fired
+from inside finisher resolution, say) is only counted once, in the innermost
+section. SQL statements run on the shared connections (see
+``db_utils.ConnectionManager.trace_statements``) are counted for the duration
+of the profile. When the profile ends the totals are merged into
+``game_state_debug.performance_stats``.
+
+With no profiler active the engine takes none of these timings.
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+
+from src.core.db_utils import get_connection_manager
+
+SECTIONS = ("move_selection", "move_success", "finisher", "commentary", "ui_callbacks", "db_persistence")
+
+
+class MatchProfiler:
+    """Accumulates per-section call counts and exclusive time."""
+
+    def __init__(self):
+        self.sections = {name: [0, 0.0] for name in SECTIONS}
+        self.matches = 0
+        self.match_time = 0.0
+        self.db_statements = 0
+        self._stack = []
+
+    def _enter(self, name):
+        now = time.perf_counter()
+        if self._stack:
+            # Pause the enclosing section
+            parent = self._stack[-1]
+            self.sections[parent[0]][1] += now - parent[1]
+        self._stack.append([name, now])
+
+    def _exit(self):
+        now = time.perf_counter()
+        name, start = self._stack.pop()
+        totals = self.sections.setdefault(name, [0, 0.0])
+        totals[0] += 1
+        totals[1] += now - start
+        if self._stack:
+            self._stack[-1][1] = now
+
+    @contextmanager
+    def section(self, name):
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def wrap(self, name, func):
+        """Return ``func`` timed under ``name`` (None stays None)."""
+        if func is None:
+            return None
+
+        def timed(*args, **kwargs):
+            self._enter(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit()
+        return timed
+
+    def record_match(self, duration):
+        self.matches += 1
+        self.match_time += duration
+
+    def to_dict(self):
+        """Snapshot of the profile as plain JSON-serialisable data."""
+        return {
+            "matches": self.matches,
+            "match_time": self.match_time,
+            "db_statements": self.db_statements,
+            "db_statements_per_match": self.db_statements / self.matches if self.matches else 0,
+            "sections": {
+                name: {
+                    "calls": calls,
+                    "time": total,
+                    "avg_time": total / calls if calls else 0
+                }
+                for name, (calls, total) in self.sections.items()
+            }
+        }
+
+    def export_json(self, path):
+        """Write the profile to ``path`` as JSON."""
+        data = self.to_dict()
+        data["timestamp"] = datetime.now().isoformat()
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        logging.info(f"Match profile exported to {path}")
+
+    def log_report(self):
+        """Log a per-section breakdown, slowest first."""
+        # Persistence happens after run_match returns, outside match_time
+        overall = self.match_time + self.sections["db_persistence"][1]
+        logging.info(f"Match profile: {self.matches} match(es), {overall:.3f}s total, "
+                     f"{self.db_statements} DB statement(s)")
+        for name, (calls, total) in sorted(self.sections.items(), key=lambda item: -item[1][1]):
+            share = (total / overall * 100) if overall else 0
+            logging.info(f"  {name:<15} {calls:>8} calls {total:9.4f}s ({share:5.1f}%)")
+
+
+_active_profiler = None
+
+
+def get_active_profiler():
+    """Return the profiler currently collecting, or None."""
+    return _active_profiler
+
+
+@contextmanager
+def profile_matches(count_statements=True):
+    """
+    Profile every match simulated inside the block.
+
+    Yields the MatchProfiler; on exit its totals are merged into
+    game_state_debug.performance_stats.
+    """
+    global _active_profiler
+    if _active_profiler is not None:
+        # Nested profiles share the outer profiler
+        yield _active_profiler
+        return
+
+    profiler = MatchProfiler()
+    manager = get_connection_manager()
+    start = manager.statements
+    _active_profiler = profiler
+    try:
+        with manager.trace_statements() if count_statements else nullcontext():
+            yield profiler
+    finally:
+        _active_profiler = None
+        if count_statements:
+            profiler.db_statements = manager.statements - start
+
+        from src.core import game_state_debug
+        game_state_debug.track_match_profile(profiler.to_dict())
@@ -0,0 +1,337 @@
+"""
+Match Replay Log
+
+Compact, append-only binary record of every move in a match, written per
+event next to matches.db (``db/replays/event_<id>.replay``).
+
+The file is a small header followed by fixed-size 20-byte records, so record
+``i`` lives at ``HEADER.size + i * RECORD_SIZE`` and any turn can be read with
+a single seek. Each match is stored as one match record followed by its turn
+records:
+
+- match record: wrestler ids, winner id, finish type, quality, turn count
+- turn record: turn number, move id, attacker id, success/reversal/category
+  flags, execution score and the stamina/damage deltas of both wrestlers
+  (booking order) caused by the move
+
+Move names are interned in a sidecar ``.moves`` file (one name per line, the
+line number is the move id) so records stay fixed-size. Replaying a turn sums
+the deltas from the start of the match; analytics jobs can stream records
+with ``ReplayReader.iter_turns`` without any JSON parsing.
+"""
+
+import os
+import struct
+import logging
+import threading
+from collections import namedtuple
+
+from src.core.match_core import MatchObserver
+
+REPLAY_MAGIC = b"WRPL"
+REPLAY_VERSION = 1
+
+HEADER = struct.Struct("<4sHH")  # magic, version, record size
+
+# kind, flags, turn, move_id, attacker_id, exec_score, stamina/damage deltas (left, right)
+TURN_RECORD = struct.Struct("<BBHHxxIfbbbb")
+# kind, finish, turns, wrestler1_id, wrestler2_id, winner_id, quality
+MATCH_RECORD = struct.Struct("<BBHIIIi")
+RECORD_SIZE = TURN_RECORD.size
+assert MATCH_RECORD.size == RECORD_SIZE
+
+KIND_MATCH = 0
+KIND_TURN = 1
+
+# Turn record flags
+FLAG_SUCCESS = 0x01
+FLAG_REVERSED = 0x02
+FLAG_SIGNATURE = 0x04
+FLAG_FINISHER = 0x08
+
+FINISH_TYPES = (None, "pinfall", "submission")
+
+STARTING_STAMINA = 100
+
+MatchInfo = namedtuple("MatchInfo", [
+    "match_no", "record_index", "wrestler1_id", "wrestler2_id",
+    "winner_id", "finish_type", "quality", "turn_count"
+])
+TurnRecord = namedtuple("TurnRecord", [
+    "turn", "move_id", "move_name", "attacker_id", "success", "reversed", "category",
+    "exec_score", "stamina_delta", "damage_delta"
+])
+TurnState = namedtuple("TurnState", ["turn", "stamina", "damage_taken"])
+
+
+def replay_path(event_id):
+    """Path of the replay file for an event."""
+    from src.db.utils import db_path
+    return db_path(os.path.join("replays", f"event_{event_id}.replay"))
+
+
+def _moves_path(path):
+    return path + ".moves"
+
+
+def _load_move_names(path):
+    try:
+        with open(_moves_path(path), encoding="utf-8") as f:
+            return [line.rstrip("\n") for line in f]
+    except FileNotFoundError:
+        return []
+
+
+def _clamp_delta(value):
+    return max(-128, min(127, int(value)))
+
+
+class ReplayWriter:
+    """Appends matches to a replay file."""
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._names = _load_move_names(path)
+        self._ids = {name: i for i, name in enumerate(self._names)}
+        self._lock = threading.Lock()
+
+        self._file = open(path, "ab")
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, RECORD_SIZE))
+            self._file.flush()
+        self._records = (self._file.tell() - HEADER.size) // RECORD_SIZE
+
+    def move_id(self, name):
+        """Return the id of a move name, adding it to the names file if new."""
+        with self._lock:
+            move_id = self._ids.get(name)
+            if move_id is None:
+                move_id = self._ids[name] = len(self._names)
+                self._names.append(name)
+                with open(_moves_path(self.path), "a", encoding="utf-8") as f:
+                    f.write(name.replace("\n", " ") + "\n")
+            return move_id
+
+    def append_match(self, wrestler1_id, wrestler2_id, winner_id, finish_type, quality, turn_count, turn_records):
+        """
+        Append one match. ``turn_records`` is the packed turn records as bytes.
+
+        Returns the record index of the match record.
+        """
+        finish = FINISH_TYPES.index(finish_type) if finish_type in FINISH_TYPES else 0
+        header = MATCH_RECORD.pack(
+            KIND_MATCH, finish, min(turn_count, 0xFFFF),
+            wrestler1_id or 0, wrestler2_id or 0, winner_id or 0, int(quality)
+        )
+        with self._lock:
+            index = self._records
+            self._file.write(header + bytes(turn_records))
+            self._file.flush()
+            self._records += 1 + len(turn_records) // RECORD_SIZE
+        return index
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ReplayRecorder(MatchObserver):
+    """Collects one match's moves and appends them to a ReplayWriter when it ends."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self._buffer = bytearray()
+        self._turns = 0
+        self._last = (STARTING_STAMINA, STARTING_STAMINA, 0, 0)
+
+    def on_move(self, turn, entry, left, right):
+        state = (left["stamina"], right["stamina"], left["damage_taken"], right["damage_taken"])
+        deltas = [_clamp_delta(now - before) for now, before in zip(state, self._last)]
+        self._last = state
+
+        flags = FLAG_SUCCESS if entry["success"] else 0
+        if entry.get("reversed"):
+            flags |= FLAG_REVERSED
+        if entry["category"] == "signature":
+            flags |= FLAG_SIGNATURE
+        elif entry["category"] == "finisher":
+            flags |= FLAG_FINISHER
+
+        self._buffer += TURN_RECORD.pack(
+            KIND_TURN, flags, min(turn, 0xFFFF),
+            self.writer.move_id(entry["move_name"]),
+            entry.get("wrestler_id") or 0,
+            entry.get("exec_score") or 0.0,
+            *deltas
+        )
+        self._turns = turn
+
+    def finish(self, wrestler1, wrestler2, result):
+        """Write the match to the replay file. Returns its record index."""
+        winner = result.get("winner")
+        if winner == wrestler1["name"]:
+            winner_id = wrestler1.get("id")
+        elif winner == wrestler2["name"]:
+            winner_id = wrestler2.get("id")
+        else:
+            winner_id = None
+        return self.writer.append_match(
+            wrestler1.get("id"), wrestler2.get("id"), winner_id,
+            result.get("finish_type", result.get("win_type")), result.get("quality", 0),
+            result.get("turns", self._turns), self._buffer
+        )
+
+
+class ReplayReader:
+    """Random access to the records of a replay file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        magic, version, record_size = HEADER.unpack(self._file.read(HEADER.size))
+        if magic != REPLAY_MAGIC or record_size != RECORD_SIZE:
+            self._file.close()
+            raise ValueError(f"{path} is not a replay file")
+        if version != REPLAY_VERSION:
+            logging.warning(f"Replay file {path} has version {version}, expected {REPLAY_VERSION}")
+        self.move_names = _load_move_names(path)
+        self._matches = None
+
+    def __len__(self):
+        """Number of records in the file."""
+        return (os.fstat(self._file.fileno()).st_size - HEADER.size) // RECORD_SIZE
+
+    def _read(self, index, count=1):
+        self._file.seek(HEADER.size + index * RECORD_SIZE)
+        return self._file.read(count * RECORD_SIZE)
+
+    def _decode_turn(self, raw):
+        (_, flags, turn, move_id, attacker_id, exec_score,
+         d_stamina_1, d_stamina_2, d_damage_1, d_damage_2) = TURN_RECORD.unpack(raw)
+        if flags & FLAG_FINISHER:
+            category = "finisher"
+        elif flags & FLAG_SIGNATURE:
+            category = "signature"
+        else:
+            category = "regular"
+        return TurnRecord(
+            turn, move_id,
+            self.move_names[move_id] if move_id < len(self.move_names) else None,
+            attacker_id or None, bool(flags & FLAG_SUCCESS), bool(flags & FLAG_REVERSED), category,
+            exec_score, (d_stamina_1, d_stamina_2), (d_damage_1, d_damage_2)
+        )
+
+    def matches(self):
+        """Return MatchInfo for every match in the file, in write order."""
+        if self._matches is None:
+            self._file.seek(HEADER.size)
+            # First byte of each record is its kind
+            kinds = self._file.read()[::RECORD_SIZE]
+            self._matches = []
+            for index, kind in enumerate(kinds):
+                if kind != KIND_MATCH:
+                    continue
+                (_, finish, turns, w1_id, w2_id, winner_id, quality) = MATCH_RECORD.unpack(self._read(index))
+                self._matches.append(MatchInfo(
+                    len(self._matches), index, w1_id or None, w2_id or None, winner_id or None,
+                    FINISH_TYPES[finish] if finish < len(FINISH_TYPES) else None, quality, turns
+                ))
+        return self._matches
+
+    def _move_count(self, match_no):
+        matches = self.matches()
+        start = matches[match_no].record_index + 1
+        end = matches[match_no + 1].record_index if match_no + 1 < len(matches) else len(self)
+        return start, end - start
+
+    def match_moves(self, match_no):
+        """Return every TurnRecord of a match."""
+        start, count = self._move_count(match_no)
+        raw = self._read(start, count)
+        return [self._decode_turn(raw[i:i + RECORD_SIZE]) for i in range(0, len(raw), RECORD_SIZE)]
+
+    def move(self, match_no, move_index):
+        """Return a single TurnRecord by its position within the match."""
+        start, count = self._move_count(match_no)
+        if not 0 <= move_index < count:
+            raise IndexError(move_index)
+        return self._decode_turn(self._read(start + move_index))
+
+    def state_at(self, match_no, move_index):
+        """Rebuild both wrestlers' stamina and damage after the given move."""
+        start, count = self._move_count(match_no)
+        if not 0 <= move_index < count:
+            raise IndexError(move_index)
+        stamina = [STARTING_STAMINA, STARTING_STAMINA]
+        damage = [0, 0]
+        raw = self._read(start, move_index + 1)
+        turn = 0
+        for record in TURN_RECORD.iter_unpack(raw):
+            turn = record[2]
+            stamina[0] += record[6]
+            stamina[1] += record[7]
+            damage[0] += record[8]
+            damage[1] += record[9]
+        return TurnState(turn, tuple(stamina), tuple(damage))
+
+    def iter_turns(self, chunk_records=65536):
+        """Stream (match_no, TurnRecord) for every move in the file."""
+        self._file.seek(HEADER.size)
+        match_no = -1
+        while True:
+            raw = self._file.read(chunk_records * RECORD_SIZE)
+            if not raw:
+                break
+            for offset in range(0, len(raw) - RECORD_SIZE + 1, RECORD_SIZE):
+                record = raw[offset:offset + RECORD_SIZE]
+                if record[0] == KIND_MATCH:
+                    match_no += 1
+                else:
+                    yield match_no, self._decode_turn(record)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_active_writer = None
+
+
+def begin_event_replay(event_id):
+    """Record every match simulated until end_event_replay() into the event's replay file."""
+    global _active_writer
+    end_event_replay()
+    try:
+        _active_writer = ReplayWriter(replay_path(event_id))
+    except OSError as e:
+        logging.error(f"Could not open replay file for event {event_id}: {e}")
+        _active_writer = None
+    return _active_writer
+
+
+def end_event_replay():
+    global _active_writer
+    if _active_writer is not None:
+        _active_writer.close()
+        _active_writer = None
+
+
+def get_active_replay_writer():
+    """Return the writer of the event currently being recorded, or None."""
+    return _active_writer
@@ -1,13 +1,19 @@
 import sqlite3
 import os
 from datetime import datetime
-from src.core.game_state import get_game_date
+from src.core.game_state import get_game_date, get_game_date_ordinal
 import json
 import logging
+from src.db.utils import db_path
+from src.db.migrations import migrate
+from src.core.db_utils import shared_connection, transaction
+from src.core.career_stats import apply_match_result, check_wrestler_stats, rebuild_wrestler_stats
 
 class MatchStatistics:
     def __init__(self):
-        self.db_path = "match_statistics.db"
+        self.db_path = db_path("match_statistics.db")
+        # IDs of wrestlers looked up by name, so repeat lookups skip the roster query
+        self._name_ids = {}
         self._init_db()
         
     def _init_db(self):
@@ -68,28 +74,11 @@ class MatchStatistics:
                     created_at TEXT NOT NULL
                 )
             ''')
-            
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS wrestler_stats (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    wrestler_name TEXT NOT NULL UNIQUE,
-                    matches INTEGER DEFAULT 0,
-                    wins INTEGER DEFAULT 0,
-                    losses INTEGER DEFAULT 0,
-                    avg_quality REAL DEFAULT 0,
-                    total_quality INTEGER DEFAULT 0,
-                    best_match INTEGER DEFAULT 0,
-                    worst_match INTEGER DEFAULT 100,
-                    avg_drama REAL DEFAULT 0,
-                    total_drama INTEGER DEFAULT 0,
-                    reversal_rate REAL DEFAULT 0,
-                    total_reversals INTEGER DEFAULT 0,
-                    last_updated TEXT NOT NULL
-                )
-            ''')
-            
+
             conn.commit()
             conn.close()
+            # Adds match_participants and the materialized wrestler_stats
+            migrate("match_statistics.db")
             logging.info(f"Match statistics database initialized at {self.db_path}")
             return True
         except Exception as e:
@@ -132,12 +121,16 @@ class MatchStatistics:
         if not name:
             return None
         
+        if name in self._name_ids:
+            return self._name_ids[name]
+
         try:
             # Check if we have a function to load wrestlers by name
             from src.core.match_engine import load_wrestler_by_name
             wrestler = load_wrestler_by_name(name)
             if wrestler:
-                return self.get_wrestler_attr(wrestler, 'id')
+                wrestler_id = self._name_ids[name] = self.get_wrestler_attr(wrestler, 'id')
+                return wrestler_id
         except ImportError:
             pass
         
@@ -315,64 +308,71 @@ class MatchStatistics:
             # Get current game date
             match_date = get_game_date()
             
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            # One transaction for the match, its participants and the career stats
+            with transaction(self.db_path, immediate=True) as conn:
+                cursor = conn.cursor()
             
-            # Insert match record
-            cursor.execute('''
-                INSERT INTO matches (
+                # Insert match record
+                cursor.execute('''
+                    INSERT INTO matches (
+                        wrestler1_id, wrestler2_id, winner_id, 
+                        match_date, match_rating, duration_minutes,
+                        moves_used, match_type
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
                     wrestler1_id, wrestler2_id, winner_id, 
                     match_date, match_rating, duration_minutes,
-                    moves_used, match_type
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                wrestler1_id, wrestler2_id, winner_id, 
-                match_date, match_rating, duration_minutes,
-                moves_json, match_type
-            ))
+                    moves_json, match_type
+                ))
             
-            match_id = cursor.lastrowid
+                match_id = cursor.lastrowid
             
-            # Insert wrestler statistics
-            # For wrestler 1
-            self._record_wrestler_performance(
-                cursor, match_id, wrestler1_id, 
-                winner_id == wrestler1_id,
-                match_rating, duration_minutes
-            )
+                # Insert wrestler statistics
+                # For wrestler 1
+                self._record_wrestler_performance(
+                    cursor, match_id, wrestler1_id, 
+                    winner_id == wrestler1_id,
+                    match_rating, duration_minutes
+                )
             
-            # For wrestler 2
-            self._record_wrestler_performance(
-                cursor, match_id, wrestler2_id, 
-                winner_id == wrestler2_id,
-                match_rating, duration_minutes
-            )
+                # For wrestler 2
+                self._record_wrestler_performance(
+                    cursor, match_id, wrestler2_id,
+                    winner_id == wrestler2_id,
+                    match_rating, duration_minutes
+                )
+
+                # Indexed per-wrestler history and career stats, in the same transaction
+                drama_score = match_result.get("drama_score", match_rating) if match_result else match_rating
+                self._record_participants(
+                    cursor, match_id,
+                    [(wrestler1_id, self._match_reversals(match_result, "wrestler1")),
+                     (wrestler2_id, self._match_reversals(match_result, "wrestler2"))],
+                    winner_id, match_rating, drama_score, duration_minutes, get_game_date_ordinal(match_date)
+                )
             
-            # Also add to match history table (legacy format)
-            if match_result:
-                self._insert_legacy_match_history(cursor, match_id, match_result, wrestler1_id, wrestler2_id, winner_id)
-            else:
-                # Create minimal match history entry
-                wrestlers_json = json.dumps({
-                    "wrestler1_id": wrestler1_id,
-                    "wrestler2_id": wrestler2_id
-                })
+                # Also add to match history table (legacy format)
+                if match_result:
+                    self._insert_legacy_match_history(cursor, match_id, match_result, wrestler1_id, wrestler2_id, winner_id)
+                else:
+                    # Create minimal match history entry
+                    wrestlers_json = json.dumps({
+                        "wrestler1_id": wrestler1_id,
+                        "wrestler2_id": wrestler2_id
+                    })
                 
-                cursor.execute('''
-                    INSERT INTO match_history (
-                        match_id, date, wrestlers_json, winner, 
-                        quality, drama_score, crowd_energy,
-                        execution_summary_json, reversals_json, 
-                        stamina_drain_json, created_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
-                ''', (
-                    f"match_{match_id}", match_date, wrestlers_json, str(winner_id),
-                    match_rating, match_rating, 50,
-                    "{}", "{}", "{}"
-                ))
-            
-            conn.commit()
-            conn.close()
+                    cursor.execute('''
+                        INSERT INTO match_history (
+                            match_id, date, wrestlers_json, winner, 
+                            quality, drama_score, crowd_energy,
+                            execution_summary_json, reversals_json, 
+                            stamina_drain_json, created_at
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'))
+                    ''', (
+                        f"match_{match_id}", match_date, wrestlers_json, str(winner_id),
+                        match_rating, match_rating, 50,
+                        "{}", "{}", "{}"
+                    ))
             
             logging.info(f"Match statistics recorded: {wrestler1_id} vs {wrestler2_id}, winner: {winner_id}")
             return True
@@ -434,84 +434,199 @@ class MatchStatistics:
             match_id, wrestler_id, 1 if is_winner else 0, match_rating, duration
         ))
         
-    def get_wrestler_stats(self, wrestler_id):
-        """Get statistics for a specific wrestler."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT COUNT(*) as total_matches,
-                   SUM(CASE WHEN won = 1 THEN 1 ELSE 0 END) as wins,
-                   AVG(match_rating) as avg_rating,
-                   AVG(duration_minutes) as avg_duration
-            FROM wrestler_performances
-            WHERE wrestler_id = ?
-        ''', (wrestler_id,))
-        
-        result = cursor.fetchone()
-        conn.close()
-        
-        if result:
-            total, wins, avg_rating, avg_duration = result
-            losses = total - wins if total else 0
-            win_rate = (wins / total * 100) if total > 0 else 0
-            
-            return {
-                "total_matches": total or 0,
-                "wins": wins or 0,
-                "losses": losses,
-                "win_rate": win_rate,
-                "avg_rating": avg_rating or 0,
-                "avg_duration": avg_duration or 0
-            }
-        
-        return {
+    def _match_reversals(self, match_result, position):
+        """Reversals by the wrestler in ``position`` ("wrestler1"/"wrestler2"); keyed by name in match results."""
+        if not match_result or not isinstance(match_result.get("reversals"), dict):
+            return 0
+        name = match_result.get(f"{position}_name") or self.get_wrestler_attr(match_result.get(position), "name")
+        count = match_result["reversals"].get(name, 0)
+        return count if isinstance(count, int) else 0
+
+    def _record_participants(self, cursor, match_id, participants, winner_id, quality, drama, duration, date_ordinal):
+        """Add a match_participants row per (wrestler_id, reversals) and fold it into wrestler_stats."""
+        for wrestler_id, reversals in participants:
+            won = wrestler_id == winner_id
+            cursor.execute('''
+                INSERT OR IGNORE INTO match_participants (
+                    match_id, wrestler_id, won, quality, drama, date_ordinal, duration_minutes, reversals
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (match_id, wrestler_id, 1 if won else 0, quality, drama, date_ordinal, duration, reversals))
+            if cursor.rowcount:
+                apply_match_result(cursor, wrestler_id, won, quality, drama, reversals, duration)
+
+    def _resolve_wrestler_id(self, wrestler):
+        """ID of a wrestler given as an ID, name or wrestler object."""
+        return wrestler if isinstance(wrestler, int) else self.get_wrestler_id(wrestler)
+
+    def get_wrestler_stats(self, wrestler):
+        """
+        Get career statistics for a wrestler (ID, name or wrestler object).
+
+        Reads the wrestler's row of the materialized wrestler_stats table, so
+        the cost does not grow with the number of matches recorded.
+        """
+        empty = {
             "total_matches": 0,
             "wins": 0,
             "losses": 0,
             "win_rate": 0,
             "avg_rating": 0,
-            "avg_duration": 0
+            "avg_duration": 0,
+            "best_match": None,
+            "worst_match": None,
+            "avg_drama": 0,
+            "reversal_rate": 0
         }
+        wrestler_id = self._resolve_wrestler_id(wrestler)
+        if wrestler_id is None:
+            return empty
+
+        conn = shared_connection(self.db_path)
+        try:
+            result = conn.execute('''
+                SELECT matches, wins, losses, avg_quality, total_duration,
+                       best_match, worst_match, avg_drama, reversal_rate
+                FROM wrestler_stats
+                WHERE wrestler_id = ?
+            ''', (wrestler_id,)).fetchone()
+        finally:
+            conn.close()
+
+        if not result or not result[0]:
+            return empty
+
+        total, wins, losses, avg_rating, total_duration, best, worst, avg_drama, reversal_rate = result
+        return {
+            "total_matches": total,
+            "wins": wins,
+            "losses": losses,
+            "win_rate": wins / total * 100,
+            "avg_rating": avg_rating,
+            "avg_duration": total_duration / total,
+            "best_match": best,
+            "worst_match": worst,
+            "avg_drama": avg_drama,
+            "reversal_rate": reversal_rate
+        }
+
+    def rebuild_wrestler_stats(self):
+        """Recompute wrestler_stats from the recorded matches. Returns the number of wrestlers."""
+        with transaction(self.db_path, immediate=True) as conn:
+            count = rebuild_wrestler_stats(conn)
+        logging.info(f"Rebuilt career stats for {count} wrestlers")
+        return count
+
+    def check_wrestler_stats(self, wrestler=None):
+        """(wrestler_id, column, stored, expected) for every wrestler_stats value that is out of date."""
+        wrestler_id = self._resolve_wrestler_id(wrestler) if wrestler is not None else None
+        conn = shared_connection(self.db_path)
+        try:
+            return check_wrestler_stats(conn, wrestler_id)
+        finally:
+            conn.close()
     
-    def get_wrestler_trends(self, wrestler_name, last_n_matches=5):
-        """Get recent performance trends for a wrestler"""
+    def get_recent_matches(self, wrestler, last_n_matches=None, since_date=None):
+        """
+        A wrestler's matches, most recent first, as (won, quality, drama) rows.
+
+        ``wrestler`` is an ID, name or wrestler object. ``since_date`` (a game
+        date string) keeps only matches on or after that date. The rows come
+        from the (wrestler_id, date_ordinal) index, so the cost depends on the
+        rows returned, not on career length.
+        """
+        wrestler_id = self._resolve_wrestler_id(wrestler)
+        if wrestler_id is None:
+            return []
+
+        query = "SELECT won, quality, drama FROM match_participants WHERE wrestler_id = ?"
+        params = [wrestler_id]
+        if since_date is not None:
+            query += " AND date_ordinal >= ?"
+            params.append(get_game_date_ordinal(since_date))
+        query += " ORDER BY date_ordinal DESC, match_id DESC"
+        if last_n_matches is not None:
+            query += " LIMIT ?"
+            params.append(last_n_matches)
+
+        conn = shared_connection(self.db_path)
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Get last N matches for this wrestler
-                cursor.execute("""
-                    SELECT * FROM match_history 
-                    WHERE wrestlers_json LIKE ?
-                    ORDER BY date DESC
-                    LIMIT ?
-                """, (f'%"{wrestler_name}"%', last_n_matches))
-                
-                recent_matches = cursor.fetchall()
-                
-                if not recent_matches:
-                    return None
-                
-                # Calculate trends
-                qualities = [match[5] for match in recent_matches]
-                dramas = [match[6] for match in recent_matches]
-                
-                # Calculate win streak
-                win_streak = 0
-                for match in recent_matches:
-                    if match[4] == wrestler_name:
-                        win_streak += 1
-                    else:
+            return conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+
+    def get_wrestler_trends(self, wrestler, last_n_matches=5):
+        """Get recent performance trends for a wrestler (ID, name or wrestler object)"""
+        try:
+            recent_matches = self.get_recent_matches(wrestler, last_n_matches)
+
+            if not recent_matches:
+                return None
+
+            # Calculate trends
+            qualities = [quality for _, quality, _ in recent_matches]
+            dramas = [drama for _, _, drama in recent_matches]
+
+            # Calculate win streak
+            win_streak = 0
+            for won, _, _ in recent_matches:
+                if won:
+                    win_streak += 1
+                else:
+                    break
+
+            return {
+                "recent_quality_avg": sum(qualities) / len(qualities),
+                "recent_drama_avg": sum(dramas) / len(dramas),
+                "win_streak": win_streak,
+                "quality_trend": "up" if len(qualities) > 1 and qualities[0] > qualities[-1] else "down",
+                "match_count": len(recent_matches)
+            }
+        except Exception as e:
+            logging.error(f"Error getting wrestler trends for {wrestler}: {e}")
+            return None
+
+    def get_form_guide(self, wrestler, last_n_matches=5):
+        """Recent results, most recent first (e.g. "WWLWL")."""
+        try:
+            return "".join("W" if won else "L" for won, _, _ in self.get_recent_matches(wrestler, last_n_matches))
+        except Exception as e:
+            logging.error(f"Error getting form guide for {wrestler}: {e}")
+            return ""
+
+    def get_current_streak(self, wrestler):
+        """
+        The wrestler's current run of results as ("W" or "L", length).
+
+        Walks the index from the most recent match and stops at the first
+        different result. Returns (None, 0) for a wrestler with no matches.
+        """
+        try:
+            wrestler_id = self._resolve_wrestler_id(wrestler)
+            if wrestler_id is None:
+                return None, 0
+
+            conn = shared_connection(self.db_path)
+            rows = None
+            try:
+                rows = conn.execute('''
+                    SELECT won FROM match_participants
+                    WHERE wrestler_id = ?
+                    ORDER BY date_ordinal DESC, match_id DESC
+                ''', (wrestler_id,))
+                first = rows.fetchone()
+                if first is None:
+                    return None, 0
+                length = 1
+                for (won,) in rows:
+                    if won != first[0]:
                         break
-                
-                return {
-                    "recent_quality_avg": sum(qualities) / len(qualities),
-                    "recent_drama_avg": sum(dramas) / len(dramas),
-                    "win_streak": win_streak,
-                    "quality_trend": "up" if len(qualities) > 1 and qualities[0] > qualities[-1] else "down",
-                    "match_count": len(recent_matches)
-                }
+                    length += 1
+                return ("W" if first[0] else "L"), length
+            finally:
+                # Finish the partly read statement so it does not pin a read snapshot
+                if rows is not None:
+                    rows.close()
+                conn.close()
         except Exception as e:
-            logging.error(f"Error getting wrestler trends for {wrestler_name}: {e}")
-            return None 
\ No newline at end of file
+            logging.error(f"Error getting current streak for {wrestler}: {e}")
+            return None, 0
@@ -7,12 +7,12 @@ from src.db.business_db_manager import BusinessDBManager
 # Initialize the business database manager
 business_db = BusinessDBManager()
 
-def generate_merch_stats():
+def generate_merch_stats(rng=random):
     """Generate random merchandise quality stats"""
-    design_quality = random.randint(1, 5)  # Changed to 1-5 star rating
-    material_quality = random.randint(1, 5)  # Changed to 1-5 star rating
-    uniqueness = random.randint(1, 5)  # Changed to 1-5 star rating
-    fan_appeal = random.randint(1, 5)  # Changed to 1-5 star rating
+    design_quality = rng.randint(1, 5)  # Changed to 1-5 star rating
+    material_quality = rng.randint(1, 5)  # Changed to 1-5 star rating
+    uniqueness = rng.randint(1, 5)  # Changed to 1-5 star rating
+    fan_appeal = rng.randint(1, 5)  # Changed to 1-5 star rating
     
     # Calculate overall quality as a weighted average (still 1-5 scale)
     overall_quality = round(design_quality * 0.35 + material_quality * 0.25 + 
@@ -26,7 +26,7 @@ def generate_merch_stats():
         'overall_quality': overall_quality
     }
 
-def create_merchandise_item(wrestler_id, name, merch_type, base_price=None, production_cost=None):
+def create_merchandise_item(wrestler_id, name, merch_type, base_price=None, production_cost=None, rng=random):
     """Create a new merchandise item for a wrestler with random stats"""
     # Get default price and cost based on type if not provided
     if base_price is None or production_cost is None:
@@ -49,7 +49,7 @@ def create_merchandise_item(wrestler_id, name, merch_type, base_price=None, prod
             production_cost = production_cost or 1  # Default to 1 star for cost
     
     # Generate random stats
-    stats = generate_merch_stats()
+    stats = generate_merch_stats(rng)
     
     # Create the merchandise item
     item_id = business_db.create_merchandise_item(
@@ -67,7 +67,7 @@ def create_merchandise_item(wrestler_id, name, merch_type, base_price=None, prod
     
     return item_id
 
-def calculate_daily_sales(merch_item, wrestler_popularity):
+def calculate_daily_sales(merch_item, wrestler_popularity, rng=random):
     """Calculate daily sales for a merchandise item"""
     # Base sales is related to wrestler popularity but merchandise quality matters too
     quality_factor = merch_item['overall_quality'] / 100.0
@@ -80,7 +80,7 @@ def calculate_daily_sales(merch_item, wrestler_popularity):
     adjusted_sales = base_sales * (0.5 * popularity_factor + 0.5 * quality_factor)
     
     # Add some randomness (sales can vary by ±30%)
-    randomness = random.uniform(0.7, 1.3)
+    randomness = rng.uniform(0.7, 1.3)
     final_sales = adjusted_sales * randomness
     
     # Different merch types have different sales volumes
@@ -103,7 +103,7 @@ def calculate_daily_sales(merch_item, wrestler_popularity):
     
     return quantity
 
-def calculate_event_sales(merch_item, wrestler_popularity, is_on_card, attendance):
+def calculate_event_sales(merch_item, wrestler_popularity, is_on_card, attendance, rng=random):
     """Calculate merchandise sales during an event"""
     # Base calculation is similar to daily sales
     quality_factor = merch_item['overall_quality'] / 100.0
@@ -123,7 +123,7 @@ def calculate_event_sales(merch_item, wrestler_popularity, is_on_card, attendanc
     expected_sales = attendance * adjusted_percentage
     
     # Add some randomness (sales can vary by ±25%)
-    randomness = random.uniform(0.75, 1.25)
+    randomness = rng.uniform(0.75, 1.25)
     final_sales = expected_sales * randomness
     
     # Different merch types have different sales volumes
@@ -209,7 +209,7 @@ def record_merchandise_sale(merch_item, wrestler_id, quantity, show_id=None, sal
     
     return sale_id
 
-def process_daily_merchandise_sales():
+def process_daily_merchandise_sales(rng=random):
     """Process daily merchandise sales for all active items"""
     # Get all active merchandise items
     items = business_db.get_all_active_merchandise()
@@ -226,7 +226,7 @@ def process_daily_merchandise_sales():
         popularity = wrestler.get('popularity', 50)
         
         # Calculate daily sales quantity
-        quantity = calculate_daily_sales(item, popularity)
+        quantity = calculate_daily_sales(item, popularity, rng)
         
         if quantity > 0:
             # Record the sale
@@ -238,7 +238,7 @@ def process_daily_merchandise_sales():
     logging.info(f"Daily merchandise sales processed: {total_items_sold} items sold for ${total_revenue:.2f}")
     return total_items_sold, total_revenue
 
-def process_event_merchandise_sales(show_id):
+def process_event_merchandise_sales(show_id, rng=random):
     """Process merchandise sales for an event"""
     # Get show details
     show = business_db.get_show_details(show_id)
@@ -276,7 +276,7 @@ def process_event_merchandise_sales(show_id):
         is_on_card = item['wrestler_id'] in wrestlers_on_card
         
         # Calculate event sales quantity
-        quantity = calculate_event_sales(item, popularity, is_on_card, attendance)
+        quantity = calculate_event_sales(item, popularity, is_on_card, attendance, rng)
         
         if quantity > 0:
             # Record the sale
@@ -300,7 +300,7 @@ def process_event_merchandise_sales(show_id):
     logging.info(f"Event merchandise sales processed: {total_items_sold} items sold for ${total_revenue:.2f}")
     return total_items_sold, total_revenue
 
-def auto_manage_merchandise(wrestler_id=None):
+def auto_manage_merchandise(wrestler_id=None, rng=random):
     """Auto-generate merchandise for a wrestler or all wrestlers"""
     if wrestler_id:
         # Get wrestler details
@@ -347,7 +347,7 @@ def auto_manage_merchandise(wrestler_id=None):
             # First, ensure they have a T-Shirt
             if 'T-Shirt' not in existing_types and 'T-Shirt' in available_types:
                 name = f"{wrestler['name']} T-Shirt"
-                create_merchandise_item(wrestler_id, name, 'T-Shirt')
+                create_merchandise_item(wrestler_id, name, 'T-Shirt', rng=rng)
                 current_count += 1
             
             # Add more items up to the target count
@@ -359,18 +359,18 @@ def auto_manage_merchandise(wrestler_id=None):
                     # If all types are used, duplicate a T-Shirt with a different design
                     if current_count < target_item_count:
                         name = f"{wrestler['name']} Special T-Shirt"
-                        create_merchandise_item(wrestler_id, name, 'T-Shirt')
+                        create_merchandise_item(wrestler_id, name, 'T-Shirt', rng=rng)
                         current_count += 1
                     break
                 
                 # Choose a random type
-                chosen_type = random.choice(remaining_types)
+                chosen_type = rng.choice(remaining_types)
                 
                 # Create a name for the item
                 name = f"{wrestler['name']} {chosen_type}"
                 
                 # Create the item
-                create_merchandise_item(wrestler_id, name, chosen_type)
+                create_merchandise_item(wrestler_id, name, chosen_type, rng=rng)
                 
                 # Update counters
                 current_count += 1
@@ -383,7 +383,7 @@ def auto_manage_merchandise(wrestler_id=None):
         success_count = 0
         
         for wrestler in wrestlers:
-            if auto_manage_merchandise(wrestler['id']):
+            if auto_manage_merchandise(wrestler['id'], rng):
                 success_count += 1
                 
         logging.info(f"Auto-managed merchandise for {success_count} wrestlers")
@@ -0,0 +1,169 @@
+"""
+Move Experience Accumulator
+
+Collects per-wrestler move experience in memory and writes it to the
+``wrestler_move_experience`` table in wrestlers.db in a single transaction.
+
+A match used to open a connection and commit once per move (40-80 commits
+per match). Now simulate_match records the whole move log here and flushes
+once. While a batch is open (a whole event, or a bulk run) nothing is written
+until the batch closes, ``flush_move_experience()`` is called, or the process
+shuts down.
+"""
+
+import atexit
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from src.core.db_utils import transaction
+
+# Experience awarded per attempt
+SUCCESS_XP = 2
+FAILURE_XP = 1
+
+UPSERT_SQL = """
+    INSERT INTO wrestler_move_experience
+        (wrestler_id, move_name, experience, times_used, times_succeeded)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(wrestler_id, move_name) DO UPDATE SET
+        experience = experience + excluded.experience,
+        times_used = times_used + excluded.times_used,
+        times_succeeded = times_succeeded + excluded.times_succeeded
+"""
+
+
+class MoveExperienceAccumulator:
+    """Aggregates (wrestler_id, move_name) -> (attempts, successes, xp) deltas."""
+
+    def __init__(self, db_file=None):
+        # db_file defaults to wrestlers.db, resolved at flush time
+        self.db_file = db_file
+        self._deltas = {}
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+
+    @property
+    def batching(self):
+        return self._batch_depth > 0
+
+    def pending(self):
+        """Number of (wrestler, move) pairs waiting to be written."""
+        with self._lock:
+            return len(self._deltas)
+
+    def record(self, wrestler_id, move_name, success):
+        """Record a single move attempt."""
+        if not wrestler_id:
+            return
+        key = (wrestler_id, move_name)
+        with self._lock:
+            delta = self._deltas.get(key)
+            if delta is None:
+                delta = self._deltas[key] = [0, 0, 0]
+            delta[0] += 1
+            if success:
+                delta[1] += 1
+                delta[2] += SUCCESS_XP
+            else:
+                delta[2] += FAILURE_XP
+
+    def record_move_log(self, move_log):
+        """Record every entry of a match move log."""
+        for move_entry in move_log:
+            self.record(move_entry.get("wrestler_id"), move_entry["move_name"], move_entry["success"])
+
+    def flush(self):
+        """Write all pending deltas in one transaction. Returns the rows written."""
+        with self._lock:
+            if not self._deltas:
+                return 0
+            rows = [
+                (wrestler_id, move_name, xp, attempts, successes)
+                for (wrestler_id, move_name), (attempts, successes, xp) in self._deltas.items()
+            ]
+
+            db_file = self.db_file
+            if db_file is None:
+                from db.utils import db_path
+                db_file = db_path("wrestlers.db")
+
+            try:
+                with transaction(db_file) as conn:
+                    conn.executemany(UPSERT_SQL, rows)
+            except sqlite3.Error as e:
+                # Keep the deltas so a later flush can retry
+                logging.error(f"Failed to flush move experience: {e}")
+                return 0
+
+            self._deltas.clear()
+            logging.debug(f"Flushed move experience for {len(rows)} wrestler/move pairs")
+            return len(rows)
+
+    def discard(self):
+        """Drop all pending deltas without writing them."""
+        with self._lock:
+            self._deltas.clear()
+
+    def begin_batch(self):
+        """Defer writes until the matching end_batch()."""
+        with self._lock:
+            self._batch_depth += 1
+
+    def end_batch(self):
+        """Close a batch, flushing when the outermost batch ends."""
+        with self._lock:
+            self._batch_depth = max(0, self._batch_depth - 1)
+            if self._batch_depth == 0:
+                return self.flush()
+        return 0
+
+    @contextmanager
+    def batch(self):
+        self.begin_batch()
+        try:
+            yield self
+        finally:
+            self.end_batch()
+
+
+_accumulator = MoveExperienceAccumulator()
+atexit.register(_accumulator.flush)
+
+
+def get_move_experience_accumulator():
+    """Return the process-wide accumulator."""
+    return _accumulator
+
+
+def record_match_moves(move_log):
+    """Record a finished match's move log, flushing unless a batch is open."""
+    _accumulator.record_move_log(move_log)
+    if not _accumulator.batching:
+        _accumulator.flush()
+
+
+def update_wrestler_move_experience(wrestler_id, move_name, success):
+    """Record a single move attempt, flushing unless a batch is open."""
+    _accumulator.record(wrestler_id, move_name, success)
+    if not _accumulator.batching:
+        _accumulator.flush()
+
+
+def flush_move_experience():
+    """Write any pending move experience now (event end, shutdown)."""
+    return _accumulator.flush()
+
+
+def begin_move_experience_batch():
+    _accumulator.begin_batch()
+
+
+def end_move_experience_batch():
+    return _accumulator.end_batch()
+
+
+def move_experience_batch():
+    """Context manager deferring move experience writes until it exits."""
+    return _accumulator.batch()
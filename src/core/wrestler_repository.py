@@ -0,0 +1,222 @@
+"""
+Wrestler Repository
+
+Process-wide cache of wrestler match profiles.
+
+The whole roster is loaded in one pass (three queries on one connection)
+into compact ``WrestlerProfile`` objects: ``__slots__`` instances with the
+detailed attributes stored as a tuple in ``ATTRIBUTE_NAMES`` order and the
+derived high-level stats precomputed. Lookups by id and by name are dict
+lookups.
+
+Anything that writes a wrestler (the creator UI, the CSV importer,
+``db_admin.add_wrestler``) must call ``invalidate_wrestler`` afterwards;
+a targeted invalidation reloads just that wrestler on its next lookup.
+"""
+
+import logging
+import sqlite3
+import threading
+
+from src.ui.stats_utils import calculate_high_level_stats_with_grades
+
+# Column order of the wrestler_attributes table (after wrestler_id)
+ATTRIBUTE_NAMES = (
+    "powerlifting", "grapple_control", "grip_strength",
+    "agility", "balance", "flexibility", "recovery_rate", "conditioning",
+    "chain_wrestling", "mat_transitions", "submission_technique", "strike_accuracy",
+    "brawling_technique", "aerial_precision", "counter_timing", "pressure_handling",
+    "promo_delivery", "fan_engagement", "entrance_presence", "presence_under_fire", "confidence",
+    "focus", "resilience", "adaptability", "risk_assessment",
+    "loyalty", "political_instinct", "determination"
+)
+
+HIGH_LEVEL_STATS = ("strength", "dexterity", "intelligence", "endurance", "charisma")
+
+_PROFILE_SQL = """
+    SELECT w.id, w.name, w.reputation, w.condition,
+        f.name AS finisher_name, f.style, f.damage
+    FROM wrestlers w
+    JOIN finishers f ON f.id = w.finisher_id
+"""
+
+_ATTRIBUTES_SQL = f"SELECT wrestler_id, {', '.join(ATTRIBUTE_NAMES)} FROM wrestler_attributes"
+
+_SIGNATURES_SQL = """
+    SELECT wsm.wrestler_id, s.name, s.type, s.damage, s.difficulty
+    FROM signature_moves s
+    JOIN wrestler_signature_moves wsm ON s.id = wsm.signature_move_id
+"""
+
+
+class WrestlerProfile:
+    """Read-only match profile of a single wrestler."""
+
+    __slots__ = (
+        "id", "name", "reputation", "condition",
+        "finisher", "signature_moves", "attributes", "derived"
+    )
+
+    def __init__(self, wrestler_id, name, reputation, condition, finisher, signature_moves, attributes):
+        self.id = wrestler_id
+        self.name = name
+        self.reputation = reputation
+        self.condition = condition
+        self.finisher = finisher                          # (name, style, damage)
+        self.signature_moves = tuple(signature_moves)     # ((name, type, damage, difficulty), ...)
+        self.attributes = tuple(attributes)               # values in ATTRIBUTE_NAMES order
+        self.derived = calculate_high_level_stats_with_grades(self.attribute_dict())
+
+    def attribute_dict(self):
+        return dict(zip(ATTRIBUTE_NAMES, self.attributes))
+
+    def stat(self, name):
+        """Value of a high-level stat (strength, dexterity, ...)."""
+        return self.derived[name]["value"]
+
+    def to_dict(self):
+        """Build a fresh wrestler dict in the shape simulate_match expects."""
+        fin_name, fin_style, fin_damage = self.finisher
+        wrestler = {
+            "id": self.id,
+            "name": self.name,
+            "reputation": self.reputation,
+            "condition": self.condition,
+            "finisher": {
+                "name": fin_name,
+                "style": fin_style,
+                "damage": fin_damage
+            },
+            "signature_moves": [
+                {"name": n, "type": t, "damage": d, "difficulty": diff}
+                for n, t, d, diff in self.signature_moves
+            ],
+        }
+        for stat in HIGH_LEVEL_STATS:
+            wrestler[stat] = self.derived[stat]["value"]
+        wrestler.update(zip(ATTRIBUTE_NAMES, self.attributes))
+        return wrestler
+
+
+class WrestlerRepository:
+    """Loads and caches WrestlerProfile objects for the whole roster."""
+
+    def __init__(self, db_file=None):
+        # db_file defaults to wrestlers.db, resolved at load time
+        self.db_file = db_file
+        self._by_id = None
+        self._by_name = {}
+        self._dirty = set()
+        self._lock = threading.RLock()
+
+    def _connect(self):
+        from src.db.utils import db_path
+        conn = sqlite3.connect(self.db_file or db_path("wrestlers.db"))
+        if self.db_file is None:
+            # Finishers may live in the legacy finishers.db
+            conn.execute(f"ATTACH DATABASE '{db_path('finishers.db')}' AS fdb")
+        return conn
+
+    def _fetch(self, conn, wrestler_id=None):
+        """Fetch profiles for the whole roster, or one wrestler."""
+        params = () if wrestler_id is None else (wrestler_id,)
+
+        cursor = conn.cursor()
+        cursor.execute(_PROFILE_SQL + (" WHERE w.id = ?" if params else ""), params)
+        profile_rows = cursor.fetchall()
+
+        cursor.execute(_ATTRIBUTES_SQL + (" WHERE wrestler_id = ?" if params else ""), params)
+        attributes = {row[0]: row[1:] for row in cursor.fetchall()}
+
+        cursor.execute(_SIGNATURES_SQL + (" WHERE wsm.wrestler_id = ?" if params else ""), params)
+        signatures = {}
+        for row in cursor.fetchall():
+            signatures.setdefault(row[0], []).append(row[1:])
+
+        profiles = {}
+        for w_id, name, reputation, condition, fin_name, fin_style, fin_dmg in profile_rows:
+            attr_row = attributes.get(w_id)
+            if attr_row is None:
+                logging.warning(f"Wrestler {w_id} ({name}) has no attributes, skipping")
+                continue
+            profiles[w_id] = WrestlerProfile(
+                w_id, name, reputation, condition,
+                (fin_name, fin_style, fin_dmg),
+                signatures.get(w_id, ()),
+                attr_row
+            )
+        return profiles
+
+    def load(self):
+        """(Re)load the whole roster in one pass."""
+        with self._lock:
+            conn = self._connect()
+            try:
+                self._by_id = self._fetch(conn)
+            finally:
+                conn.close()
+            self._by_name = {p.name: p for p in self._by_id.values()}
+            self._dirty.clear()
+            logging.debug(f"Wrestler repository loaded {len(self._by_id)} wrestlers")
+
+    def _refresh_dirty(self):
+        conn = self._connect()
+        try:
+            for wrestler_id in self._dirty:
+                old = self._by_id.pop(wrestler_id, None)
+                if old is not None and self._by_name.get(old.name) is old:
+                    del self._by_name[old.name]
+                profile = self._fetch(conn, wrestler_id).get(wrestler_id)
+                if profile is not None:
+                    self._by_id[wrestler_id] = profile
+                    self._by_name[profile.name] = profile
+        finally:
+            conn.close()
+        self._dirty.clear()
+
+    def _ensure_loaded(self):
+        if self._by_id is None:
+            self.load()
+        elif self._dirty:
+            self._refresh_dirty()
+
+    def get(self, wrestler_id):
+        """Return the profile for ``wrestler_id`` or None."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._by_id.get(wrestler_id)
+
+    def get_by_name(self, name):
+        """Return the profile for the wrestler called ``name`` or None."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._by_name.get(name)
+
+    def all(self):
+        """Return every profile, ordered by name."""
+        with self._lock:
+            self._ensure_loaded()
+            return sorted(self._by_id.values(), key=lambda p: p.name)
+
+    def invalidate(self, wrestler_id=None):
+        """Reload one wrestler on next access, or the whole roster if no id is given."""
+        with self._lock:
+            if wrestler_id is None or self._by_id is None:
+                self._by_id = None
+                self._by_name = {}
+                self._dirty.clear()
+            else:
+                self._dirty.add(wrestler_id)
+
+
+_repository = WrestlerRepository()
+
+
+def get_wrestler_repository():
+    """Return the process-wide wrestler repository."""
+    return _repository
+
+
+def invalidate_wrestler(wrestler_id=None):
+    """Call after writing a wrestler; pass no id after bulk changes."""
+    _repository.invalidate(wrestler_id)
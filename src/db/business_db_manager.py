@@ -3,6 +3,7 @@ from datetime import datetime
 import json
 import logging
 from db.utils import db_path
+from src.core.db_utils import shared_connection
 
 class BusinessDBManager:
     def __init__(self):
@@ -15,8 +16,8 @@ class BusinessDBManager:
         create_business_tables()
 
     def _get_connection(self):
-        """Get a database connection"""
-        return sqlite3.connect(self.db_path)
+        """Get this thread's shared connection to business.db"""
+        return shared_connection(self.db_path)
 
     # Show Management Methods
     def create_show(self, name, show_type, date, venue_id, budget):
@@ -446,7 +447,7 @@ class BusinessDBManager:
     def get_wrestler_relationships(self, wrestler_id):
         """Get all relationships for a wrestler from relationships.db"""
         try:
-            conn = sqlite3.connect(db_path("relationships.db"))
+            conn = shared_connection("relationships.db")
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -466,7 +467,7 @@ class BusinessDBManager:
     def save_business_state(self):
         """Save business state to save_state.db"""
         try:
-            conn = sqlite3.connect(db_path("save_state.db"))
+            conn = shared_connection("save_state.db")
             cursor = conn.cursor()
             
             # Ensure table exists
@@ -512,7 +513,7 @@ class BusinessDBManager:
     def load_business_state(self):
         """Load business state from save_state.db"""
         try:
-            conn = sqlite3.connect(db_path("save_state.db"))
+            conn = shared_connection("save_state.db")
             cursor = conn.cursor()
             
             # Check if table exists
@@ -542,7 +543,7 @@ class BusinessDBManager:
                             uniqueness=None, fan_appeal=None):
         """Create a new merchandise item"""
         try:
-            conn = sqlite3.connect(db_path("business.db"))
+            conn = shared_connection("business.db")
             cursor = conn.cursor()
             
             # Generate reasonable defaults for optional parameters
@@ -592,7 +593,7 @@ class BusinessDBManager:
     def get_wrestler_merchandise(self, wrestler_id):
         """Get merchandise items for a specific wrestler"""
         try:
-            conn = sqlite3.connect(db_path("business.db"))
+            conn = shared_connection("business.db")
             cursor = conn.cursor()
             
             cursor.execute("""
@@ -1165,7 +1166,7 @@ class BusinessDBManager:
         try:
             if wrestler_id:
                 # Get a single wrestler
-                conn = sqlite3.connect(db_path("wrestlers.db"))
+                conn = shared_connection("wrestlers.db")
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -1182,7 +1183,7 @@ class BusinessDBManager:
                 return False
             else:
                 # Get all wrestlers
-                conn = sqlite3.connect(db_path("wrestlers.db"))
+                conn = shared_connection("wrestlers.db")
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -1,6 +1,7 @@
 import sqlite3
 from datetime import datetime
 from db.utils import db_path
+from src.db.migrations import migrate
 
 def create_business_tables():
     """Create all business-related database tables"""
@@ -199,6 +200,7 @@ def create_business_tables():
 
     conn.commit()
     conn.close()
+    migrate("business.db")
 
 def initialize_business_data():
     """Initialize some basic business data"""
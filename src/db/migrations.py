@@ -0,0 +1,348 @@
+"""
+Schema Migrations
+
+Ordered, versioned schema changes for the game databases. Each database keeps
+a ``schema_version`` table listing the migrations applied to it; ``migrate()``
+applies the missing ones in version order, each in its own transaction
+together with its ``schema_version`` row.
+
+Tables are still created by the code that owns them (MatchStatistics,
+StorylineManager, the db/setup_* scripts), often lazily. A migration whose
+tables do not exist yet is left pending and runs on a later ``migrate()``
+call, so owners call ``migrate("<db>")`` right after creating their tables
+and the game calls ``migrate_all()`` at startup.
+
+Adding a migration: append a ``Migration`` with the next version number.
+Never edit or renumber one that has shipped.
+
+Index plan
+----------
+``HOT_QUERIES`` lists the queries the game runs on every match, event or
+screen refresh. ``find_full_scans()`` runs EXPLAIN QUERY PLAN over them and
+reports any that read a whole table; tests/test_migrations.py keeps that list
+empty.
+"""
+
+import os
+import re
+import json
+import logging
+from collections import namedtuple
+from datetime import datetime
+
+from src.core.db_utils import transaction, shared_connection
+from src.core.career_stats import CREATE_WRESTLER_STATS_SQL, rebuild_wrestler_stats
+from src.db.utils import db_path
+
+# apply: SQL script, or a callable taking the connection
+Migration = namedtuple("Migration", ["version", "db_name", "name", "tables", "apply"])
+
+
+def _table_exists(conn, table):
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone() is not None
+
+
+def _has_unique_index(conn, table, columns):
+    for _, index, unique, *_ in conn.execute(f'PRAGMA index_list("{table}")').fetchall():
+        if unique and {row[2] for row in conn.execute(f'PRAGMA index_info("{index}")')} == set(columns):
+            return True
+    return False
+
+
+def ensure_unique(table, columns, index_name):
+    """
+    Migration step adding UNIQUE(columns) to ``table``.
+
+    Duplicate rows are moved to ``<table>_archived`` first, keeping the most
+    recent (highest rowid) in place. Rows with a NULL key column are left
+    alone: they never clash under a UNIQUE index. Nothing is created if an
+    equivalent unique index or constraint exists.
+    """
+    column_list = ", ".join(columns)
+    keyed = " AND ".join(f"{column} IS NOT NULL" for column in columns)
+    duplicates = f"""
+        {keyed} AND rowid NOT IN (
+            SELECT MAX(rowid) FROM {table} WHERE {keyed} GROUP BY {column_list}
+        )
+    """
+
+    def apply(conn):
+        if _has_unique_index(conn, table, columns):
+            return
+        if conn.execute(f"SELECT 1 FROM {table} WHERE {duplicates} LIMIT 1").fetchone():
+            archive = f"{table}_archived"
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {archive} AS SELECT * FROM {table} WHERE 0")
+            conn.execute(f"INSERT INTO {archive} SELECT * FROM {table} WHERE {duplicates}")
+            removed = conn.execute(f"DELETE FROM {table} WHERE {duplicates}").rowcount
+            logging.warning(
+                f"Moved {removed} duplicate rows from {table} to {archive} before adding UNIQUE({column_list})"
+            )
+        conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table} ({column_list})")
+    return apply
+
+
+def _create_match_participants(conn):
+    """One row per wrestler per match, backfilled from the matches recorded so far."""
+    from src.core.game_state import get_game_date_ordinal
+
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS match_participants (
+            match_id INTEGER NOT NULL,
+            wrestler_id INTEGER NOT NULL,
+            won INTEGER NOT NULL,
+            quality INTEGER NOT NULL,
+            drama INTEGER NOT NULL,
+            date_ordinal INTEGER NOT NULL,
+            PRIMARY KEY (match_id, wrestler_id),
+            FOREIGN KEY (match_id) REFERENCES matches (id)
+        )
+    """)
+    conn.execute("""
+        CREATE INDEX IF NOT EXISTS idx_participants_wrestler_date
+            ON match_participants (wrestler_id, date_ordinal DESC, match_id DESC)
+    """)
+
+    drama = dict(conn.execute("SELECT match_id, drama_score FROM match_history").fetchall())
+    rows = []
+    for match_id, w1_id, w2_id, winner_id, match_date, rating in conn.execute(
+            "SELECT id, wrestler1_id, wrestler2_id, winner_id, match_date, match_rating FROM matches"):
+        try:
+            ordinal = get_game_date_ordinal(match_date)
+        except (TypeError, ValueError):
+            logging.warning(f"Match {match_id} has an unreadable date ({match_date!r}); backfilled as day 0")
+            ordinal = 0
+        match_drama = drama.get(f"match_{match_id}", rating)
+        for wrestler_id in (w1_id, w2_id):
+            rows.append((match_id, wrestler_id, 1 if wrestler_id == winner_id else 0, rating, match_drama, ordinal))
+    conn.executemany("INSERT OR IGNORE INTO match_participants VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+
+def _materialize_wrestler_stats(conn):
+    """Carry duration and reversals on match_participants and rebuild wrestler_stats from it."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(match_participants)")}
+    if "duration_minutes" not in columns:
+        conn.execute("ALTER TABLE match_participants ADD COLUMN duration_minutes REAL NOT NULL DEFAULT 0")
+        conn.execute("""
+            UPDATE match_participants SET duration_minutes = COALESCE(
+                (SELECT duration_minutes FROM matches WHERE matches.id = match_participants.match_id), 0
+            )
+        """)
+    if "reversals" not in columns:
+        conn.execute("ALTER TABLE match_participants ADD COLUMN reversals INTEGER NOT NULL DEFAULT 0")
+        updates = []
+        for match_id, wrestlers_json, reversals_json in conn.execute(
+                "SELECT match_id, wrestlers_json, reversals_json FROM match_history WHERE match_id LIKE 'match_%'"):
+            try:
+                wrestlers, reversals = json.loads(wrestlers_json), json.loads(reversals_json)
+                match_number = int(match_id[len("match_"):])
+            except (TypeError, ValueError):
+                continue
+            for position in ("wrestler1", "wrestler2"):
+                count = reversals.get(wrestlers.get(position)) if isinstance(reversals, dict) else None
+                if isinstance(count, int) and wrestlers.get(f"{position}_id") is not None:
+                    updates.append((count, match_number, wrestlers[f"{position}_id"]))
+        conn.executemany("UPDATE match_participants SET reversals = ? WHERE match_id = ? AND wrestler_id = ?", updates)
+
+    # The legacy table was keyed by name and never maintained
+    conn.execute("DROP TABLE IF EXISTS wrestler_stats")
+    conn.execute(CREATE_WRESTLER_STATS_SQL)
+    rebuild_wrestler_stats(conn)
+
+
+MIGRATIONS = [
+    Migration(1, "storylines.db", "index storyline interactions by pair", ["storyline_interactions"], """
+        CREATE INDEX IF NOT EXISTS idx_storyline_interactions_pair
+            ON storyline_interactions (storyline_pair, interaction_date);
+    """),
+    Migration(2, "match_statistics.db", "index wrestler performances by wrestler", ["wrestler_performances"], """
+        CREATE INDEX IF NOT EXISTS idx_performances_wrestler
+            ON wrestler_performances (wrestler_id, won, match_rating, duration_minutes);
+    """),
+    Migration(3, "match_statistics.db", "one performance per wrestler per match", ["wrestler_performances"],
+              ensure_unique("wrestler_performances", ("match_id", "wrestler_id"), "ux_performances_match_wrestler")),
+    Migration(4, "matches.db", "one match per card slot", ["matches"],
+              ensure_unique("matches", ("event_id", "match_index"), "ux_matches_event_index")),
+    Migration(5, "business.db", "index merchandise sales by wrestler and show", ["merchandise_sales"], """
+        CREATE INDEX IF NOT EXISTS idx_merch_sales_date ON merchandise_sales (sale_date);
+        CREATE INDEX IF NOT EXISTS idx_merch_sales_wrestler_date ON merchandise_sales (wrestler_id, sale_date);
+        CREATE INDEX IF NOT EXISTS idx_merch_sales_show_date ON merchandise_sales (show_id, sale_date);
+    """),
+    Migration(6, "business.db", "index financial transactions by date", ["financial_transactions"], """
+        CREATE INDEX IF NOT EXISTS idx_transactions_date ON financial_transactions (transaction_date);
+    """),
+    Migration(7, "relationships.db", "index relationship events by time", ["relationship_events"], """
+        CREATE INDEX IF NOT EXISTS idx_relationship_events_timestamp ON relationship_events (timestamp);
+    """),
+    Migration(8, "wrestlers.db", "unique move experience per wrestler and move", ["wrestler_move_experience"],
+              ensure_unique("wrestler_move_experience", ("wrestler_id", "move_name"), "ux_move_experience_wrestler_move")),
+    Migration(9, "wrestlers.db", "drop duplicate move experience index", ["wrestler_move_experience"], """
+        DROP INDEX IF EXISTS idx_wrestler_move;
+    """),
+    Migration(10, "match_statistics.db", "normalize match participants", ["matches", "match_history"],
+              _create_match_participants),
+    Migration(11, "match_statistics.db", "materialize wrestler career stats", ["match_participants"],
+              _materialize_wrestler_stats),
+]
+
+
+def _create_version_table(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+    """)
+
+
+def applied_versions(db_name):
+    """Versions of the migrations applied to a database."""
+    conn = shared_connection(db_name)
+    try:
+        if not _table_exists(conn, "schema_version"):
+            return set()
+        return {row[0] for row in conn.execute("SELECT version FROM schema_version")}
+    finally:
+        conn.close()
+
+
+def schema_version(db_name):
+    """Highest migration version applied to a database (0 if none)."""
+    return max(applied_versions(db_name), default=0)
+
+
+def migrate(db_name, migrations=None):
+    """
+    Apply a database's pending migrations in version order.
+
+    Migrations whose tables do not exist yet stay pending. Returns the
+    versions applied.
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    pending = sorted((m for m in migrations if m.db_name == db_name), key=lambda m: m.version)
+    if not pending:
+        return []
+
+    done = applied_versions(db_name)
+    applied = []
+    for migration in pending:
+        if migration.version in done:
+            continue
+        with transaction(db_name, immediate=True) as conn:
+            if not all(_table_exists(conn, table) for table in migration.tables):
+                continue
+            if callable(migration.apply):
+                migration.apply(conn)
+            else:
+                for statement in _split_script(migration.apply):
+                    conn.execute(statement)
+            _create_version_table(conn)
+            conn.execute("INSERT INTO schema_version (version, name, applied_at) VALUES (?, ?, ?)",
+                         (migration.version, migration.name, datetime.now().isoformat()))
+        applied.append(migration.version)
+        logging.info(f"Applied migration {migration.version} to {db_name}: {migration.name}")
+    return applied
+
+
+def migrate_all(migrations=None):
+    """
+    Run migrate() on every existing database that has migrations.
+
+    Returns {db_name: versions applied}.
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    results = {}
+    for db_name in dict.fromkeys(m.db_name for m in migrations):
+        if not os.path.exists(db_path(db_name)):
+            continue
+        try:
+            results[db_name] = migrate(db_name, migrations)
+        except Exception as e:
+            logging.error(f"Error migrating {db_name}: {e}")
+            results[db_name] = []
+    return results
+
+
+def _split_script(script):
+    # executescript() would commit the open transaction
+    return [statement.strip() for statement in script.split(";") if statement.strip()]
+
+
+# (db_name, query, params) run on every match, event or screen refresh
+HOT_QUERIES = [
+    ("storylines.db", """
+        SELECT base_value, decay_rate, interaction_date FROM storyline_interactions
+        WHERE storyline_pair = ?
+    """, ("1-2",)),
+    ("storylines.db", """
+        SELECT id, interaction_type, interaction_date FROM storyline_interactions
+        WHERE storyline_pair = ? ORDER BY interaction_date DESC
+    """, ("1-2",)),
+    ("match_statistics.db", """
+        SELECT matches, wins, losses, avg_quality, total_duration FROM wrestler_stats WHERE wrestler_id = ?
+    """, (1,)),
+    ("match_statistics.db", """
+        SELECT won, quality, drama FROM match_participants
+        WHERE wrestler_id = ? ORDER BY date_ordinal DESC, match_id DESC LIMIT ?
+    """, (1, 5)),
+    ("match_statistics.db", """
+        SELECT won, quality, drama FROM match_participants
+        WHERE wrestler_id = ? AND date_ordinal >= ? ORDER BY date_ordinal DESC, match_id DESC
+    """, (1, 739000)),
+    ("matches.db", """
+        SELECT wrestler_1, wrestler_2, winner FROM matches
+        WHERE event_id = ? ORDER BY match_index DESC LIMIT 1
+    """, (1,)),
+    ("business.db", """
+        SELECT * FROM merchandise_sales WHERE sale_date >= ? AND sale_date <= ? ORDER BY sale_date DESC
+    """, ("2025-01-01", "2025-01-31")),
+    ("business.db", """
+        SELECT * FROM merchandise_sales WHERE wrestler_id = ? ORDER BY sale_date DESC
+    """, (1,)),
+    ("business.db", """
+        SELECT * FROM merchandise_sales WHERE show_id = ? ORDER BY sale_date DESC
+    """, (1,)),
+    ("business.db", """
+        SELECT transaction_type, category, SUM(amount) FROM financial_transactions
+        WHERE transaction_date BETWEEN ? AND ? GROUP BY transaction_type, category
+    """, ("2025-01-01", "2025-01-31")),
+    ("business.db", """
+        SELECT id, amount FROM financial_transactions ORDER BY transaction_date DESC LIMIT ?
+    """, (50,)),
+    ("relationships.db", """
+        SELECT wrestler1_id, wrestler2_id, event_description, value_change, timestamp
+        FROM relationship_events ORDER BY timestamp DESC LIMIT 100
+    """, ()),
+    ("wrestlers.db", """
+        SELECT experience FROM wrestler_move_experience WHERE wrestler_id = ? AND move_name = ?
+    """, (1, "Suplex")),
+]
+
+_FULL_SCAN = re.compile(r"^SCAN (?:TABLE )?(\w+)$")
+
+
+def full_scans(conn, query, params=()):
+    """Tables ``query`` reads in full, according to EXPLAIN QUERY PLAN."""
+    plan = conn.execute("EXPLAIN QUERY PLAN " + query, params).fetchall()
+    scans = []
+    for row in plan:
+        match = _FULL_SCAN.match(row[-1].strip())
+        if match:
+            scans.append(match.group(1))
+    return scans
+
+
+def find_full_scans(queries=None):
+    """[(db_name, query, tables)] for hot queries that fall back to a full table scan."""
+    offenders = []
+    for db_name, query, params in HOT_QUERIES if queries is None else queries:
+        conn = shared_connection(db_name)
+        try:
+            tables = full_scans(conn, query, params)
+        finally:
+            conn.close()
+        if tables:
+            offenders.append((db_name, " ".join(query.split()), tables))
+    return offenders
@@ -0,0 +1,360 @@
+"""
+Save Snapshots
+
+A save snapshot is one SQLite file per save slot (``db/saves/slot_<n>.save``)
+holding a copy of every game database. Each database's tables are namespaced
+with the database's name, so ``business.db``'s ``merchandise_sales`` is stored
+as ``business__merchandise_sales`` and the ``matches`` tables of
+``matches.db`` and ``match_history.db`` no longer collide. Cross-domain
+reports over a snapshot run as single queries::
+
+    conn = open_save(1)
+    conn.execute('''
+        SELECT w.popularity, SUM(s.quantity)
+        FROM business__merchandise_sales s
+        JOIN business__wrestlers w ON w.id = s.wrestler_id
+        GROUP BY s.wrestler_id
+    ''')
+
+Snapshots, not live storage
+---------------------------
+This module exports and imports snapshots; it does not consolidate the live
+game into one file. The game keeps running on its separate working
+databases: ``db_path("x.db")`` callers are not redirected into the slot file,
+writes during play are atomic per database only, and live cross-database
+joins need ``attach_domains()``. ``save_game()`` copies all working databases
+into the slot in one transaction, so a slot holds either the new snapshot or
+its previous one, and ``load_game()`` expands a slot back into the working
+files.
+
+``db/snapshot_databases.py`` builds a snapshot from the current databases,
+including the copies older builds left in the working directory or ``data/``.
+"""
+
+import os
+import re
+import sqlite3
+import logging
+from datetime import datetime
+from urllib.request import pathname2url
+
+from src.db.utils import db_path
+
+SAVE_FORMAT_VERSION = 1
+SAVES_DIR = "saves"
+DEFAULT_SLOT = 1
+NAMESPACE_SEPARATOR = "__"
+
+# namespace -> working database file
+DOMAINS = {
+    "wrestlers": "wrestlers.db",
+    "finishers": "finishers.db",
+    "manoeuvres": "manoeuvres.db",
+    "events": "events.db",
+    "matches": "matches.db",
+    "match_history": "match_history.db",
+    "business": "business.db",
+    "relationships": "relationships.db",
+    "save_state": "save_state.db",
+    "commentary": "commentary.db",
+    "storylines": "storylines.db",
+    "rivalries": "rivalries.db",
+    "match_statistics": "match_statistics.db",
+}
+
+# Directories older builds wrote some databases to, relative to the project root
+LEGACY_DIRS = ("", "data")
+
+_CREATE_TABLE = re.compile(r'^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?("[^"]+"|\[[^\]]+\]|`[^`]+`|\w+)', re.I)
+_CREATE_INDEX = re.compile(
+    r'^\s*CREATE\s+(UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?("[^"]+"|\[[^\]]+\]|`[^`]+`|\w+)\s+ON\s+'
+    r'("[^"]+"|\[[^\]]+\]|`[^`]+`|\w+)', re.I
+)
+
+
+def namespaced(namespace, name):
+    """Name of a database's table inside a save snapshot."""
+    return f"{namespace}{NAMESPACE_SEPARATOR}{name}"
+
+
+def namespace_for(db_name):
+    """Namespace of a working database file name ("business.db" -> "business")."""
+    for namespace, filename in DOMAINS.items():
+        if filename == os.path.basename(db_name):
+            return namespace
+    raise KeyError(f"{db_name} is not a game database")
+
+
+def save_path(slot=DEFAULT_SLOT):
+    """Path of a save slot's file."""
+    return db_path(os.path.join(SAVES_DIR, f"slot_{slot}.save"))
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _unquote(token):
+    if token[0] in '"[`':
+        return token[1:-1]
+    return token
+
+
+def _rename_table_sql(sql, name):
+    return _CREATE_TABLE.sub(lambda m: f"CREATE TABLE {_quote(name)}", sql, count=1)
+
+
+def _rename_index_sql(sql, index_name, table_name):
+    return _CREATE_INDEX.sub(
+        lambda m: f"CREATE {m.group(1) or ''}INDEX {_quote(index_name)} ON {_quote(table_name)}", sql, count=1
+    )
+
+
+def _schema(conn, schema="main"):
+    """(tables, indexes) of a database, as (name, sql) and (name, table, sql) lists."""
+    rows = conn.execute(f"""
+        SELECT type, name, tbl_name, sql FROM {schema}.sqlite_master
+        WHERE type IN ('table', 'index') AND sql IS NOT NULL AND name NOT LIKE 'sqlite_%'
+        ORDER BY rowid
+    """).fetchall()
+    tables = [(name, sql) for kind, name, _, sql in rows if kind == "table"]
+    indexes = [(name, table, sql) for kind, name, table, sql in rows if kind == "index"]
+    return tables, indexes
+
+
+def _sequences(conn):
+    try:
+        return dict(conn.execute("SELECT name, seq FROM sqlite_sequence").fetchall())
+    except sqlite3.OperationalError:
+        return {}
+
+
+def _create_catalog(conn):
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS save_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS save_tables (
+            namespace TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            name TEXT NOT NULL,
+            table_name TEXT NOT NULL,
+            sql TEXT NOT NULL,
+            seq INTEGER,
+            PRIMARY KEY (namespace, kind, name)
+        )
+    """)
+
+
+def default_sources():
+    """Working database paths by namespace, for the databases that exist."""
+    sources = {}
+    for namespace, filename in DOMAINS.items():
+        path = db_path(filename)
+        if os.path.exists(path) and os.path.getsize(path):
+            sources[namespace] = path
+    return sources
+
+
+def legacy_sources(project_root=None):
+    """
+    default_sources() plus databases only found where older builds kept them
+    (the working directory or ``data/``).
+    """
+    project_root = project_root or os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    sources = default_sources()
+    for namespace, filename in DOMAINS.items():
+        if namespace in sources:
+            continue
+        for directory in (os.getcwd(),) + tuple(os.path.join(project_root, d) for d in LEGACY_DIRS):
+            path = os.path.join(directory, filename)
+            if os.path.isfile(path) and os.path.getsize(path):
+                sources[namespace] = path
+                break
+    return sources
+
+
+def save_game(slot=DEFAULT_SLOT, path=None, sources=None):
+    """
+    Snapshot every game database into a save slot in a single transaction.
+
+    ``sources`` maps namespaces to database files (default: the working
+    databases). Tables from an earlier save of the slot are replaced. Returns
+    the number of rows saved per namespace.
+    """
+    path = path or save_path(slot)
+    sources = default_sources() if sources is None else sources
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    counts = {}
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            _create_catalog(conn)
+            for namespace, name in conn.execute(
+                    "SELECT namespace, name FROM save_tables WHERE kind = 'table'").fetchall():
+                conn.execute(f"DROP TABLE IF EXISTS {_quote(namespaced(namespace, name))}")
+            conn.execute("DELETE FROM save_tables")
+
+            for namespace, source_path in sources.items():
+                counts[namespace] = _save_namespace(conn, namespace, source_path)
+
+            conn.executemany("INSERT OR REPLACE INTO save_meta VALUES (?, ?)", [
+                ("format_version", str(SAVE_FORMAT_VERSION)),
+                ("slot", str(slot)),
+                ("saved_at", datetime.now().isoformat())
+            ])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
+    logging.info(f"Saved {len(counts)} databases ({sum(counts.values())} rows) to {path}")
+    return counts
+
+
+def _save_namespace(conn, namespace, source_path):
+    source = sqlite3.connect(f"file:{pathname2url(os.path.abspath(source_path))}?mode=ro", uri=True)
+    rows_saved = 0
+    try:
+        tables, indexes = _schema(source)
+        sequences = _sequences(source)
+        for table, sql in tables:
+            target = namespaced(namespace, table)
+            conn.execute(_rename_table_sql(sql, target))
+            columns = [row[1] for row in source.execute(f"PRAGMA table_info({_quote(table)})")]
+            column_list = ", ".join(_quote(c) for c in columns)
+            cursor = source.execute(f"SELECT {column_list} FROM {_quote(table)}")
+            insert = f"INSERT INTO {_quote(target)} ({column_list}) VALUES ({', '.join('?' * len(columns))})"
+            while True:
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                conn.executemany(insert, rows)
+                rows_saved += len(rows)
+            seq = sequences.get(table)
+            if seq is not None:
+                conn.execute("DELETE FROM sqlite_sequence WHERE name = ?", (target,))
+                conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (target, seq))
+            conn.execute("INSERT INTO save_tables VALUES (?, 'table', ?, ?, ?, ?)", (namespace, table, table, sql, seq))
+
+        for index, table, sql in indexes:
+            conn.execute(_rename_index_sql(sql, namespaced(namespace, index), namespaced(namespace, table)))
+            conn.execute("INSERT INTO save_tables VALUES (?, 'index', ?, ?, ?, NULL)", (namespace, index, table, sql))
+    finally:
+        source.close()
+    return rows_saved
+
+
+def open_save(slot=DEFAULT_SLOT, path=None):
+    """Open a save slot's file for cross-domain queries over the namespaced tables."""
+    path = path or save_path(slot)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No save snapshot at {path}")
+    return sqlite3.connect(path)
+
+
+def load_game(slot=DEFAULT_SLOT, path=None, directory=None):
+    """
+    Replace the working databases with a save slot's snapshot.
+
+    Each database is rebuilt in a temporary file next to it and swapped in
+    once every database has been rebuilt; databases the save does not contain
+    are left alone. Returns the namespaces loaded.
+    """
+    conn = open_save(slot, path)
+    try:
+        version = conn.execute("SELECT value FROM save_meta WHERE key = 'format_version'").fetchone()
+        if version is None or int(version[0]) > SAVE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported save snapshot format: {version[0] if version else 'unknown'}")
+        catalog = {}
+        for namespace, kind, name, table_name, sql, seq in conn.execute(
+                "SELECT namespace, kind, name, table_name, sql, seq FROM save_tables ORDER BY rowid"):
+            catalog.setdefault(namespace, []).append((kind, name, table_name, sql, seq))
+
+        staged = {}
+        try:
+            for namespace, entries in catalog.items():
+                target = os.path.join(directory, DOMAINS[namespace]) if directory else db_path(DOMAINS[namespace])
+                staged[target] = _expand_namespace(conn, namespace, entries, target + ".loading")
+        except BaseException:
+            for temp_path in staged.values():
+                os.remove(temp_path)
+            raise
+    finally:
+        conn.close()
+
+    # Nothing may keep the old files (or their WAL) open while they are swapped
+    from src.core.db_utils import close_connections
+    close_connections()
+    for target, temp_path in staged.items():
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(target + suffix):
+                os.remove(target + suffix)
+        os.replace(temp_path, target)
+    invalidate_db_caches()
+
+    logging.info(f"Loaded {len(staged)} databases from save slot {slot}")
+    return sorted(catalog)
+
+
+def _expand_namespace(conn, namespace, entries, temp_path):
+    if os.path.exists(temp_path):
+        os.remove(temp_path)
+    out = sqlite3.connect(temp_path)
+    try:
+        for kind, name, table_name, sql, seq in entries:
+            if kind != "table":
+                continue
+            out.execute(sql)
+            source = namespaced(namespace, name)
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({_quote(source)})")]
+            column_list = ", ".join(_quote(c) for c in columns)
+            cursor = conn.execute(f"SELECT {column_list} FROM {_quote(source)}")
+            insert = f"INSERT INTO {_quote(name)} ({column_list}) VALUES ({', '.join('?' * len(columns))})"
+            while True:
+                rows = cursor.fetchmany(1000)
+                if not rows:
+                    break
+                out.executemany(insert, rows)
+            if seq is not None:
+                out.execute("DELETE FROM sqlite_sequence WHERE name = ?", (name,))
+                out.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (name, seq))
+        for kind, name, table_name, sql, seq in entries:
+            if kind == "index":
+                out.execute(sql)
+        out.commit()
+    finally:
+        out.close()
+    return temp_path
+
+
+def attach_domains(conn, *namespaces, directory=None):
+    """
+    ATTACH working databases to ``conn`` under their namespaces.
+
+    Lets one connection join across databases on live data, e.g.
+    ``business.merchandise_sales`` with ``wrestlers.wrestlers``. SQLite allows
+    ten attached databases per connection by default.
+    """
+    for namespace in namespaces:
+        filename = DOMAINS[namespace]
+        path = os.path.join(directory, filename) if directory else db_path(filename)
+        conn.execute("ATTACH DATABASE ? AS " + _quote(namespace), (path,))
+    return conn
+
+
+def invalidate_db_caches():
+    """Drop in-memory copies of database contents after the files changed underneath them."""
+    from src.core.wrestler_repository import invalidate_wrestler
+    from src.core.manoeuvre_catalog import invalidate_manoeuvre_catalog
+    from src.core.commentary_store import invalidate_commentary_store
+    invalidate_wrestler()
+    invalidate_manoeuvre_catalog()
+    invalidate_commentary_store()
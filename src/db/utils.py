@@ -1,11 +1,15 @@
 import os
 import logging
 
+# Points every db_path() lookup at another directory (e.g. a benchmark fixture)
+DB_DIR_ENV = "OVERBOOKED_DB_DIR"
+
 def db_path(db_name):
     """
     Get the path to a database file.
     
-    This function returns the path to the database file in the /db directory.
+    This function returns the path to the database file in the /db directory,
+    or in the directory named by the OVERBOOKED_DB_DIR environment variable.
     
     Args:
         db_name: Name of the database file
@@ -13,6 +17,10 @@ def db_path(db_name):
     Returns:
         Full path to the database file
     """
+    override = os.environ.get(DB_DIR_ENV)
+    if override:
+        return os.path.join(override, db_name)
+
     # Get project root directory
     current_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(os.path.dirname(current_dir))
@@ -58,6 +58,9 @@ def main():
     setup_logging()
     logging.info("=== Overbooked: Wrestling Simulator ===")
     logging.info("Starting application...")
+
+    from src.db.migrations import migrate_all
+    migrate_all()
     
     app = QApplication(sys.argv)
 
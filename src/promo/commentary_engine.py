@@ -1364,176 +1364,193 @@ def generate_commentary(beat):
     
     return commentary
 
-def generate_standard_commentary(beat, score):
-    """Generate commentary for standard (single wrestler) promos."""
-    phase = beat.get('phase', 'middle')
-    
-    # Commentary pool by score range and phase
-    commentary_pool = {
-        'opening': {
-            'great': [
-                "What a strong opening!",
-                "That's how you kick off a promo!",
-                "Perfect way to start things off!",
-                "The crowd is loving this opening!"
-            ],
-            'good': [
-                "Solid start to this promo.",
-                "Good energy to begin with.",
-                "Nice opening by the superstar.",
-                "Starting things off on the right foot."
-            ],
-            'average': [
-                "Let's see where this goes.",
-                "A typical opening.",
-                "The crowd seems interested.",
-                "Starting with the basics."
-            ],
-            'poor': [
-                "A bit of a slow start.",
-                "Not the strongest opening.",
-                "The crowd isn't quite connecting yet.",
-                "Needs to find a better rhythm."
-            ],
-            'bad': [
-                "Struggling to get started here.",
-                "The crowd is already restless.",
-                "Not the way you want to begin.",
-                "Completely missing the mark with this opening."
-            ]
-        },
-        'middle': {
-            'great': [
-                "The audience is completely captivated!",
-                "This is masterful mic work!",
-                "This promo is on another level!",
-                "We're witnessing something special here!"
-            ],
-            'good': [
-                "The crowd is really getting into this.",
-                "Strong words from the superstar.",
-                "They're building momentum nicely.",
-                "This promo is hitting all the right notes."
-            ],
-            'average': [
-                "The audience is paying attention.",
-                "This promo is moving along.",
-                "Keeping the crowd engaged.",
-                "Steady performance on the mic."
-            ],
-            'poor': [
-                "The crowd's attention is wavering.",
-                "Losing momentum here.",
-                "This promo needs more energy.",
-                "Not quite connecting with the audience."
-            ],
-            'bad': [
-                "The crowd is turning against this promo.",
-                "This is falling completely flat.",
-                "They've lost the audience entirely.",
-                "This promo is going nowhere fast."
-            ]
-        },
-        'ending': {
-            'great': [
-                "What a perfect finish!",
-                "That's how you close a promo!",
-                "The crowd is erupting!",
-                "An absolutely stellar conclusion!"
-            ],
-            'good': [
-                "Strong finish to this promo.",
-                "Ended on a high note.",
-                "The crowd appreciated that closing.",
-                "Solid way to wrap things up."
-            ],
-            'average': [
-                "And that concludes the promo.",
-                "A standard finish.",
-                "The crowd seems satisfied.",
-                "Wrapped up as expected."
-            ],
-            'poor': [
-                "That ending fell a bit flat.",
-                "Needed a stronger conclusion.",
-                "The crowd was expecting more.",
-                "A weak way to finish."
-            ],
-            'bad': [
-                "That ending completely missed the mark.",
-                "The crowd is disappointed with that finish.",
-                "A terrible way to conclude.",
-                "That promo ended with a whimper, not a bang."
-            ]
-        }
+# Beat commentary by phase and score quality (standard promos)
+STANDARD_COMMENTARY = {
+    "opening": {
+        "great": (
+            "What a strong opening!",
+            "That's how you kick off a promo!",
+            "Perfect way to start things off!",
+            "The crowd is loving this opening!"
+        ),
+        "good": (
+            "Solid start to this promo.",
+            "Good energy to begin with.",
+            "Nice opening by the superstar.",
+            "Starting things off on the right foot."
+        ),
+        "average": (
+            "Let's see where this goes.",
+            "A typical opening.",
+            "The crowd seems interested.",
+            "Starting with the basics."
+        ),
+        "poor": (
+            "A bit of a slow start.",
+            "Not the strongest opening.",
+            "The crowd isn't quite connecting yet.",
+            "Needs to find a better rhythm."
+        ),
+        "bad": (
+            "Struggling to get started here.",
+            "The crowd is already restless.",
+            "Not the way you want to begin.",
+            "Completely missing the mark with this opening."
+        )
+    },
+    "middle": {
+        "great": (
+            "The audience is completely captivated!",
+            "This is masterful mic work!",
+            "This promo is on another level!",
+            "We're witnessing something special here!"
+        ),
+        "good": (
+            "The crowd is really getting into this.",
+            "Strong words from the superstar.",
+            "They're building momentum nicely.",
+            "This promo is hitting all the right notes."
+        ),
+        "average": (
+            "The audience is paying attention.",
+            "This promo is moving along.",
+            "Keeping the crowd engaged.",
+            "Steady performance on the mic."
+        ),
+        "poor": (
+            "The crowd's attention is wavering.",
+            "Losing momentum here.",
+            "This promo needs more energy.",
+            "Not quite connecting with the audience."
+        ),
+        "bad": (
+            "The crowd is turning against this promo.",
+            "This is falling completely flat.",
+            "They've lost the audience entirely.",
+            "This promo is going nowhere fast."
+        )
+    },
+    "ending": {
+        "great": (
+            "What a perfect finish!",
+            "That's how you close a promo!",
+            "The crowd is erupting!",
+            "An absolutely stellar conclusion!"
+        ),
+        "good": (
+            "Strong finish to this promo.",
+            "Ended on a high note.",
+            "The crowd appreciated that closing.",
+            "Solid way to wrap things up."
+        ),
+        "average": (
+            "And that concludes the promo.",
+            "A standard finish.",
+            "The crowd seems satisfied.",
+            "Wrapped up as expected."
+        ),
+        "poor": (
+            "That ending fell a bit flat.",
+            "Needed a stronger conclusion.",
+            "The crowd was expecting more.",
+            "A weak way to finish."
+        ),
+        "bad": (
+            "That ending completely missed the mark.",
+            "The crowd is disappointed with that finish.",
+            "A terrible way to conclude.",
+            "That promo ended with a whimper, not a bang."
+        )
     }
-    
-    # Determine quality category based on score
+}
+
+# Beat commentary by score quality (versus promos)
+VERSUS_COMMENTARY = {
+    "great": (
+        "That was a devastating verbal assault!",
+        "The audience is going wild for that exchange!",
+        "What a brilliant counter-point!",
+        "That's how you dominate a verbal confrontation!"
+    ),
+    "good": (
+        "Strong response in this back-and-forth.",
+        "The crowd is loving this exchange.",
+        "That landed perfectly in this war of words.",
+        "Gaining the upper hand in this verbal duel."
+    ),
+    "average": (
+        "This back-and-forth continues.",
+        "The verbal jousting continues.",
+        "Trading words in the center of the ring.",
+        "Neither one backing down in this exchange."
+    ),
+    "poor": (
+        "That response didn't quite land.",
+        "Losing ground in this exchange.",
+        "The crowd expected a stronger comeback.",
+        "Struggling to find the right words."
+    ),
+    "bad": (
+        "Completely outmatched in this exchange.",
+        "That verbal jab missed by a mile.",
+        "The audience is cringing at that response.",
+        "Dropping the ball in this confrontation."
+    )
+}
+
+
+def _index_commentary():
+    """Flatten the commentary pools into one template table and per-pool id tuples."""
+    templates = []
+    pools = {}
+
+    def add_pool(key, lines):
+        pools[key] = tuple(range(len(templates), len(templates) + len(lines)))
+        templates.extend(lines)
+
+    for phase, qualities in STANDARD_COMMENTARY.items():
+        for quality, lines in qualities.items():
+            add_pool((phase, quality), lines)
+    for quality, lines in VERSUS_COMMENTARY.items():
+        add_pool(("versus", quality), lines)
+    return tuple(templates), pools
+
+
+# Every commentary template, addressed by id; beats store the id and the
+# text is only looked up when the beat is displayed
+COMMENTARY_TEMPLATES, COMMENTARY_POOLS = _index_commentary()
+
+
+def commentary_quality(score):
+    """Map a beat score to its commentary quality bucket."""
     if score >= 85:
-        quality = 'great'
+        return 'great'
     elif score >= 70:
-        quality = 'good'
+        return 'good'
     elif score >= 50:
-        quality = 'average'
+        return 'average'
     elif score >= 30:
-        quality = 'poor'
+        return 'poor'
     else:
-        quality = 'bad'
-    
-    # Select a random commentary line from the appropriate pool
-    if phase in commentary_pool and quality in commentary_pool[phase]:
-        return random.choice(commentary_pool[phase][quality])
+        return 'bad'
+
+
+def pick_commentary_id(score, phase='middle', versus_mode=False, rng=random):
+    """Pick the id of a commentary template for a beat."""
+    quality = commentary_quality(score)
+    if versus_mode:
+        ids = COMMENTARY_POOLS[("versus", quality)]
     else:
-        # Fallback to middle phase if the specified phase isn't found
-        return random.choice(commentary_pool['middle'][quality])
+        # Fall back to the middle phase if the phase has no pool
+        ids = COMMENTARY_POOLS.get((phase, quality)) or COMMENTARY_POOLS[("middle", quality)]
+    return rng.choice(ids)
+
+
+def generate_standard_commentary(beat, score):
+    """Generate commentary for standard (single wrestler) promos."""
+    return COMMENTARY_TEMPLATES[pick_commentary_id(score, beat.get('phase', 'middle'))]
+
 
 def generate_versus_commentary(beat, score):
     """Generate commentary for versus promos."""
-    # Commentary pool by score range for versus promos
-    commentary_pool = {
-        'great': [
-            "That was a devastating verbal assault!",
-            "The audience is going wild for that exchange!",
-            "What a brilliant counter-point!",
-            "That's how you dominate a verbal confrontation!"
-        ],
-        'good': [
-            "Strong response in this back-and-forth.",
-            "The crowd is loving this exchange.",
-            "That landed perfectly in this war of words.",
-            "Gaining the upper hand in this verbal duel."
-        ],
-        'average': [
-            "This back-and-forth continues.",
-            "The verbal jousting continues.",
-            "Trading words in the center of the ring.",
-            "Neither one backing down in this exchange."
-        ],
-        'poor': [
-            "That response didn't quite land.",
-            "Losing ground in this exchange.",
-            "The crowd expected a stronger comeback.",
-            "Struggling to find the right words."
-        ],
-        'bad': [
-            "Completely outmatched in this exchange.",
-            "That verbal jab missed by a mile.",
-            "The audience is cringing at that response.",
-            "Dropping the ball in this confrontation."
-        ]
-    }
-    
-    # Determine quality category based on score
-    if score >= 85:
-        quality = 'great'
-    elif score >= 70:
-        quality = 'good'
-    elif score >= 50:
-        quality = 'average'
-    elif score >= 30:
-        quality = 'poor'
-    else:
-        quality = 'bad'
-    
-    # Select a random commentary line from the appropriate pool
-    return random.choice(commentary_pool[quality]) 
\ No newline at end of file
+    return COMMENTARY_TEMPLATES[pick_commentary_id(score, versus_mode=True)]
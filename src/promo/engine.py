@@ -39,7 +39,7 @@ def generate_promo(wrestler, focus=10, difficulty=10, style="boast", theme="lega
     
     # Try to use PromoEngine or fall back to simple template
     try:
-        promo_engine = PromoEngine(enhanced_wrestler, crowd_reaction=50, tone=style, theme=theme)
+        promo_engine = PromoEngine(enhanced_wrestler, crowd_reaction=50, tone=style, theme=theme, compact_beats=True)
         result = promo_engine.simulate()
         promo_text = f"[{wrestler['name']}]: "
         
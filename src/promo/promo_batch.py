@@ -0,0 +1,265 @@
+"""
+Batch Promo Simulator
+
+Runs large numbers of promos across a process pool for balance testing
+(score spread per archetype, cash-in frequency, final-rating distribution).
+
+- The grid is every (archetype, tone, theme) cell; each cell is simulated
+  ``trials`` times. Every promo gets its own seed drawn from a master seed up
+  front and runs on its own ``random.Random`` built from it (see
+  ``src/core/rng_utils.py``), so a master seed gives the same aggregates for
+  any worker count or chunk size.
+- Workers reduce each chunk of promos to compact per-cell aggregates (score
+  histogram, cash-in counts, final ratings) and only those travel back to the
+  parent. Beats are folded in as ``PromoEngine.iter_beats`` produces them and
+  full beat lists are kept only with ``keep_beats=True``, as compact
+  ``PromoBeats`` logs (call ``to_dicts()`` for plain dicts).
+"""
+
+import os
+import math
+import random
+import time
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from src.core.rng_utils import make_rng, split_seeds
+from src.promo.promo_engine import PromoEngine
+
+SCORE_BUCKET_SIZE = 5
+RATING_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+PROMO_STATS = (
+    "promo_delivery", "fan_engagement", "entrance_presence", "presence_under_fire",
+    "confidence", "focus", "resilience", "adaptability", "risk_assessment",
+    "determination", "reputation"
+)
+
+# Promo stat level of the archetypes used by the balance scripts
+ARCHETYPE_LEVELS = {
+    "Weak": 5,
+    "Regular": 10,
+    "Talented": 17
+}
+
+# Cells of the grid available to the current worker process
+_worker_cells = []
+
+
+def archetype_wrestler(name, level):
+    """Build a wrestler with every promo stat at ``level``."""
+    wrestler = {stat: level for stat in PROMO_STATS}
+    wrestler["name"] = name
+    return wrestler
+
+
+def default_archetypes():
+    return {name: archetype_wrestler(name, level) for name, level in ARCHETYPE_LEVELS.items()}
+
+
+def plan_promos(cell_count, trials, master_seed):
+    """
+    Draw the per-promo seeds for a batch run.
+
+    Returns a list of (cell_index, trial, seed) tuples that depends only on
+    the grid size, the trial count and the master seed.
+    """
+    seeds = iter(split_seeds(master_seed, cell_count * trials))
+    return [
+        (cell_index, trial, next(seeds))
+        for cell_index in range(cell_count)
+        for trial in range(trials)
+    ]
+
+
+def _new_aggregate():
+    return {
+        "promos": 0,
+        "beats": 0,
+        "score_totals": [],
+        "score_histogram": {},
+        "cash_ins": 0,
+        "promos_with_cash_in": 0,
+        "final_ratings": [],
+        "beat_lists": []
+    }
+
+
+def planned_promo_engine(cell, seed):
+    """Return the engine for one promo of a cell, on its own random stream."""
+    wrestler, tone, theme, crowd_reaction = cell
+    return PromoEngine(wrestler, crowd_reaction=crowd_reaction, tone=tone, theme=theme, rng=make_rng(seed),
+                       compact_beats=True)
+
+
+def simulate_planned_promo(cell, seed):
+    """Simulate one promo of a cell with its own seed and return its result."""
+    return planned_promo_engine(cell, seed).simulate()
+
+
+def add_promo(aggregate, trial, engine, keep_beats=False):
+    """Run a planned promo and fold its beats into a cell aggregate as they are produced."""
+    histogram = aggregate["score_histogram"]
+    cash_ins = 0
+    score_total = 0.0
+    for beat in engine.iter_beats(keep_beats):
+        # The intro and summary beats are bookkeeping, not delivered lines
+        if beat.get("is_first_beat") or beat.get("is_last_beat"):
+            continue
+        score = beat.get("score", 0)
+        bucket = int(score // SCORE_BUCKET_SIZE) * SCORE_BUCKET_SIZE
+        histogram[bucket] = histogram.get(bucket, 0) + 1
+        score_total += score
+        aggregate["beats"] += 1
+        if beat.get("cash_in_used"):
+            cash_ins += 1
+
+    result = engine.result
+    aggregate["promos"] += 1
+    aggregate["cash_ins"] += cash_ins
+    if cash_ins:
+        aggregate["promos_with_cash_in"] += 1
+    aggregate["score_totals"].append(score_total)
+    aggregate["final_ratings"].append((trial, result["final_rating"]))
+    if keep_beats:
+        aggregate["beat_lists"].append((trial, result["beats"]))
+
+
+def _merge(target, partial):
+    for key in ("promos", "beats", "cash_ins", "promos_with_cash_in"):
+        target[key] += partial[key]
+    for bucket, count in partial["score_histogram"].items():
+        target["score_histogram"][bucket] = target["score_histogram"].get(bucket, 0) + count
+    target["score_totals"].extend(partial["score_totals"])
+    target["final_ratings"].extend(partial["final_ratings"])
+    target["beat_lists"].extend(partial["beat_lists"])
+
+
+def _init_worker(cells):
+    global _worker_cells
+    _worker_cells = cells
+
+
+def _simulate_chunk(chunk, keep_beats):
+    partials = {}
+    for cell_index, trial, seed in chunk:
+        engine = planned_promo_engine(_worker_cells[cell_index], seed)
+        aggregate = partials.get(cell_index)
+        if aggregate is None:
+            aggregate = partials[cell_index] = _new_aggregate()
+        add_promo(aggregate, trial, engine, keep_beats)
+    return partials
+
+
+def _chunked(plan, chunk_size):
+    return [plan[i:i + chunk_size] for i in range(0, len(plan), chunk_size)]
+
+
+def summarize_cell(archetype, tone, theme, aggregate):
+    """Turn a merged cell aggregate into the distribution summary returned to callers."""
+    ratings = np.array([rating for _, rating in sorted(aggregate["final_ratings"])], dtype=float)
+    promos = aggregate["promos"]
+    beats = aggregate["beats"]
+    quantiles = np.quantile(ratings, RATING_QUANTILES) if promos else [0] * len(RATING_QUANTILES)
+
+    summary = {
+        "archetype": archetype,
+        "tone": tone,
+        "theme": theme,
+        "promos": promos,
+        "beats": beats,
+        "avg_beats": beats / promos if promos else 0,
+        "avg_score": math.fsum(aggregate["score_totals"]) / beats if beats else 0,
+        "score_histogram": dict(sorted(aggregate["score_histogram"].items())),
+        "cash_ins": aggregate["cash_ins"],
+        "cash_in_rate": aggregate["cash_ins"] / beats if beats else 0,
+        "promos_with_cash_in_rate": aggregate["promos_with_cash_in"] / promos if promos else 0,
+        "avg_final_rating": float(ratings.mean()) if promos else 0,
+        "final_rating_std": float(ratings.std()) if promos else 0,
+        "final_rating_quantiles": {q: float(value) for q, value in zip(RATING_QUANTILES, quantiles)}
+    }
+    if aggregate["beat_lists"]:
+        summary["beat_lists"] = [beats for _, beats in sorted(aggregate["beat_lists"], key=lambda item: item[0])]
+    return summary
+
+
+def simulate_promos_batch(archetypes=None, tones=("boast",), themes=("legacy",), trials=1000,
+                          master_seed=None, workers=None, chunk_size=None, crowd_reaction=50,
+                          keep_beats=False, progress_callback=None):
+    """
+    Simulate ``trials`` promos for every archetype/tone/theme combination.
+
+    Args:
+        archetypes: {name: wrestler} to simulate (default: Weak/Regular/Talented)
+        tones: Promo tones of the grid
+        themes: Promo themes of the grid
+        trials: Promos per grid cell
+        master_seed: Seed for the per-promo seeds (random if None)
+        workers: Worker processes to use; 1 runs in-process (default: CPU count)
+        chunk_size: Promos per task sent to a worker (default: sized from the total)
+        crowd_reaction: Starting crowd reaction of every promo
+        keep_beats: Also return every promo's PromoBeats log under "beat_lists"
+        progress_callback: Called as progress_callback(completed, total) after
+            each finished chunk
+
+    Returns:
+        Dictionary with run information and one summary per grid cell, in
+        archetype, tone, theme order, under "cells".
+    """
+    start_time = time.time()
+
+    if archetypes is None:
+        archetypes = default_archetypes()
+    if master_seed is None:
+        master_seed = random.SystemRandom().getrandbits(64)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    keys = [(name, tone, theme) for name in archetypes for tone in tones for theme in themes]
+    cells = [(archetypes[name], tone, theme, crowd_reaction) for name, tone, theme in keys]
+    if not cells:
+        raise ValueError("Batch promo simulation needs at least one archetype, tone and theme")
+
+    plan = plan_promos(len(cells), trials, master_seed)
+    total = len(plan)
+    if chunk_size is None:
+        chunk_size = max(1, min(500, total // (workers * 8) or 1))
+    chunks = _chunked(plan, chunk_size)
+
+    aggregates = [_new_aggregate() for _ in cells]
+    completed = 0
+
+    def collect(partials):
+        nonlocal completed
+        for cell_index, partial in partials.items():
+            _merge(aggregates[cell_index], partial)
+            completed += partial["promos"]
+        if progress_callback:
+            progress_callback(completed, total)
+
+    if workers <= 1:
+        _init_worker(cells)
+        for chunk in chunks:
+            collect(_simulate_chunk(chunk, keep_beats))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cells,)) as pool:
+            futures = [pool.submit(_simulate_chunk, chunk, keep_beats) for chunk in chunks]
+            for future in as_completed(futures):
+                collect(future.result())
+
+    total_time = time.time() - start_time
+    logging.info(f"Simulated {total} promos in {len(cells)} cell(s) on {workers} worker(s) in {total_time:.2f}s")
+
+    return {
+        "total_promos": total,
+        "trials": trials,
+        "master_seed": master_seed,
+        "workers": workers,
+        "total_time": total_time,
+        "cells": [
+            summarize_cell(name, tone, theme, aggregate)
+            for (name, tone, theme), aggregate in zip(keys, aggregates)
+        ]
+    }
@@ -0,0 +1,279 @@
+"""
+Promo Beat Log
+
+Compact storage for the beats of one promo. The numeric fields of every beat
+are packed into typed ``array`` rows, so a beat costs about 130 bytes instead of a
+dict of twenty-odd keys with copies of the streak info, the promo line and
+references to both wrestlers.
+
+Indexing the log returns a ``PromoBeat`` view that reads like the old beat
+dict (``beat["score"]``, ``beat.get("promo_line")``, ``dict(beat)``). The
+display text is only produced when a view is read: the promo line and the
+commentary are stored as template ids and rendered from the precompiled
+indexes in ``promo_lines`` and ``commentary_engine`` on access.
+"""
+
+import math
+from array import array
+from collections.abc import Mapping
+
+from src.promo.commentary_engine import COMMENTARY_TEMPLATES
+from src.promo.promo_engine_helpers import determine_line_quality
+from src.promo.promo_lines import render_promo_line
+
+PHASES = ("opening", "middle", "ending")
+GENERATED_COMMENTARY = {"opening": "Opening beat", "middle": "Mid beat", "ending": "End beat"}
+
+# Numeric fields stored in the float rows; NaN marks a field the beat does not have
+FLOAT_FIELDS = (
+    "score", "momentum", "confidence", "momentum_gain", "momentum_change",
+    "confidence_shift", "momentum_meter", "confidence_level", "rolling_rating", "star_rating"
+)
+_FLOAT_OFFSETS = {name: offset for offset, name in enumerate(FLOAT_FIELDS)}
+_STREAK_QUALITY = len(FLOAT_FIELDS)
+_STREAK_LAST = _STREAK_QUALITY + 1
+FLOAT_STRIDE = _STREAK_LAST + 1
+
+# Integer row: beat number, streak count, promo line id, commentary id (-1 = none)
+_BEAT_NUMBER, _STREAK_COUNT, _LINE_ID, _COMMENTARY_ID = range(4)
+INT_STRIDE = 4
+
+# Code row: phase index (-1 = stored in extras), flags
+CODE_STRIDE = 2
+
+# Beat flags
+FLAG_FIRST = 0x01
+FLAG_LAST = 0x02
+FLAG_SPEAKER = 0x04      # beat has the wrestler/opponent keys
+FLAG_GENERATED = 0x08    # rolled beat: has beat_number, line_quality, commentary
+FLAG_CASH_IN_KEY = 0x10  # beat has a cash_in_used key
+FLAG_CASH_IN = 0x20
+FLAG_STREAK = 0x40
+
+SPEAKER_COLOR = "#66CCFF"
+
+# Keys derived from the rows rather than stored per beat
+_DERIVED_KEYS = (
+    "tone", "theme", "phase", "beat_number", "line_quality", "commentary",
+    "line_id", "commentary_id", "streak_info", "is_first_beat", "is_last_beat",
+    "cash_in_used", "wrestler", "opponent", "wrestler_color", "versus_mode"
+)
+_STORED_KEYS = frozenset(FLOAT_FIELDS + _DERIVED_KEYS)
+
+
+class PromoBeats:
+    """Row store of a promo's beats; behaves as a sequence of PromoBeat views."""
+
+    def __init__(self, tone, theme, wrestler=None, opponent=None):
+        self.tone = tone
+        self.theme = theme
+        self.wrestler = wrestler
+        self.opponent = opponent
+        self._floats = array("d")
+        self._ints = array("i")
+        self._codes = array("b")
+        # Rare per-beat fields (exceptional performances, cash-in details, final quality)
+        self._extras = {}
+
+    def append(self, beat):
+        """Store a beat dict built by the promo engine."""
+        index = len(self)
+        for name in FLOAT_FIELDS:
+            value = beat.get(name)
+            self._floats.append(math.nan if value is None else value)
+
+        flags = 0
+        if beat.get("is_first_beat"):
+            flags |= FLAG_FIRST
+        if beat.get("is_last_beat"):
+            flags |= FLAG_LAST
+        if "wrestler" in beat:
+            flags |= FLAG_SPEAKER
+        if "beat_number" in beat:
+            flags |= FLAG_GENERATED
+        if "cash_in_used" in beat:
+            flags |= FLAG_CASH_IN_KEY
+            if beat["cash_in_used"]:
+                flags |= FLAG_CASH_IN
+
+        streak = beat.get("streak_info")
+        if streak is not None:
+            flags |= FLAG_STREAK
+            self._floats.append(streak["quality"])
+            self._floats.append(streak["last_score"])
+        else:
+            self._floats.append(0)
+            self._floats.append(0)
+
+        line_id = beat.get("line_id")
+        commentary_id = beat.get("commentary_id")
+        self._ints.append(beat.get("beat_number", 0))
+        self._ints.append(streak["count"] if streak is not None else 0)
+        self._ints.append(-1 if line_id is None else line_id)
+        self._ints.append(-1 if commentary_id is None else commentary_id)
+
+        phase = beat.get("phase")
+        extras = {key: value for key, value in beat.items() if key not in _STORED_KEYS}
+        if phase in PHASES:
+            self._codes.append(PHASES.index(phase))
+        else:
+            self._codes.append(-1)
+            extras["phase"] = phase
+            if "commentary" in beat:
+                extras["commentary"] = beat["commentary"]
+        self._codes.append(flags)
+        if extras:
+            self._extras[index] = extras
+
+    def clear(self):
+        """Drop every stored beat; views of earlier beats become invalid."""
+        del self._floats[:]
+        del self._ints[:]
+        del self._codes[:]
+        self._extras.clear()
+
+    def __len__(self):
+        return len(self._codes) // CODE_STRIDE
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [PromoBeat(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return PromoBeat(self, index)
+
+    def __iter__(self):
+        return (PromoBeat(self, i) for i in range(len(self)))
+
+    def to_dicts(self):
+        """Materialise every beat as a plain dict (e.g. for JSON export)."""
+        return [dict(beat) for beat in self]
+
+
+class PromoBeat(Mapping):
+    """Read-mostly dict view of one beat in a PromoBeats log."""
+
+    __slots__ = ("_log", "_index")
+
+    def __init__(self, log, index):
+        self._log = log
+        self._index = index
+
+    def _float(self, offset):
+        return self._log._floats[self._index * FLOAT_STRIDE + offset]
+
+    def _int(self, offset):
+        return self._log._ints[self._index * INT_STRIDE + offset]
+
+    def _flags(self):
+        return self._log._codes[self._index * CODE_STRIDE + 1]
+
+    def _phase(self):
+        code = self._log._codes[self._index * CODE_STRIDE]
+        return PHASES[code] if code >= 0 else self._log._extras[self._index]["phase"]
+
+    def _keys(self):
+        log = self._log
+        flags = self._flags()
+        keys = [name for offset, name in enumerate(FLOAT_FIELDS) if not math.isnan(self._float(offset))]
+        keys += ["tone", "theme", "phase", "promo_line", "versus_mode"]
+        if self._int(_LINE_ID) >= 0:
+            keys.append("line_id")
+        if self._int(_COMMENTARY_ID) >= 0:
+            keys += ["commentary_id", "commentary_line"]
+        if flags & FLAG_FIRST:
+            keys.append("is_first_beat")
+        if flags & FLAG_LAST:
+            keys.append("is_last_beat")
+        if flags & FLAG_GENERATED:
+            keys += ["beat_number", "line_quality", "commentary"]
+        if flags & FLAG_CASH_IN_KEY:
+            keys.append("cash_in_used")
+        if flags & FLAG_STREAK:
+            keys.append("streak_info")
+        if flags & FLAG_SPEAKER:
+            keys += ["wrestler", "opponent"]
+            if log.wrestler is not None:
+                keys.append("wrestler_color")
+        extras = log._extras.get(self._index)
+        if extras:
+            keys += [key for key in extras if key not in keys]
+        return keys
+
+    def __getitem__(self, key):
+        log = self._log
+        extras = log._extras.get(self._index)
+        if extras and key in extras:
+            return extras[key]
+
+        offset = _FLOAT_OFFSETS.get(key)
+        if offset is not None:
+            value = self._float(offset)
+            if math.isnan(value):
+                raise KeyError(key)
+            return value
+
+        flags = self._flags()
+        if key == "tone":
+            return log.tone
+        if key == "theme":
+            return log.theme
+        if key == "phase":
+            return self._phase()
+        if key == "versus_mode":
+            return False
+        if key == "promo_line":
+            opponent = log.opponent if flags & FLAG_SPEAKER else None
+            opponent_name = opponent.get("name", "their opponent") if opponent else None
+            line_id = self._int(_LINE_ID)
+            return render_promo_line(log.tone, log.theme, self._phase(), line_id if line_id >= 0 else None, opponent_name)
+        if key == "line_id" and self._int(_LINE_ID) >= 0:
+            return self._int(_LINE_ID)
+        if key in ("commentary_id", "commentary_line") and self._int(_COMMENTARY_ID) >= 0:
+            commentary_id = self._int(_COMMENTARY_ID)
+            return commentary_id if key == "commentary_id" else COMMENTARY_TEMPLATES[commentary_id]
+        if key == "is_first_beat" and flags & FLAG_FIRST:
+            return True
+        if key == "is_last_beat" and flags & FLAG_LAST:
+            return True
+        if flags & FLAG_GENERATED:
+            if key == "beat_number":
+                return self._int(_BEAT_NUMBER)
+            if key == "line_quality":
+                return determine_line_quality(None, self._float(_FLOAT_OFFSETS["score"]))
+            if key == "commentary":
+                return f"{GENERATED_COMMENTARY[self._phase()]} {self._int(_BEAT_NUMBER)}"
+        if key == "cash_in_used" and flags & FLAG_CASH_IN_KEY:
+            return bool(flags & FLAG_CASH_IN)
+        if key == "streak_info" and flags & FLAG_STREAK:
+            return {
+                "count": self._int(_STREAK_COUNT),
+                "quality": self._float(_STREAK_QUALITY),
+                "last_score": self._float(_STREAK_LAST)
+            }
+        if flags & FLAG_SPEAKER:
+            if key == "wrestler":
+                return log.wrestler
+            if key == "opponent":
+                return log.opponent
+            if key == "wrestler_color" and log.wrestler is not None:
+                return SPEAKER_COLOR
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        # Late annotations (by a UI, say) are kept alongside the rows
+        self._log._extras.setdefault(self._index, {})[key] = value
+
+    def __contains__(self, key):
+        return key in self._keys()
+
+    def __iter__(self):
+        return iter(self._keys())
+
+    def __len__(self):
+        return len(self._keys())
+
+    def __repr__(self):
+        return f"PromoBeat({dict(self)!r})"
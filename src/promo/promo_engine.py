@@ -1,11 +1,87 @@
 # promo_engine.py
 
 from src.promo.promo_engine_helpers import *
+import math
 import random
-import statistics
+from collections import deque
+
+from src.promo.commentary_engine import pick_commentary_id
+from src.promo.promo_beats import PromoBeats
+from src.promo.promo_lines import pick_promo_line_id
+
+# Own generator so picking commentary never shifts the promo's random stream
+_commentary_random = random.Random()
+
+
+class RollingRating:
+    """
+    Running promo rating, updated in O(1) per beat.
+
+    Keeps the weighted score sum and count, a Welford mean/variance of the raw
+    scores and the last three scores, which is everything the rating formula
+    needs without rescanning earlier beats.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.weighted_sum = 0
+        self.weighted_count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.last_scores = deque(maxlen=3)
+
+    def add(self, score):
+        # Same weighting and summation order as the full recalculation
+        if score >= 85:  # Excellent scores get 2x weight
+            self.weighted_sum += score
+            self.weighted_sum += score
+            self.weighted_count += 2
+        elif score >= 70:  # Good scores get 1.5x weight
+            self.weighted_sum += score
+            self.weighted_sum += score * 0.5
+            self.weighted_count += 2
+        else:
+            self.weighted_sum += score
+            self.weighted_count += 1
+
+        self.count += 1
+        delta = score - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (score - self._mean)
+        self.last_scores.append(score)
+
+    @property
+    def avg_score(self):
+        return self.weighted_sum / self.weighted_count if self.weighted_count else 0
+
+    @property
+    def score_std(self):
+        return math.sqrt(max(0.0, self._m2) / (self.count - 1)) if self.count > 1 else 0
+
+    @property
+    def consistency_bonus(self):
+        return max(0, (20 - self.score_std) / 20) * 5  # Up to +5 points for consistency
+
+    @property
+    def finish_bonus(self):
+        # Bonus for strong finish (last 3 beats)
+        if self.count >= 3:
+            final_beats_avg = sum(self.last_scores) / 3
+            if final_beats_avg >= 85:
+                return 5
+            elif final_beats_avg >= 70:
+                return 3
+        return 0
+
+    @property
+    def rating(self):
+        rating = self.avg_score + self.consistency_bonus + self.finish_bonus
+        return max(0, min(100, rating))
+
 
 class PromoEngine:
-    def __init__(self, wrestler, crowd_reaction=50, tone="boast", theme="legacy", opponent=None):
+    def __init__(self, wrestler, crowd_reaction=50, tone="boast", theme="legacy", opponent=None, rng=None,
+                 compact_beats=False):
         # Extract wrestler stats safely using getattr for objects or get for dictionaries
         def get_wrestler_attr(wrestler, attr, default=10):
             if wrestler is None:
@@ -31,6 +107,8 @@ class PromoEngine:
             "reputation": get_wrestler_attr(wrestler, "reputation", 10)
         }
         
+        # Every roll of this promo comes from rng (default: the global generator)
+        self.rng = rng if rng is not None else random
         self.wrestler = wrestler
         self.opponent = opponent
         self.crowd_reaction = crowd_reaction
@@ -38,16 +116,45 @@ class PromoEngine:
         self.confidence = self.stats.get("confidence", 50)
         self.phase = "beginning"
         self.beat_number = 0
-        self.beats = []
-        self.max_beats = random.randint(24, 49)  # Variable promo length
+        self.beats = PromoBeats(tone, theme, wrestler, opponent)
+        self.max_beats = self.rng.randint(24, 49)  # Variable promo length
         self.end_beats_remaining = 0
         self.streak_info = {"count": 0, "quality": 0, "last_score": 0}
         self.end_cash_in_done = False  # Track if we've done the end phase cash-in
         self.tone = tone  # Store the promo tone
         self.theme = theme  # Store the promo theme
+        self.rating = RollingRating()
+        self.keep_beats = True
+        # Hand the compact PromoBeats log to callers instead of plain dicts
+        self.compact_beats = compact_beats
+        self.result = None
 
     def simulate(self):
         """Run a full promo simulation."""
+        for _ in self.iter_beats():
+            pass
+        return self.result
+
+    def iter_beats(self, keep_beats=True):
+        """
+        Run the promo one beat at a time, yielding each beat as it is produced.
+
+        Every yielded beat carries the running rolling_rating/star_rating.
+        When the generator is exhausted the final result (as returned by
+        simulate()) is in ``self.result`` and is also the generator's return
+        value.
+
+        Args:
+            keep_beats: Keep every beat in ``self.beats`` and the result. With
+                False only the latest beat is stored, so a yielded beat is valid
+                until the next one is produced (copy it with dict(beat) to keep
+                it) and the result has no "beats" entry. The result's beats
+                are plain dicts unless the engine was built with
+                compact_beats=True, which returns the PromoBeats log itself.
+        """
+        self.keep_beats = keep_beats
+        rng = self.rng
+
         # Add intro beat
         intro_beat = {
             "tone": self.tone,
@@ -60,21 +167,21 @@ class PromoEngine:
             "wrestler": self.wrestler,
             "opponent": self.opponent
         }
-        self._apply_beat(intro_beat)  # Use _apply_beat instead of directly appending
+        yield self._apply_beat(intro_beat)  # Use _apply_beat instead of directly appending
         
         while True:
             self.beat_number += 1
             cashed_in = False
 
             if self.phase == "beginning":
-                beat = generate_beginning_beat(self.stats, self.beat_number, self.momentum, self.confidence, self.crowd_reaction)
+                beat = generate_beginning_beat(self.stats, self.beat_number, self.momentum, self.confidence, self.crowd_reaction, rng)
                 beat["phase"] = "opening"  # Map "beginning" phase to "opening" for promo lines
                 if self.beat_number >= 3:
                     self.phase = "middle"
             elif self.phase == "middle":
-                if should_start_end_phase(self.beat_number, self.max_beats, self.stats, self.momentum):
+                if should_start_end_phase(self.beat_number, self.max_beats, self.stats, self.momentum, rng):
                     self.phase = "end"
-                    self.end_beats_remaining = random.randint(3, 5)  # Variable end length
+                    self.end_beats_remaining = rng.randint(3, 5)  # Variable end length
                     
                     # Do the end phase cash-in if we have momentum
                     if self.momentum > 0:
@@ -92,14 +199,14 @@ class PromoEngine:
                     
                     # Check for potential momentum cash-in
                     new_confidence, new_momentum, cashed_in = maybe_cash_in_momentum(
-                        self.momentum, self.confidence, self.stats, self.beat_number
+                        self.momentum, self.confidence, self.stats, self.beat_number, rng
                     )
                     
                     if cashed_in:
                         self.confidence = new_confidence
                         self.momentum = new_momentum
 
-                beat = generate_regular_beat(self.stats, self.beat_number, self.momentum, self.confidence, self.crowd_reaction, self.streak_info)
+                beat = generate_regular_beat(self.stats, self.beat_number, self.momentum, self.confidence, self.crowd_reaction, self.streak_info, rng)
                 beat["phase"] = "middle"  # Ensure middle phase is set
                 
                 if cashed_in:
@@ -109,7 +216,7 @@ class PromoEngine:
                     beat["cash_in_used"] = True
                     beat["confidence_boost"] = self.confidence - old_confidence
             elif self.phase == "end":
-                beat = generate_end_beat(self.stats, self.beat_number, self.momentum, self.confidence, self.crowd_reaction, self.streak_info)
+                beat = generate_end_beat(self.stats, self.beat_number, self.momentum, self.confidence, self.crowd_reaction, self.streak_info, rng)
                 beat["phase"] = "ending"  # Map "end" phase to "ending" for promo lines
                 self.end_beats_remaining -= 1
                 if self.end_beats_remaining <= 0:
@@ -141,10 +248,10 @@ class PromoEngine:
             beat["confidence_level"] = self.confidence
             beat["streak_info"] = dict(self.streak_info)  # Store a copy of streak info
 
-            self._apply_beat(beat)
+            yield self._apply_beat(beat)
             
         # Calculate final quality based on the last few beats
-        final_scores = [b.get("score", 0) for b in self.beats[-3:]]  # Last 3 beats
+        final_scores = list(self.rating.last_scores)  # Last 3 beats
         avg_final_score = sum(final_scores) / len(final_scores)
         
         if avg_final_score >= 90:
@@ -173,9 +280,10 @@ class PromoEngine:
             "final_quality": final_quality,
             "score": avg_final_score
         }
-        self._apply_beat(summary_beat)  # Use _apply_beat instead of directly appending
+        yield self._apply_beat(summary_beat)  # Use _apply_beat instead of directly appending
 
-        return self._calculate_final_result()
+        self.result = self._calculate_final_result()
+        return self.result
 
     def _apply_beat(self, beat):
         # Apply momentum change if not a cash-in
@@ -198,95 +306,43 @@ class PromoEngine:
         beat["confidence"] = self.confidence
         
         # Calculate rolling rating for this beat
-        scores = [b.get("score", 0) for b in self.beats] + [beat.get("score", 0)]
-        weighted_scores = []
-        for score in scores:
-            if score >= 85:  # Excellent scores get 2x weight
-                weighted_scores.extend([score, score])
-            elif score >= 70:  # Good scores get 1.5x weight
-                weighted_scores.extend([score, score * 0.5])
-            else:
-                weighted_scores.append(score)
-        
-        avg_score = sum(weighted_scores) / len(weighted_scores)
-        score_std = statistics.stdev(scores) if len(scores) > 1 else 0
-        consistency_bonus = max(0, (20 - score_std) / 20) * 5
-        
-        # Calculate finish bonus based on last 3 beats
-        finish_bonus = 0
-        if len(scores) >= 3:
-            final_beats_avg = sum(scores[-3:]) / 3
-            if final_beats_avg >= 85:
-                finish_bonus = 5
-            elif final_beats_avg >= 70:
-                finish_bonus = 3
-        
-        rolling_rating = avg_score + consistency_bonus + finish_bonus
-        rolling_rating = max(0, min(100, rolling_rating))
+        self.rating.add(beat.get("score", 0))
+        rolling_rating = self.rating.rating
         beat["rolling_rating"] = round(rolling_rating, 2)
         
         # Convert rating to stars (0-5 stars, can go over 5 for exceptional performances)
         star_rating = (rolling_rating / 20)  # 100 rating = 5 stars
         beat["star_rating"] = round(star_rating, 2)
         
-        # Add the beat to the list
-        self.beats.append(beat)
-        
-        # Add wrestler-specific attributes to ensure consistent display with versus promos
-        beat["versus_mode"] = False  # Mark as not versus mode
-        
-        # Generate promo line if not already present 
+        # Pick the promo line and commentary; their text is only rendered
+        # when the beat is displayed
         if "promo_line" not in beat and "tone" in beat and "theme" in beat:
-            from src.promo.promo_engine_helpers import get_promo_line
-            
-            # Get the line based on tone, theme, and phase
-            beat["promo_line"] = get_promo_line(
-                beat["tone"], 
-                beat["theme"], 
+            beat["line_id"] = pick_promo_line_id(
+                beat["tone"],
+                beat["theme"],
                 beat["phase"],
-                beat.get("opponent")
+                bool(beat.get("opponent")),
+                self.rng
+            )
+        if "beat_number" in beat:
+            beat["commentary_id"] = pick_commentary_id(
+                beat.get("score", 0), beat["phase"], rng=_commentary_random
             )
-            
-        # Ensure wrestler info is properly formatted for display
-        if "wrestler" in beat and beat["wrestler"] is not None:
-            # Add wrestler color for consistent styling with versus promos
-            beat["wrestler_color"] = "#66CCFF"
+
+        # Add the beat to the log
+        if not self.keep_beats:
+            self.beats.clear()
+        self.beats.append(beat)
+        return self.beats[-1]
 
     def _calculate_final_result(self):
-        scores = [b["score"] for b in self.beats]
-        
-        # Calculate weighted average giving more weight to high scores
-        weighted_scores = []
-        for score in scores:
-            if score >= 85:  # Excellent scores get 2x weight
-                weighted_scores.extend([score, score])
-            elif score >= 70:  # Good scores get 1.5x weight
-                weighted_scores.extend([score, score * 0.5])
-            else:
-                weighted_scores.append(score)
-        
-        avg_score = sum(weighted_scores) / len(weighted_scores)
-        
-        # Bonus for consistency
-        score_std = statistics.stdev(scores) if len(scores) > 1 else 0
-        consistency_bonus = max(0, (20 - score_std) / 20) * 5  # Up to +5 points for consistency
-        
-        # Bonus for strong finish (last 3 beats)
-        finish_bonus = 0
-        if len(scores) >= 3:
-            final_beats_avg = sum(scores[-3:]) / 3
-            if final_beats_avg >= 85:
-                finish_bonus = 5
-            elif final_beats_avg >= 70:
-                finish_bonus = 3
-        
-        final_rating = avg_score + consistency_bonus + finish_bonus
-        final_rating = max(0, min(100, final_rating))
-        
-        return {
-            "final_rating": round(final_rating, 2),
-            "avg_score": avg_score,
-            "consistency_bonus": consistency_bonus,
-            "finish_bonus": finish_bonus,
-            "beats": self.beats
+        rating = self.rating
+        result = {
+            "final_rating": round(rating.rating, 2),
+            "avg_score": rating.avg_score,
+            "consistency_bonus": rating.consistency_bonus,
+            "finish_bonus": rating.finish_bonus
         }
+        if self.keep_beats:
+            result["beats"] = self.beats if self.compact_beats else self.beats.to_dicts()
+        return result
@@ -2,6 +2,8 @@
 
 import random
 
+from src.promo.promo_lines import pick_promo_line
+
 def extract_promo_stats(wrestler):
     return wrestler.get("attributes", {})
 
@@ -28,7 +30,7 @@ def determine_max_promo_length(rep_score):
     else:
         return 50
 
-def should_start_end_phase(beat_number, max_beats, stats, momentum):
+def should_start_end_phase(beat_number, max_beats, stats, momentum, rng=random):
     """Determine if the promo should enter its end phase."""
     risk = stats.get("risk_taking", 10)
     focus = stats.get("focus", 10)
@@ -53,7 +55,7 @@ def should_start_end_phase(beat_number, max_beats, stats, momentum):
         return True
         
     # Random chance to end based on calculated probability
-    return random.random() < end_chance
+    return rng.random() < end_chance
 
 def get_momentum_gain(score, skill_level):
     """Calculate momentum gain based on performance."""
@@ -175,7 +177,7 @@ def apply_confidence_shift(current_confidence, shift, stats):
     
     return max(floor, min(100, new_confidence))
 
-def calculate_exceptional_bonus(stats, current_score, momentum, confidence, beat_number, streak_info, exceptional_chance_mod=1.0):
+def calculate_exceptional_bonus(stats, current_score, momentum, confidence, beat_number, streak_info, exceptional_chance_mod=1.0, rng=random):
     """Calculate chance and impact of exceptional performance."""
     # Base chance scales with skill and mental state
     promo_delivery = stats.get("promo_delivery", 10)
@@ -212,7 +214,7 @@ def calculate_exceptional_bonus(stats, current_score, momentum, confidence, beat
     final_chance *= exceptional_chance_mod
     
     # Roll for exceptional performance
-    if random.random() * 100 < final_chance:
+    if rng.random() * 100 < final_chance:
         # Calculate boost amount (8-25 base boost)
         base_boost = 8 + (promo_delivery * 0.85)  # Increased skill scaling
         
@@ -273,12 +275,29 @@ def calculate_exceptional_bonus(stats, current_score, momentum, confidence, beat
     
     return None
 
-def roll_promo_score(stats, beat_number, momentum, confidence, crowd_reaction, streak_info=None):
-    """Calculate promo score with balanced variance and achievable excellence."""
+def roll_promo_score(stats, beat_number, momentum, confidence, crowd_reaction, streak_info=None, size=None, rng=None):
+    """
+    Calculate promo score with balanced variance and achievable excellence.
+
+    ``rng`` is a random.Random for a single roll (default: the global
+    generator). With ``size`` (a trial count or shape) the roll is delegated
+    to the vectorized kernel, ``rng`` is a NumPy Generator or seed, and
+    (scores, exceptional) NumPy arrays are returned; see
+    promo_score_kernel.roll_promo_scores.
+    """
     promo_delivery = stats.get("promo_delivery", 10)
     confidence_stat = stats.get("confidence", 10)
     resilience = stats.get("resilience", 10)
     pressure_handling = stats.get("pressure_handling", 10)
+
+    if size is not None:
+        from src.promo.promo_score_kernel import roll_promo_scores
+        return roll_promo_scores(
+            promo_delivery, confidence_stat, resilience, pressure_handling,
+            beat_number, momentum, confidence, crowd_reaction, size=size, rng=rng
+        )
+    if rng is None:
+        rng = random
     
     # Calculate mental profile with weighted importance
     mental_stats = {
@@ -348,7 +367,7 @@ def roll_promo_score(stats, beat_number, momentum, confidence, crowd_reaction, s
         variance = base_variance
     
     # Apply randomness with score-based scaling
-    randomness = random.uniform(-variance, variance)
+    randomness = rng.uniform(-variance, variance)
     if current_score > 70:
         # Reduce randomness at high scores but not as aggressively
         score_factor = max(0.5, 1.0 - ((current_score - 70) / 40))  # Less aggressive reduction
@@ -366,7 +385,8 @@ def roll_promo_score(stats, beat_number, momentum, confidence, crowd_reaction, s
     exceptional = calculate_exceptional_bonus(
         stats, final_score, momentum, confidence, 
         beat_number, streak_info,
-        exceptional_chance_mod  # Pass the modifier to the function
+        exceptional_chance_mod,  # Pass the modifier to the function
+        rng
     )
     
     # Apply exceptional boost if any
@@ -394,9 +414,9 @@ def determine_line_quality(stats, score):
     else:
         return "flop"
 
-def generate_beginning_beat(stats, beat_number, momentum, confidence, crowd_reaction):
+def generate_beginning_beat(stats, beat_number, momentum, confidence, crowd_reaction, rng=random):
     """Generate opening beat with streak tracking."""
-    score, exceptional = roll_promo_score(stats, beat_number, momentum, confidence, crowd_reaction)
+    score, exceptional = roll_promo_score(stats, beat_number, momentum, confidence, crowd_reaction, rng=rng)
     quality = determine_line_quality(stats, score)
     
     # Calculate momentum gain
@@ -431,11 +451,11 @@ def generate_beginning_beat(stats, beat_number, momentum, confidence, crowd_reac
     
     return beat_data
 
-def generate_regular_beat(stats, beat_number, momentum, confidence, crowd_reaction, streak_info=None):
+def generate_regular_beat(stats, beat_number, momentum, confidence, crowd_reaction, streak_info=None, rng=random):
     """Generate a regular beat with streak tracking."""
     score, exceptional = roll_promo_score(
         stats, beat_number, momentum, confidence, 
-        crowd_reaction, streak_info
+        crowd_reaction, streak_info, rng=rng
     )
     quality = determine_line_quality(stats, score)
     
@@ -461,7 +481,7 @@ def generate_regular_beat(stats, beat_number, momentum, confidence, crowd_reacti
     
     # Check for momentum cash-in
     new_confidence, new_momentum, cashed_in = maybe_cash_in_momentum(
-        momentum + momentum_gain, confidence, stats, beat_number
+        momentum + momentum_gain, confidence, stats, beat_number, rng
     )
     
     if not cashed_in:
@@ -490,12 +510,12 @@ def generate_regular_beat(stats, beat_number, momentum, confidence, crowd_reacti
     
     return beat_data
 
-def generate_end_beat(stats, beat_number, momentum, confidence, crowd_reaction, streak_info):
+def generate_end_beat(stats, beat_number, momentum, confidence, crowd_reaction, streak_info, rng=random):
     """Generate end beat with streak and finale mechanics."""
     # End beats get +10 confidence and increased exceptional chances
     score, exceptional = roll_promo_score(
         stats, beat_number, momentum, confidence + 10, 
-        crowd_reaction, streak_info
+        crowd_reaction, streak_info, rng=rng
     )
     quality = determine_line_quality(stats, score)
     
@@ -530,7 +550,7 @@ def generate_end_beat(stats, beat_number, momentum, confidence, crowd_reaction,
     
     return beat_data
 
-def maybe_cash_in_momentum(momentum, confidence, stats, beat_number):
+def maybe_cash_in_momentum(momentum, confidence, stats, beat_number, rng=random):
     """Decide whether to cash in momentum."""
     # Don't allow cash-ins with no momentum
     if momentum <= 0:
@@ -569,7 +589,7 @@ def maybe_cash_in_momentum(momentum, confidence, stats, beat_number):
     # Decision to cash in
     if should_cash_in:
         # Calculate confidence boost using the new formula
-        conf_boost = calculate_cash_in_boost(momentum)
+        conf_boost = calculate_cash_in_boost(momentum, rng)
         
         # Calculate final confidence with boost
         new_confidence = min(100, confidence + conf_boost)
@@ -577,11 +597,12 @@ def maybe_cash_in_momentum(momentum, confidence, stats, beat_number):
     
     return confidence, momentum, False
 
-def calculate_cash_in_boost(momentum: float) -> float:
+def calculate_cash_in_boost(momentum: float, rng=random) -> float:
     """Calculate confidence boost when cashing in momentum.
     
     Args:
         momentum (float): Current momentum value (0-100)
+        rng: random.Random for the variation (default: the global generator)
         
     Returns:
         float: Confidence boost value (10-50)
@@ -605,70 +626,12 @@ def calculate_cash_in_boost(momentum: float) -> float:
     
     # Add random variation (±5%)
     variance = boost * VARIANCE_PCT
-    boost += random.uniform(-variance, variance)
+    boost += rng.uniform(-variance, variance)
     
     # Clamp the final value between MIN_BOOST and MAX_BOOST
     return max(MIN_BOOST, min(MAX_BOOST, boost))
 
-def get_promo_line(tone, theme, phase, opponent=None):
+def get_promo_line(tone, theme, phase, opponent=None, rng=random):
     """Get a promo line based on tone, theme, and phase."""
-    from src.promo.promo_lines import PROMO_LINES
-    
-    # Map tone to promo line bucket
-    tone_map = {
-        "boast": "boast",
-        "insult": "insult",
-        "callout": "callout",
-        "challenge": "callout",
-        "humble": "humble"
-    }
-    
-    # Map theme to promo line bucket
-    theme_map = {
-        "legacy": "legacy",
-        "dominance": "dominance",
-        "betrayal": "betrayal",
-        "power": "power",
-        "comeback": "comeback",
-        "respect": "respect"
-    }
-    
-    # Map phase to promo line bucket
-    phase_map = {
-        "beginning": "opening",
-        "opening": "opening",
-        "middle": "middle",
-        "end": "closing",
-        "ending": "closing"
-    }
-    
-    mapped_tone = tone_map.get(tone, "boast")
-    mapped_theme = theme_map.get(theme, "legacy")
-    mapped_phase = phase_map.get(phase, "middle")
-    
-    # Get lines for this combination
-    lines = PROMO_LINES.get(mapped_phase, {}).get(mapped_tone, {}).get(mapped_theme, [])
-    
-    if not lines:
-        # Fallback to generic lines if specific combination not found
-        lines = PROMO_LINES.get(mapped_phase, {}).get(mapped_tone, {}).get("generic", [])
-    
-    if not lines:
-        # Last resort fallback
-        return "The wrestler cuts a passionate promo."
-    
-    # Choose a random line
-    line = random.choice(lines)
-    
-    # If we have an opponent, try to use a line that references opponents
-    if opponent and "opponent" in line:
-        opponent_lines = [l for l in lines if "opponent" in l]
-        if opponent_lines:
-            line = random.choice(opponent_lines)
-    
-    # Replace opponent placeholder if available
-    if opponent:
-        opponent_name = opponent.get("name", "their opponent")
-        line = line.replace("opponent", opponent_name)
-    
-    return line
+    opponent_name = opponent.get("name", "their opponent") if opponent else None
+    return pick_promo_line(tone, theme, phase, opponent_name, rng)
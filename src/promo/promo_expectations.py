@@ -0,0 +1,249 @@
+"""
+Promo Expectation Table
+
+Expected final promo rating for planning screens, without running a
+stochastic ``PromoEngine.simulate()`` per query.
+
+The table is built offline by the batch promo simulator over a grid of
+quantized promo stats (promo_delivery, confidence, resilience,
+pressure_handling, focus) and tone/theme, and stored in
+``db/promo_expectations.db``. Stats not on the grid are left at the engine
+default of 10. Lookups snap a wrestler's stats to the nearest grid level and
+read the cell from an in-memory dict, behind an LRU cache.
+
+Tone and theme only pick promo lines today, so the default build stores one
+wildcard ("*") tone/theme per stat cell and lookups fall back to it. Rebuild
+the table with ``db/setup_promo_expectations_db.py`` whenever the scoring in
+``promo_engine_helpers`` changes; a table built from other engine sources is
+still served but logs a warning. The table is loaded once per process, so a
+running game picks up a rebuilt file only after
+``invalidate_promo_expectations()``.
+"""
+
+import os
+import bisect
+import hashlib
+import logging
+import sqlite3
+from functools import lru_cache
+
+from src.promo.promo_batch import archetype_wrestler, simulate_promos_batch
+
+EXPECTATIONS_DB = "promo_expectations.db"
+
+EXPECTATION_STATS = ("promo_delivery", "confidence", "resilience", "pressure_handling", "focus")
+STAT_LEVELS = (2, 6, 10, 14, 18)
+ANY = "*"
+
+# Tone/theme simulated for wildcard cells; they do not affect scoring
+_WILDCARD_TONE = "boast"
+_WILDCARD_THEME = "legacy"
+
+
+def engine_fingerprint():
+    """Hash of the promo engine sources the table was simulated with."""
+    from src.promo import promo_engine, promo_engine_helpers
+    digest = hashlib.sha1()
+    for module in (promo_engine_helpers, promo_engine):
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def quantize_stat(value, levels=STAT_LEVELS):
+    """Snap a stat to the nearest grid level (ties go to the lower level)."""
+    index = bisect.bisect_left(levels, value)
+    if index == 0:
+        return levels[0]
+    if index == len(levels):
+        return levels[-1]
+    lower, upper = levels[index - 1], levels[index]
+    return lower if value - lower <= upper - value else upper
+
+
+def quantize_stats(wrestler, levels=STAT_LEVELS):
+    """Return the grid cell of a wrestler object or dictionary."""
+    def get_stat(stat):
+        if hasattr(wrestler, stat):
+            return getattr(wrestler, stat)
+        if isinstance(wrestler, dict):
+            return wrestler.get(stat, 10)
+        return 10
+    return tuple(quantize_stat(get_stat(stat), levels) for stat in EXPECTATION_STATS)
+
+
+class PromoExpectationTable:
+    """Expected final ratings keyed by (tone, theme, quantized stats)."""
+
+    def __init__(self, levels, rows, fingerprint=None):
+        # rows are (tone, theme, cell, promos, avg_rating, rating_std) tuples
+        self.levels = tuple(levels)
+        self.fingerprint = fingerprint
+        self._cells = {(tone, theme, tuple(cell)): (promos, avg, std) for tone, theme, cell, promos, avg, std in rows}
+
+    def __len__(self):
+        return len(self._cells)
+
+    @classmethod
+    def from_db(cls, path):
+        """Load a table written by save()."""
+        conn = sqlite3.connect(path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT key, value FROM promo_expectation_meta")
+            meta = dict(cursor.fetchall())
+            cursor.execute(f"""
+                SELECT tone, theme, {', '.join(EXPECTATION_STATS)}, promos, avg_rating, rating_std
+                FROM promo_expectations
+            """)
+            stat_count = len(EXPECTATION_STATS)
+            rows = [
+                (row[0], row[1], row[2:2 + stat_count], *row[2 + stat_count:])
+                for row in cursor.fetchall()
+            ]
+        finally:
+            conn.close()
+        levels = tuple(int(level) for level in meta["levels"].split(","))
+        logging.debug(f"Loaded {len(rows)} promo expectation cells")
+        return cls(levels, rows, meta.get("fingerprint"))
+
+    def save(self, path):
+        """Write the table to a SQLite file, replacing any previous table."""
+        conn = sqlite3.connect(path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("DROP TABLE IF EXISTS promo_expectations")
+            cursor.execute("DROP TABLE IF EXISTS promo_expectation_meta")
+            cursor.execute(f"""
+                CREATE TABLE promo_expectations (
+                    tone TEXT NOT NULL,
+                    theme TEXT NOT NULL,
+                    {', '.join(f'{stat} INTEGER NOT NULL' for stat in EXPECTATION_STATS)},
+                    promos INTEGER NOT NULL,
+                    avg_rating REAL NOT NULL,
+                    rating_std REAL NOT NULL,
+                    PRIMARY KEY (tone, theme, {', '.join(EXPECTATION_STATS)})
+                )
+            """)
+            cursor.execute("CREATE TABLE promo_expectation_meta (key TEXT PRIMARY KEY, value TEXT)")
+            cursor.executemany(
+                f"INSERT INTO promo_expectations VALUES ({', '.join('?' * (len(EXPECTATION_STATS) + 5))})",
+                [(tone, theme, *cell, *values) for (tone, theme, cell), values in self._cells.items()]
+            )
+            cursor.executemany("INSERT INTO promo_expectation_meta VALUES (?, ?)", [
+                ("levels", ",".join(str(level) for level in self.levels)),
+                ("fingerprint", self.fingerprint or "")
+            ])
+            conn.commit()
+        finally:
+            conn.close()
+
+    def lookup(self, tone, theme, cell):
+        """
+        Return (promos, avg_rating, rating_std) for a cell, or None.
+
+        Exact tone/theme first, then wildcard tone, wildcard theme and both.
+        """
+        cells = self._cells
+        for key in ((tone, theme, cell), (ANY, theme, cell), (tone, ANY, cell), (ANY, ANY, cell)):
+            values = cells.get(key)
+            if values is not None:
+                return values
+        return None
+
+
+def build_promo_expectations(levels=STAT_LEVELS, tones=(ANY,), themes=(ANY,), trials=100,
+                             master_seed=0, workers=None, progress_callback=None):
+    """
+    Simulate every grid cell with the batch promo simulator and return the table.
+
+    Args:
+        levels: Stat levels of the grid, shared by every quantized stat
+        tones, themes: Tones/themes to key the table by (ANY for a wildcard cell)
+        trials: Promos simulated per cell
+        master_seed: Seed of the batch run, so a rebuild is reproducible
+        workers, progress_callback: Passed to simulate_promos_batch
+    """
+    levels = tuple(sorted(levels))
+    cells = [()]
+    for _ in EXPECTATION_STATS:
+        cells = [cell + (level,) for cell in cells for level in levels]
+
+    archetypes = {}
+    for cell in cells:
+        name = "/".join(str(level) for level in cell)
+        wrestler = archetype_wrestler(name, 10)
+        wrestler.update(zip(EXPECTATION_STATS, cell))
+        archetypes[name] = wrestler
+
+    tone_names = {(tone if tone != ANY else _WILDCARD_TONE): tone for tone in tones}
+    theme_names = {(theme if theme != ANY else _WILDCARD_THEME): theme for theme in themes}
+    batch = simulate_promos_batch(
+        archetypes, tones=tuple(tone_names), themes=tuple(theme_names), trials=trials,
+        master_seed=master_seed, workers=workers, progress_callback=progress_callback
+    )
+
+    rows = [
+        (
+            tone_names[summary["tone"]],
+            theme_names[summary["theme"]],
+            tuple(int(level) for level in summary["archetype"].split("/")),
+            summary["promos"],
+            summary["avg_final_rating"],
+            summary["final_rating_std"]
+        )
+        for summary in batch["cells"]
+    ]
+    logging.info(f"Built {len(rows)} promo expectation cells from {batch['total_promos']} promos")
+    return PromoExpectationTable(levels, rows, engine_fingerprint())
+
+
+def _default_db_path():
+    from db.utils import db_path
+    return db_path(EXPECTATIONS_DB)
+
+
+_table = None
+
+
+def get_promo_expectations():
+    """Return the process-wide expectation table, loading it on first use."""
+    global _table
+    if _table is None:
+        path = _default_db_path()
+        try:
+            if not os.path.exists(path):
+                raise sqlite3.OperationalError(f"{path} not found")
+            _table = PromoExpectationTable.from_db(path)
+        except (sqlite3.Error, KeyError) as e:
+            logging.error(f"Failed to load promo expectations ({e}); run db/setup_promo_expectations_db.py")
+            _table = PromoExpectationTable(STAT_LEVELS, ())
+        else:
+            if _table.fingerprint != engine_fingerprint():
+                logging.warning("Promo expectations were built from other promo engine sources; rebuild them")
+    return _table
+
+
+def invalidate_promo_expectations():
+    """Drop the cached table and estimates so the next lookup reloads the file."""
+    global _table
+    _table = None
+    _cached_estimate.cache_clear()
+    logging.info("Promo expectations invalidated")
+
+
+@lru_cache(maxsize=4096)
+def _cached_estimate(tone, theme, cell):
+    values = get_promo_expectations().lookup(tone, theme, cell)
+    return values[1] if values is not None else None
+
+
+def estimate_promo_rating(wrestler, tone="boast", theme="legacy"):
+    """
+    Expected final promo rating of a wrestler for a tone and theme.
+
+    Returns the mean final rating of the wrestler's grid cell, or None when
+    the expectation table has no such cell.
+    """
+    cell = quantize_stats(wrestler, get_promo_expectations().levels)
+    return _cached_estimate(tone, theme, cell)
@@ -454,236 +454,354 @@ PROMO_LINES = {
     }
 }
 
-def get_versus_promo_line(tone, phase, position):
-    """Get a promo line for versus promos based on tone, phase and position."""
-    # Versus promo lines by tone, phase and position
-    versus_lines = {
-        "boast": {
-            "opening": {
-                "first": [
-                    "[WRESTLER] steps into the center of the ring. 'Let me tell you all why I'm the best in this business.'",
-                    "'Ladies and gentlemen, you're looking at the greatest superstar of all time!' [WRESTLER] proclaims proudly.",
-                    "[WRESTLER] grabs the mic with confidence. 'There's not a person in this arena who can touch my legacy!'",
-                    "'When they write the history books of this industry, my name will be on every page!' [WRESTLER] boasts."
-                ],
-                "response": [
-                    "[WRESTLER] laughs. 'You think you're something special? Let me remind you who I am.'",
-                    "'That's cute, [OPPONENT]. But while you're talking, I'm making history every single night.'",
-                    "[WRESTLER] shakes their head. 'I've accomplished more in a month than you have in your entire career.'",
-                    "'I don't need to respond to [OPPONENT]. My championships speak for themselves.'"
-                ]
-            },
-            "middle": {
-                "first": [
-                    "'Let's be honest, [OPPONENT]. You're standing in the ring with greatness right now.'",
-                    "[WRESTLER] points to the crowd. 'They didn't come to see you. They came to see me!'",
-                    "'I've beaten legends that make you look like an amateur, [OPPONENT].'",
-                    "[WRESTLER] paces confidently. 'You're just another name on my list of conquests.'"
-                ],
-                "response": [
-                    "[WRESTLER] smirks. 'You think that impresses me? I eat challenges like you for breakfast.'",
-                    "'[OPPONENT], I've forgotten more about this business than you'll ever know.'",
-                    "[WRESTLER] laughs off [OPPONENT]'s words. 'You're not even in my league.'",
-                    "'The difference between us is simple: I'm [WRESTLER], and you're... well, you're just you.'"
-                ]
-            },
-            "ending": {
-                "first": [
-                    "'When this is all said and done, [OPPONENT], they'll remember my name, not yours.'",
-                    "[WRESTLER] raises their arms triumphantly. 'This is what a real champion looks like!'",
-                    "'After I'm done with you, [OPPONENT], you'll be begging for my autograph.'",
-                    "[WRESTLER] points to the exit. 'There's the door. Use it before I embarrass you even more.'"
-                ],
-                "response": [
-                    "[WRESTLER] laughs confidently. 'Is that all you've got? I've had tougher challenges from rookies.'",
-                    "'When I'm done with you, [OPPONENT], they'll be chanting MY name, not yours.'",
-                    "[WRESTLER] waves dismissively. 'You've had your moment. Now it's time for a real star to shine.'",
-                    "'Remember this moment, [OPPONENT]. It's the closest you'll ever get to greatness.'"
-                ]
-            }
+# Versus promo lines by tone, phase and position
+VERSUS_LINES = {
+    "boast": {
+        "opening": {
+            "first": [
+                "[WRESTLER] steps into the center of the ring. 'Let me tell you all why I'm the best in this business.'",
+                "'Ladies and gentlemen, you're looking at the greatest superstar of all time!' [WRESTLER] proclaims proudly.",
+                "[WRESTLER] grabs the mic with confidence. 'There's not a person in this arena who can touch my legacy!'",
+                "'When they write the history books of this industry, my name will be on every page!' [WRESTLER] boasts."
+            ],
+            "response": [
+                "[WRESTLER] laughs. 'You think you're something special? Let me remind you who I am.'",
+                "'That's cute, [OPPONENT]. But while you're talking, I'm making history every single night.'",
+                "[WRESTLER] shakes their head. 'I've accomplished more in a month than you have in your entire career.'",
+                "'I don't need to respond to [OPPONENT]. My championships speak for themselves.'"
+            ]
         },
-        "challenge": {
-            "opening": {
-                "first": [
-                    "[WRESTLER] points directly at [OPPONENT]. 'You think you're so tough? Prove it right here, right now!'",
-                    "'[OPPONENT], I'm calling you out! Let's settle this once and for all!'",
-                    "[WRESTLER] paces like a predator. 'I've been waiting for this moment to finally shut you up.'",
-                    "'You've been running your mouth for too long, [OPPONENT]. Time to back it up!'"
-                ],
-                "response": [
-                    "[WRESTLER] steps forward aggressively. 'You want to challenge ME? You have no idea what you're in for.'",
-                    "'[OPPONENT], you just made the biggest mistake of your career challenging me.'",
-                    "[WRESTLER] rolls up their sleeves. 'I accept your challenge, and I'll raise you one beating you won't forget.'",
-                    "'Be careful what you wish for, [OPPONENT]. You might just get it.'"
-                ]
-            },
-            "middle": {
-                "first": [
-                    "'I'm not just going to beat you, [OPPONENT]. I'm going to make an example out of you.'",
-                    "[WRESTLER] slams their fist into their palm. 'Anytime, anywhere. Name the place.'",
-                    "'You want to test yourself against the best? Then bring everything you've got!'",
-                    "[WRESTLER] gets in [OPPONENT]'s face. 'No excuses when I beat you clean in the middle of this ring.'"
-                ],
-                "response": [
-                    "[WRESTLER] steps even closer. 'You think that scares me? I eat challenges like this for breakfast.'",
-                    "'[OPPONENT], you just signed your own defeat. I accept, and you'll regret it.'",
-                    "[WRESTLER] nods slowly. 'Challenge accepted. But remember, you asked for this.'",
-                    "'You want to test me? Fine. But don't cry when I break you in half.'"
-                ]
-            },
-            "ending": {
-                "first": [
-                    "'This Sunday, [OPPONENT], no excuses, no running away. Just you and me.'",
-                    "[WRESTLER] gets nose to nose with [OPPONENT]. 'One match. Winner takes all.'",
-                    "'I'm challenging you right here, right now. Do you accept, or are you a coward?'",
-                    "[WRESTLER] holds up a title belt. 'This is what you want? Come and take it if you can!'"
-                ],
-                "response": [
-                    "[WRESTLER] nods confidently. 'Consider your challenge accepted. And your career shortened.'",
-                    "'[OPPONENT], I hope you're ready to back up those words with action.'",
-                    "[WRESTLER] extends a hand. 'Deal. But don't say I didn't warn you.'",
-                    "'Challenge accepted. And after I win, you'll never get another shot.'"
-                ]
-            }
+        "middle": {
+            "first": [
+                "'Let's be honest, [OPPONENT]. You're standing in the ring with greatness right now.'",
+                "[WRESTLER] points to the crowd. 'They didn't come to see you. They came to see me!'",
+                "'I've beaten legends that make you look like an amateur, [OPPONENT].'",
+                "[WRESTLER] paces confidently. 'You're just another name on my list of conquests.'"
+            ],
+            "response": [
+                "[WRESTLER] smirks. 'You think that impresses me? I eat challenges like you for breakfast.'",
+                "'[OPPONENT], I've forgotten more about this business than you'll ever know.'",
+                "[WRESTLER] laughs off [OPPONENT]'s words. 'You're not even in my league.'",
+                "'The difference between us is simple: I'm [WRESTLER], and you're... well, you're just you.'"
+            ]
         },
-        "insult": {
-            "opening": {
-                "first": [
-                    "[WRESTLER] looks disgusted. 'Look at [OPPONENT], the biggest joke in this company.'",
-                    "'Ladies and gentlemen, behold [OPPONENT], professional wrestling's greatest disappointment!'",
-                    "[WRESTLER] laughs mockingly. 'I can't believe they actually pay you to embarrass yourself each week.'",
-                    "'[OPPONENT], you are without a doubt the most pathetic excuse for a wrestler I've ever seen.'"
-                ],
-                "response": [
-                    "[WRESTLER] slow claps sarcastically. 'Wow, [OPPONENT], did you stay up all night thinking of that one?'",
-                    "'That's rich coming from a two-bit hack like you, [OPPONENT].'",
-                    "[WRESTLER] looks around confused. 'I'm sorry, was that supposed to hurt my feelings?'",
-                    "'At least I have talent, [OPPONENT]. What's your excuse?'"
-                ]
-            },
-            "middle": {
-                "first": [
-                    "'You're nothing but a footnote in my career, [OPPONENT]. A forgettable chapter at best.'",
-                    "[WRESTLER] sneers. 'Look at you, trying so hard yet achieving so little.'",
-                    "'The difference between us is simple: talent. I have it, you don't.'",
-                    "[WRESTLER] points at [OPPONENT]'s face. 'Even your family changes the channel when you come on.'"
-                ],
-                "response": [
-                    "[WRESTLER] laughs derisively. 'That's the best you've got? Pathetic, just like your career.'",
-                    "'[OPPONENT], your words are as weak as your in-ring skills.'",
-                    "[WRESTLER] mimes yawning. 'I've heard better insults from rookies on their first day.'",
-                    "'Keep talking, [OPPONENT]. It's the only thing you're even remotely good at.'"
-                ]
-            },
-            "ending": {
-                "first": [
-                    "'After I'm done with you, [OPPONENT], you'll be begging for a job at the local fast food joint.'",
-                    "[WRESTLER] looks [OPPONENT] up and down with disgust. 'You're not even worth my time.'",
-                    "'You're nothing but a stepping stone in my journey to greatness, [OPPONENT].'",
-                    "[WRESTLER] mimics wiping dust off their shoulder. 'That's all you are to me. Dust to be brushed aside.'"
-                ],
-                "response": [
-                    "[WRESTLER] smirks. 'Big words from someone with such a small talent.'",
-                    "'I'd insult you back, [OPPONENT], but it looks like genetics already did that job for me.'",
-                    "[WRESTLER] laughs harshly. 'When this is over, you'll be remembered as just another victim.'",
-                    "'Keep dreaming, [OPPONENT]. That's as close as you'll ever get to beating me.'"
-                ]
-            }
+        "ending": {
+            "first": [
+                "'When this is all said and done, [OPPONENT], they'll remember my name, not yours.'",
+                "[WRESTLER] raises their arms triumphantly. 'This is what a real champion looks like!'",
+                "'After I'm done with you, [OPPONENT], you'll be begging for my autograph.'",
+                "[WRESTLER] points to the exit. 'There's the door. Use it before I embarrass you even more.'"
+            ],
+            "response": [
+                "[WRESTLER] laughs confidently. 'Is that all you've got? I've had tougher challenges from rookies.'",
+                "'When I'm done with you, [OPPONENT], they'll be chanting MY name, not yours.'",
+                "[WRESTLER] waves dismissively. 'You've had your moment. Now it's time for a real star to shine.'",
+                "'Remember this moment, [OPPONENT]. It's the closest you'll ever get to greatness.'"
+            ]
+        }
+    },
+    "challenge": {
+        "opening": {
+            "first": [
+                "[WRESTLER] points directly at [OPPONENT]. 'You think you're so tough? Prove it right here, right now!'",
+                "'[OPPONENT], I'm calling you out! Let's settle this once and for all!'",
+                "[WRESTLER] paces like a predator. 'I've been waiting for this moment to finally shut you up.'",
+                "'You've been running your mouth for too long, [OPPONENT]. Time to back it up!'"
+            ],
+            "response": [
+                "[WRESTLER] steps forward aggressively. 'You want to challenge ME? You have no idea what you're in for.'",
+                "'[OPPONENT], you just made the biggest mistake of your career challenging me.'",
+                "[WRESTLER] rolls up their sleeves. 'I accept your challenge, and I'll raise you one beating you won't forget.'",
+                "'Be careful what you wish for, [OPPONENT]. You might just get it.'"
+            ]
         },
-        "callout": {
-            "opening": {
-                "first": [
-                    "[WRESTLER] points accusingly. '[OPPONENT], you've been ducking me for months, and everyone knows it!'",
-                    "'I'm calling you out, [OPPONENT]! Stop hiding and face me like a real competitor!'",
-                    "[WRESTLER] paces angrily. 'The truth about [OPPONENT] needs to be heard, and I'm the one to tell it!'",
-                    "'[OPPONENT], I'm tired of your lies and excuses. It ends tonight!'"
-                ],
-                "response": [
-                    "[WRESTLER] steps forward aggressively. 'You want to call ME out? That's rich!'",
-                    "'[OPPONENT], you've got some nerve questioning my integrity!'",
-                    "[WRESTLER] laughs bitterly. 'That's funny coming from you of all people.'",
-                    "'Let's get one thing straight, [OPPONENT]. You don't get to question me. Ever.'"
-                ]
-            },
-            "middle": {
-                "first": [
-                    "'Everyone in that locker room knows you're a fraud, [OPPONENT]. And now so does the world.'",
-                    "[WRESTLER] points to the crowd. 'They see right through you, just like I do!'",
-                    "'You talk about respect? You don't even know the meaning of the word, [OPPONENT]!'",
-                    "[WRESTLER] circles [OPPONENT]. 'Your time of lying and cheating your way to the top is over!'"
-                ],
-                "response": [
-                    "[WRESTLER] steps closer. 'You dare question my achievements? Let's compare resumes right now!'",
-                    "'[OPPONENT], your accusations just show how desperate you are.'",
-                    "[WRESTLER] shakes their head. 'The only fraud in this ring is the one I'm looking at.'",
-                    "'Rich words from someone who couldn't lace my boots on their best day.'"
-                ]
-            },
-            "ending": {
-                "first": [
-                    "'The fans deserve better than what you give them, [OPPONENT], and I'm here to deliver!'",
-                    "[WRESTLER] points to the stage. 'Come out and face the truth, [OPPONENT]! I'm waiting!'",
-                    "'I'm exposing you for what you really are, [OPPONENT]: a coward and a fraud!'",
-                    "[WRESTLER] challenges with open arms. 'Prove me wrong if you can, [OPPONENT]! I dare you!'"
-                ],
-                "response": [
-                    "[WRESTLER] stands tall. 'You've called me out, now you'll have to deal with the consequences.'",
-                    "'[OPPONENT], you just wrote a check your body can't cash.'",
-                    "[WRESTLER] approaches menacingly. 'You wanted my attention? Well, now you have it.'",
-                    "'Be careful what you wish for, [OPPONENT]. You might just get it.'"
-                ]
-            }
+        "middle": {
+            "first": [
+                "'I'm not just going to beat you, [OPPONENT]. I'm going to make an example out of you.'",
+                "[WRESTLER] slams their fist into their palm. 'Anytime, anywhere. Name the place.'",
+                "'You want to test yourself against the best? Then bring everything you've got!'",
+                "[WRESTLER] gets in [OPPONENT]'s face. 'No excuses when I beat you clean in the middle of this ring.'"
+            ],
+            "response": [
+                "[WRESTLER] steps even closer. 'You think that scares me? I eat challenges like this for breakfast.'",
+                "'[OPPONENT], you just signed your own defeat. I accept, and you'll regret it.'",
+                "[WRESTLER] nods slowly. 'Challenge accepted. But remember, you asked for this.'",
+                "'You want to test me? Fine. But don't cry when I break you in half.'"
+            ]
         },
-        "humble": {
-            "opening": {
-                "first": [
-                    "[WRESTLER] speaks calmly. 'I don't need to boast or brag. My actions speak for themselves.'",
-                    "'I respect you, [OPPONENT], but that won't stop me from giving everything I have.'",
-                    "[WRESTLER] nods respectfully. 'You're good, [OPPONENT]. One of the best. But so am I.'",
-                    "'This isn't about who talks the best game. It's about who performs when it matters.'"
-                ],
-                "response": [
-                    "[WRESTLER] nods thoughtfully. 'I hear your words, [OPPONENT], and I respect your confidence.'",
-                    "'I don't need to match your attitude, [OPPONENT]. I'll let my skills do the talking.'",
-                    "[WRESTLER] remains composed. 'You can try to get under my skin, but I'm focused on one thing: winning.'",
-                    "'Your opinion of me doesn't define who I am or what I can do.'"
-                ]
-            },
-            "middle": {
-                "first": [
-                    "'I've worked too hard to get here to let anyone, even you [OPPONENT], stand in my way.'",
-                    "[WRESTLER] speaks earnestly. 'This isn't personal. It's about being the best I can be.'",
-                    "'You deserve respect for what you've accomplished, [OPPONENT]. But so do I.'",
-                    "[WRESTLER] extends a hand. 'May the best competitor win when we face off.'"
-                ],
-                "response": [
-                    "[WRESTLER] remains calm. 'Your words don't change my resolve or my preparation.'",
-                    "'I don't need to match your intensity, [OPPONENT]. I just need to beat you.'",
-                    "[WRESTLER] nods. 'Fair points. But when we meet in that ring, talk won't matter.'",
-                    "'I appreciate your passion, [OPPONENT]. I really do. But it won't be enough.'"
-                ]
-            },
-            "ending": {
-                "first": [
-                    "'When all is said and done, [OPPONENT], we'll shake hands, but I plan on being the victor.'",
-                    "[WRESTLER] speaks with quiet confidence. 'I respect everything you stand for. That's why beating you means so much.'",
-                    "'Win or lose, [OPPONENT], the fans will get our very best. That's a promise.'",
-                    "[WRESTLER] nods respectfully. 'Let's give them a match they'll never forget.'"
-                ],
-                "response": [
-                    "[WRESTLER] offers a respectful nod. 'May the best competitor win. But know I'm bringing everything I have.'",
-                    "'I accept your challenge with humility and determination, [OPPONENT].'",
-                    "[WRESTLER] extends a hand. 'When this is over, we'll both be better for it.'",
-                    "'I look forward to proving myself against a competitor of your caliber.'"
-                ]
-            }
+        "ending": {
+            "first": [
+                "'This Sunday, [OPPONENT], no excuses, no running away. Just you and me.'",
+                "[WRESTLER] gets nose to nose with [OPPONENT]. 'One match. Winner takes all.'",
+                "'I'm challenging you right here, right now. Do you accept, or are you a coward?'",
+                "[WRESTLER] holds up a title belt. 'This is what you want? Come and take it if you can!'"
+            ],
+            "response": [
+                "[WRESTLER] nods confidently. 'Consider your challenge accepted. And your career shortened.'",
+                "'[OPPONENT], I hope you're ready to back up those words with action.'",
+                "[WRESTLER] extends a hand. 'Deal. But don't say I didn't warn you.'",
+                "'Challenge accepted. And after I win, you'll never get another shot.'"
+            ]
+        }
+    },
+    "insult": {
+        "opening": {
+            "first": [
+                "[WRESTLER] looks disgusted. 'Look at [OPPONENT], the biggest joke in this company.'",
+                "'Ladies and gentlemen, behold [OPPONENT], professional wrestling's greatest disappointment!'",
+                "[WRESTLER] laughs mockingly. 'I can't believe they actually pay you to embarrass yourself each week.'",
+                "'[OPPONENT], you are without a doubt the most pathetic excuse for a wrestler I've ever seen.'"
+            ],
+            "response": [
+                "[WRESTLER] slow claps sarcastically. 'Wow, [OPPONENT], did you stay up all night thinking of that one?'",
+                "'That's rich coming from a two-bit hack like you, [OPPONENT].'",
+                "[WRESTLER] looks around confused. 'I'm sorry, was that supposed to hurt my feelings?'",
+                "'At least I have talent, [OPPONENT]. What's your excuse?'"
+            ]
+        },
+        "middle": {
+            "first": [
+                "'You're nothing but a footnote in my career, [OPPONENT]. A forgettable chapter at best.'",
+                "[WRESTLER] sneers. 'Look at you, trying so hard yet achieving so little.'",
+                "'The difference between us is simple: talent. I have it, you don't.'",
+                "[WRESTLER] points at [OPPONENT]'s face. 'Even your family changes the channel when you come on.'"
+            ],
+            "response": [
+                "[WRESTLER] laughs derisively. 'That's the best you've got? Pathetic, just like your career.'",
+                "'[OPPONENT], your words are as weak as your in-ring skills.'",
+                "[WRESTLER] mimes yawning. 'I've heard better insults from rookies on their first day.'",
+                "'Keep talking, [OPPONENT]. It's the only thing you're even remotely good at.'"
+            ]
+        },
+        "ending": {
+            "first": [
+                "'After I'm done with you, [OPPONENT], you'll be begging for a job at the local fast food joint.'",
+                "[WRESTLER] looks [OPPONENT] up and down with disgust. 'You're not even worth my time.'",
+                "'You're nothing but a stepping stone in my journey to greatness, [OPPONENT].'",
+                "[WRESTLER] mimics wiping dust off their shoulder. 'That's all you are to me. Dust to be brushed aside.'"
+            ],
+            "response": [
+                "[WRESTLER] smirks. 'Big words from someone with such a small talent.'",
+                "'I'd insult you back, [OPPONENT], but it looks like genetics already did that job for me.'",
+                "[WRESTLER] laughs harshly. 'When this is over, you'll be remembered as just another victim.'",
+                "'Keep dreaming, [OPPONENT]. That's as close as you'll ever get to beating me.'"
+            ]
+        }
+    },
+    "callout": {
+        "opening": {
+            "first": [
+                "[WRESTLER] points accusingly. '[OPPONENT], you've been ducking me for months, and everyone knows it!'",
+                "'I'm calling you out, [OPPONENT]! Stop hiding and face me like a real competitor!'",
+                "[WRESTLER] paces angrily. 'The truth about [OPPONENT] needs to be heard, and I'm the one to tell it!'",
+                "'[OPPONENT], I'm tired of your lies and excuses. It ends tonight!'"
+            ],
+            "response": [
+                "[WRESTLER] steps forward aggressively. 'You want to call ME out? That's rich!'",
+                "'[OPPONENT], you've got some nerve questioning my integrity!'",
+                "[WRESTLER] laughs bitterly. 'That's funny coming from you of all people.'",
+                "'Let's get one thing straight, [OPPONENT]. You don't get to question me. Ever.'"
+            ]
+        },
+        "middle": {
+            "first": [
+                "'Everyone in that locker room knows you're a fraud, [OPPONENT]. And now so does the world.'",
+                "[WRESTLER] points to the crowd. 'They see right through you, just like I do!'",
+                "'You talk about respect? You don't even know the meaning of the word, [OPPONENT]!'",
+                "[WRESTLER] circles [OPPONENT]. 'Your time of lying and cheating your way to the top is over!'"
+            ],
+            "response": [
+                "[WRESTLER] steps closer. 'You dare question my achievements? Let's compare resumes right now!'",
+                "'[OPPONENT], your accusations just show how desperate you are.'",
+                "[WRESTLER] shakes their head. 'The only fraud in this ring is the one I'm looking at.'",
+                "'Rich words from someone who couldn't lace my boots on their best day.'"
+            ]
+        },
+        "ending": {
+            "first": [
+                "'The fans deserve better than what you give them, [OPPONENT], and I'm here to deliver!'",
+                "[WRESTLER] points to the stage. 'Come out and face the truth, [OPPONENT]! I'm waiting!'",
+                "'I'm exposing you for what you really are, [OPPONENT]: a coward and a fraud!'",
+                "[WRESTLER] challenges with open arms. 'Prove me wrong if you can, [OPPONENT]! I dare you!'"
+            ],
+            "response": [
+                "[WRESTLER] stands tall. 'You've called me out, now you'll have to deal with the consequences.'",
+                "'[OPPONENT], you just wrote a check your body can't cash.'",
+                "[WRESTLER] approaches menacingly. 'You wanted my attention? Well, now you have it.'",
+                "'Be careful what you wish for, [OPPONENT]. You might just get it.'"
+            ]
+        }
+    },
+    "humble": {
+        "opening": {
+            "first": [
+                "[WRESTLER] speaks calmly. 'I don't need to boast or brag. My actions speak for themselves.'",
+                "'I respect you, [OPPONENT], but that won't stop me from giving everything I have.'",
+                "[WRESTLER] nods respectfully. 'You're good, [OPPONENT]. One of the best. But so am I.'",
+                "'This isn't about who talks the best game. It's about who performs when it matters.'"
+            ],
+            "response": [
+                "[WRESTLER] nods thoughtfully. 'I hear your words, [OPPONENT], and I respect your confidence.'",
+                "'I don't need to match your attitude, [OPPONENT]. I'll let my skills do the talking.'",
+                "[WRESTLER] remains composed. 'You can try to get under my skin, but I'm focused on one thing: winning.'",
+                "'Your opinion of me doesn't define who I am or what I can do.'"
+            ]
+        },
+        "middle": {
+            "first": [
+                "'I've worked too hard to get here to let anyone, even you [OPPONENT], stand in my way.'",
+                "[WRESTLER] speaks earnestly. 'This isn't personal. It's about being the best I can be.'",
+                "'You deserve respect for what you've accomplished, [OPPONENT]. But so do I.'",
+                "[WRESTLER] extends a hand. 'May the best competitor win when we face off.'"
+            ],
+            "response": [
+                "[WRESTLER] remains calm. 'Your words don't change my resolve or my preparation.'",
+                "'I don't need to match your intensity, [OPPONENT]. I just need to beat you.'",
+                "[WRESTLER] nods. 'Fair points. But when we meet in that ring, talk won't matter.'",
+                "'I appreciate your passion, [OPPONENT]. I really do. But it won't be enough.'"
+            ]
+        },
+        "ending": {
+            "first": [
+                "'When all is said and done, [OPPONENT], we'll shake hands, but I plan on being the victor.'",
+                "[WRESTLER] speaks with quiet confidence. 'I respect everything you stand for. That's why beating you means so much.'",
+                "'Win or lose, [OPPONENT], the fans will get our very best. That's a promise.'",
+                "[WRESTLER] nods respectfully. 'Let's give them a match they'll never forget.'"
+            ],
+            "response": [
+                "[WRESTLER] offers a respectful nod. 'May the best competitor win. But know I'm bringing everything I have.'",
+                "'I accept your challenge with humility and determination, [OPPONENT].'",
+                "[WRESTLER] extends a hand. 'When this is over, we'll both be better for it.'",
+                "'I look forward to proving myself against a competitor of your caliber.'"
+            ]
         }
     }
-    
-    # If the requested tone, phase or position isn't available, return a generic line
-    if tone not in versus_lines or phase not in versus_lines[tone] or position not in versus_lines[tone][phase]:
-        return "[WRESTLER] faces off against [OPPONENT] in an intense exchange!"
-    
-    # Return a random line from the appropriate category
-    lines = versus_lines[tone][phase][position]
-    return random.choice(lines) 
\ No newline at end of file
+}
+
+VERSUS_FALLBACK_LINE = "[WRESTLER] faces off against [OPPONENT] in an intense exchange!"
+PROMO_FALLBACK_LINE = "The wrestler cuts a passionate promo."
+
+# Requested tone, theme and phase -> PROMO_LINES bucket
+TONE_BUCKETS = {
+    "boast": "boast",
+    "insult": "insult",
+    "callout": "callout",
+    "challenge": "callout",
+    "humble": "humble"
+}
+THEME_BUCKETS = {
+    "legacy": "legacy",
+    "dominance": "dominance",
+    "betrayal": "betrayal",
+    "power": "power",
+    "comeback": "comeback",
+    "respect": "respect"
+}
+PHASE_BUCKETS = {
+    "beginning": "opening",
+    "opening": "opening",
+    "middle": "middle",
+    "end": "closing",
+    "ending": "closing"
+}
+
+
+def compile_line(line, bare_opponent=False):
+    """
+    Turn a promo line into a ``str.format`` template with {wrestler}/{opponent} fields.
+
+    ``[WRESTLER]``/``{self}`` and ``[OPPONENT]``/``{opponent}`` placeholders are
+    recognised; with ``bare_opponent`` every occurrence of the word "opponent"
+    is a placeholder, as in PROMO_LINES.
+    """
+    template = line.replace("{", "{{").replace("}", "}}")
+    if bare_opponent:
+        return template.replace("opponent", "{opponent}")
+    template = template.replace("{{self}}", "{wrestler}").replace("{{opponent}}", "{opponent}")
+    return template.replace("[WRESTLER]", "{wrestler}").replace("[OPPONENT]", "{opponent}")
+
+
+def _build_promo_line_index():
+    """(phase, tone, theme) bucket -> ((line, template) entries, ids of the opponent-referencing lines)."""
+    index = {}
+    for phase in set(PHASE_BUCKETS.values()):
+        for tone in set(TONE_BUCKETS.values()):
+            tones = PROMO_LINES.get(phase, {}).get(tone, {})
+            for theme in set(THEME_BUCKETS.values()):
+                # Fall back to the generic lines when a theme has none
+                lines = tones.get(theme, []) or tones.get("generic", [])
+                if not lines:
+                    continue
+                entries = tuple((line, compile_line(line, bare_opponent=True)) for line in lines)
+                index[(phase, tone, theme)] = (
+                    entries,
+                    tuple(i for i, line in enumerate(lines) if "opponent" in line)
+                )
+    return index
+
+
+def _build_versus_line_index():
+    """(tone, phase, position) -> tuple of (line, template)."""
+    return {
+        (tone, phase, position): tuple((line, compile_line(line)) for line in lines)
+        for tone, phases in VERSUS_LINES.items()
+        for phase, positions in phases.items()
+        for position, lines in positions.items()
+    }
+
+
+PROMO_LINE_INDEX = _build_promo_line_index()
+VERSUS_LINE_INDEX = _build_versus_line_index()
+_VERSUS_FALLBACK = ((VERSUS_FALLBACK_LINE, compile_line(VERSUS_FALLBACK_LINE)),)
+
+
+def _promo_line_bucket(tone, theme, phase):
+    return PROMO_LINE_INDEX.get((
+        PHASE_BUCKETS.get(phase, "middle"),
+        TONE_BUCKETS.get(tone, "boast"),
+        THEME_BUCKETS.get(theme, "legacy")
+    ))
+
+
+def pick_promo_line_id(tone, theme, phase, has_opponent=False, rng=random):
+    """
+    Pick a solo promo line and return its id within the bucket (None if the bucket is empty).
+
+    With an opponent, a line that references the opponent is re-drawn from the
+    opponent lines only.
+    """
+    bucket = _promo_line_bucket(tone, theme, phase)
+    if bucket is None:
+        return None
+    lines, opponent_ids = bucket
+    line_id = rng.choice(range(len(lines)))
+    if has_opponent and "opponent" in lines[line_id][0]:
+        line_id = rng.choice(opponent_ids)
+    return line_id
+
+
+def render_promo_line(tone, theme, phase, line_id, opponent_name=None):
+    """Text of a line picked by pick_promo_line_id, with the opponent's name filled in."""
+    bucket = _promo_line_bucket(tone, theme, phase)
+    if bucket is None or line_id is None:
+        return PROMO_FALLBACK_LINE
+    line, template = bucket[0][line_id]
+    return line if opponent_name is None else template.format(opponent=opponent_name)
+
+
+def pick_promo_line(tone, theme, phase, opponent_name=None, rng=random):
+    """Pick a solo promo line, preferring opponent references when there is an opponent."""
+    line_id = pick_promo_line_id(tone, theme, phase, opponent_name is not None, rng)
+    return render_promo_line(tone, theme, phase, line_id, opponent_name)
+
+
+def get_versus_promo_line(tone, phase, position, rng=random):
+    """Get a promo line for versus promos based on tone, phase and position."""
+    lines = VERSUS_LINE_INDEX.get((tone, phase, position), _VERSUS_FALLBACK)
+    return rng.choice(lines)[0]
+
+
+def render_versus_promo_line(tone, phase, position, wrestler_name, opponent_name, rng=random):
+    """Pick a versus promo line and fill in the speaker's and target's names."""
+    lines = VERSUS_LINE_INDEX.get((tone, phase, position), _VERSUS_FALLBACK)
+    return rng.choice(lines)[1].format(wrestler=wrestler_name, opponent=opponent_name)
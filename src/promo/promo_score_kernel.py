@@ -0,0 +1,146 @@
+"""
+Vectorized Promo Score Kernel
+
+NumPy version of ``roll_promo_score`` (and the ``calculate_exceptional_bonus``
+roll inside it) for parameter sweeps. Every input may be a scalar or an
+array; they are broadcast together and each element is one independent roll,
+so a whole focus x skill x confidence grid, or thousands of trials of a
+single stat line, is scored in one call.
+
+Each lane applies exactly the piecewise formulas of the scalar helpers; only
+the random draws come from a NumPy generator instead of the ``random``
+module. Results therefore agree with ``roll_promo_score`` in distribution,
+not draw for draw; ``tests/test_promo_score_kernel.py`` checks the agreement.
+"""
+
+import numpy as np
+
+# Exceptional performance types in calculate_exceptional_bonus order;
+# lanes without an exceptional performance get NO_EXCEPTIONAL
+EXCEPTIONAL_TYPES = ("crescendo", "breakthrough", "perfect_moment", "crowd_pleaser")
+CRESCENDO, BREAKTHROUGH, PERFECT_MOMENT, CROWD_PLEASER = range(len(EXCEPTIONAL_TYPES))
+NO_EXCEPTIONAL = -1
+
+
+def _high_score_damping(score, floor, exponent, span):
+    """max(floor, 1 - ((score - 70) / span) ** exponent) above 70, else 1."""
+    over = np.maximum(score - 70, 0) / span
+    return np.where(score > 70, np.maximum(floor, 1.0 - over ** exponent), 1.0)
+
+
+def roll_promo_scores(promo_delivery=10, confidence_stat=10, resilience=10, pressure_handling=10,
+                      beat_number=1, momentum=50, confidence=50, crowd_reaction=50, size=None, rng=None):
+    """
+    Roll promo scores for broadcast arrays of inputs.
+
+    Args:
+        promo_delivery, confidence_stat, resilience, pressure_handling: Wrestler stats
+        beat_number, momentum, confidence, crowd_reaction: Beat state
+        size: Optional output shape; inputs are broadcast to it (e.g. the
+            number of trials for a single stat line)
+        rng: numpy Generator or seed (default: fresh generator)
+
+    Returns:
+        (scores, exceptional) arrays: scores in 0-99 and the index into
+        EXCEPTIONAL_TYPES of any exceptional performance (NO_EXCEPTIONAL if none).
+    """
+    rng = rng if isinstance(rng, np.random.Generator) else np.random.default_rng(rng)
+    arrays = [np.asarray(value, dtype=float) for value in (
+        promo_delivery, confidence_stat, resilience, pressure_handling,
+        beat_number, momentum, confidence, crowd_reaction
+    )]
+    shape = np.broadcast_shapes(*(a.shape for a in arrays)) if size is None else size
+    (promo_delivery, confidence_stat, resilience, pressure_handling,
+     beat_number, momentum, confidence, crowd_reaction) = (np.broadcast_to(a, shape) for a in arrays)
+
+    # Mental profile and base score
+    mental_average = (confidence_stat * 1.0 + resilience * 1.2 + pressure_handling * 1.0) / (1.0 + 1.2 + 1.0)
+    base = np.select(
+        [promo_delivery <= 7, promo_delivery <= 13],
+        [25 + (promo_delivery - 5) * 2.5, 35 + (promo_delivery - 7) * 2.5],
+        50 + (promo_delivery - 13) * 1.5
+    )
+
+    mental_factor = (mental_average / 20) ** 0.7
+    effective_skill = (promo_delivery * 0.6) + (mental_average * 0.4 * mental_factor)
+    skill_scale = np.select(
+        [effective_skill <= 7, effective_skill <= 13],
+        [0.2 + (effective_skill / 7) * 0.2, 0.4 + ((effective_skill - 7) / 6) * 0.2],
+        0.6 + ((effective_skill - 13) / 7) * 0.15
+    )
+
+    confidence_ratio = (confidence / 100) ** 0.8
+    crowd_ratio = (crowd_reaction / 100) ** 0.9
+    momentum_ratio = (momentum / 100) ** 0.85
+
+    current_score = base * (
+        1.0 +
+        (skill_scale * 0.25) +
+        (confidence_ratio * 0.15) +
+        (crowd_ratio * 0.10) +
+        (momentum_ratio * 0.15)
+    )
+
+    # External factors weigh more for low skill wrestlers
+    low_skill_factor = (10 - promo_delivery) / 10
+    current_score = np.where(
+        promo_delivery <= 10,
+        current_score * (1.0 + (crowd_ratio * 0.10 * low_skill_factor) + (momentum_ratio * 0.10 * low_skill_factor)),
+        current_score
+    )
+
+    # Variance from mental stability, widened when struggling or at high scores
+    mental_stability = (resilience + pressure_handling) / 40
+    base_variance = 20 * (2.0 - mental_stability)
+    variance = np.select(
+        [current_score < 40, current_score > 80],
+        [base_variance * (1.0 + (40 - current_score) / 40), base_variance * (1.0 + (current_score - 80) / 20)],
+        base_variance
+    )
+
+    score_factor = _high_score_damping(current_score, 0.5, 1.0, 40)
+    randomness = (-variance + 2 * variance * rng.random(shape)) * score_factor
+    final_score = current_score + randomness
+
+    # Exceptional performance roll (calculate_exceptional_bonus)
+    skill_mod = (promo_delivery / 20) * 15
+    base_chance = 0.5 + ((promo_delivery / 20) ** 0.5 * 7.5)
+    momentum_factor = 0.8 + ((momentum / 100) * 0.8)
+    exceptional_mental = ((confidence_stat + pressure_handling + resilience) / 60) ** 0.5
+    mental_boost = exceptional_mental * 8.0
+    confidence_boost = np.maximum(0, ((confidence - 40) / 60) * 3.0)
+    final_chance = (
+        (base_chance * (1 + exceptional_mental) * momentum_factor)
+        + (mental_boost * (1 + exceptional_mental * 0.7))
+        + confidence_boost
+    ) * score_factor
+    exceptional = rng.random(shape) * 100 < final_chance
+
+    base_boost = 8 + (promo_delivery * 0.85)
+    condition_factor = ((momentum + confidence) / 200) ** 0.5
+    boost = base_boost * (1 + exceptional_mental * 0.7) * (1 + condition_factor * 0.5)
+    boost = boost * _high_score_damping(final_score, 0.15, 0.6, 30)
+
+    skill_bonus = promo_delivery / 20
+    mental_bonus = exceptional_mental * 0.3
+    exceptional_type = np.select(
+        [
+            (beat_number >= 3) & (momentum >= 75 - skill_mod),
+            confidence <= 35 + skill_mod,
+            (confidence >= 75 - skill_mod) & (momentum >= 55 - skill_mod)
+        ],
+        [CRESCENDO, BREAKTHROUGH, PERFECT_MOMENT],
+        CROWD_PLEASER
+    )
+    type_multiplier = np.choose(exceptional_type, [
+        1.0 + skill_bonus * 2.5,
+        0.7 + mental_bonus * 1.5,
+        0.9 + skill_bonus * 1.2,
+        0.8 + skill_bonus * 0.6
+    ])
+    boost = boost * type_multiplier * _high_score_damping(final_score, 0.2, 0.5, 30)
+    boost = np.minimum(boost, 40 - ((final_score - 50) / 50) * 25)
+
+    final_score = np.where(exceptional, final_score + boost, final_score)
+    scores = np.clip(final_score, 0, 99)
+    return scores, np.where(exceptional, exceptional_type, NO_EXCEPTIONAL).astype(np.int8)
@@ -8,7 +8,7 @@ import random
 import statistics
 import math
 from src.promo.promo_engine_helpers import roll_promo_score
-from src.promo.promo_lines import get_versus_promo_line
+from src.promo.promo_lines import render_versus_promo_line
 
 def get_attribute(wrestler, attr_name, default=50):
     """Helper function to get attributes from wrestler object with fallback default."""
@@ -70,68 +70,158 @@ VERSUS_PROMO_LINES = {
     }
 }
 
+def get_wrestler_name(wrestler):
+    """Helper function to get a display name from a wrestler object or dictionary."""
+    if hasattr(wrestler, 'name'):
+        return wrestler.name
+    if isinstance(wrestler, dict):
+        return wrestler['name']
+    return str(wrestler)
+
+
+class VersusSpeaker:
+    """
+    One side of a versus promo.
+
+    The wrestler's stats are resolved once; momentum, confidence and scores
+    are the running state of the current promo and are cleared by reset().
+    """
+
+    __slots__ = ("wrestler", "name", "stats", "aggression", "momentum", "confidence", "scores")
+
+    def __init__(self, wrestler):
+        self.wrestler = wrestler
+        self.name = get_wrestler_name(wrestler)
+        self.aggression = get_attribute(wrestler, "aggression", 50)
+        self.stats = {
+            "promo_delivery": get_attribute(wrestler, "microphone", 50),
+            "charisma": get_attribute(wrestler, "charisma", 50),
+            "showmanship": get_attribute(wrestler, "showmanship", 50),
+            "intelligence": get_attribute(wrestler, "intelligence", 50),
+            "aggression": self.aggression
+        }
+        self.reset()
+
+    def reset(self):
+        self.momentum = 0
+        self.confidence = 50
+        self.scores = []
+
+    @property
+    def avg_score(self):
+        return statistics.mean(self.scores) if self.scores else 0
+
+
 class VersusPromoEngine:
     """Engine to simulate a promo battle between two wrestlers."""
     
-    def __init__(self, wrestler1, wrestler2):
+    def __init__(self, wrestler1, wrestler2, rng=None):
+        # Every roll of the battle comes from rng (default: the global generator)
+        self.rng = rng if rng is not None else random
         self.wrestler1 = wrestler1
         self.wrestler2 = wrestler2
         self.beats = []
         
-        # Get the relevant stats
-        self.w1_charisma = get_attribute(wrestler1, "charisma", 50)
-        self.w1_showmanship = get_attribute(wrestler1, "showmanship", 50)
-        self.w1_microphone = get_attribute(wrestler1, "microphone", 50)
-        self.w1_intelligence = get_attribute(wrestler1, "intelligence", 50)
-        self.w1_aggression = get_attribute(wrestler1, "aggression", 50)
-        
-        self.w2_charisma = get_attribute(wrestler2, "charisma", 50)
-        self.w2_showmanship = get_attribute(wrestler2, "showmanship", 50)
-        self.w2_microphone = get_attribute(wrestler2, "microphone", 50)
-        self.w2_intelligence = get_attribute(wrestler2, "intelligence", 50)
-        self.w2_aggression = get_attribute(wrestler2, "aggression", 50)
-        
-        # Track momentum for each wrestler
-        self.w1_momentum = 0
-        self.w2_momentum = 0
-        
-        # Track confidence for each wrestler
-        self.w1_confidence = 50
-        self.w2_confidence = 50
-        
-        # Keep track of scores
-        self.w1_scores = []
-        self.w2_scores = []
+        # Resolve both wrestlers once; speakers are addressed by position (0 or 1)
+        self.speakers = (VersusSpeaker(wrestler1), VersusSpeaker(wrestler2))
+        self.keep_beats = True
+        self.last_beat = None
+        self.result = None
         
     def simulate(self):
         """Simulate the entire promo battle and return results."""
+        for _ in self.iter_beats():
+            pass
+        return self.result
+
+    def iter_beats(self, keep_beats=True):
+        """
+        Simulate the promo battle one beat at a time, yielding each beat as it is produced.
+
+        When the generator is exhausted the final result (as returned by
+        simulate()) is in ``self.result`` and is also the generator's return
+        value. With keep_beats=False the beats are not collected in
+        ``self.beats`` and the result has no "beats" entry.
+        """
+        self.keep_beats = keep_beats
+        
         # Add intro
-        self._add_intro()
+        yield self._add_intro()
         
         # Determine number of exchanges (4-6 normally)
-        num_exchanges = random.randint(4, 6)
+        num_exchanges = self.rng.randint(4, 6)
         
         # Simulate each exchange
         for i in range(num_exchanges):
             phase = "opening" if i == 0 else "ending" if i == num_exchanges - 1 else "middle"
-            self._simulate_exchange(phase)
+            yield from self._simulate_exchange(phase)
         
         # Add a summary beat
-        self._add_summary()
+        yield self._add_summary()
         
         # Calculate final scores
         final_scores = self._calculate_final_scores()
         
-        return {
-            "beats": self.beats,
-            "final_scores": final_scores
+        self.result = {"final_scores": final_scores}
+        if keep_beats:
+            self.result["beats"] = self.beats
+        return self.result
+
+    def simulate_many(self, runs, keep_beats=False):
+        """
+        Run many independent promo battles between the same two wrestlers.
+
+        The resolved speakers are reused and only their running state is
+        reset between runs, which keeps rivalry planning over thousands of
+        battles cheap.
+
+        Args:
+            runs: Number of promo battles to simulate
+            keep_beats: Whether to keep each run's beats (off by default to save memory)
+
+        Returns:
+            Dictionary with the per-run final scores, win counts and the
+            average overall score.
+        """
+        results = []
+        beat_lists = []
+        wins = [0, 0]
+        overall_total = 0
+
+        for _ in range(runs):
+            self.beats = []
+            for speaker in self.speakers:
+                speaker.reset()
+
+            for _ in self.iter_beats(keep_beats):
+                pass
+            result = self.result
+            final_scores = result["final_scores"]
+            results.append(final_scores)
+            if keep_beats:
+                beat_lists.append(result["beats"])
+
+            if final_scores["wrestler1_score"] > final_scores["wrestler2_score"]:
+                wins[0] += 1
+            elif final_scores["wrestler2_score"] > final_scores["wrestler1_score"]:
+                wins[1] += 1
+            overall_total += final_scores["overall_score"]
+
+        summary = {
+            "runs": runs,
+            "results": results,
+            "wrestler1_wins": wins[0],
+            "wrestler2_wins": wins[1],
+            "draws": runs - wins[0] - wins[1],
+            "avg_overall_score": overall_total / runs if runs else 0
         }
+        if keep_beats:
+            summary["beats"] = beat_lists
+        return summary
     
     def _add_intro(self):
         """Add an introductory beat to set the scene."""
-        # Get names safely
-        w1_name = self.wrestler1.name if hasattr(self.wrestler1, 'name') else self.wrestler1['name'] if isinstance(self.wrestler1, dict) else str(self.wrestler1)
-        w2_name = self.wrestler2.name if hasattr(self.wrestler2, 'name') else self.wrestler2['name'] if isinstance(self.wrestler2, dict) else str(self.wrestler2)
+        w1_name, w2_name = self.speakers[0].name, self.speakers[1].name
         
         intro_text = f"{w1_name} and {w2_name} face off in the ring, microphones in hand."
         
@@ -145,17 +235,16 @@ class VersusPromoEngine:
             "confidence": 50
         }
         
-        self.beats.append(intro_beat)
+        return self._record(intro_beat)
     
     def _add_summary(self):
         """Add a summary beat to conclude the promo battle."""
-        # Get names safely
-        w1_name = self.wrestler1.name if hasattr(self.wrestler1, 'name') else self.wrestler1['name'] if isinstance(self.wrestler1, dict) else str(self.wrestler1)
-        w2_name = self.wrestler2.name if hasattr(self.wrestler2, 'name') else self.wrestler2['name'] if isinstance(self.wrestler2, dict) else str(self.wrestler2)
+        w1, w2 = self.speakers
+        w1_name, w2_name = w1.name, w2.name
         
         # Determine who had better overall scores
-        w1_avg = statistics.mean(self.w1_scores) if self.w1_scores else 0
-        w2_avg = statistics.mean(self.w2_scores) if self.w2_scores else 0
+        w1_avg = w1.avg_score
+        w2_avg = w2.avg_score
         
         if w1_avg > w2_avg + 10:
             summary_text = f"{w1_name} clearly dominated this verbal exchange, leaving {w2_name} struggling to respond."
@@ -174,159 +263,105 @@ class VersusPromoEngine:
             "phase": "ending",
             "is_summary": True,
             "wrestler": None,  # No specific wrestler speaking
-            "momentum": max(self.w1_momentum, self.w2_momentum),
+            "momentum": max(w1.momentum, w2.momentum),
             "confidence": 50
         }
         
-        self.beats.append(summary_beat)
+        return self._record(summary_beat)
     
     def _simulate_exchange(self, phase):
         """Simulate a verbal exchange between the two wrestlers."""
+        w1, w2 = self.speakers
         # Determine who goes first (50/50 chance, but slightly favoring wrestler with momentum)
-        w1_goes_first = random.random() < 0.5 + (self.w1_momentum - self.w2_momentum) / 200
+        w1_goes_first = self.rng.random() < 0.5 + (w1.momentum - w2.momentum) / 200
         
         # Simulate the first wrestler's promo
         if w1_goes_first:
-            self._simulate_promo_line(self.wrestler1, self.wrestler2, phase, "first")
-            self._simulate_promo_line(self.wrestler2, self.wrestler1, phase, "response")
+            yield self._simulate_promo_line(0, phase, "first")
+            yield self._simulate_promo_line(1, phase, "response")
         else:
-            self._simulate_promo_line(self.wrestler2, self.wrestler1, phase, "first")
-            self._simulate_promo_line(self.wrestler1, self.wrestler2, phase, "response")
+            yield self._simulate_promo_line(1, phase, "first")
+            yield self._simulate_promo_line(0, phase, "response")
     
-    def _simulate_promo_line(self, speaker, target, phase, position):
-        """Simulate a single promo line from one wrestler to another."""
-        # Determine the tone based on aggression and position
-        if speaker == self.wrestler1:
-            aggression = self.w1_aggression
-            speaker_momentum = self.w1_momentum
-            speaker_confidence = self.w1_confidence
-        else:
-            aggression = self.w2_aggression
-            speaker_momentum = self.w2_momentum
-            speaker_confidence = self.w2_confidence
+    def _simulate_promo_line(self, position_index, phase, position):
+        """Simulate a single promo line from the speaker at position_index to the other wrestler."""
+        rng = self.rng
+        speaker = self.speakers[position_index]
+        target = self.speakers[1 - position_index]
+        speaker_momentum = speaker.momentum
+        speaker_confidence = speaker.confidence
         
+        # Determine the tone based on aggression and position
         # Higher aggression means more likely to use aggressive tones
-        aggressive_chance = aggression / 100
+        aggressive_chance = speaker.aggression / 100
         
         if position == "first":
             # First speaker sets the tone
-            if random.random() < aggressive_chance:
-                tone = random.choice(["insult", "challenge", "callout"])
+            if rng.random() < aggressive_chance:
+                tone = rng.choice(["insult", "challenge", "callout"])
             else:
-                tone = random.choice(["boast", "humble"])
+                tone = rng.choice(["boast", "humble"])
         else:
             # Response usually matches or escalates
-            prev_beat = self.beats[-1]
+            prev_beat = self.last_beat
             prev_tone = prev_beat.get("tone", "boast")
             
             if prev_tone in ["insult", "challenge", "callout"]:
                 # Respond to aggression
-                if random.random() < aggressive_chance:
+                if rng.random() < aggressive_chance:
                     # Respond aggressively
-                    tone = random.choice(["insult", "challenge", "callout"])
+                    tone = rng.choice(["insult", "challenge", "callout"])
                 else:
                     # Deflect
-                    tone = random.choice(["boast", "humble"])
+                    tone = rng.choice(["boast", "humble"])
             else:
                 # Respond to non-aggression
-                if random.random() < aggressive_chance:
+                if rng.random() < aggressive_chance:
                     # Escalate
-                    tone = random.choice(["insult", "challenge", "callout"])
+                    tone = rng.choice(["insult", "challenge", "callout"])
                 else:
                     # Stay calm
-                    tone = random.choice(["boast", "humble"])
-        
-        # Get a promo line
-        promo_line = get_versus_promo_line(tone, phase, position)
+                    tone = rng.choice(["boast", "humble"])
         
-        # Replace placeholders with wrestler names
-        promo_line = promo_line.replace("[WRESTLER]", speaker["name"])
-        promo_line = promo_line.replace("[OPPONENT]", target["name"])
+        # Get a promo line with the wrestler names filled in
+        promo_line = render_versus_promo_line(tone, phase, position, speaker.name, target.name, rng)
         
         # Roll for promo quality
-        if speaker == self.wrestler1:
-            # Create stats dictionary
-            stats = {
-                "promo_delivery": self.w1_microphone,
-                "charisma": self.w1_charisma,
-                "showmanship": self.w1_showmanship,
-                "intelligence": self.w1_intelligence,
-                "aggression": self.w1_aggression
-            }
-            
-            # Add randomness to create more varied scores
-            quality_roll = roll_promo_score(
-                stats,
-                1,  # beat number
-                self.w1_momentum,
-                self.w1_confidence,
-                50  # default crowd reaction
-            )
-            
-            # Add random variation to scores (-15 to +10)
-            # Extract the score from the tuple returned by roll_promo_score
-            base_score = quality_roll[0]  # The first element is the score
-            variation = random.randint(-15, 10)
-            quality_roll = max(30, min(99, base_score + variation))
-            
-            # Update momentum and confidence based on quality
-            momentum_change = (quality_roll - 50) / 10
-            self.w1_momentum = max(0, min(100, self.w1_momentum + momentum_change))
-            
-            confidence_change = (quality_roll - 50) / 15
-            self.w1_confidence = max(30, min(70, self.w1_confidence + confidence_change))
-            
-            # Add to score tracking
-            self.w1_scores.append(quality_roll)
-        else:
-            # Create stats dictionary
-            stats = {
-                "promo_delivery": self.w2_microphone,
-                "charisma": self.w2_charisma,
-                "showmanship": self.w2_showmanship,
-                "intelligence": self.w2_intelligence,
-                "aggression": self.w2_aggression
-            }
-            
-            # Add randomness to create more varied scores
-            quality_roll = roll_promo_score(
-                stats,
-                1,  # beat number
-                self.w2_momentum,
-                self.w2_confidence,
-                50  # default crowd reaction
-            )
-            
-            # Add random variation to scores (-15 to +10)
-            # Extract the score from the tuple returned by roll_promo_score
-            base_score = quality_roll[0]  # The first element is the score
-            variation = random.randint(-15, 10)
-            quality_roll = max(30, min(99, base_score + variation))
-            
-            # Update momentum and confidence based on quality
-            momentum_change = (quality_roll - 50) / 10
-            self.w2_momentum = max(0, min(100, self.w2_momentum + momentum_change))
-            
-            confidence_change = (quality_roll - 50) / 15
-            self.w2_confidence = max(30, min(70, self.w2_confidence + confidence_change))
-            
-            # Add to score tracking
-            self.w2_scores.append(quality_roll)
+        quality_roll = roll_promo_score(
+            speaker.stats,
+            1,  # beat number
+            speaker.momentum,
+            speaker.confidence,
+            50,  # default crowd reaction
+            rng=rng
+        )
+        
+        # Add random variation to scores (-15 to +10)
+        # Extract the score from the tuple returned by roll_promo_score
+        base_score = quality_roll[0]  # The first element is the score
+        variation = rng.randint(-15, 10)
+        quality_roll = max(30, min(99, base_score + variation))
+        
+        # Update momentum and confidence based on quality
+        momentum_change = (quality_roll - 50) / 10
+        speaker.momentum = max(0, min(100, speaker.momentum + momentum_change))
+        
+        confidence_change = (quality_roll - 50) / 15
+        speaker.confidence = max(30, min(70, speaker.confidence + confidence_change))
+        
+        # Add to score tracking
+        speaker.scores.append(quality_roll)
         
         # If this is a response, impact the previous speaker's confidence
         if position == "response":
             if quality_roll >= 80:  # Great response
-                if speaker == self.wrestler1:
-                    self.w2_confidence = max(0, self.w2_confidence - 10)
-                    self.w2_momentum = max(0, self.w2_momentum - 5)
-                else:
-                    self.w1_confidence = max(0, self.w1_confidence - 10)
-                    self.w1_momentum = max(0, self.w1_momentum - 5)
+                target.confidence = max(0, target.confidence - 10)
+                target.momentum = max(0, target.momentum - 5)
         
         # Format as a beat
         beat = {
-            "wrestler": speaker,
-            "opponent": target,
+            "wrestler": speaker.wrestler,
+            "opponent": target.wrestler,
             "promo_line": promo_line,
             "tone": tone,
             "phase": phase,
@@ -337,13 +372,20 @@ class VersusPromoEngine:
             "is_versus_beat": True
         }
         
-        self.beats.append(beat)
+        return self._record(beat)
+
+    def _record(self, beat):
+        """Keep a produced beat (if beats are kept) and remember it as the latest."""
+        if self.keep_beats:
+            self.beats.append(beat)
+        self.last_beat = beat
+        return beat
     
     def _calculate_final_scores(self):
         """Calculate the final scores for the promo battle."""
         # Calculate average scores
-        w1_avg = statistics.mean(self.w1_scores) if self.w1_scores else 0
-        w2_avg = statistics.mean(self.w2_scores) if self.w2_scores else 0
+        w1_avg = self.speakers[0].avg_score
+        w2_avg = self.speakers[1].avg_score
         
         # Calculate competition bonus (how close the two were)
         score_diff = abs(w1_avg - w2_avg)
@@ -5,11 +5,12 @@ import logging
 from datetime import datetime
 from src.core.game_state import get_game_date
 from src.storyline.storyline_manager import StorylineManager
+from src.db.utils import db_path
 
 class EnhancedStorylineManager(StorylineManager):
     def __init__(self):
         super().__init__()
-        self.rivalry_db_path = "rivalries.db"
+        self.rivalry_db_path = db_path("rivalries.db")
         self._init_rivalry_db()
         
     def _init_rivalry_db(self):
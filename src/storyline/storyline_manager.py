@@ -6,10 +6,12 @@ from src.core.game_state import get_game_date
 import os
 import logging
 import random
+from src.db.utils import db_path
+from src.db.migrations import migrate
 
 class StorylineManager:
     def __init__(self):
-        self.db_path = "storylines.db"
+        self.db_path = db_path("storylines.db")
         self._init_db()
 
     def _init_db(self):
@@ -80,6 +82,8 @@ class StorylineManager:
                 """)
                 
                 conn.commit()
+
+            migrate("storylines.db")
                 
         except Exception as e:
             logging.error(f"Error initializing storyline database: {e}")
@@ -303,7 +303,7 @@ class DebugMenuUI(QWidget):
         logging.info(f"Running {count} test matches...")
         
         try:
-            from match_engine import get_all_wrestlers, load_wrestler_by_id, simulate_match
+            from match_engine import get_all_wrestlers, load_wrestler_by_id, simulate_match, SILENT
             import random
             
             wrestlers = get_all_wrestlers()
@@ -327,15 +327,12 @@ class DebugMenuUI(QWidget):
                 # Measure time
                 start_time = time.time()
                 
-                # Run simulation with minimal logging
-                def minimal_log(msg):
-                    pass
-                
                 logging.info(f"Test match {i+1}/{count}: {w1['name']} vs {w2['name']}")
-                result = simulate_match(w1, w2, log_function=minimal_log, fast_mode=True)
+                # Silent run: no narrative is formatted and no report is printed
+                result = simulate_match(w1, w2, log_function=None, fast_mode=True, verbosity=SILENT)
                 
+                # simulate_match reports the run to game_state_debug itself
                 duration = time.time() - start_time
-                game_state_debug.track_match_simulation(duration)
                 total_time += duration
                 
                 logging.info(f"Match {i+1} completed in {duration:.2f}s")
@@ -5,9 +5,10 @@ import os
 import datetime
 from random import choice, randint
 from src.core.game_state import get_game_date
+from src.core.db_utils import shared_connection
 
 def connect():
-    return sqlite3.connect(db_path("events.db"))
+    return shared_connection("events.db")
 
 def get_all_events():
     conn = connect()
@@ -19,7 +20,7 @@ def get_all_events():
 
 
 def delete_event(event_id):
-    conn = sqlite3.connect(db_path("events.db"))
+    conn = shared_connection("events.db")
     cursor = conn.cursor()
     cursor.execute("DELETE FROM events WHERE id = ?", (event_id,))
     conn.commit()
@@ -85,7 +86,7 @@ def get_event_by_id(event_id):
 
 
 def update_event(event_id, name, card):
-    conn = sqlite3.connect(db_path("events.db"))
+    conn = shared_connection("events.db")
     cursor = conn.cursor()
     cursor.execute("""
         UPDATE events
@@ -142,7 +143,7 @@ def save_match_to_db(event_id, match_index, name1, name2, result):
     import sqlite3
     from db.utils import db_path
 
-    conn = sqlite3.connect(db_path("matches.db"))
+    conn = shared_connection("matches.db")
     cursor = conn.cursor()
 
     # Defensive extraction of stats (handle dict or int)
@@ -159,8 +160,9 @@ def save_match_to_db(event_id, match_index, name1, name2, result):
     total_successes = safe_total(result.get("successes", 0))
     total_misses = safe_total(misses)
 
+    # A replayed card slot replaces its earlier result (UNIQUE(event_id, match_index))
     cursor.execute("""
-        INSERT INTO matches (
+        INSERT OR REPLACE INTO matches (
             event_id, match_index,
             wrestler_1, wrestler_2, winner, method,
             quality, crowd_reaction, reversal_count,
@@ -193,7 +195,7 @@ def get_main_event(event_id):
     import sqlite3
     from db.utils import db_path
 
-    conn = sqlite3.connect(db_path("matches.db"))
+    conn = shared_connection("matches.db")
     cursor = conn.cursor()
     cursor.execute("""
         SELECT wrestler_1, wrestler_2
@@ -213,7 +215,7 @@ def get_main_event_result(event_id):
     import sqlite3
     from db.utils import db_path
 
-    conn = sqlite3.connect(db_path("matches.db"))
+    conn = shared_connection("matches.db")
     cursor = conn.cursor()
     cursor.execute("""
         SELECT wrestler_1, wrestler_2, winner
@@ -236,7 +238,7 @@ def generate_weekly_events_for_year(start_year, start_month):
     from datetime import datetime, timedelta
     import sqlite3
 
-    conn = sqlite3.connect(db_path("events.db"))
+    conn = shared_connection("events.db")
     cursor = conn.cursor()
 
     # Load all weekly show configs
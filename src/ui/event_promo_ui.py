@@ -169,12 +169,14 @@ class EventPromoUI(QWidget):
         
         self.promo_display.setVisible(True)
         
-        # Run the promo engine
+        # Run the promo engine; the display reads the compact beat log,
+        # rendering each line only when it is shown
         engine = PromoEngine(
             self.wrestler,
             tone=self.selected_tone,
             theme=self.selected_theme,
-            opponent=None
+            opponent=None,
+            compact_beats=True
         )
         result = engine.simulate()
         self.promo_result = result
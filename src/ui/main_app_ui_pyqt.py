@@ -379,11 +379,20 @@ class MainApp(QMainWindow):
         from src.ui.event_manager_helper import get_event_by_id
         from src.ui.event_summary_pyqt import EventSummaryUI
         from src.core.game_state import set_event_lock, save_game_state
+        from src.core.move_experience import begin_move_experience_batch, end_move_experience_batch
+        from src.core.match_replay import begin_event_replay, end_event_replay
 
         event_data = get_event_by_id(event_id)
         print(f"🎮 Playing event from news: {event_data['name']} (ID: {event_id})")
 
+        # Collect move experience for the whole card and write it once at the end
+        begin_move_experience_batch()
+        begin_event_replay(event_id)
+
         def on_event_complete():
+            end_move_experience_batch()
+            end_event_replay()
+
             # Make sure to unlock events when returning from the event screen
             set_event_lock(False)
             save_game_state()
@@ -445,8 +454,27 @@ class MainApp(QMainWindow):
         
     def save_game_state_manually(self):
         from src.core.game_state import save_game_state
-        self.diplomacy_system.save_to_db()
-        save_game_state()
+        from src.db.save_snapshot import save_game
+        # The snapshot is only taken once every working database is up to date,
+        # so a slot never mixes this save's state with stale data
+        if not (self.diplomacy_system.save_to_db() and save_game_state()):
+            QMessageBox.warning(
+                self,
+                "Save Error",
+                "The game state could not be written, so the save slot was left unchanged.\n"
+                "See the log for details."
+            )
+            return
+        try:
+            save_game()
+        except Exception as e:
+            logging.error(f"Error writing save snapshot: {e}")
+            QMessageBox.warning(
+                self,
+                "Save Error",
+                f"The save snapshot could not be written; the save slot still holds the previous save:\n{str(e)}"
+            )
+            return
         logging.info("Manual save completed")
         if game_state_debug:
             game_state_debug.export_debug_state()  # Also export debug state
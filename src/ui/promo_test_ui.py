@@ -1867,7 +1867,8 @@ class PromoTestUI(QWidget):
                 w1,
                 tone=tone,
                 theme=theme,
-                opponent=None
+                opponent=None,
+                compact_beats=True
             )
             result = engine.simulate()
             self.promo_result = result
@@ -17,6 +17,7 @@ from src.models.wrestler_creator_model import (
     get_attribute_names, ARCHETYPES
 )
 from src.ui.theme import apply_styles
+from src.core.wrestler_repository import invalidate_wrestler
 
 class AttributeField(QSpinBox):
     """Custom SpinBox for wrestler attributes"""
@@ -803,6 +804,7 @@ class WrestlerCreatorUI(QWidget):
             
             conn.commit()
             conn.close()
+            invalidate_wrestler(wrestler_id)
             
             QMessageBox.information(self, "Success", f"Wrestler '{name}' added successfully!")
             
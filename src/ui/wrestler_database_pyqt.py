@@ -6,6 +6,7 @@ from PyQt5.QtWidgets import (
 import sqlite3
 from db.utils import db_path
 from match_engine import get_all_wrestlers
+from src.core.wrestler_repository import invalidate_wrestler
 
 
 class WrestlerDatabaseUI(QWidget):
@@ -143,6 +144,7 @@ class WrestlerDatabaseUI(QWidget):
 
             conn.commit()
             conn.close()
+            invalidate_wrestler(wrestler_id)
 
             QMessageBox.information(self, "Success", f"✅ Wrestler '{data['name']}' added successfully!")
 
@@ -10,6 +10,7 @@ from src.ui.stats_utils import calculate_high_level_stats_with_grades
 from src.ui.stats_utils import GRADE_SCALE
 from src.core.game_state import get_relationships_refresh_flag, set_relationships_refresh_flag
 from src.ui.wrestler_merchandise_ui import WrestlerMerchandiseUI
+from src.core.wrestler_repository import invalidate_wrestler
 
 
 class WrestlerProfileUI(QWidget):
@@ -149,6 +150,7 @@ class WrestlerProfileUI(QWidget):
                     mental_attr, mental_attr, mental_attr  # Mental 2
                 ))
                 conn.commit()
+                invalidate_wrestler(self.wrestler_id)
                 
                 # Fetch the newly created attributes
                 cursor.execute("SELECT * FROM wrestler_attributes WHERE wrestler_id = ?", (self.wrestler_id,))
@@ -0,0 +1,38 @@
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.manoeuvre_catalog import get_manoeuvre_catalog
+
+
+@pytest.fixture
+def build_wrestler():
+    """Factory for a match-ready wrestler dict with every attribute set to ``stat``."""
+    def build(name, wrestler_id, stat=12, finisher_style="slam", finisher_name="Finisher"):
+        return {
+            "id": wrestler_id,
+            "name": name,
+            "strength": stat,
+            "dexterity": stat,
+            "intelligence": stat,
+            "endurance": stat,
+            "charisma": stat,
+            "fan_engagement": stat,
+            "entrance_presence": stat,
+            "presence_under_fire": stat,
+            "confidence": stat,
+            "signature_moves": [
+                {"name": "Snap Suplex", "type": "slam", "damage": 8, "difficulty": 4}
+            ],
+            "finisher": {"name": finisher_name, "style": finisher_style, "damage": 10}
+        }
+    return build
+
+
+@pytest.fixture(scope="session")
+def manoeuvre_catalog():
+    """The manoeuvres.db catalog, loaded once for the session (as the engine loads it once per process)."""
+    return get_manoeuvre_catalog()
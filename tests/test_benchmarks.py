@@ -0,0 +1,72 @@
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import benchmarks
+from src.core.benchmarks import (
+    BENCHMARKS, fixture_database, find_regressions, load_baseline, main, run_benchmark,
+    run_suite, save_baseline
+)
+from src.db.utils import DB_DIR_ENV, db_path
+
+
+def test_every_benchmark_runs_against_the_fixture(tmp_path):
+    game_db = db_path("wrestlers.db")
+    with fixture_database(str(tmp_path)) as fixture:
+        assert db_path("wrestlers.db") == str(tmp_path / "wrestlers.db")
+        for name in BENCHMARKS:
+            result = run_benchmark(name, fixture, iterations=3, warmup=1)
+            assert result["iterations"] == 3
+            assert result["ops_per_sec"] > 0
+            assert 0 <= result["p50_ms"] <= result["p99_ms"]
+
+        # The card was played into the fixture's databases
+        from src.ui.event_manager_helper import get_event_by_id
+        event = get_event_by_id(fixture.event_id)
+        assert len(event["results"]) == len(event["card"])
+        assert os.path.exists(tmp_path / "replays" / f"event_{fixture.event_id}.replay")
+
+    assert DB_DIR_ENV not in os.environ
+    assert db_path("wrestlers.db") == game_db
+
+
+def test_regressions_respect_thresholds():
+    baseline = {
+        "promo": {"ops_per_sec": 1000.0},
+        "match_fast": {"ops_per_sec": 500.0},
+        "event_card": {"ops_per_sec": 50.0}
+    }
+    results = {
+        "promo": {"ops_per_sec": 850.0},       # -15%
+        "match_fast": {"ops_per_sec": 350.0},  # -30%
+        "event_card": {"ops_per_sec": 60.0},
+        "daily_business": {"ops_per_sec": 1.0}  # not in the baseline
+    }
+
+    assert [r["name"] for r in find_regressions(results, baseline)] == ["match_fast"]
+    assert [r["name"] for r in find_regressions(results, baseline, 0.1)] == ["promo", "match_fast"]
+    regressions = find_regressions(results, baseline, 0.1, thresholds={"promo": 0.2})
+    assert [r["name"] for r in regressions] == ["match_fast"]
+    assert regressions[0]["change"] == pytest.approx(-0.3)
+
+
+def test_cli_fails_when_throughput_regresses(tmp_path, capsys):
+    path = str(tmp_path / "baseline.json")
+    assert load_baseline(path) is None
+    assert main(["promo", "--iterations", "5", "--baseline", path, "--update-baseline"]) == 0
+    assert set(load_baseline(path)) == {"promo"}
+
+    # A baseline far beyond any real machine must be reported as a regression
+    save_baseline({"promo": {"ops_per_sec": 1e12}}, path)
+    assert main(["promo", "--iterations", "5", "--baseline", path]) == 1
+    assert "REGRESSION promo" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(not os.path.exists(benchmarks.BASELINE_PATH), reason="no benchmark baseline recorded")
+def test_throughput_against_baseline():
+    baseline = load_baseline()
+    results = run_suite(list(baseline))
+    assert find_regressions(results, baseline) == []
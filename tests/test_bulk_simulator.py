@@ -0,0 +1,34 @@
+import sys
+import os
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.bulk_simulator import plan_matches, simulate_bulk
+
+
+@pytest.fixture
+def roster(build_wrestler):
+    return {i: build_wrestler(f"Wrestler {i}", i, stat=8 + i) for i in range(1, 7)}
+
+
+def test_plan_is_independent_of_id_order():
+    assert plan_matches([3, 1, 2], 20, 99) == plan_matches([1, 2, 3], 20, 99)
+    assert all(w1 != w2 for _, w1, w2, _ in plan_matches([1, 2, 3], 50, 5))
+
+
+def test_same_seed_same_results_for_any_worker_count(roster):
+    serial = simulate_bulk(60, master_seed=1234, workers=1, roster=roster)
+    parallel = simulate_bulk(60, master_seed=1234, workers=2, chunk_size=7, roster=roster)
+
+    assert serial["results"] == parallel["results"]
+    assert [r["index"] for r in parallel["results"]] == list(range(60))
+
+
+def test_progress_callback_streams_every_match(roster):
+    seen = []
+    simulate_bulk(25, master_seed=7, workers=1, chunk_size=10, roster=roster,
+                  progress_callback=lambda done, total, summaries: seen.append((done, total, len(summaries))))
+
+    assert seen == [(10, 25, 10), (20, 25, 10), (25, 25, 5)]
@@ -0,0 +1,129 @@
+import sys
+import os
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import game_state
+from src.core.db_utils import close_connections
+from src.core.match_statistics import MatchStatistics
+from src.db.utils import DB_DIR_ENV
+
+
+@pytest.fixture
+def stats(tmp_path, monkeypatch):
+    monkeypatch.setenv(DB_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(game_state, "current_date", datetime(2025, 6, 1))
+    yield MatchStatistics()
+    close_connections(str(tmp_path))
+
+
+def record(stats, w1, w2, winner, quality, drama, duration, reversals):
+    assert stats.record_match({
+        "wrestler1_id": w1, "wrestler2_id": w2, "winner_id": winner, "quality": quality,
+        "drama_score": drama, "duration_minutes": duration,
+        "wrestler1": {"name": f"W{w1}"}, "wrestler2": {"name": f"W{w2}"},
+        "reversals": {f"W{w1}": reversals[0], f"W{w2}": reversals[1]}
+    })
+
+
+def test_stats_are_maintained_per_match(stats):
+    record(stats, 1, 2, 1, 60, 40, 10, (2, 1))
+    record(stats, 1, 3, 3, 80, 90, 15, (1, 0))
+    record(stats, 2, 1, 1, 70, 50, 20, (0, 3))
+
+    assert stats.get_wrestler_stats(1) == {
+        "total_matches": 3,
+        "wins": 2,
+        "losses": 1,
+        "win_rate": 2 / 3 * 100,
+        "avg_rating": 70,
+        "avg_duration": 15,
+        "best_match": 80,
+        "worst_match": 60,
+        "avg_drama": 60,
+        "reversal_rate": 2
+    }
+    assert stats.get_wrestler_stats(3)["wins"] == 1
+    assert stats.get_wrestler_stats(99)["total_matches"] == 0
+    assert stats.check_wrestler_stats() == []
+
+
+def test_check_and_rebuild(stats):
+    record(stats, 1, 2, 2, 55, 60, 12, (1, 1))
+    record(stats, 1, 2, 1, 65, 70, 8, (0, 2))
+
+    conn = sqlite3.connect(stats.db_path)
+    conn.execute("UPDATE wrestler_stats SET wins = 0, best_match = 99 WHERE wrestler_id = 1")
+    conn.execute("DELETE FROM wrestler_stats WHERE wrestler_id = 2")
+    conn.commit()
+    conn.close()
+
+    assert stats.check_wrestler_stats() == [
+        (1, "wins", 0, 1), (1, "best_match", 99, 65), (2, "matches", 0, 2)
+    ]
+    assert stats.check_wrestler_stats(1) == [(1, "wins", 0, 1), (1, "best_match", 99, 65)]
+    assert stats.rebuild_wrestler_stats() == 2
+    assert stats.check_wrestler_stats() == []
+    assert stats.get_wrestler_stats(2)["reversal_rate"] == 1.5
+
+
+def test_migration_backfills_stats_from_history(tmp_path, monkeypatch):
+    monkeypatch.setenv(DB_DIR_ENV, str(tmp_path))
+    conn = sqlite3.connect(str(tmp_path / "match_statistics.db"))
+    conn.executescript("""
+        CREATE TABLE matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, wrestler1_id INTEGER NOT NULL, wrestler2_id INTEGER NOT NULL,
+            winner_id INTEGER, match_date TEXT NOT NULL, match_rating INTEGER NOT NULL,
+            duration_minutes REAL NOT NULL, moves_used TEXT, match_type TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE match_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, match_id TEXT NOT NULL, date TEXT NOT NULL,
+            wrestlers_json TEXT NOT NULL, winner TEXT NOT NULL, quality INTEGER NOT NULL,
+            drama_score INTEGER NOT NULL, crowd_energy INTEGER NOT NULL, execution_summary_json TEXT NOT NULL,
+            reversals_json TEXT NOT NULL, stamina_drain_json TEXT NOT NULL, created_at TEXT NOT NULL
+        );
+        CREATE TABLE wrestler_stats (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, wrestler_name TEXT NOT NULL UNIQUE, matches INTEGER DEFAULT 0,
+            last_updated TEXT NOT NULL
+        );
+        INSERT INTO matches (wrestler1_id, wrestler2_id, winner_id, match_date, match_rating, duration_minutes, match_type)
+        VALUES (1, 2, 1, 'Sunday, 01 June 2025', 70, 12.5, 'Singles');
+        INSERT INTO match_history (match_id, date, wrestlers_json, winner, quality, drama_score, crowd_energy,
+                                   execution_summary_json, reversals_json, stamina_drain_json, created_at)
+        VALUES ('match_1', 'Sunday, 01 June 2025',
+                '{"wrestler1": "Ace", "wrestler2": "Brute", "wrestler1_id": 1, "wrestler2_id": 2}',
+                'Ace', 70, 65, 50, '{}', '{"Ace": 3, "Brute": 1}', '{}', 'now');
+    """)
+    conn.commit()
+    conn.close()
+
+    stats = MatchStatistics()
+    try:
+        ace = stats.get_wrestler_stats(1)
+        assert (ace["total_matches"], ace["wins"], ace["avg_duration"], ace["reversal_rate"]) == (1, 1, 12.5, 3)
+        assert stats.get_wrestler_stats(2)["avg_drama"] == 65
+        assert stats.check_wrestler_stats() == []
+    finally:
+        close_connections(str(tmp_path))
+
+
+def test_name_lookups_are_cached(stats, monkeypatch):
+    from src.core import match_engine
+    lookups = []
+
+    def load_wrestler_by_name(name):
+        lookups.append(name)
+        return {"id": 1, "name": name}
+
+    monkeypatch.setattr(match_engine, "load_wrestler_by_name", load_wrestler_by_name)
+    record(stats, 1, 2, 1, 60, 40, 10, (0, 0))
+
+    assert stats.get_wrestler_stats("Ace")["wins"] == 1
+    assert stats.get_current_streak("Ace") == ("W", 1)
+    assert stats.get_form_guide("Ace") == "W"
+    assert lookups == ["Ace"]
@@ -0,0 +1,46 @@
+import sys
+import os
+import sqlite3
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.commentary_store import CommentaryStore, compile_template
+
+
+def build_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE attacking_commentary (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            context TEXT NOT NULL,
+            tier TEXT,
+            line TEXT NOT NULL
+        )
+    """)
+    conn.executemany("INSERT INTO attacking_commentary (context, tier, line) VALUES (?, ?, ?)", [
+        ("momentum", None, "(wrestler1) is taking it to (wrestler2)!"),
+        ("momentum", None, "(wrestler1) is on fire {literally}!"),
+        ("crowd", "high", "The crowd is behind (wrestler2)!"),
+    ])
+    conn.commit()
+    conn.close()
+
+
+def test_lines_render_like_placeholder_replacement(tmp_path):
+    path = str(tmp_path / "commentary.db")
+    build_db(path)
+    store = CommentaryStore.from_db(path)
+
+    expected = {
+        "Alpha is taking it to Bravo!",
+        "Alpha is on fire {literally}!",
+    }
+    assert {store.line("momentum", w1="Alpha", w2="Bravo") for _ in range(50)} == expected
+    assert store.line("crowd", "high", w1="Alpha", w2="Bravo") == "The crowd is behind Bravo!"
+    assert len(store.pool("momentum")) == 2
+
+
+def test_missing_pool_falls_back():
+    store = CommentaryStore([])
+    assert store.line("colour", w1="Alpha", w2="Bravo") == "Alpha is in control!"
+    assert compile_template("(wrestler1) vs (wrestler2)") == "{w1} vs {w2}"
@@ -0,0 +1,149 @@
+import sys
+import os
+import sqlite3
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.db_utils import (
+    close_connections, execute_query, execute_update, get_connection_manager, shared_connection, transaction
+)
+from src.db.utils import DB_DIR_ENV
+
+
+@pytest.fixture
+def db_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(DB_DIR_ENV, str(tmp_path))
+    conn = sqlite3.connect(str(tmp_path / "test.db"))
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+    yield tmp_path
+    close_connections(str(tmp_path))
+
+
+def count_items(path):
+    # Read through an independent connection to see only committed rows
+    conn = sqlite3.connect(str(path))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_one_tuned_connection_per_thread(db_dir):
+    manager = get_connection_manager()
+    entry = manager.entry("test.db")
+    assert manager.entry(str(db_dir / "test.db")) is entry
+    assert entry.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert entry.conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(manager.entry("test.db")))
+    thread.start()
+    thread.join()
+    assert other[0] is not entry
+
+    assert close_connections(str(db_dir)) == 2
+    assert manager.entry("test.db") is not entry
+
+
+def test_legacy_open_commit_close_pattern(db_dir):
+    conn = shared_connection("test.db")
+    conn.execute("INSERT INTO items (name) VALUES ('kept')")
+    conn.commit()
+    conn.close()
+
+    conn = shared_connection("test.db")
+    conn.row_factory = sqlite3.Row
+    conn.execute("INSERT INTO items (name) VALUES ('discarded')")
+    # Rows come back through the handle's own row factory
+    assert conn.execute("SELECT name FROM items").fetchone()["name"] == "kept"
+    conn.close()
+
+    assert count_items(db_dir / "test.db") == 1
+    assert shared_connection("test.db").execute("SELECT name FROM items").fetchall() == [("kept",)]
+
+
+def test_nested_handle_does_not_discard_callers_work(db_dir):
+    outer = shared_connection("test.db")
+    outer.execute("INSERT INTO items (name) VALUES ('outer')")
+    inner = shared_connection("test.db")
+    inner.execute("SELECT COUNT(*) FROM items").fetchone()
+    inner.close()
+    outer.commit()
+    outer.close()
+    assert count_items(db_dir / "test.db") == 1
+
+
+def test_handle_left_open_by_an_error_discards_its_write(db_dir):
+    def insert(item_id, fail):
+        conn = shared_connection("test.db")
+        conn.execute("INSERT INTO items (id) VALUES (?)", (item_id,))
+        if fail:
+            raise ValueError("failed before commit/close")
+        conn.commit()
+        conn.close()
+
+    try:
+        insert(1, fail=True)
+    except ValueError:
+        pass
+    assert get_connection_manager().entry("test.db").handles == 0
+    insert(2, fail=False)
+    assert shared_connection("test.db").execute("SELECT id FROM items").fetchall() == [(2,)]
+
+
+def test_transactions_commit_roll_back_and_nest(db_dir):
+    path = db_dir / "test.db"
+    with transaction("test.db") as conn:
+        conn.execute("INSERT INTO items (name) VALUES ('a')")
+        with pytest.raises(ValueError):
+            with transaction("test.db") as nested:
+                nested.execute("INSERT INTO items (name) VALUES ('b')")
+                raise ValueError("undo the savepoint only")
+        # Legacy helpers inside the block do not commit early
+        helper = shared_connection("test.db")
+        helper.execute("INSERT INTO items (name) VALUES ('c')")
+        helper.commit()
+        helper.close()
+        assert count_items(path) == 0
+    assert count_items(path) == 2
+
+    with pytest.raises(sqlite3.IntegrityError):
+        with transaction("test.db") as conn:
+            conn.execute("INSERT INTO items (id, name) VALUES (100, 'd')")
+            conn.execute("INSERT INTO items (id, name) VALUES (100, 'e')")
+    assert count_items(path) == 2
+
+
+def test_query_helpers_use_the_shared_connection(db_dir):
+    assert execute_update("test.db", "INSERT INTO items (name) VALUES (?)", ("x",)) == 1
+    rows = execute_query("test.db", "SELECT id, name FROM items")
+    assert rows[0]["name"] == "x"
+    assert count_items(db_dir / "test.db") == 1
+
+
+def test_legacy_rollback_inside_a_block_undoes_only_that_block(db_dir):
+    with transaction("test.db") as outer:
+        outer.execute("INSERT INTO items (id) VALUES (1)")
+        with transaction("test.db") as inner:
+            inner.execute("INSERT INTO items (id) VALUES (2)")
+            legacy = shared_connection("test.db")
+            legacy.execute("INSERT INTO items (id) VALUES (3)")
+            legacy.rollback()
+            legacy.close()
+        outer.execute("INSERT INTO items (id) VALUES (4)")
+        # Still one atomic unit: nothing is visible before the outer block ends
+        assert count_items(db_dir / "test.db") == 0
+
+    conn = sqlite3.connect(str(db_dir / "test.db"))
+    assert conn.execute("SELECT id FROM items ORDER BY id").fetchall() == [(1,), (4,)]
+    conn.close()
+
+
+def test_execute_query_does_not_open_a_transaction(db_dir):
+    execute_query("test.db", "SELECT * FROM items")
+    assert not get_connection_manager().entry("test.db").conn.in_transaction
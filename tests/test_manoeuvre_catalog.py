@@ -0,0 +1,88 @@
+import sys
+import os
+import random
+import sqlite3
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import manoeuvre_catalog
+from src.core.manoeuvre_catalog import ManoeuvreCatalog, progressive_window
+
+MOVES = [
+    ("Chop", "strike", 3, 2),
+    ("Body Slam", "slam", 6, 4),
+    ("Suplex", "grapple", 8, 6),
+    ("Moonsault", "aerial", 8, 8),
+    ("Shooting Star Press", "aerial", 10, 10),
+    ("Armbar", "submission", 6, 5),
+]
+
+
+def build_db(path, moves):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE manoeuvres (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            type TEXT NOT NULL,
+            damage INTEGER NOT NULL,
+            difficulty INTEGER NOT NULL
+        )
+    """)
+    conn.executemany("INSERT INTO manoeuvres (name, type, damage, difficulty) VALUES (?, ?, ?, ?)", moves)
+    conn.commit()
+    conn.close()
+
+
+def test_window_candidates_match_sql_filter(tmp_path):
+    path = str(tmp_path / "manoeuvres.db")
+    build_db(path, MOVES)
+    catalog = ManoeuvreCatalog.from_db(path)
+
+    conn = sqlite3.connect(path)
+    for turn in range(0, 60):
+        window = progressive_window(turn)
+        expected = conn.execute("""
+            SELECT name, type, damage, difficulty FROM manoeuvres
+            WHERE damage BETWEEN ? AND ? AND difficulty <= ?
+            ORDER BY id
+        """, window).fetchall()
+        assert list(catalog.window_candidates(*window)) == expected
+    conn.close()
+
+
+def test_pick_for_turn_stays_in_window():
+    catalog = ManoeuvreCatalog(MOVES)
+    rng = random.Random(7)
+    for turn in range(1, 60):
+        move = catalog.pick_for_turn(turn, rng)
+        min_damage, max_damage, max_difficulty = progressive_window(turn)
+        if move is not None:
+            assert min_damage <= move[2] <= max_damage
+            assert move[3] <= max_difficulty
+
+
+def test_empty_window_returns_none():
+    catalog = ManoeuvreCatalog([("Chop", "strike", 1, 1)])
+    assert catalog.pick_for_turn(40) is None
+    assert catalog.pick_by_type("aerial") is None
+
+
+def test_invalidate_forces_reload(tmp_path, monkeypatch):
+    path = str(tmp_path / "manoeuvres.db")
+    build_db(path, MOVES[:1])
+    monkeypatch.setattr("db.utils.db_path", lambda name: path)
+    manoeuvre_catalog.invalidate_manoeuvre_catalog()
+
+    assert len(manoeuvre_catalog.get_manoeuvre_catalog().moves) == 1
+
+    conn = sqlite3.connect(path)
+    conn.executemany("INSERT INTO manoeuvres (name, type, damage, difficulty) VALUES (?, ?, ?, ?)", MOVES[1:])
+    conn.commit()
+    conn.close()
+
+    # Still served from the cached snapshot until invalidated
+    assert len(manoeuvre_catalog.get_manoeuvre_catalog().moves) == 1
+    manoeuvre_catalog.invalidate_manoeuvre_catalog()
+    assert len(manoeuvre_catalog.get_manoeuvre_catalog().moves) == len(MOVES)
+    manoeuvre_catalog.invalidate_manoeuvre_catalog()
@@ -0,0 +1,89 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.match_core import MatchObserver, CallbackObserver, run_match
+
+
+class RecordingObserver(MatchObserver):
+    def __init__(self):
+        self.lines = []
+        self.updates = []
+        self.stats = []
+        self.ticks = 0
+
+    def on_log(self, line):
+        self.lines.append(line)
+
+    def on_update(self, left, right):
+        self.updates.append((left["name"], right["name"]))
+
+    def on_stats(self, stats):
+        self.stats.append(stats)
+
+    def on_tick(self):
+        self.ticks += 1
+
+
+def test_headless_match_without_observers(build_wrestler):
+    random.seed(1)
+    w1, w2 = build_wrestler("Alpha", 1), build_wrestler("Bravo", 2)
+    result = run_match(w1, w2)
+
+    assert result["winner"] in ("Alpha", "Bravo")
+    assert result["win_type"] == result["finish_type"]
+    assert 10 <= result["quality"] <= 100
+    assert result["turns"] == len([m for m in result["move_log"] if m["category"] != "finisher"])
+
+
+def test_observer_receives_events_in_booking_order(build_wrestler):
+    random.seed(2)
+    observer = RecordingObserver()
+    result = run_match(build_wrestler("Alpha", 1), build_wrestler("Bravo", 2), [observer])
+
+    assert observer.lines[0].startswith("The bell rings")
+    assert observer.ticks >= result["turns"]
+    assert all(update == ("Alpha", "Bravo") for update in observer.updates)
+    assert observer.stats[-1]["quality"] == result["quality"]
+
+
+def test_same_seed_gives_same_match_with_or_without_observers(build_wrestler):
+    random.seed(3)
+    silent = run_match(build_wrestler("Alpha", 1), build_wrestler("Bravo", 2))
+    random.seed(3)
+    observed = run_match(build_wrestler("Alpha", 1), build_wrestler("Bravo", 2),
+                         [CallbackObserver(log_function=lambda line: None)])
+
+    for key in ("winner", "win_type", "quality", "turns", "drama_score"):
+        assert silent[key] == observed[key]
+
+
+def test_engine_imports_without_qt():
+    import src.core.match_engine  # noqa: F401
+    import src.core.optimized_match_engine  # noqa: F401
+    assert "PyQt5" not in sys.modules
+
+
+def test_silent_verbosity_formats_no_narrative(monkeypatch, build_wrestler):
+    import src.core.match_core as match_core
+
+    def fail(*args):
+        raise AssertionError("commentary rendered in a silent match")
+    monkeypatch.setattr(match_core, "get_execution_commentary", fail)
+
+    random.seed(4)
+    observer = RecordingObserver()
+    result = run_match(build_wrestler("Alpha", 1), build_wrestler("Bravo", 2), [observer], verbosity=match_core.SILENT)
+
+    assert observer.lines == []
+    assert observer.stats[-1]["quality"] == result["quality"]
+
+
+def test_execution_commentary_templates():
+    from src.core.match_engine_utils import EXECUTION_COMMENTARY, get_execution_commentary
+
+    line = get_execution_commentary("perfect", "Alpha", "Suplex")
+    assert line in [t.format(wrestler_name="Alpha", move_name="Suplex") for t in EXECUTION_COMMENTARY["perfect"]]
+    assert get_execution_commentary("unknown", "Alpha", "Suplex") is None
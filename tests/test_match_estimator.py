@@ -0,0 +1,50 @@
+import sys
+import os
+import random
+import statistics
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.match_core import run_match
+from src.core.match_estimator import estimate_matchup, estimate_card
+
+
+def test_estimate_agrees_with_scalar_engine(build_wrestler):
+    technician = build_wrestler("Technician", 1, 16, finisher_style="submission")
+    brawler = build_wrestler("Brawler", 2, 11, finisher_style="slam")
+
+    random.seed(2024)
+    scalar = [run_match(dict(technician), dict(brawler)) for _ in range(1500)]
+    estimate = estimate_matchup(technician, brawler, simulations=20000, seed=2024)
+
+    # Tolerances are several standard errors of the 1500-match scalar sample
+    scalar_win_rate = sum(r["winner"] == "Technician" for r in scalar) / len(scalar)
+    assert abs(estimate["win_rate"][0] - scalar_win_rate) < 0.04
+
+    scalar_submissions = sum(r["finish_type"] == "submission" for r in scalar) / len(scalar)
+    assert abs(estimate["finish_types"]["submission"] / 20000 - scalar_submissions) < 0.04
+
+    assert abs(estimate["avg_quality"] - statistics.mean(r["quality"] for r in scalar)) < 2.0
+    assert abs(estimate["avg_turns"] - statistics.mean(r["turns"] for r in scalar)) < 1.5
+    assert abs(estimate["avg_false_finishes"] - statistics.mean(r["false_finishes"] for r in scalar)) < 0.2
+
+
+def test_estimate_is_reproducible_and_consistent(build_wrestler):
+    w1 = build_wrestler("Left", 1, 12, finisher_style="slam")
+    w2 = build_wrestler("Right", 2, 12, finisher_style="slam")
+
+    first = estimate_matchup(w1, w2, simulations=500, seed=7)
+    assert first == estimate_matchup(w1, w2, simulations=500, seed=7)
+
+    assert sum(first["wins"]) == 500
+    assert sum(first["finish_types"].values()) == 500
+    assert sum(first["quality_histogram"].values()) == 500
+    assert all(10 <= q <= 100 for q in first["quality_histogram"])
+
+
+def test_estimate_card_keeps_pairing_order(build_wrestler):
+    w1 = build_wrestler("Left", 1, 14, finisher_style="slam")
+    w2 = build_wrestler("Right", 2, 10, finisher_style="slam")
+
+    results = estimate_card([(w1, w2), (w2, w1)], simulations=300, seed=1)
+    assert [r["wrestlers"] for r in results] == [["Left", "Right"], ["Right", "Left"]]
@@ -0,0 +1,87 @@
+import sys
+import os
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import game_state
+from src.core.db_utils import close_connections
+from src.core.match_statistics import MatchStatistics
+from src.db.utils import DB_DIR_ENV
+
+
+@pytest.fixture
+def stats(tmp_path, monkeypatch):
+    monkeypatch.setenv(DB_DIR_ENV, str(tmp_path))
+    monkeypatch.setattr(game_state, "current_date", datetime(2025, 6, 1))
+    yield MatchStatistics()
+    close_connections(str(tmp_path))
+
+
+def record(stats, day, w1, w2, winner, quality, drama=None):
+    game_state.current_date = datetime(2025, 6, day)
+    result = {"wrestler1_id": w1, "wrestler2_id": w2, "winner_id": winner, "quality": quality}
+    if drama is not None:
+        result["drama_score"] = drama
+    assert stats.record_match(result)
+
+
+def test_trends_follow_game_dates(stats):
+    # Saturday sorts after Monday as text; the trend must still be chronological
+    record(stats, 2, 1, 2, 1, 40, drama=30)   # Monday
+    record(stats, 7, 1, 3, 3, 60, drama=50)   # Saturday
+    record(stats, 9, 2, 1, 1, 80, drama=70)   # Monday
+    record(stats, 9, 1, 4, 1, 90, drama=90)   # same day, recorded later
+
+    assert stats.get_recent_matches(1) == [(1, 90, 90), (1, 80, 70), (0, 60, 50), (1, 40, 30)]
+    trends = stats.get_wrestler_trends(1, last_n_matches=3)
+    assert trends == {
+        "recent_quality_avg": (90 + 80 + 60) / 3,
+        "recent_drama_avg": (90 + 70 + 50) / 3,
+        "win_streak": 2,
+        "quality_trend": "up",
+        "match_count": 3
+    }
+    assert stats.get_form_guide(1) == "WWLW"
+    assert stats.get_current_streak(1) == ("W", 2)
+    assert stats.get_current_streak(2) == ("L", 2)
+    assert stats.get_current_streak(99) == (None, 0)
+    assert stats.get_wrestler_trends(99) is None
+    assert stats.get_recent_matches(1, since_date="Saturday, 07 June 2025") == [(1, 90, 90), (1, 80, 70), (0, 60, 50)]
+
+
+def test_backfill_existing_history(tmp_path, monkeypatch):
+    monkeypatch.setenv(DB_DIR_ENV, str(tmp_path))
+    conn = sqlite3.connect(str(tmp_path / "match_statistics.db"))
+    conn.executescript("""
+        CREATE TABLE matches (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, wrestler1_id INTEGER NOT NULL, wrestler2_id INTEGER NOT NULL,
+            winner_id INTEGER, match_date TEXT NOT NULL, match_rating INTEGER NOT NULL,
+            duration_minutes REAL NOT NULL, moves_used TEXT, match_type TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE match_history (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, match_id TEXT NOT NULL, date TEXT NOT NULL,
+            wrestlers_json TEXT NOT NULL, winner TEXT NOT NULL, quality INTEGER NOT NULL,
+            drama_score INTEGER NOT NULL, crowd_energy INTEGER NOT NULL, execution_summary_json TEXT NOT NULL,
+            reversals_json TEXT NOT NULL, stamina_drain_json TEXT NOT NULL, created_at TEXT NOT NULL
+        );
+        INSERT INTO matches (wrestler1_id, wrestler2_id, winner_id, match_date, match_rating, duration_minutes, match_type)
+        VALUES (1, 2, 2, 'Sunday, 01 June 2025', 55, 10, 'Singles'),
+               (1, 2, 1, 'Monday, 02 June 2025', 75, 12, 'Singles');
+        INSERT INTO match_history (match_id, date, wrestlers_json, winner, quality, drama_score, crowd_energy,
+                                   execution_summary_json, reversals_json, stamina_drain_json, created_at)
+        VALUES ('match_2', 'Monday, 02 June 2025', '{}', 'Ace', 75, 88, 50, '{}', '{}', '{}', 'now');
+    """)
+    conn.commit()
+    conn.close()
+
+    stats = MatchStatistics()
+    try:
+        assert stats.get_recent_matches(1) == [(1, 75, 88), (0, 55, 55)]
+        assert stats.get_form_guide(2) == "LW"
+    finally:
+        close_connections(str(tmp_path))
@@ -0,0 +1,65 @@
+import sys
+import os
+import json
+import random
+import sqlite3
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core import game_state_debug
+from src.core.db_utils import get_connection_manager, shared_connection
+from src.core.match_core import run_match, CallbackObserver
+from src.core.match_profiler import MatchProfiler, profile_matches, get_active_profiler
+
+
+def test_nested_sections_are_exclusive():
+    profiler = MatchProfiler()
+    with profiler.section("finisher"):
+        with profiler.section("ui_callbacks"):
+            pass
+
+    assert profiler.sections["finisher"][0] == 1
+    assert profiler.sections["ui_callbacks"][0] == 1
+    assert profiler.sections["finisher"][1] >= 0
+    assert not profiler._stack
+
+
+def test_profiled_matches_feed_debug_stats(tmp_path, build_wrestler, manoeuvre_catalog):
+    game_state_debug.reset_stats()
+    random.seed(5)
+    lines = []
+    connect = sqlite3.connect
+    conn = shared_connection(":memory:")
+
+    with profile_matches() as profiler:
+        for _ in range(3):
+            run_match(build_wrestler("Alpha", 1), build_wrestler("Bravo", 2),
+                      [CallbackObserver(log_function=lines.append)])
+        conn.execute("SELECT 1").fetchall()
+        # Only statements on managed connections are counted, without patching sqlite3
+        assert sqlite3.connect is connect
+        sqlite3.connect(":memory:").execute("SELECT 1").connection.close()
+
+    assert get_active_profiler() is None
+    assert profiler.matches == 3
+    assert profiler.db_statements == 1
+
+    # Tracing stops with the profile
+    statements = get_connection_manager().statements
+    conn.execute("SELECT 1").fetchall()
+    conn.close()
+    assert get_connection_manager().statements == statements
+    sections = profiler.to_dict()["sections"]
+    assert sections["move_selection"]["calls"] > 0
+    assert sections["move_success"]["calls"] > 0
+    assert sections["ui_callbacks"]["calls"] >= len(lines)
+    assert sections["commentary"]["calls"] > 0
+
+    merged = game_state_debug.performance_stats["match_profile"]
+    assert merged["matches"] == 3
+    assert merged["sections"]["move_success"]["calls"] == sections["move_success"]["calls"]
+
+    path = str(tmp_path / "perf.json")
+    assert game_state_debug.export_performance_stats(path) == path
+    with open(path) as f:
+        assert json.load(f)["match_profile"]["db_statements"] == 1
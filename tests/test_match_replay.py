@@ -0,0 +1,60 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.match_core import run_match
+from src.core.match_replay import ReplayWriter, ReplayRecorder, ReplayReader
+
+
+def record_match(writer, seed, build_wrestler):
+    random.seed(seed)
+    w1 = build_wrestler("Left", 1, 14, finisher_style="submission", finisher_name="Crossface")
+    w2 = build_wrestler("Right", 2, 11, finisher_style="submission", finisher_name="Crossface")
+    recorder = ReplayRecorder(writer)
+    result = run_match(w1, w2, [recorder])
+    recorder.finish(w1, w2, result)
+    return w1, w2, result
+
+
+def test_replay_round_trip(tmp_path, build_wrestler):
+    path = str(tmp_path / "event_1.replay")
+    with ReplayWriter(path) as writer:
+        first = record_match(writer, 11, build_wrestler)
+        second = record_match(writer, 12, build_wrestler)
+
+    with ReplayReader(path) as reader:
+        matches = reader.matches()
+        assert len(matches) == 2
+
+        for match_no, (w1, w2, result) in enumerate((first, second)):
+            info = matches[match_no]
+            assert (info.wrestler1_id, info.wrestler2_id) == (1, 2)
+            assert info.finish_type == result["finish_type"]
+            assert info.quality == result["quality"]
+            assert info.turn_count == result["turns"]
+
+            moves = reader.match_moves(match_no)
+            move_log = result["move_log"]
+            assert [m.move_name for m in moves] == [e["move_name"] for e in move_log]
+            assert [m.success for m in moves] == [e["success"] for e in move_log]
+            assert moves[3] == reader.move(match_no, 3)
+
+            # Summing the deltas rebuilds the final state of both wrestlers
+            final = reader.state_at(match_no, len(moves) - 1)
+            assert final.stamina == (w1["stamina"], w2["stamina"])
+            assert final.damage_taken == (w1["damage_taken"], w2["damage_taken"])
+
+
+def test_reopened_file_appends_and_streams(tmp_path, build_wrestler):
+    path = str(tmp_path / "event_2.replay")
+    with ReplayWriter(path) as writer:
+        record_match(writer, 5, build_wrestler)
+    with ReplayWriter(path) as writer:
+        _, _, result = record_match(writer, 6, build_wrestler)
+
+    with ReplayReader(path) as reader:
+        assert len(reader.matches()) == 2
+        streamed = [record for match_no, record in reader.iter_turns() if match_no == 1]
+        assert [r.move_name for r in streamed] == [e["move_name"] for e in result["move_log"]]
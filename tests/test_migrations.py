@@ -0,0 +1,103 @@
+import sys
+import os
+import sqlite3
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.db_utils import close_connections
+from src.db.utils import DB_DIR_ENV
+from src.db.migrations import (
+    HOT_QUERIES, MIGRATIONS, Migration, ensure_unique, find_full_scans, full_scans, migrate, migrate_all, schema_version
+)
+
+
+@pytest.fixture
+def db_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(DB_DIR_ENV, str(tmp_path))
+    yield tmp_path
+    close_connections(str(tmp_path))
+
+
+def build_game_databases():
+    """Create every table the hot queries touch through the code that owns it."""
+    from src.core.match_statistics import MatchStatistics
+    from src.core.diplomacy_system import DiplomacySystem
+    from src.storyline.storyline_manager import StorylineManager
+    from src.db.business_schema import create_business_tables
+    from db.setup_events_and_matches import setup_matches_db
+    from db.setup_move_experience_db import setup_move_experience_db
+
+    MatchStatistics()
+    StorylineManager()
+    DiplomacySystem().load_from_db()
+    create_business_tables()
+    setup_matches_db()
+    setup_move_experience_db()
+
+
+def test_hot_queries_use_indexes(db_dir):
+    build_game_databases()
+    migrate_all()
+    assert find_full_scans() == []
+    assert {db_name for db_name, _, _ in HOT_QUERIES} <= {m.db_name for m in MIGRATIONS}
+
+
+def test_full_scan_detection():
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, day TEXT)")
+    assert full_scans(conn, "SELECT * FROM events WHERE day = ?", ("x",)) == ["events"]
+    assert full_scans(conn, "SELECT * FROM events WHERE id = ?", (1,)) == []
+    conn.execute("CREATE INDEX idx_day ON events (day)")
+    assert full_scans(conn, "SELECT * FROM events WHERE day = ?", ("x",)) == []
+    conn.close()
+
+
+def test_migrations_apply_once_in_order(db_dir):
+    sqlite3.connect(str(db_dir / "test.db")).close()
+    migrations = [
+        Migration(2, "test.db", "add index", ["items"], "CREATE INDEX idx_items_name ON items (name);"),
+        Migration(1, "test.db", "add table", [], "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT);"),
+    ]
+    assert migrate("test.db", migrations) == [1, 2]
+    assert schema_version("test.db") == 2
+    assert migrate("test.db", migrations) == []
+
+
+def test_migration_waits_for_its_table(db_dir):
+    migrations = [Migration(1, "test.db", "add index", ["items"], "CREATE INDEX idx_items_name ON items (name);")]
+    sqlite3.connect(str(db_dir / "test.db")).close()
+    assert migrate("test.db", migrations) == []
+    assert schema_version("test.db") == 0
+
+    conn = sqlite3.connect(str(db_dir / "test.db"))
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    conn.commit()
+    conn.close()
+    assert migrate("test.db", migrations) == [1]
+    # Databases that do not exist are not created
+    assert migrate_all([Migration(1, "absent.db", "noop", [], "SELECT 1;")]) == {}
+    assert not (db_dir / "absent.db").exists()
+
+
+def test_ensure_unique_archives_duplicates(db_dir):
+    conn = sqlite3.connect(str(db_dir / "test.db"))
+    conn.execute("CREATE TABLE slots (event_id INTEGER, match_index INTEGER, winner TEXT)")
+    conn.executemany("INSERT INTO slots VALUES (?, ?, ?)", [
+        (1, 0, "old"), (1, 0, "new"), (1, 1, "other"), (None, 2, "tbd"), (None, 2, "tbd too")
+    ])
+    conn.commit()
+    conn.close()
+
+    step = ensure_unique("slots", ("event_id", "match_index"), "ux_slots")
+    assert migrate("test.db", [Migration(1, "test.db", "unique slots", ["slots"], step)]) == [1]
+
+    conn = sqlite3.connect(str(db_dir / "test.db"))
+    assert conn.execute("SELECT winner FROM slots ORDER BY match_index, rowid").fetchall() == [
+        ("new",), ("other",), ("tbd",), ("tbd too",)
+    ]
+    assert conn.execute("SELECT * FROM slots_archived").fetchall() == [(1, 0, "old")]
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute("INSERT INTO slots VALUES (1, 1, 'again')")
+    conn.close()
@@ -0,0 +1,81 @@
+import sys
+import os
+import sqlite3
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.move_experience import MoveExperienceAccumulator
+
+
+def build_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE wrestler_move_experience (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            wrestler_id INTEGER NOT NULL,
+            move_name TEXT NOT NULL,
+            experience INTEGER DEFAULT 0,
+            times_used INTEGER DEFAULT 0,
+            times_succeeded INTEGER DEFAULT 0,
+            UNIQUE(wrestler_id, move_name)
+        )
+    """)
+    conn.execute("""
+        INSERT INTO wrestler_move_experience (wrestler_id, move_name, experience, times_used, times_succeeded)
+        VALUES (1, 'Suplex', 10, 6, 4)
+    """)
+    conn.commit()
+    conn.close()
+
+
+def read_rows(path):
+    conn = sqlite3.connect(path)
+    rows = conn.execute("""
+        SELECT wrestler_id, move_name, experience, times_used, times_succeeded
+        FROM wrestler_move_experience ORDER BY wrestler_id, move_name
+    """).fetchall()
+    conn.close()
+    return rows
+
+
+def test_flush_aggregates_and_upserts(tmp_path):
+    path = str(tmp_path / "wrestlers.db")
+    build_db(path)
+    accumulator = MoveExperienceAccumulator(path)
+
+    accumulator.record_move_log([
+        {"wrestler_id": 1, "move_name": "Suplex", "success": True},
+        {"wrestler_id": 1, "move_name": "Suplex", "success": False},
+        {"wrestler_id": 2, "move_name": "Chop", "success": True},
+        {"wrestler_id": None, "move_name": "Chop", "success": True},
+    ])
+    assert accumulator.pending() == 2
+    assert accumulator.flush() == 2
+    assert accumulator.pending() == 0
+
+    assert read_rows(path) == [
+        (1, "Suplex", 13, 8, 5),
+        (2, "Chop", 2, 1, 1),
+    ]
+
+
+def test_batch_defers_until_outermost_end(tmp_path):
+    path = str(tmp_path / "wrestlers.db")
+    build_db(path)
+    accumulator = MoveExperienceAccumulator(path)
+
+    with accumulator.batch():
+        accumulator.record(3, "Armbar", True)
+        with accumulator.batch():
+            accumulator.record(3, "Armbar", True)
+        assert read_rows(path) == [(1, "Suplex", 10, 6, 4)]
+
+    assert read_rows(path)[-1] == (3, "Armbar", 4, 2, 2)
+
+
+def test_failed_flush_keeps_deltas(tmp_path):
+    accumulator = MoveExperienceAccumulator(str(tmp_path / "missing_table.db"))
+    accumulator.record(1, "Suplex", True)
+
+    assert accumulator.flush() == 0
+    assert accumulator.pending() == 1
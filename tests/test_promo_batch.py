@@ -0,0 +1,60 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.promo.promo_beats import PromoBeats
+from src.promo.promo_batch import plan_promos, simulate_promos_batch, archetype_wrestler
+
+
+def build_archetypes():
+    return {
+        "Weak": archetype_wrestler("Weak", 5),
+        "Talented": archetype_wrestler("Talented", 17)
+    }
+
+
+def test_plan_is_deterministic():
+    plan = plan_promos(3, 10, 42)
+    assert plan == plan_promos(3, 10, 42)
+    assert [cell for cell, _, _ in plan] == [0] * 10 + [1] * 10 + [2] * 10
+
+
+def test_same_seed_same_aggregates_for_any_worker_count():
+    kwargs = dict(archetypes=build_archetypes(), tones=("boast", "insult"), trials=30, master_seed=99)
+    serial = simulate_promos_batch(workers=1, **kwargs)
+    parallel = simulate_promos_batch(workers=2, chunk_size=7, **kwargs)
+
+    assert serial["cells"] == parallel["cells"]
+    assert [(c["archetype"], c["tone"]) for c in serial["cells"]] == [
+        ("Weak", "boast"), ("Weak", "insult"), ("Talented", "boast"), ("Talented", "insult")
+    ]
+
+
+def test_aggregates_are_compact_and_consistent():
+    seen = []
+    batch = simulate_promos_batch(archetypes=build_archetypes(), trials=20, master_seed=3, workers=1,
+                                  chunk_size=15, progress_callback=lambda done, total: seen.append((done, total)))
+    assert seen == [(15, 40), (30, 40), (40, 40)]
+
+    weak, talented = batch["cells"]
+    for cell in (weak, talented):
+        assert cell["promos"] == 20
+        assert sum(cell["score_histogram"].values()) == cell["beats"]
+        assert "beat_lists" not in cell
+        quantiles = list(cell["final_rating_quantiles"].values())
+        assert quantiles == sorted(quantiles)
+    assert talented["avg_final_rating"] > weak["avg_final_rating"]
+
+
+def test_keep_beats_returns_beat_lists_in_trial_order():
+    archetypes = {"Regular": archetype_wrestler("Regular", 10)}
+    kept = simulate_promos_batch(archetypes=archetypes, trials=5, master_seed=8, workers=1, keep_beats=True)
+    plain = simulate_promos_batch(archetypes=archetypes, trials=5, master_seed=8, workers=1)
+
+    cell = kept["cells"][0]
+    assert len(cell["beat_lists"]) == 5
+    assert all(isinstance(beats, PromoBeats) for beats in cell["beat_lists"])
+    assert sum(len(beats) - 2 for beats in cell["beat_lists"]) == cell["beats"]
+    cell.pop("beat_lists")
+    assert cell == plain["cells"][0]
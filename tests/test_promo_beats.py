@@ -0,0 +1,92 @@
+import sys
+import os
+import json
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.promo.commentary_engine import COMMENTARY_TEMPLATES
+from src.promo.custom_commentary_engine import fixed_generate_commentary
+from src.promo.promo_beats import PromoBeats, PromoBeat
+from src.promo.promo_engine import PromoEngine
+from src.promo.promo_lines import render_promo_line
+
+WRESTLER = {"name": "Ace", "promo_delivery": 14}
+OPPONENT = {"name": "Brute"}
+
+
+def run_promo(seed, opponent=OPPONENT, compact_beats=True):
+    random.seed(seed)
+    return PromoEngine(
+        WRESTLER, tone="insult", theme="betrayal", opponent=opponent, compact_beats=compact_beats
+    ).simulate()
+
+
+def test_beats_read_like_the_old_dicts():
+    beats = run_promo(3)["beats"]
+    assert isinstance(beats, PromoBeats)
+
+    intro, first, summary = beats[0], beats[1], beats[-1]
+    assert isinstance(first, PromoBeat)
+    assert intro["is_first_beat"] and intro["score"] == 0 and "beat_number" not in intro
+    assert summary["is_last_beat"] and "final_quality" in summary and "wrestler" not in summary
+
+    assert first["beat_number"] == 1
+    assert first["phase"] == "opening"
+    assert first["tone"] == "insult" and first["theme"] == "betrayal"
+    assert first["wrestler"] is WRESTLER and first["opponent"] is OPPONENT
+    assert first["wrestler_color"] == "#66CCFF" and first["versus_mode"] is False
+    assert first["commentary"] == "Opening beat 1"
+    assert set(first["streak_info"]) == {"count", "quality", "last_score"}
+    assert first.get("missing", "default") == "default"
+
+    # Round-trips to plain, JSON-ready dicts
+    plain = beats.to_dicts()
+    assert [set(beat) for beat in plain] == [set(beat.keys()) for beat in beats]
+    json.dumps(plain, default=str)
+
+
+def test_result_beats_are_plain_dicts_by_default():
+    plain = run_promo(3, compact_beats=False)["beats"]
+    assert type(plain) is list and all(type(beat) is dict for beat in plain)
+    compact = run_promo(3)["beats"]
+    assert [set(beat) for beat in plain] == [set(beat) for beat in compact]
+    assert [beat["score"] for beat in plain] == [beat["score"] for beat in compact]
+    json.dumps(plain, default=str)
+
+
+def test_text_is_rendered_from_stored_ids():
+    beats = run_promo(8)["beats"]
+    for beat in beats:
+        if "line_id" in beat:
+            assert beat["promo_line"] == render_promo_line(
+                "insult", "betrayal", beat["phase"], beat["line_id"],
+                "Brute" if "opponent" in beat else None
+            )
+        if "beat_number" in beat:
+            commentary = fixed_generate_commentary(beat)
+            assert beat["commentary_line"] == COMMENTARY_TEMPLATES[beat["commentary_id"]]
+            assert commentary["commentary_line"] == beat["commentary_line"]
+
+
+def test_late_annotations_are_kept():
+    beats = run_promo(4)["beats"]
+    beats[2]["highlight"] = True
+    assert beats[2]["highlight"] is True
+    assert "highlight" in beats[2] and "highlight" not in beats[3]
+
+
+def test_commentary_picks_do_not_shift_promo_rolls():
+    first = run_promo(21)
+    second = run_promo(21)
+    assert [b["score"] for b in first["beats"]] == [b["score"] for b in second["beats"]]
+    assert first["final_rating"] == second["final_rating"]
+    # Same line picks and the global stream ends in the same place
+    assert [b.get("line_id") for b in first["beats"]] == [b.get("line_id") for b in second["beats"]]
+
+
+def test_beat_log_is_compact():
+    beats = run_promo(5)["beats"]
+    stored = sum(sys.getsizeof(column) for column in (beats._floats, beats._ints, beats._codes))
+    # A beat dict alone (without its values) is several hundred bytes
+    assert stored / len(beats) < 200
@@ -0,0 +1,73 @@
+import sys
+import os
+import logging
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.promo import promo_expectations
+from src.promo.promo_batch import archetype_wrestler
+from src.promo.promo_expectations import (
+    ANY, EXPECTATION_STATS, PromoExpectationTable, build_promo_expectations,
+    estimate_promo_rating, invalidate_promo_expectations, quantize_stat, quantize_stats
+)
+
+LEVELS = (5, 15)
+
+
+def use_table(monkeypatch, path):
+    monkeypatch.setattr(promo_expectations, "_default_db_path", lambda: str(path))
+    invalidate_promo_expectations()
+
+
+def test_quantize_snaps_to_nearest_level():
+    assert [quantize_stat(v, (2, 6, 10)) for v in (0, 2, 4, 5, 8, 9, 20)] == [2, 2, 2, 6, 6, 10, 10]
+
+    class Wrestler:
+        promo_delivery = 17
+        focus = 4
+    assert quantize_stats(Wrestler(), LEVELS) == (15, 5, 5, 5, 5)
+    assert quantize_stats({"promo_delivery": 3}, LEVELS) == (5, 5, 5, 5, 5)
+
+
+def test_table_round_trips_through_sqlite(tmp_path, monkeypatch):
+    table = build_promo_expectations(levels=LEVELS, trials=6, master_seed=4, workers=1)
+    assert len(table) == len(LEVELS) ** len(EXPECTATION_STATS)
+
+    cell = (15, 5, 15, 5, 15)
+    wrestler = archetype_wrestler("/".join(map(str, cell)), 10)
+    wrestler.update(zip(EXPECTATION_STATS, cell))
+    promos, avg, _ = table.lookup("boast", "legacy", cell)
+    assert promos == 6
+
+    path = tmp_path / "expectations.db"
+    table.save(str(path))
+    loaded = PromoExpectationTable.from_db(str(path))
+    assert loaded.levels == LEVELS
+    assert loaded.lookup(ANY, ANY, cell) == (promos, avg, table.lookup(ANY, ANY, cell)[2])
+
+    use_table(monkeypatch, path)
+    assert estimate_promo_rating(wrestler, "insult", "betrayal") == avg
+    # Nearby stats share the cell; answers come from the cache
+    wrestler["promo_delivery"] = 14
+    assert estimate_promo_rating(wrestler, "insult", "betrayal") == avg
+    assert promo_expectations._cached_estimate.cache_info().hits >= 1
+    invalidate_promo_expectations()
+
+
+def test_stronger_talkers_are_expected_to_rate_higher(tmp_path, monkeypatch):
+    path = tmp_path / "expectations.db"
+    build_promo_expectations(levels=LEVELS, trials=10, master_seed=1, workers=1).save(str(path))
+    use_table(monkeypatch, path)
+
+    strong = {stat: 15 for stat in EXPECTATION_STATS}
+    weak = {stat: 5 for stat in EXPECTATION_STATS}
+    assert estimate_promo_rating(strong) > estimate_promo_rating(weak)
+    invalidate_promo_expectations()
+
+
+def test_missing_table_estimates_nothing(tmp_path, monkeypatch, caplog):
+    use_table(monkeypatch, tmp_path / "missing.db")
+    with caplog.at_level(logging.ERROR):
+        assert estimate_promo_rating({"promo_delivery": 12}) is None
+    assert "setup_promo_expectations_db" in caplog.text
+    invalidate_promo_expectations()
@@ -0,0 +1,75 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.promo.promo_engine import PromoEngine
+from src.promo.versus_promo_engine import VersusPromoEngine
+
+WRESTLER = {"name": "Ace", "promo_delivery": 13}
+RIVAL = {"name": "Brute", "microphone": 45, "aggression": 80}
+
+
+def comparable(beat):
+    # Commentary picks come from their own unseeded generator
+    return {key: value for key, value in dict(beat).items() if key not in ("commentary_id", "commentary_line")}
+
+
+def test_iter_beats_matches_simulate():
+    random.seed(12)
+    expected = PromoEngine(WRESTLER, tone="boast", theme="power").simulate()
+
+    random.seed(12)
+    engine = PromoEngine(WRESTLER, tone="boast", theme="power")
+    streamed = []
+    generator = engine.iter_beats()
+    first = next(generator)
+    # The first beat is available before the rest of the promo is simulated
+    assert first["is_first_beat"] and len(engine.beats) == 1
+    streamed.append(comparable(first))
+    streamed.extend(comparable(beat) for beat in generator)
+
+    assert streamed == [comparable(beat) for beat in expected["beats"]]
+    assert engine.result["final_rating"] == expected["final_rating"]
+    # Each beat carries the running rating
+    assert streamed[-1]["rolling_rating"] == round(engine.rating.rating, 2)
+
+
+def test_iter_beats_without_keeping_beats():
+    random.seed(3)
+    expected = PromoEngine(WRESTLER).simulate()
+
+    random.seed(3)
+    engine = PromoEngine(WRESTLER)
+    scores = []
+    for beat in engine.iter_beats(keep_beats=False):
+        scores.append(beat["score"])
+        assert len(engine.beats) == 1
+
+    assert scores == [beat["score"] for beat in expected["beats"]]
+    assert "beats" not in engine.result
+    assert engine.result["final_rating"] == expected["final_rating"]
+
+
+def test_generator_returns_the_final_result():
+    generator = PromoEngine(WRESTLER).iter_beats()
+    try:
+        while True:
+            next(generator)
+    except StopIteration as stop:
+        assert stop.value["final_rating"] >= 0
+
+
+def test_versus_iter_beats_matches_simulate():
+    random.seed(5)
+    expected = VersusPromoEngine(WRESTLER, RIVAL).simulate()
+
+    random.seed(5)
+    engine = VersusPromoEngine(WRESTLER, RIVAL)
+    streamed = list(engine.iter_beats(keep_beats=False))
+
+    assert streamed == expected["beats"]
+    assert streamed[0]["is_intro"] and streamed[-1]["is_summary"]
+    assert engine.beats == [] and "beats" not in engine.result
+    assert engine.result["final_scores"] == expected["final_scores"]
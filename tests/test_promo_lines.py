@@ -0,0 +1,61 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.promo.promo_engine_helpers import get_promo_line
+from src.promo.promo_lines import (
+    PROMO_LINES, VERSUS_LINES, compile_line, get_versus_promo_line, render_versus_promo_line
+)
+
+
+def reference_promo_line(tone, theme, phase, opponent=None):
+    """The original per-call lookup and linear opponent-line scan."""
+    tone_map = {"boast": "boast", "insult": "insult", "callout": "callout", "challenge": "callout", "humble": "humble"}
+    theme_map = {t: t for t in ("legacy", "dominance", "betrayal", "power", "comeback", "respect")}
+    phase_map = {"beginning": "opening", "opening": "opening", "middle": "middle", "end": "closing", "ending": "closing"}
+    bucket = PROMO_LINES.get(phase_map.get(phase, "middle"), {}).get(tone_map.get(tone, "boast"), {})
+    lines = bucket.get(theme_map.get(theme, "legacy"), []) or bucket.get("generic", [])
+    if not lines:
+        return "The wrestler cuts a passionate promo."
+    line = random.choice(lines)
+    if opponent and "opponent" in line:
+        opponent_lines = [l for l in lines if "opponent" in l]
+        if opponent_lines:
+            line = random.choice(opponent_lines)
+    if opponent:
+        line = line.replace("opponent", opponent.get("name", "their opponent"))
+    return line
+
+
+def test_promo_line_index_matches_original_selection():
+    opponents = (None, {"name": "The Rival"}, {"id": 4})
+    for tone in ("boast", "insult", "callout", "challenge", "humble", "unknown"):
+        for theme in ("legacy", "betrayal", "respect", "unknown"):
+            for phase in ("beginning", "middle", "end", "ending", "unknown"):
+                for opponent in opponents:
+                    random.seed(hash((tone, theme, phase)) & 0xFFFF)
+                    expected = [reference_promo_line(tone, theme, phase, opponent) for _ in range(12)]
+                    state = random.getstate()
+
+                    random.seed(hash((tone, theme, phase)) & 0xFFFF)
+                    assert [get_promo_line(tone, theme, phase, opponent) for _ in range(12)] == expected
+                    # Same number of draws, so promo scoring downstream is unchanged
+                    assert random.getstate() == state
+
+
+def test_versus_lines_render_like_placeholder_replacement():
+    for tone in list(VERSUS_LINES) + ["unknown"]:
+        for phase in ("opening", "middle", "ending"):
+            for position in ("first", "response"):
+                random.seed(5)
+                raw = get_versus_promo_line(tone, phase, position)
+                random.seed(5)
+                rendered = render_versus_promo_line(tone, phase, position, "Ace", "Brute")
+                assert rendered == raw.replace("[WRESTLER]", "Ace").replace("[OPPONENT]", "Brute")
+
+
+def test_compile_line_placeholders():
+    assert compile_line("{self} vs {opponent} [OPPONENT]").format(wrestler="A", opponent="B") == "A vs B B"
+    assert compile_line("Beat opponent {x}", bare_opponent=True).format(opponent="B") == "Beat B {x}"
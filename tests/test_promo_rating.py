@@ -0,0 +1,80 @@
+import sys
+import os
+import random
+import statistics
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.promo.promo_engine import PromoEngine, RollingRating
+
+
+def build_wrestler(stat):
+    return {
+        "name": "Talker",
+        "promo_delivery": stat,
+        "fan_engagement": stat,
+        "entrance_presence": stat,
+        "presence_under_fire": stat,
+        "confidence": stat,
+        "focus": stat,
+        "resilience": stat,
+        "adaptability": stat,
+        "risk_assessment": stat,
+        "determination": stat,
+        "reputation": stat
+    }
+
+
+def reference_rating(scores):
+    """The original full recalculation over every score so far."""
+    weighted_scores = []
+    for score in scores:
+        if score >= 85:
+            weighted_scores.extend([score, score])
+        elif score >= 70:
+            weighted_scores.extend([score, score * 0.5])
+        else:
+            weighted_scores.append(score)
+    avg_score = sum(weighted_scores) / len(weighted_scores)
+    score_std = statistics.stdev(scores) if len(scores) > 1 else 0
+    consistency_bonus = max(0, (20 - score_std) / 20) * 5
+    finish_bonus = 0
+    if len(scores) >= 3:
+        final_beats_avg = sum(scores[-3:]) / 3
+        if final_beats_avg >= 85:
+            finish_bonus = 5
+        elif final_beats_avg >= 70:
+            finish_bonus = 3
+    return max(0, min(100, avg_score + consistency_bonus + finish_bonus)), avg_score, finish_bonus
+
+
+def test_rolling_rating_matches_full_recalculation():
+    for seed in range(40):
+        random.seed(seed)
+        result = PromoEngine(build_wrestler(random.randint(3, 20))).simulate()
+
+        scores = []
+        for beat in result["beats"]:
+            scores.append(beat["score"])
+            rating, _, _ = reference_rating(scores)
+            assert beat["rolling_rating"] == round(rating, 2)
+            assert beat["star_rating"] == round(rating / 20, 2)
+
+        rating, avg_score, finish_bonus = reference_rating(scores)
+        assert result["final_rating"] == round(rating, 2)
+        assert result["avg_score"] == pytest.approx(avg_score)
+        assert result["finish_bonus"] == finish_bonus
+
+
+def test_accumulator_handles_single_and_constant_scores():
+    accumulator = RollingRating()
+    accumulator.add(0)
+    assert accumulator.score_std == 0
+    assert accumulator.rating == 5
+
+    for _ in range(4):
+        accumulator.add(90)
+    assert list(accumulator.last_scores) == [90, 90, 90]
+    assert accumulator.finish_bonus == 5
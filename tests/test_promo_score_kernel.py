@@ -0,0 +1,55 @@
+import sys
+import os
+import random
+import statistics
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.promo.promo_engine_helpers import roll_promo_score
+from src.promo.promo_score_kernel import roll_promo_scores, NO_EXCEPTIONAL, EXCEPTIONAL_TYPES
+
+
+def build_stats(skill, mental=10):
+    return {
+        "promo_delivery": skill,
+        "confidence": mental,
+        "resilience": mental,
+        "pressure_handling": mental
+    }
+
+
+def test_kernel_agrees_with_scalar_roll():
+    cases = [
+        (build_stats(5, 6), 1, 10, 30, 50),
+        (build_stats(10), 4, 50, 50, 50),
+        (build_stats(17, 16), 6, 80, 85, 70)
+    ]
+    for stats, beat_number, momentum, confidence, crowd in cases:
+        random.seed(11)
+        scalar = [roll_promo_score(stats, beat_number, momentum, confidence, crowd) for _ in range(4000)]
+        scores, exceptional = roll_promo_score(stats, beat_number, momentum, confidence, crowd, size=40000, rng=11)
+
+        assert scores.shape == exceptional.shape == (40000,)
+        assert abs(scores.mean() - statistics.mean(s for s, _ in scalar)) < 1.0
+        assert abs(scores.std() - statistics.pstdev(s for s, _ in scalar)) < 1.0
+
+        scalar_rate = sum(e is not None for _, e in scalar) / len(scalar)
+        assert abs((exceptional != NO_EXCEPTIONAL).mean() - scalar_rate) < 0.02
+
+        scalar_types = {e["type"] for _, e in scalar if e}
+        assert {EXCEPTIONAL_TYPES[t] for t in np.unique(exceptional) if t != NO_EXCEPTIONAL} == scalar_types
+
+
+def test_kernel_sweeps_broadcast_grid():
+    skill, focus, mental = np.meshgrid(np.arange(1, 21), np.arange(1, 21), np.arange(1, 21), indexing="ij")
+    scores, exceptional = roll_promo_scores(skill, mental, focus, mental, rng=3)
+
+    assert scores.shape == exceptional.shape == (20, 20, 20)
+    assert scores.min() >= 0 and scores.max() <= 99
+    # Better talkers score higher on average across the rest of the grid
+    assert scores[-1].mean() > scores[0].mean()
+
+    again, _ = roll_promo_scores(skill, mental, focus, mental, rng=3)
+    assert np.array_equal(scores, again)
@@ -0,0 +1,65 @@
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.match_core import run_match
+from src.core.diplomacy_system import DiplomacySystem
+from src.core.rng_utils import make_rng, split_seeds
+from src.promo.promo_engine import PromoEngine
+from src.promo.versus_promo_engine import VersusPromoEngine
+
+MATCH_KEYS = ("winner", "win_type", "quality", "turns", "drama_score")
+WRESTLER = {"name": "Ace", "promo_delivery": 13}
+RIVAL = {"name": "Brute", "microphone": 45, "aggression": 80}
+
+
+def gameplay(beat):
+    # Commentary picks come from their own unseeded generator
+    return {key: value for key, value in dict(beat).items() if key not in ("commentary_id", "commentary_line")}
+
+
+def test_match_rng_matches_seeded_global_generator(build_wrestler):
+    random.seed(7)
+    expected = run_match(build_wrestler("Alpha", 1), build_wrestler("Bravo", 2))
+
+    random.seed(99)
+    state = random.getstate()
+    result = run_match(build_wrestler("Alpha", 1), build_wrestler("Bravo", 2), rng=random.Random(7))
+
+    assert [result[key] for key in MATCH_KEYS] == [expected[key] for key in MATCH_KEYS]
+    # The injected generator is the only one drawn from
+    assert random.getstate() == state
+
+
+def test_promo_engines_are_reproducible_from_an_rng():
+    state = random.getstate()
+    first = PromoEngine(WRESTLER, rng=random.Random(4)).simulate()
+    second = PromoEngine(WRESTLER, rng=random.Random(4)).simulate()
+    assert [gameplay(beat) for beat in first["beats"]] == [gameplay(beat) for beat in second["beats"]]
+    assert first["final_rating"] == second["final_rating"]
+
+    first = VersusPromoEngine(WRESTLER, RIVAL, rng=random.Random(4)).simulate()
+    second = VersusPromoEngine(WRESTLER, RIVAL, rng=random.Random(4)).simulate()
+    assert first == second
+    assert random.getstate() == state
+
+
+def test_split_seeds_is_deterministic():
+    seeds = split_seeds(11, 5)
+    assert seeds == split_seeds(11, 5)
+    assert seeds[:3] == split_seeds(11, 3)
+    assert len(set(seeds)) == 5
+    rng = random.Random(1)
+    assert make_rng(rng) is rng
+
+
+def test_relationship_decay_takes_an_rng():
+    decayed = []
+    for _ in range(2):
+        diplomacy = DiplomacySystem()
+        diplomacy.relationships = {(i, i + 1): 50 - i * 20 for i in range(6)}
+        diplomacy.decay_relationships(amount=3, rng=random.Random(2))
+        decayed.append(diplomacy.relationships)
+    assert decayed[0] == decayed[1]
@@ -0,0 +1,120 @@
+import sys
+import os
+import sqlite3
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.db.utils import DB_DIR_ENV
+from src.db import save_snapshot
+from src.db.save_snapshot import (
+    attach_domains, load_game, namespaced, open_save, save_game, save_path, _rename_index_sql, _rename_table_sql
+)
+
+
+def make_db(path, script):
+    conn = sqlite3.connect(str(path))
+    conn.executescript(script)
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def game_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(DB_DIR_ENV, str(tmp_path))
+    make_db(tmp_path / "wrestlers.db", """
+        CREATE TABLE wrestlers (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT);
+        INSERT INTO wrestlers (name) VALUES ('Ace'), ('Brute');
+    """)
+    make_db(tmp_path / "business.db", """
+        CREATE TABLE merchandise_sales (id INTEGER PRIMARY KEY, wrestler_id INTEGER, quantity INTEGER);
+        CREATE INDEX idx_sales_wrestler ON merchandise_sales(wrestler_id);
+        INSERT INTO merchandise_sales (wrestler_id, quantity) VALUES (1, 5), (1, 3), (2, 4);
+    """)
+    # Same table name in two databases
+    make_db(tmp_path / "matches.db", "CREATE TABLE matches (id INTEGER PRIMARY KEY, event_id INTEGER);")
+    make_db(tmp_path / "match_history.db", """
+        CREATE TABLE matches (id INTEGER PRIMARY KEY, winner TEXT);
+        INSERT INTO matches (winner) VALUES ('Ace');
+    """)
+    return tmp_path
+
+
+def test_rename_schema_sql():
+    assert _rename_table_sql("CREATE TABLE IF NOT EXISTS wrestlers (id INTEGER)", "w__wrestlers") == \
+        'CREATE TABLE "w__wrestlers" (id INTEGER)'
+    assert _rename_index_sql("CREATE UNIQUE INDEX idx ON sales(day)", "b__idx", "b__sales") == \
+        'CREATE UNIQUE INDEX "b__idx" ON "b__sales"(day)'
+
+
+def test_save_namespaces_every_database(game_dir):
+    counts = save_game(2)
+    assert counts == {"wrestlers": 2, "matches": 0, "match_history": 1, "business": 3}
+    assert save_path(2) == str(game_dir / "saves" / "slot_2.save")
+
+    conn = open_save(2)
+    # Cross-domain report as one query
+    totals = conn.execute(f"""
+        SELECT w.name, SUM(s.quantity) FROM {namespaced('business', 'merchandise_sales')} s
+        JOIN {namespaced('wrestlers', 'wrestlers')} w ON w.id = s.wrestler_id
+        GROUP BY w.name ORDER BY w.name
+    """).fetchall()
+    assert totals == [("Ace", 8), ("Brute", 4)]
+    assert conn.execute("SELECT winner FROM match_history__matches").fetchall() == [("Ace",)]
+    assert conn.execute(
+        "SELECT seq FROM sqlite_sequence WHERE name = 'wrestlers__wrestlers'").fetchone() == (2,)
+    assert conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'business__idx_sales_wrestler'").fetchone()
+    conn.close()
+
+
+def test_resave_replaces_previous_tables(game_dir):
+    save_game()
+    make_db(game_dir / "wrestlers.db", "DELETE FROM wrestlers WHERE name = 'Brute';")
+    os.remove(game_dir / "business.db")
+    save_game()
+
+    conn = open_save()
+    assert conn.execute("SELECT COUNT(*) FROM wrestlers__wrestlers").fetchone() == (1,)
+    assert not conn.execute("SELECT 1 FROM sqlite_master WHERE name LIKE 'business__%'").fetchone()
+    conn.close()
+
+
+def test_failed_save_keeps_the_previous_save(game_dir):
+    save_game()
+    with pytest.raises(sqlite3.DatabaseError):
+        save_game(sources={"wrestlers": str(game_dir / "wrestlers.db"), "business": str(game_dir / "missing.db")})
+
+    conn = open_save()
+    assert conn.execute("SELECT COUNT(*) FROM business__merchandise_sales").fetchone() == (3,)
+    conn.close()
+
+
+def test_load_restores_the_working_databases(game_dir, monkeypatch):
+    invalidated = []
+    monkeypatch.setattr(save_snapshot, "invalidate_db_caches", lambda: invalidated.append(True))
+    save_game()
+    make_db(game_dir / "wrestlers.db", "DELETE FROM wrestlers; INSERT INTO wrestlers (name) VALUES ('Cole');")
+
+    assert load_game() == ["business", "match_history", "matches", "wrestlers"]
+    assert invalidated
+
+    conn = sqlite3.connect(str(game_dir / "wrestlers.db"))
+    assert conn.execute("SELECT name FROM wrestlers ORDER BY id").fetchall() == [("Ace",), ("Brute",)]
+    # AUTOINCREMENT keeps counting from the saved position
+    conn.execute("INSERT INTO wrestlers (name) VALUES ('Dax')")
+    assert conn.execute("SELECT id FROM wrestlers WHERE name = 'Dax'").fetchone() == (3,)
+    conn.close()
+    assert not list(game_dir.glob("*.loading"))
+
+
+def test_attach_domains_joins_live_databases(game_dir):
+    conn = attach_domains(sqlite3.connect(":memory:"), "wrestlers", "business")
+    rows = conn.execute("""
+        SELECT w.name, SUM(s.quantity) FROM business.merchandise_sales s
+        JOIN wrestlers.wrestlers w ON w.id = s.wrestler_id
+        GROUP BY w.name ORDER BY w.name
+    """).fetchall()
+    assert rows == [("Ace", 8), ("Brute", 4)]
+    conn.close()
@@ -0,0 +1,57 @@
+import sys
+import os
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.promo.versus_promo_engine import VersusPromoEngine, VersusSpeaker
+
+CHAMPION = {"name": "Ace", "microphone": 80, "aggression": 70}
+CHALLENGER = {"name": "Brute", "attributes": {"microphone": 40, "charisma": 60}}
+
+
+def test_speakers_resolve_stats_once():
+    speaker = VersusSpeaker(CHALLENGER)
+    assert speaker.name == "Brute"
+    assert speaker.stats["promo_delivery"] == 40
+    assert speaker.stats["charisma"] == 60
+    assert speaker.aggression == 50
+    assert (speaker.momentum, speaker.confidence, speaker.scores) == (0, 50, [])
+
+
+def test_equal_wrestlers_keep_separate_state():
+    # Two identical dicts used to be told apart by equality, so every line
+    # was credited to wrestler1
+    twin = {"name": "Twin", "microphone": 60}
+    random.seed(2)
+    engine = VersusPromoEngine(twin, dict(twin))
+    result = engine.simulate()
+
+    first, second = engine.speakers
+    exchanges = sum(1 for beat in result["beats"] if beat.get("position") == "first")
+    assert len(first.scores) == len(second.scores) == exchanges
+    assert result["final_scores"]["wrestler2_score"] > 0
+
+
+def test_simulate_many_matches_fresh_engines():
+    random.seed(9)
+    expected = [VersusPromoEngine(CHAMPION, CHALLENGER).simulate() for _ in range(25)]
+
+    random.seed(9)
+    summary = VersusPromoEngine(CHAMPION, CHALLENGER).simulate_many(25, keep_beats=True)
+
+    assert summary["runs"] == 25
+    assert summary["results"] == [result["final_scores"] for result in expected]
+    assert summary["beats"] == [result["beats"] for result in expected]
+    assert summary["wrestler1_wins"] + summary["wrestler2_wins"] + summary["draws"] == 25
+    assert summary["avg_overall_score"] == pytest.approx(sum(r["overall_score"] for r in summary["results"]) / 25)
+    # The stronger talker wins the rivalry more often than not
+    assert summary["wrestler1_wins"] > summary["wrestler2_wins"]
+
+
+def test_simulate_many_drops_beats_by_default():
+    summary = VersusPromoEngine(CHAMPION, CHALLENGER).simulate_many(3)
+    assert "beats" not in summary
+    assert len(summary["results"]) == 3
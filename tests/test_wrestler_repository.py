@@ -0,0 +1,82 @@
+import sys
+import os
+import sqlite3
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.wrestler_repository import WrestlerRepository, ATTRIBUTE_NAMES
+
+
+def build_db(path):
+    conn = sqlite3.connect(path)
+    conn.executescript(f"""
+        CREATE TABLE finishers (id INTEGER PRIMARY KEY, name TEXT, style TEXT, damage INTEGER);
+        CREATE TABLE wrestlers (
+            id INTEGER PRIMARY KEY, name TEXT, reputation INTEGER,
+            condition INTEGER, finisher_id INTEGER
+        );
+        CREATE TABLE wrestler_attributes (
+            wrestler_id INTEGER PRIMARY KEY,
+            {', '.join(f'{name} INTEGER' for name in ATTRIBUTE_NAMES)}
+        );
+        CREATE TABLE signature_moves (id INTEGER PRIMARY KEY, name TEXT, type TEXT, damage INTEGER, difficulty INTEGER);
+        CREATE TABLE wrestler_signature_moves (wrestler_id INTEGER, signature_move_id INTEGER);
+
+        INSERT INTO finishers VALUES (1, 'Piledriver', 'slam', 10);
+        INSERT INTO wrestlers VALUES (1, 'Alpha', 70, 100, 1);
+        INSERT INTO wrestlers VALUES (2, 'Bravo', 50, 90, 1);
+        INSERT INTO signature_moves VALUES (1, 'Lariat', 'strike', 8, 4);
+        INSERT INTO wrestler_signature_moves VALUES (1, 1);
+    """)
+    for wrestler_id, value in ((1, 15), (2, 9)):
+        conn.execute(
+            f"INSERT INTO wrestler_attributes VALUES ({', '.join('?' * (len(ATTRIBUTE_NAMES) + 1))})",
+            (wrestler_id,) + (value,) * len(ATTRIBUTE_NAMES)
+        )
+    conn.commit()
+    conn.close()
+
+
+def test_to_dict_matches_loader_shape(tmp_path):
+    path = str(tmp_path / "wrestlers.db")
+    build_db(path)
+    repository = WrestlerRepository(path)
+
+    wrestler = repository.get(1).to_dict()
+    assert wrestler["name"] == "Alpha"
+    assert wrestler["finisher"] == {"name": "Piledriver", "style": "slam", "damage": 10}
+    assert wrestler["signature_moves"] == [{"name": "Lariat", "type": "strike", "damage": 8, "difficulty": 4}]
+    assert wrestler["powerlifting"] == 15
+    assert wrestler["strength"] == repository.get(1).stat("strength")
+
+    # Every call hands out an independent dict
+    wrestler["stamina"] = 0
+    assert "stamina" not in repository.get(1).to_dict()
+
+
+def test_lookup_by_name_and_missing(tmp_path):
+    path = str(tmp_path / "wrestlers.db")
+    build_db(path)
+    repository = WrestlerRepository(path)
+
+    assert repository.get_by_name("Bravo").id == 2
+    assert repository.get(99) is None
+    assert [p.name for p in repository.all()] == ["Alpha", "Bravo"]
+
+
+def test_targeted_invalidation_reloads_one_wrestler(tmp_path):
+    path = str(tmp_path / "wrestlers.db")
+    build_db(path)
+    repository = WrestlerRepository(path)
+    untouched = repository.get(1)
+
+    conn = sqlite3.connect(path)
+    conn.execute("UPDATE wrestlers SET name = 'Bravo Prime' WHERE id = 2")
+    conn.commit()
+    conn.close()
+
+    assert repository.get(2).name == "Bravo"
+    repository.invalidate(2)
+    assert repository.get(2).name == "Bravo Prime"
+    assert repository.get_by_name("Bravo") is None
+    assert repository.get(1) is untouched